@@ -6,7 +6,13 @@ from arango.database import Database
 from arango.api import API
 from arango.exceptions import *
 from arango.constants import HTTP_OK, LOG_LEVELS, DEFAULT_DATABASE
-from arango.clients import DefaultClient
+from arango.clients import (
+    DefaultClient,
+    LoadBalancingClient,
+    UnixSocketClient,
+)
+from arango.codec import get_codec
+from arango.registry import Registry
 from arango.utils import uncamelify
 
 
@@ -20,7 +26,12 @@ class Arango(object):
     """
 
     def __init__(self, protocol="http", host="localhost", port=8529,
-                 username="root", password="", client=None):
+                 username="root", password="", client=None, pool_size=10,
+                 pool_block=False, keep_alive=True, idle_timeout=None,
+                 timeout=None, prewarm=0, endpoints=None,
+                 load_balancing="round_robin", codec=None, compression=None,
+                 retry=None, interceptors=None, endpoint=None,
+                 profiler=None):
         """Initialize the wrapper object.
 
         :param protocol: the internet transfer protocol (default: 'http')
@@ -35,20 +46,82 @@ class Arango(object):
         :type password: str
         :param client: HTTP client for this wrapper to use
         :type client: arango.clients.base.BaseClient or None
+        :param pool_size: max number of connections kept open per host
+        :type pool_size: int
+        :param pool_block: wait for a free connection if the pool is exhausted
+        :type pool_block: bool
+        :param keep_alive: whether or not to reuse connections between requests
+        :type keep_alive: bool
+        :param idle_timeout: close pooled connections idle for longer (in sec)
+        :type idle_timeout: int or float or None
+        :param timeout: the default connect and read timeouts of the
+            requests in seconds, a number for both or a (connect, read)
+            tuple (default: None, no timeout)
+        :type timeout: int or float or tuple or None
+        :param prewarm: the number of connections to open on initialization
+        :type prewarm: int
+        :param endpoints: coordinator URLs to spread the requests over
+            (e.g. ['http://10.0.0.1:8529', 'http://10.0.0.2:8529'])
+        :type endpoints: list or None
+        :param load_balancing: 'round_robin', 'random' or 'least_outstanding'
+        :type load_balancing: str
+        :param codec: the JSON codec name ('auto', 'orjson', 'ujson' or
+            'json') or instance, shared by all databases (default: 'auto')
+        :type codec: str or arango.codec.Codec or None
+        :param compression: the compression settings for request and
+            response bodies, shared by all databases (default: None)
+        :type compression: arango.compression.Compression or None
+        :param retry: the retry policy and circuit breakers, shared by all
+            databases (default: None, no retries)
+        :type retry: arango.retry.RetryPolicy or None
+        :param interceptors: the interceptors called around every request,
+            shared by all databases (see ``arango.interceptors``)
+        :type interceptors: list or None
+        :param endpoint: the ArangoDB endpoint, used instead of ``protocol``,
+            ``host`` and ``port`` if given (e.g. 'tcp://10.0.0.1:8529', or
+            'unix:///tmp/arangodb.sock' for a Unix domain socket)
+        :type endpoint: str or None
+        :param profiler: the recorder of slow AQL queries, shared by all
+            databases (see ``arango.profiler``)
+        :type profiler: arango.profiler.QueryProfiler or None
         :raises: ConnectionError
+
+        The connection pool, timeout and load balancing settings only apply
+        if ``client`` is not given. If ``endpoints`` is given, ``protocol``,
+        ``host`` and ``port`` are ignored in favour of the endpoints.
         """
         self.protocol = protocol
         self.host = host
         self.port = port
         self.username = username
         self.password = password
+        self.endpoint = endpoint
+        self.codec = get_codec(codec)
+        self.compression = compression
+        self.retry = retry
+        self.interceptors = [] if interceptors is None else interceptors
+        self.profiler = profiler
 
         # Initialize the ArangoDB HTTP Client if not given
         if client is not None:
             self.client = client
         else:
-            client_init_data = {"auth": (self.username, self.password)}
-            self.client = DefaultClient(client_init_data)
+            client_init_data = {
+                "auth": (self.username, self.password),
+                "pool_size": pool_size,
+                "pool_block": pool_block,
+                "keep_alive": keep_alive,
+                "idle_timeout": idle_timeout,
+                "timeout": timeout,
+            }
+            if endpoints:
+                client_init_data["endpoints"] = endpoints
+                client_init_data["strategy"] = load_balancing
+                self.client = LoadBalancingClient(client_init_data)
+            elif endpoint is not None and endpoint.startswith("unix://"):
+                self.client = UnixSocketClient(client_init_data)
+            else:
+                self.client = DefaultClient(client_init_data)
 
         # Initialize the ArangoDB API wrapper object
         self.api = API(
@@ -58,8 +131,18 @@ class Arango(object):
             username=self.username,
             password=self.password,
             client=self.client,
+            codec=self.codec,
+            compression=self.compression,
+            retry=self.retry,
+            interceptors=self.interceptors,
+            endpoint=self.endpoint,
+            profiler=self.profiler,
         )
 
+        # Open the requested number of connections up front
+        if prewarm and hasattr(self.client, "prewarm"):
+            self.client.prewarm(self.api.url_prefix, prewarm)
+
         # Check the connection by requesting a header
         res = self.api.head("/_api/version")
         if res.status_code not in HTTP_OK:
@@ -69,9 +152,11 @@ class Arango(object):
         self._default_database = Database(DEFAULT_DATABASE, self.api)
 
         # Cache for Database objects
-        self._database_cache = {
-            DEFAULT_DATABASE: self._default_database
-        }
+        self._database_cache = Registry(
+            load=lambda: self.databases["all"],
+            create=self._create_database_object,
+            objects={DEFAULT_DATABASE: self._default_database},
+        )
 
     def __getattr__(self, attr):
         """Call __getattr__ of the default database."""
@@ -83,23 +168,37 @@ class Arango(object):
 
     def _invalidate_database_cache(self):
         """Invalidate the Database objects cache."""
-        real_dbs = set(self.databases["all"])
-        cached_dbs = set(self._database_cache)
-        for db_name in cached_dbs - real_dbs:
-            del self._database_cache[db_name]
-        for db_name in real_dbs - cached_dbs:
-            self._database_cache[db_name] = Database(
-                name=db_name,
-                api=API(
-                    protocol=self.protocol,
-                    host=self.host,
-                    port=self.port,
-                    username=self.username,
-                    password=self.password,
-                    database=db_name,
-                    client=self.client
-                )
+        self._database_cache.refresh()
+
+    def _create_database_object(self, db_name):
+        """Return the Database object of the given name."""
+        return Database(
+            name=db_name,
+            api=API(
+                protocol=self.protocol,
+                host=self.host,
+                port=self.port,
+                username=self.username,
+                password=self.password,
+                database=db_name,
+                client=self.client,
+                codec=self.codec,
+                compression=self.compression,
+                retry=self.retry,
+                interceptors=self.interceptors,
+                endpoint=self.endpoint,
+                profiler=self.profiler,
             )
+        )
+
+    @property
+    def pool_stats(self):
+        """Return the counters of the HTTP client's connection pool.
+
+        :returns: the hits, new_connections, waits, evictions and discards
+        :rtype: dict or None
+        """
+        return getattr(self.client, "pool_stats", None)
 
     ###########################
     # Miscellaneous Functions #
@@ -323,13 +422,10 @@ class Arango(object):
         :rtype: arango.database.Database
         :raises: DatabaseNotFoundError
         """
-        if name in self._database_cache:
-            return self._database_cache[name]
-        else:
-            self._invalidate_database_cache()
-            if name not in self._database_cache:
-                raise DatabaseNotFoundError(name)
-            return self._database_cache[name]
+        db = self._database_cache.get(name)
+        if db is None:
+            raise DatabaseNotFoundError(name)
+        return db
 
     def create_database(self, name, users=None):
         """Create a new database.
@@ -0,0 +1,238 @@
+"""ArangoDB's asynchronous Top-Level API (requires Python 3.6+)."""
+
+from arango.aio.api import AsyncAPI
+from arango.aio.database import AsyncDatabase
+from arango.exceptions import *
+from arango.constants import HTTP_OK, DEFAULT_DATABASE
+from arango.clients.aio import AsyncioClient
+from arango.codec import get_codec
+
+
+class AsyncArango(object):
+    """Awaitable counterpart of ``arango.Arango``.
+
+    Since the connection check cannot run in ``__init__``, it is done by
+    ``connect``, which is also called when entering the object as an
+    asynchronous context manager:
+
+    .. code-block:: python
+
+        async with AsyncArango(host="localhost", port=8529) as arango:
+            db = await arango.db("my_database")
+            col = await db.collection("my_collection")
+            await col.create_document({"_key": "doc01"})
+    """
+
+    def __init__(self, protocol="http", host="localhost", port=8529,
+                 username="root", password="", client=None, pool_size=100,
+                 timeout=None, codec=None, compression=None, retry=None,
+                 interceptors=None):
+        """Initialize the wrapper object.
+
+        :param protocol: the internet transfer protocol (default: 'http')
+        :type protocol: str
+        :param host: ArangoDB host (default: 'localhost')
+        :type host: str
+        :param port: ArangoDB port (default: 8529)
+        :type port: int or str
+        :param username: ArangoDB username (default: 'root')
+        :type username: str
+        :param password: ArangoDB password (default: '')
+        :type password: str
+        :param client: asynchronous HTTP client for this wrapper to use
+        :type client: arango.clients.aio.AsyncioClient or None
+        :param pool_size: max number of connections kept open per host
+        :type pool_size: int
+        :param timeout: the default connect and read timeouts of the
+            requests in seconds, a number for both or a (connect, read)
+            tuple (default: None, no timeout)
+        :type timeout: int or float or tuple or None
+        :param codec: the JSON codec name ('auto', 'orjson', 'ujson' or
+            'json') or instance, shared by all databases (default: 'auto')
+        :type codec: str or arango.codec.Codec or None
+        :param compression: the compression settings for request and
+            response bodies, shared by all databases (default: None)
+        :type compression: arango.compression.Compression or None
+        :param retry: the retry policy and circuit breakers, shared by all
+            databases (default: None, no retries)
+        :type retry: arango.retry.RetryPolicy or None
+        :param interceptors: the interceptors called around every request,
+            shared by all databases (see ``arango.interceptors``)
+        :type interceptors: list or None
+        """
+        self.protocol = protocol
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.codec = get_codec(codec)
+        self.compression = compression
+        self.retry = retry
+        self.interceptors = [] if interceptors is None else interceptors
+
+        # Initialize the ArangoDB HTTP Client if not given
+        if client is not None:
+            self.client = client
+        else:
+            client_init_data = {
+                "auth": (self.username, self.password),
+                "pool_size": pool_size,
+                "timeout": timeout,
+            }
+            self.client = AsyncioClient(client_init_data)
+
+        # Initialize the ArangoDB API wrapper object
+        self.api = AsyncAPI(
+            protocol=self.protocol,
+            host=self.host,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            client=self.client,
+            codec=self.codec,
+            compression=self.compression,
+            retry=self.retry,
+            interceptors=self.interceptors,
+        )
+
+        # Default ArangoDB database wrapper object
+        self._default_database = AsyncDatabase(DEFAULT_DATABASE, self.api)
+
+        # Cache for AsyncDatabase objects
+        self._database_cache = {
+            DEFAULT_DATABASE: self._default_database
+        }
+
+    def __getattr__(self, attr):
+        """Call __getattr__ of the default database."""
+        return getattr(self._default_database, attr)
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def connect(self):
+        """Check the connection by requesting a header.
+
+        :raises: ConnectionError
+        """
+        res = await self.api.head("/_api/version")
+        if res.status_code not in HTTP_OK:
+            raise ConnectionError(res)
+
+    async def close(self):
+        """Close the connections held by the HTTP client."""
+        await self.client.close()
+
+    async def _invalidate_database_cache(self):
+        """Invalidate the AsyncDatabase objects cache."""
+        real_dbs = set((await self.databases())["all"])
+        cached_dbs = set(self._database_cache)
+        for db_name in cached_dbs - real_dbs:
+            del self._database_cache[db_name]
+        for db_name in real_dbs - cached_dbs:
+            self._database_cache[db_name] = AsyncDatabase(
+                name=db_name,
+                api=AsyncAPI(
+                    protocol=self.protocol,
+                    host=self.host,
+                    port=self.port,
+                    username=self.username,
+                    password=self.password,
+                    database=db_name,
+                    client=self.client,
+                    codec=self.codec,
+                    compression=self.compression,
+                    retry=self.retry,
+                    interceptors=self.interceptors,
+                )
+            )
+
+    async def version(self):
+        """Return the version of the ArangoDB server.
+
+        :returns: the version number
+        :rtype: str
+        :raises: VersionGetError
+        """
+        res = await self.api.get("/_api/version", params={"details": True})
+        if res.status_code not in HTTP_OK:
+            raise VersionGetError(res)
+        return res.obj["details"]
+
+    #######################
+    # Database Management #
+    #######################
+
+    async def databases(self):
+        """"Return the database names.
+
+        :returns: the database names
+        :rtype: dict
+        :raises: DatabaseListError
+        """
+        res = await self.api.get("/_api/database/user")
+        if res.status_code not in HTTP_OK:
+            raise DatabaseListError(res)
+        user_databases = res.obj["result"]
+
+        res = await self.api.get("/_api/database")
+        if res.status_code not in HTTP_OK:
+            raise DatabaseListError(res)
+        all_databases = res.obj["result"]
+
+        return {"all": all_databases, "user": user_databases}
+
+    async def db(self, name):
+        """Alias for self.database."""
+        return await self.database(name)
+
+    async def database(self, name):
+        """Return the ``AsyncDatabase`` object of the specified name.
+
+        :returns: the database object
+        :rtype: arango.aio.database.AsyncDatabase
+        :raises: DatabaseNotFoundError
+        """
+        if name in self._database_cache:
+            return self._database_cache[name]
+        await self._invalidate_database_cache()
+        if name not in self._database_cache:
+            raise DatabaseNotFoundError(name)
+        return self._database_cache[name]
+
+    async def create_database(self, name, users=None):
+        """Create a new database.
+
+        :param name: the name of the new database
+        :type name: str
+        :param users: the users configurations
+        :type users: dict
+        :returns: the AsyncDatabase object
+        :rtype: arango.aio.database.AsyncDatabase
+        :raises: DatabaseCreateError
+        """
+        data = {"name": name, "users": users} if users else {"name": name}
+        res = await self.api.post("/_api/database", data=data)
+        if res.status_code not in HTTP_OK:
+            raise DatabaseCreateError(res)
+        await self._invalidate_database_cache()
+        return await self.db(name)
+
+    async def delete_database(self, name, safe_delete=False):
+        """Remove the database of the specified name.
+
+        :param name: the name of the database to delete
+        :type name: str
+        :param safe_delete: whether to execute a safe delete (ignore 404)
+        :type safe_delete: bool
+        :raises: DatabaseDeleteError
+        """
+        res = await self.api.delete("/_api/database/{}".format(name))
+        if res.status_code not in HTTP_OK:
+            if not (res.status_code == 404 and safe_delete):
+                raise DatabaseDeleteError(res)
+        self._database_cache.pop(name, None)
@@ -0,0 +1,264 @@
+"""Wrapper for making asynchronous REST API calls to ArangoDB."""
+
+import asyncio
+import inspect
+
+from arango.api import BaseAPI
+from arango.clients.aio import AsyncioClient
+from arango.deadline import current
+from arango.retry import CONNECTION_ERRORS
+
+
+async def drive_async(steps):
+    """Run the step generator, awaiting the results which are awaitable.
+
+    This is the asynchronous counterpart of ``arango.steps.drive``.
+
+    :param steps: the step generator
+    :type steps: types.GeneratorType
+    :returns: the result of the step generator
+    :rtype: object
+    """
+    step = next(steps)
+    while True:
+        function, args = step
+        if function is None:
+            steps.close()
+            return args[0]
+        try:
+            result = function(*args)
+            if inspect.isawaitable(result):
+                result = await result
+        except Exception as error:
+            step = steps.throw(error)
+        else:
+            step = steps.send(result)
+
+
+class AsyncAPI(BaseAPI):
+    """Wrapper object which makes asynchronous REST API calls to ArangoDB.
+
+    This is the awaitable counterpart of ``arango.api.API``: every HTTP
+    method is a coroutine returning an ``arango.response.Response``.
+
+    :param protocol: the internet transfer protocol (default: 'http')
+    :type protocol: str
+    :param host: ArangoDB host (default: 'localhost')
+    :type host: str
+    :param port: ArangoDB port (default: 8529)
+    :type port: int or str
+    :param username: ArangoDB username (default: 'root')
+    :type username: str
+    :param password: ArangoDB password (default: '')
+    :type password: str
+    :param database: the ArangoDB database to point the API calls to
+    :type database: str
+    :param client: asynchronous HTTP client for this wrapper to use
+    :type client: arango.clients.aio.AsyncioClient or None
+    :param codec: the JSON codec name or instance (default: the fastest
+        installed, see ``arango.codec.get_codec``)
+    :type codec: str or arango.codec.Codec or None
+    :param timeout: the default connect and read timeouts of the requests
+        in seconds, a number for both or a (connect, read) tuple (default:
+        no timeout, only applies if ``client`` is not given)
+    :type timeout: int or float or tuple or None
+    :param compression: the compression settings for request and response
+        bodies (default: no compression)
+    :type compression: arango.compression.Compression or None
+    :param retry: the retry policy with the circuit breakers (default: no
+        retries)
+    :type retry: arango.retry.RetryPolicy or None
+    :param interceptors: the interceptors called around every request, in
+        order (hooks may be coroutines, see
+        ``arango.interceptors.Interceptor``)
+    :type interceptors: list or None
+    """
+
+    # The runner of the step generators and the retry wait
+    _drive = staticmethod(drive_async)
+    _sleep = staticmethod(asyncio.sleep)
+
+    def __init__(self, protocol="http", host="localhost", port=8529,
+                 username="root", password="", database=None, client=None,
+                 timeout=None, codec=None, compression=None,
+                 retry=None, interceptors=None):
+        super(AsyncAPI, self).__init__(
+            protocol, host, port, username, password, database, codec,
+            compression, retry, interceptors
+        )
+        if client is not None:
+            self.client = client
+        else:
+            client_init_data = {
+                "auth": (self.username, self.password),
+                "timeout": timeout,
+            }
+            self.client = AsyncioClient(client_init_data)
+
+    async def _request(self, method, path, data=None, params=None,
+                       headers=None, timeout=None):
+        """Make the request through the interceptors and the retry policy.
+
+        Every call to the REST API goes through here. The deadline active
+        when the request is made caps the timeout of each attempt.
+        """
+        request, content_type = self._prepare(
+            method, path, data, params, headers
+        )
+        active = current()
+
+        async def send():
+            kwargs = self._attempt(request, content_type, timeout, active)
+            try:
+                res = await getattr(self.client, method)(**kwargs)
+            except CONNECTION_ERRORS:
+                self._expired(active)
+                raise
+            return self._response(res)
+
+        return await drive_async(self._steps(request, send))
+
+    async def head(self, path, params=None, headers=None, timeout=None):
+        """Call a HEAD method in ArangoDB's REST API.
+
+        :param path: the API path (e.g. '/_api/version')
+        :type path: str
+        :param params: the request parameters
+        :type params: dict or None
+        :param headers: the request headers
+        :type headers: dict or None
+        :param timeout: the connect and read timeouts of the request in
+            seconds (default: the timeout of the client)
+        :type timeout: int or float or tuple or None
+        :returns: the ArangoDB http response
+        :rtype: arango.response.Response
+        """
+        return await self._request(
+            "head", path, params=params, headers=headers, timeout=timeout
+        )
+
+    async def get(self, path, params=None, headers=None, timeout=None):
+        """Call a GET method in ArangoDB's REST API.
+
+        :param path: the API path (e.g. '/_api/version')
+        :type path: str
+        :param params: the request parameters
+        :type params: dict or None
+        :param headers: the request headers
+        :type headers: dict or None
+        :param timeout: the connect and read timeouts of the request in
+            seconds (default: the timeout of the client)
+        :type timeout: int or float or tuple or None
+        :returns: the ArangoDB http response
+        :rtype: arango.response.Response
+        """
+        return await self._request(
+            "get", path, params=params, headers=headers, timeout=timeout
+        )
+
+    async def put(self, path, data=None, params=None, headers=None,
+                  timeout=None):
+        """Call a PUT method in ArangoDB's REST API.
+
+        :param path: the API path (e.g. '/_api/version')
+        :type path: str
+        :param data: the request payload
+        :type data: str or dict or None
+        :param params: the request parameters
+        :type params: dict or None
+        :param headers: the request headers
+        :type headers: dict or None
+        :param timeout: the connect and read timeouts of the request in
+            seconds (default: the timeout of the client)
+        :type timeout: int or float or tuple or None
+        :returns: the ArangoDB http response
+        :rtype: arango.response.Response
+        """
+        return await self._request(
+            "put", path, data, params, headers, timeout
+        )
+
+    async def post(self, path, data=None, params=None, headers=None,
+                   timeout=None):
+        """Call a POST method in ArangoDB's REST API.
+
+        :param path: the API path (e.g. '/_api/version')
+        :type path: str
+        :param data: the request payload
+        :type data: str or dict or None
+        :param params: the request parameters
+        :type params: dict or None
+        :param headers: the request headers
+        :type headers: dict or None
+        :param timeout: the connect and read timeouts of the request in
+            seconds (default: the timeout of the client)
+        :type timeout: int or float or tuple or None
+        :returns: the ArangoDB http response
+        :rtype: arango.response.Response
+        """
+        return await self._request(
+            "post", path, data, params, headers, timeout
+        )
+
+    async def patch(self, path, data=None, params=None, headers=None,
+                    timeout=None):
+        """Call a PATCH method in ArangoDB's REST API.
+
+        :param path: the API path (e.g. '/_api/version')
+        :type path: str
+        :param data: the request payload
+        :type data: str or dict or None
+        :param params: the request parameters
+        :type params: dict or None
+        :param headers: the request headers
+        :type headers: dict or None
+        :param timeout: the connect and read timeouts of the request in
+            seconds (default: the timeout of the client)
+        :type timeout: int or float or tuple or None
+        :returns: the ArangoDB http response
+        :rtype: arango.response.Response
+        """
+        return await self._request(
+            "patch", path, data, params, headers, timeout
+        )
+
+    async def delete(self, path, params=None, headers=None, timeout=None):
+        """Call a DELETE method in ArangoDB's REST API.
+
+        :param path: the API path (e.g. '/_api/version')
+        :type path: str
+        :param params: the request parameters
+        :type params: dict or None
+        :param headers: the request headers
+        :type headers: dict or None
+        :param timeout: the connect and read timeouts of the request in
+            seconds (default: the timeout of the client)
+        :type timeout: int or float or tuple or None
+        :returns: the ArangoDB http response
+        :rtype: arango.response.Response
+        """
+        return await self._request(
+            "delete", path, params=params, headers=headers, timeout=timeout
+        )
+
+    async def options(self, path, data=None, params=None, headers=None,
+                      timeout=None):
+        """Call an OPTIONS method in ArangoDB's REST API.
+
+        :param path: the API path (e.g. '/_api/version')
+        :type path: str
+        :param data: the request payload
+        :type data: str or dict or None
+        :param params: the request parameters
+        :type params: dict or None
+        :param headers: the request headers
+        :type headers: dict or None
+        :param timeout: the connect and read timeouts of the request in
+            seconds (default: the timeout of the client)
+        :type timeout: int or float or tuple or None
+        :returns: the ArangoDB http response
+        :rtype: arango.response.Response
+        """
+        return await self._request(
+            "options", path, data, params, headers, timeout
+        )
@@ -0,0 +1,492 @@
+"""ArangoDB asynchronous Collection."""
+
+from arango.utils import camelify, uncamelify, stream_lines
+from arango.exceptions import *
+from arango.aio.cursor import AsyncCursor
+from arango.constants import COLLECTION_STATUSES, HTTP_OK
+
+
+class AsyncCollection(object):
+    """Awaitable counterpart of ``arango.collection.Collection``.
+
+    1. Collection Properties
+    2. Document Management
+    3. Document Import & Export
+    4. Simple Queries
+    """
+
+    def __init__(self, name, api, is_edge=False):
+        """Initialize the wrapper object.
+
+        Unlike the synchronous wrapper, the collection type is not looked up
+        on initialization and must be given by the caller.
+
+        :param name: the name of this collection
+        :type name: str
+        :param api: ArangoDB asynchronous API object
+        :type api: arango.aio.api.AsyncAPI
+        :param is_edge: whether or not this is an edge collection
+        :type is_edge: bool
+        """
+        self.name = name
+        self.api = api
+        self.type = "edge" if is_edge else "document"
+
+    def __aiter__(self):
+        """Iterate asynchronously through the documents in this collection."""
+        return _LazyCursor(self.all())
+
+    #########################
+    # Collection Properties #
+    #########################
+
+    async def count(self):
+        """Return the number of documents present in this collection.
+
+        :returns: the number of documents
+        :rtype: int
+        :raises: CollectionGetError
+        """
+        res = await self.api.get(
+            "/_api/collection/{}/count".format(self.name)
+        )
+        if res.status_code not in HTTP_OK:
+            raise CollectionGetError(res)
+        return res.obj["count"]
+
+    async def properties(self):
+        """Return the properties of this collection.
+
+        :returns: the collection's id, status, key_options etc.
+        :rtype: dict
+        :raises: CollectionGetError
+        """
+        res = await self.api.get(
+            "/_api/collection/{}/properties".format(self.name)
+        )
+        if res.status_code not in HTTP_OK:
+            raise CollectionGetError(res)
+        return {
+            "id": res.obj["id"],
+            "name": res.obj["name"],
+            "is_edge": res.obj["type"] == 3,
+            "status": COLLECTION_STATUSES.get(
+                res.obj["status"],
+                "corrupted ({})".format(res.obj["status"])
+            ),
+            "do_compact": res.obj["doCompact"],
+            "is_system": res.obj["isSystem"],
+            "is_volatile": res.obj["isVolatile"],
+            "journal_size": res.obj["journalSize"],
+            "wait_for_sync": res.obj["waitForSync"],
+            "key_options": uncamelify(res.obj["keyOptions"])
+        }
+
+    async def set_properties(self, wait_for_sync=None, journal_size=None):
+        """Update the mutable properties of this collection.
+
+        :param wait_for_sync: whether or not to wait for sync to disk
+        :type wait_for_sync: bool or None
+        :param journal_size: the max size of the journal or datafile
+        :type journal_size: int or None
+        :raises: CollectionUpdateError
+        """
+        data = {}
+        if wait_for_sync is not None:
+            data[camelify("wait_for_sync")] = wait_for_sync
+        if journal_size is not None:
+            data[camelify("journal_size")] = journal_size
+        res = await self.api.put(
+            "/_api/collection/{}/properties".format(self.name), data=data
+        )
+        if res.status_code not in HTTP_OK:
+            raise CollectionUpdateError(res)
+
+    async def revision(self):
+        """Return the revision of this collection.
+
+        :returns: the collection revision (etag)
+        :rtype: str
+        :raises: CollectionGetError
+        """
+        res = await self.api.get(
+            "/_api/collection/{}/revision".format(self.name)
+        )
+        if res.status_code not in HTTP_OK:
+            raise CollectionGetError(res)
+        return res.obj["revision"]
+
+    async def truncate(self):
+        """Delete all documents from this collection.
+
+        :raises: CollectionTruncateError
+        """
+        res = await self.api.put(
+            "/_api/collection/{}/truncate".format(self.name)
+        )
+        if res.status_code not in HTTP_OK:
+            raise CollectionTruncateError(res)
+
+    async def contains(self, key):
+        """Return True if the document exists in this collection.
+
+        :param key: the document key
+        :type key: str
+        :returns: True if the document exists, else False
+        :rtype: bool
+        :raises: DocumentGetError
+        """
+        res = await self.api.head(
+            "/_api/{}/{}/{}".format(self.type, self.name, key)
+        )
+        if res.status_code == 200:
+            return True
+        elif res.status_code == 404:
+            return False
+        else:
+            raise DocumentGetError(res)
+
+    #######################
+    # Document Management #
+    #######################
+
+    async def document(self, key, rev=None, match=True):
+        """Return the document of the given key.
+
+        See ``arango.collection.Collection.document`` for details.
+
+        :param key: the key of the document to retrieve
+        :type key: str
+        :param rev: the document revision is compared against this value
+        :type rev: str or None
+        :param match: whether or not the revision should match
+        :type match: bool
+        :returns: the requested document or None if not found
+        :rtype: dict or None
+        :raises: DocumentRevisionError, DocumentGetError
+        """
+        res = await self.api.get(
+            "/_api/{}/{}/{}".format(self.type, self.name, key),
+            headers={
+                "If-Match" if match else "If-None-Match": rev
+            } if rev else {}
+        )
+        if res.status_code in {412, 304}:
+            raise DocumentRevisionError(res)
+        elif res.status_code == 404:
+            return None
+        elif res.status_code not in HTTP_OK:
+            raise DocumentGetError(res)
+        return res.obj
+
+    async def create_document(self, data, wait_for_sync=False):
+        """Create a new document to this collection.
+
+        See ``arango.collection.Collection.create_document`` for details.
+
+        :param data: the body of the new document
+        :type data: dict
+        :param wait_for_sync: wait for create to sync to disk
+        :type wait_for_sync: bool
+        :returns: the id, rev and key of the new document
+        :rtype: dict
+        :raises: DocumentInvalidError, DocumentCreateError
+        """
+        if self.type == "edge":
+            if "_to" not in data:
+                raise DocumentInvalidError(
+                    "the new document data is missing the '_to' key")
+            if "_from" not in data:
+                raise DocumentInvalidError(
+                    "the new document data is missing the '_from' key")
+        params = {
+            "collection": self.name,
+            "waitForSync": wait_for_sync,
+        }
+        if "_from" in data:
+            params["from"] = data["_from"]
+        if "_to" in data:
+            params["to"] = data["_to"]
+        res = await self.api.post(
+            "/_api/{}".format(self.type), data=data, params=params
+        )
+        if res.status_code not in HTTP_OK:
+            raise DocumentCreateError(res)
+        return res.obj
+
+    async def update_document(self, key, data, rev=None, keep_none=True,
+                              wait_for_sync=False):
+        """Update the specified document in this collection.
+
+        See ``arango.collection.Collection.update_document`` for details.
+
+        :param key: the key of the document to be updated
+        :type key: str
+        :param data: the body to update the document with
+        :type data: dict
+        :param rev: the document revision must match this value
+        :type rev: str or None
+        :param keep_none: whether or not to keep the items with value None
+        :type keep_none: bool
+        :param wait_for_sync: wait for the update to sync to disk
+        :type wait_for_sync: bool
+        :returns: the id, rev and key of the updated document
+        :rtype: dict
+        :raises: DocumentRevisionError, DocumentUpdateError
+        """
+        params = {
+            "waitForSync": wait_for_sync,
+            "keepNull": keep_none
+        }
+        if rev is not None:
+            params["rev"] = rev
+            params["policy"] = "error"
+        elif "_rev" in data:
+            params["rev"] = data["_rev"]
+            params["policy"] = "error"
+        res = await self.api.patch(
+            "/_api/{}/{}/{}".format(self.type, self.name, key),
+            data=data,
+            params=params
+        )
+        if res.status_code == 412:
+            raise DocumentRevisionError(res)
+        if res.status_code not in HTTP_OK:
+            raise DocumentUpdateError(res)
+        del res.obj["error"]
+        return res.obj
+
+    async def replace_document(self, key, data, rev=None,
+                               wait_for_sync=False):
+        """Replace the specified document in this collection.
+
+        See ``arango.collection.Collection.replace_document`` for details.
+
+        :param key: the key of the document to be replaced
+        :type key: str
+        :param data: the body to replace the document with
+        :type data: dict
+        :param rev: the document revision must match this value
+        :type rev: str or None
+        :param wait_for_sync: wait for the replace to sync to disk
+        :type wait_for_sync: bool
+        :returns: the id, rev and key of the replaced document
+        :rtype: dict
+        :raises: DocumentRevisionError, DocumentReplaceError
+        """
+        params = {"waitForSync": wait_for_sync}
+        if rev is not None:
+            params["rev"] = rev
+            params["policy"] = "error"
+        elif "_rev" in data:
+            params["rev"] = data["_rev"]
+            params["policy"] = "error"
+        res = await self.api.put(
+            "/_api/{}/{}/{}".format(self.type, self.name, key),
+            data=data,
+            params=params
+        )
+        if res.status_code == 412:
+            raise DocumentRevisionError(res)
+        elif res.status_code not in HTTP_OK:
+            raise DocumentReplaceError(res)
+        del res.obj["error"]
+        return res.obj
+
+    async def delete_document(self, key, rev=None, wait_for_sync=False):
+        """Delete the specified document from this collection.
+
+        :param key: the key of the document to be deleted
+        :type key: str
+        :param rev: the document revision must match this value
+        :type rev: str or None
+        :param wait_for_sync: wait for the delete to sync to disk
+        :type wait_for_sync: bool
+        :returns: the id, rev and key of the deleted document
+        :rtype: dict
+        :raises: DocumentRevisionError, DocumentDeleteError
+        """
+        params = {"waitForSync": wait_for_sync}
+        if rev is not None:
+            params["rev"] = rev
+            params["policy"] = "error"
+        res = await self.api.delete(
+            "/_api/{}/{}/{}".format(self.type, self.name, key),
+            params=params
+        )
+        if res.status_code == 412:
+            raise DocumentRevisionError(res)
+        elif res.status_code not in {200, 202}:
+            raise DocumentDeleteError(res)
+        del res.obj["error"]
+        return res.obj
+
+    ############################
+    # Document Import & Export #
+    ############################
+
+    async def import_documents(self, documents, complete=True, details=True):
+        """Import documents into this collection in bulk.
+
+        See ``arango.collection.Collection.import_documents`` for details.
+
+        Documents other than lists and tuples (e.g. generators) are encoded
+        lazily and streamed to the server, so the memory use stays constant
+        regardless of the number of documents.
+
+        :param documents: the documents to import
+        :type documents: list or collections.Iterable
+        :param complete: entire import fails if any document is invalid
+        :type complete: bool
+        :param details: return details about invalid documents
+        :type details: bool
+        :returns: the import results
+        :rtype: dict
+        :raises: DocumentsImportError
+        """
+        codec = self.api.codec
+        if codec.binary and isinstance(documents, (list, tuple)):
+            # Binary formats are sent as a single array of documents
+            data = codec.encode(documents)
+            import_type = "list"
+            headers = {"Content-Type": codec.content_type}
+        else:
+            # Stream one JSON document per line
+            data = stream_lines(
+                documents, getattr(codec, "json_codec", codec).encode
+            )
+            import_type = "documents"
+            headers = None
+        res = await self.api.post(
+            "/_api/import",
+            data=data,
+            params={
+                "type": import_type,
+                "collection": self.name,
+                "complete": complete,
+                "details": details
+            },
+            headers=headers
+        )
+        if res.status_code not in HTTP_OK:
+            raise DocumentsImportError(res)
+        del res.obj["error"]
+        return res.obj
+
+    ##################
+    # Simple Queries #
+    ##################
+
+    async def all(self, skip=None, limit=None):
+        """Return all documents in this collection.
+
+        ``skip`` is applied before ``limit`` if both are provided.
+
+        :param skip: the number of documents to skip
+        :type skip: int
+        :param limit: maximum number of documents to return
+        :type limit: int
+        :returns: the cursor over all documents
+        :rtype: arango.aio.cursor.AsyncCursor
+        :raises: SimpleQueryAllError
+        """
+        data = {"collection": self.name}
+        if skip is not None:
+            data["skip"] = skip
+        if limit is not None:
+            data["limit"] = limit
+        res = await self.api.put("/_api/simple/all", data=data)
+        if res.status_code not in HTTP_OK:
+            raise SimpleQueryAllError(res)
+        return AsyncCursor(self.api, res)
+
+    async def any(self):
+        """Return a random document from this collection.
+
+        :returns: the random document
+        :rtype: dict
+        :raises: SimpleQueryAnyError
+        """
+        res = await self.api.put(
+            "/_api/simple/any",
+            data={"collection": self.name}
+        )
+        if res.status_code not in HTTP_OK:
+            raise SimpleQueryAnyError(res)
+        return res.obj["document"]
+
+    async def get_first_example(self, example):
+        """Return the first document matching the given example document body.
+
+        :param example: the example document body
+        :type example: dict
+        :returns: the first matching document
+        :rtype: dict or None
+        :raises: SimpleQueryFirstExampleError
+        """
+        data = {"collection": self.name, "example": example}
+        res = await self.api.put("/_api/simple/first-example", data=data)
+        if res.status_code == 404:
+            return None
+        elif res.status_code not in HTTP_OK:
+            raise SimpleQueryFirstExampleError(res)
+        return res.obj["document"]
+
+    async def get_by_example(self, example, skip=None, limit=None):
+        """Return all documents matching the given example document body.
+
+        ``skip`` is applied before ``limit`` if both are provided.
+
+        :param example: the example document body
+        :type example: dict
+        :param skip: the number of documents to skip
+        :type skip: int
+        :param limit: maximum number of documents to return
+        :type limit: int
+        :returns: the cursor over the matching documents
+        :rtype: arango.aio.cursor.AsyncCursor
+        :raises: SimpleQueryGetByExampleError
+        """
+        data = {"collection": self.name, "example": example}
+        if skip is not None:
+            data["skip"] = skip
+        if limit is not None:
+            data["limit"] = limit
+        res = await self.api.put("/_api/simple/by-example", data=data)
+        if res.status_code not in HTTP_OK:
+            raise SimpleQueryGetByExampleError(res)
+        return AsyncCursor(self.api, res)
+
+    async def lookup_by_keys(self, keys):
+        """Return all documents whose key is in ``keys``.
+
+        :param keys: keys of documents to lookup
+        :type keys: list
+        :returns: the list of documents
+        :rtype: list
+        :raises: SimpleQueryLookupByKeysError
+        """
+        data = {
+            "collection": self.name,
+            "keys": keys,
+        }
+        res = await self.api.put("/_api/simple/lookup-by-keys", data=data)
+        if res.status_code not in HTTP_OK:
+            raise SimpleQueryLookupByKeysError(res)
+        return res.obj["documents"]
+
+
+class _LazyCursor(object):
+    """Asynchronous iterator which awaits the cursor on first use."""
+
+    def __init__(self, cursor_coroutine):
+        self._cursor_coroutine = cursor_coroutine
+        self._cursor = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._cursor is None:
+            self._cursor = await self._cursor_coroutine
+        return await self._cursor.__anext__()
@@ -0,0 +1,240 @@
+"""ArangoDB asynchronous Cursor."""
+
+import asyncio
+
+from arango.constants import HTTP_OK
+from arango.cursor import _ArrayColumns, _NumpyColumns
+from arango.deadline import activate, current
+from arango.exceptions import (
+    CursorGetNextError,
+    CursorDeleteError,
+)
+from arango.utils import uncamelify
+
+
+async def _prefetch(api, path, buffer, state):
+    """Fetch the batches of a cursor ahead of its consumer.
+
+    The responses (or the exception which ended the fetching) are put into
+    ``buffer``; ``state`` tracks whether the server has results left.
+    """
+    try:
+        while state["has_more"]:
+            res = await api.put(path)
+            if res.status_code not in HTTP_OK:
+                raise CursorGetNextError(res)
+            state["has_more"] = res.obj["hasMore"]
+            await buffer.put(res)
+    except Exception as error:
+        await buffer.put(error)
+
+
+class AsyncCursor(object):
+    """Asynchronous iterator over the results of a server cursor.
+
+    The next batch is requested from the server only once the current one
+    is exhausted. Use ``async for`` to iterate over the individual items,
+    or ``async for`` over ``batches()`` to receive whole batches. Cursors
+    not consumed to the end should be closed with ``close`` or by using
+    them as asynchronous context managers.
+
+    With ``prefetch``, a background task requests the following batches
+    while the current one is being consumed, holding up to ``prefetch``
+    of them ready.
+
+    The deadline active when the cursor is created (see ``arango.deadline``)
+    also applies to the batches requested while it is being consumed.
+
+    :param api: ArangoDB asynchronous API wrapper object
+    :type api: arango.aio.api.AsyncAPI
+    :param response: ArangoDB response object
+    :type response: arango.response.Response
+    :param prefetch: the number of batches to fetch ahead of the consumer
+        (default: 0, fetch every batch only when it is needed)
+    :type prefetch: int
+    """
+
+    def __init__(self, api, response, prefetch=0):
+        self.api = api
+        self._fields = response.obj
+        self._batch = list(response.obj["result"])
+        self._has_more = response.obj.get("hasMore", False)
+        self._id = response.obj.get("id")
+        self._index = 0
+        self._deadline = current()
+        self._prefetcher = None
+        if prefetch > 0 and self._has_more:
+            self._buffer = asyncio.Queue(prefetch)
+            self._state = {"has_more": True}
+            with activate(self._deadline):
+                # The task runs in a copy of the current context
+                self._prefetcher = asyncio.ensure_future(_prefetch(
+                    api, "/_api/cursor/{}".format(self._id), self._buffer,
+                    self._state
+                ))
+
+    def __del__(self):
+        if self._prefetcher is not None:
+            self._prefetcher.cancel()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def count(self):
+        """Return the total number of results.
+
+        :returns: the number of results, or None if the query was not run
+            with ``count=True``
+        :rtype: int or None
+        """
+        return self._fields.get("count")
+
+    @property
+    def extra(self):
+        """Return the extra information about the query result.
+
+        :returns: the warnings and statistics reported by the server
+        :rtype: dict
+        """
+        return self._fields.get("extra") or {}
+
+    @property
+    def stats(self):
+        """Return the statistics of the query execution.
+
+        :returns: e.g. the number of scanned documents (``scanned_full``,
+            ``scanned_index``), ``execution_time`` and ``full_count``
+        :rtype: dict
+        """
+        return uncamelify(self.extra.get("stats") or {})
+
+    @property
+    def full_count(self):
+        """Return the number of results before the last LIMIT of the query.
+
+        :returns: the full count, or None if the query was not run with
+            ``full_count=True``
+        :rtype: int or None
+        """
+        return self.stats.get("full_count")
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while self._index >= len(self._batch):
+            if not self._has_more:
+                await self.close()
+                raise StopAsyncIteration
+            await self._fetch_next()
+        item = self._batch[self._index]
+        self._index += 1
+        return item
+
+    async def _fetch_next(self):
+        """Request the next batch from the server cursor."""
+        if self._prefetcher is not None:
+            res = await self._buffer.get()
+            if isinstance(res, Exception):
+                self._has_more = False
+                raise res
+        else:
+            with activate(self._deadline):
+                res = await self.api.put(
+                    "/_api/cursor/{}".format(self._id)
+                )
+        if res.status_code not in HTTP_OK:
+            raise CursorGetNextError(res)
+        self._batch = res.obj["result"]
+        self._has_more = res.obj["hasMore"]
+        self._index = 0
+
+    async def batches(self):
+        """Iterate over the remaining results one batch at a time.
+
+        :returns: the asynchronous generator of batches (lists)
+        :raises: CursorGetNextError, CursorDeleteError
+        """
+        while True:
+            batch = self._batch[self._index:]
+            self._batch, self._index = [], 0
+            if batch:
+                yield batch
+            if not self._has_more:
+                break
+            await self._fetch_next()
+        await self.close()
+
+    async def to_columns(self, fields, typecodes=None):
+        """Return the values of the fields in the remaining results.
+
+        See ``arango.cursor.Cursor.to_columns``.
+
+        :param fields: the names of the fields
+        :type fields: list
+        :param typecodes: the ``array`` type codes of the columns by field
+            name; other columns are lists
+        :type typecodes: dict or None
+        :returns: the columns by field name
+        :rtype: dict
+        :raises: CursorGetNextError, CursorDeleteError
+        """
+        columns = _ArrayColumns(fields, self.count(), typecodes)
+        async for batch in self.batches():
+            columns.add(batch)
+        return columns.result()
+
+    async def to_numpy(self, fields, dtypes=None):
+        """Return the values of the fields in the remaining results.
+
+        See ``arango.cursor.Cursor.to_numpy``.
+
+        :param fields: the names of the fields
+        :type fields: list
+        :param dtypes: the NumPy data types of the columns by field name
+        :type dtypes: dict or None
+        :returns: the columns by field name
+        :rtype: dict
+        :raises: InvalidArgumentError, CursorGetNextError,
+            CursorDeleteError
+        """
+        columns = _NumpyColumns(fields, self.count(), dtypes)
+        async for batch in self.batches():
+            columns.add(batch)
+        return columns.result()
+
+    async def to_list(self):
+        """Return all the remaining results in a list.
+
+        :returns: the remaining results
+        :rtype: list
+        :raises: CursorGetNextError, CursorDeleteError
+        """
+        return [item async for item in self]
+
+    async def close(self):
+        """Delete the server cursor if it is still alive.
+
+        :raises: CursorDeleteError
+        """
+        if self._id is None:
+            return
+        cursor_id, self._id = self._id, None
+        if not self._has_more:
+            return
+        self._has_more = False
+        if self._prefetcher is not None:
+            self._prefetcher.cancel()
+            try:
+                await self._prefetcher
+            except (asyncio.CancelledError, Exception):
+                pass
+            if not self._state["has_more"]:
+                return
+        with activate(self._deadline):
+            res = await self.api.delete("/_api/cursor/{}".format(cursor_id))
+        if res.status_code not in HTTP_OK and res.status_code != 404:
+            raise CursorDeleteError(res)
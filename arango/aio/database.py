@@ -0,0 +1,419 @@
+"""ArangoDB asynchronous Database."""
+
+from arango.aql import unpack
+from arango.utils import uncamelify
+from arango.aio.graph import AsyncGraph
+from arango.aio.collection import AsyncCollection
+from arango.aio.cursor import AsyncCursor
+from arango.constants import HTTP_OK
+from arango.deadline import current
+from arango.exceptions import *
+
+
+class AsyncDatabase(object):
+    """Awaitable counterpart of ``arango.database.Database``.
+
+    1. Database properties
+    2. Collection Management
+    3. AQL Queries
+    4. Transaction
+    5. Graph Management
+    """
+
+    def __init__(self, name, api):
+        """Initialize the wrapper object.
+
+        :param name: the name of this database
+        :type name: str
+        :param api: ArangoDB asynchronous API object
+        :type api: arango.aio.api.AsyncAPI
+        """
+        self.name = name
+        self.api = api
+        self._collection_cache = {}
+        self._graph_cache = {}
+
+    async def _update_collection_cache(self):
+        """Invalidate the collection cache."""
+        res = await self.api.get("/_api/collection")
+        if res.status_code not in HTTP_OK:
+            raise CollectionListError(res)
+        real_cols = {
+            col["name"]: col["type"] == 3 for col in res.obj["collections"]
+        }
+        for col_name in set(self._collection_cache) - set(real_cols):
+            del self._collection_cache[col_name]
+        for col_name in set(real_cols) - set(self._collection_cache):
+            self._collection_cache[col_name] = AsyncCollection(
+                name=col_name, api=self.api, is_edge=real_cols[col_name]
+            )
+
+    async def _update_graph_cache(self):
+        """Invalidate the graph cache."""
+        real_graphs = set(await self.graphs())
+        cached_graphs = set(self._graph_cache)
+        for graph_name in cached_graphs - real_graphs:
+            del self._graph_cache[graph_name]
+        for graph_name in real_graphs - cached_graphs:
+            self._graph_cache[graph_name] = AsyncGraph(
+                name=graph_name, api=self.api
+            )
+
+    async def properties(self):
+        """Return all properties of this database.
+
+        :returns: the database properties
+        :rtype: dict
+        :raises: DatabasePropertyError
+        """
+        res = await self.api.get("/_api/database/current")
+        if res.status_code not in HTTP_OK:
+            raise DatabasePropertyError(res)
+        return uncamelify(res.obj["result"])
+
+    ###############
+    # AQL Queries #
+    ###############
+
+    async def explain_query(self, query, all_plans=False, max_plans=None,
+                            optimizer_rules=None, bind_vars=None):
+        """Explain the AQL query.
+
+        See ``arango.database.Database.explain_query`` for details.
+
+        :param query: the AQL query to explain
+        :type query: str or arango.aql.Query
+        :param all_plans: whether or not to return all execution plans
+        :type all_plans: bool
+        :param max_plans: maximum number of plans the optimizer generates
+        :type max_plans: None or int
+        :param optimizer_rules: list of optimizer rules
+        :type optimizer_rules: list
+        :param bind_vars: the bind variables of the query
+        :type bind_vars: dict
+        :returns: the query plan or list of plans (if all_plans is True)
+        :rtype: dict or list
+        :raises: AQLQueryExplainError
+        """
+        query, bind_vars = unpack(query, bind_vars)
+        options = {"allPlans": all_plans}
+        if max_plans is not None:
+            options["maxNumberOfPlans"] = max_plans
+        if optimizer_rules is not None:
+            options["optimizer"] = {"rules": optimizer_rules}
+        data = {"query": query, "options": options}
+        if bind_vars is not None:
+            data["bindVars"] = bind_vars
+        res = await self.api.post("/_api/explain", data=data)
+        if res.status_code not in HTTP_OK:
+            raise AQLQueryExplainError(res)
+        if "plan" in res.obj:
+            return uncamelify(res.obj["plan"])
+        else:
+            return uncamelify(res.obj["plans"])
+
+    async def validate_query(self, query):
+        """Validate the AQL query.
+
+        :param query: the AQL query to validate
+        :type query: str
+        :raises: AQLQueryValidateError
+        """
+        res = await self.api.post("/_api/query", data={"query": query})
+        if res.status_code not in HTTP_OK:
+            raise AQLQueryValidateError(res)
+
+    async def execute_query(self, query, count=False, batch_size=None,
+                            ttl=None, bind_vars=None, full_count=None,
+                            max_plans=None, optimizer_rules=None,
+                            max_runtime=None, prefetch=0):
+        """Execute the AQL query and return the result cursor.
+
+        See ``arango.database.Database.execute_query`` for details.
+
+        :param query: the AQL query to execute
+        :type query: str or arango.aql.Query
+        :param count: whether or not the document count should be returned
+        :type count: bool
+        :param batch_size: maximum number of documents in one round trip
+        :type batch_size: int
+        :param ttl: time-to-live for the cursor (in seconds)
+        :type ttl: int
+        :param bind_vars: key-value pairs of bind parameters
+        :type bind_vars: dict
+        :param full_count: whether or not to include count before last LIMIT
+        :param max_plans: maximum number of plans the optimizer generates
+        :type max_plans: None or int
+        :param optimizer_rules: list of optimizer rules
+        :type optimizer_rules: list
+        :param max_runtime: abort the query on the server after this many
+            seconds (default: the time left before the active deadline, if
+            any, see ``arango.deadline``)
+        :type max_runtime: int or float or None
+        :param prefetch: the number of batches to fetch in the background
+            while the current one is consumed
+        :type prefetch: int
+        :returns: the cursor from executing the query
+        :rtype: arango.aio.cursor.AsyncCursor
+        :raises: AQLQueryExecuteError, InvalidArgumentError
+        """
+        query, bind_vars = unpack(query, bind_vars)
+        options = {}
+        if full_count is not None:
+            options["fullCount"] = full_count
+        if max_plans is not None:
+            options["maxNumberOfPlans"] = max_plans
+        if optimizer_rules is not None:
+            options["optimizer"] = {"rules": optimizer_rules}
+        active = current()
+        if max_runtime is None and active is not None:
+            max_runtime = active.timeout()
+        if max_runtime is not None:
+            options["maxRuntime"] = max_runtime
+
+        data = {
+            "query": query,
+            "count": count,
+        }
+        if batch_size is not None:
+            data["batchSize"] = batch_size
+        if ttl is not None:
+            data["ttl"] = ttl
+        if bind_vars is not None:
+            data["bindVars"] = bind_vars
+        if options:
+            data["options"] = options
+
+        res = await self.api.post("/_api/cursor", data=data)
+        if res.status_code not in HTTP_OK:
+            raise AQLQueryExecuteError(res)
+        return AsyncCursor(self.api, res, prefetch=prefetch)
+
+    #########################
+    # Collection Management #
+    #########################
+
+    async def collections(self):
+        """Return the names of the collections in this database.
+
+        :returns: the names of the collections
+        :rtype: dict
+        :raises: CollectionListError
+        """
+        res = await self.api.get("/_api/collection")
+        if res.status_code not in HTTP_OK:
+            raise CollectionListError(res)
+
+        user_collections = []
+        system_collections = []
+        for collection in res.obj["collections"]:
+            if collection["isSystem"]:
+                system_collections.append(collection["name"])
+            else:
+                user_collections.append(collection["name"])
+        return {
+            "user": user_collections,
+            "system": system_collections,
+            "all": user_collections + system_collections,
+        }
+
+    async def col(self, name):
+        """Alias for self.collection."""
+        return await self.collection(name)
+
+    async def collection(self, name):
+        """Return the AsyncCollection object of the specified name.
+
+        :param name: the name of the collection
+        :type name: str
+        :returns: the requested collection object
+        :rtype: arango.aio.collection.AsyncCollection
+        :raises: TypeError, CollectionNotFoundError
+        """
+        if not isinstance(name, str):
+            raise TypeError("Expecting a str.")
+        if name in self._collection_cache:
+            return self._collection_cache[name]
+        await self._update_collection_cache()
+        if name not in self._collection_cache:
+            raise CollectionNotFoundError(name)
+        return self._collection_cache[name]
+
+    async def create_collection(self, name, wait_for_sync=False,
+                                do_compact=True, journal_size=None,
+                                is_system=False, is_edge=False,
+                                is_volatile=False,
+                                key_generator_type="traditional",
+                                shard_keys=None, allow_user_keys=True,
+                                key_offset=None, key_increment=None,
+                                number_of_shards=None):
+        """Create a new collection to this database.
+
+        See ``arango.database.Database.create_collection`` for details.
+
+        :param name: name of the new collection
+        :type name: str
+        :returns: the new collection object
+        :rtype: arango.aio.collection.AsyncCollection
+        :raises: CollectionCreateError
+        """
+        key_options = {
+            "type": key_generator_type,
+            "allowUserKeys": allow_user_keys
+        }
+        if key_increment is not None:
+            key_options["increment"] = key_increment
+        if key_offset is not None:
+            key_options["offset"] = key_offset
+        data = {
+            "name": name,
+            "waitForSync": wait_for_sync,
+            "doCompact": do_compact,
+            "isSystem": is_system,
+            "isVolatile": is_volatile,
+            "type": 3 if is_edge else 2,
+            "keyOptions": key_options
+        }
+        if journal_size is not None:
+            data["journalSize"] = journal_size
+        if number_of_shards is not None:
+            data["numberOfShards"] = number_of_shards
+        if shard_keys is not None:
+            data["shardKeys"] = shard_keys
+
+        res = await self.api.post("/_api/collection", data=data)
+        if res.status_code not in HTTP_OK:
+            raise CollectionCreateError(res)
+        collection = AsyncCollection(name=name, api=self.api, is_edge=is_edge)
+        self._collection_cache[name] = collection
+        return collection
+
+    async def delete_collection(self, name):
+        """Delete the specified collection from this database.
+
+        :param name: the name of the collection to delete
+        :type name: str
+        :raises: CollectionDeleteError
+        """
+        res = await self.api.delete("/_api/collection/{}".format(name))
+        if res.status_code not in HTTP_OK:
+            raise CollectionDeleteError(res)
+        self._collection_cache.pop(name, None)
+
+    ################
+    # Transactions #
+    ################
+
+    async def execute_transaction(self, action, read_collections=None,
+                                  write_collections=None, params=None,
+                                  wait_for_sync=False, lock_timeout=None):
+        """Execute the transaction and return the result.
+
+        See ``arango.database.Database.execute_transaction`` for details.
+
+        :param action: the javascript commands to be executed
+        :type action: str
+        :param read_collections: the collections read
+        :type read_collections: str or list or None
+        :param write_collections: the collections written to
+        :type write_collections: str or list or None
+        :param params: Parameters for the function in action
+        :type params: list or dict or None
+        :param wait_for_sync: wait for the transaction to sync to disk
+        :type wait_for_sync: bool
+        :param lock_timeout: timeout for waiting on collection locks
+        :type lock_timeout: int or None
+        :returns: the results of the execution
+        :rtype: dict
+        :raises: TransactionExecuteError
+        """
+        data = {"collections": {}, "action": action}
+        if read_collections is not None:
+            data["collections"]["read"] = read_collections
+        if write_collections is not None:
+            data["collections"]["write"] = write_collections
+        if params is not None:
+            data["params"] = params
+        http_params = {
+            "waitForSync": wait_for_sync,
+            "lockTimeout": lock_timeout,
+        }
+        res = await self.api.post(
+            "/_api/transaction", data=data, params=http_params
+        )
+        if res.status_code not in HTTP_OK:
+            raise TransactionExecuteError(res)
+        return res.obj["result"]
+
+    ####################
+    # Graph Management #
+    ####################
+
+    async def graphs(self):
+        """List all graphs in this database.
+
+        :returns: the graphs in this database
+        :rtype: list
+        :raises: GraphListError
+        """
+        res = await self.api.get("/_api/gharial")
+        if res.status_code not in (200, 202):
+            raise GraphListError(res)
+        return [graph["_key"] for graph in res.obj["graphs"]]
+
+    async def graph(self, name):
+        """Return the AsyncGraph object of the specified name.
+
+        :param name: the name of the graph
+        :type name: str
+        :returns: the requested graph object
+        :rtype: arango.aio.graph.AsyncGraph
+        :raises: TypeError, GraphNotFoundError
+        """
+        if not isinstance(name, str):
+            raise TypeError("Expecting a str.")
+        if name in self._graph_cache:
+            return self._graph_cache[name]
+        await self._update_graph_cache()
+        if name not in self._graph_cache:
+            raise GraphNotFoundError(name)
+        return self._graph_cache[name]
+
+    async def create_graph(self, name, edge_definitions=None,
+                           orphan_collections=None):
+        """Create a new graph in this database.
+
+        :param name: name of the new graph
+        :type name: str
+        :param edge_definitions: definitions for edges
+        :type edge_definitions: list
+        :param orphan_collections: names of additional vertex collections
+        :type orphan_collections: list
+        :returns: the graph object
+        :rtype: arango.aio.graph.AsyncGraph
+        :raises: GraphCreateError
+        """
+        data = {"name": name}
+        if edge_definitions is not None:
+            data["edgeDefinitions"] = edge_definitions
+        if orphan_collections is not None:
+            data["orphanCollections"] = orphan_collections
+
+        res = await self.api.post("/_api/gharial", data=data)
+        if res.status_code not in HTTP_OK:
+            raise GraphCreateError(res)
+        graph = AsyncGraph(name=name, api=self.api)
+        self._graph_cache[name] = graph
+        return graph
+
+    async def delete_graph(self, name):
+        """Delete the graph of the given name from this database.
+
+        :param name: the name of the graph to delete
+        :type name: str
+        :raises: GraphDeleteError
+        """
+        res = await self.api.delete("/_api/gharial/{}".format(name))
+        if res.status_code not in HTTP_OK:
+            raise GraphDeleteError(res)
+        self._graph_cache.pop(name, None)
@@ -0,0 +1,383 @@
+"""ArangoDB asynchronous Graph."""
+
+from arango.utils import uncamelify
+from arango.exceptions import *
+from arango.constants import HTTP_OK
+
+
+class AsyncGraph(object):
+    """Awaitable counterpart of ``arango.graph.Graph``.
+
+    1. Graph Properties
+    2. Vertex Management
+    3. Edge Management
+    4. Graph Traversals
+    """
+
+    def __init__(self, name, api):
+        """Initialize the wrapper object.
+
+        :param name: the name of the graph
+        :type name: str
+        :param api: ArangoDB asynchronous API object
+        :type api: arango.aio.api.AsyncAPI
+        """
+        self.name = name
+        self.api = api
+
+    async def properties(self):
+        """Return the properties of this graph.
+
+        :returns: the properties of this graph
+        :rtype: dict
+        :raises: GraphPropertyError
+        """
+        res = await self.api.get(
+            "/_api/gharial/{}".format(self.name)
+        )
+        if res.status_code not in HTTP_OK:
+            raise GraphPropertyError(res)
+        return uncamelify(res.obj["graph"])
+
+    async def vertex_collections(self):
+        """Return the vertex collections of this graph.
+
+        :returns: the string names of the vertex collections
+        :rtype: list
+        :raises: VertexCollectionListError
+        """
+        res = await self.api.get(
+            "/_api/gharial/{}/vertex".format(self.name)
+        )
+        if res.status_code not in HTTP_OK:
+            raise VertexCollectionListError(res)
+        return res.obj["collections"]
+
+    #####################
+    # Vertex Management #
+    #####################
+
+    async def get_vertex(self, vertex_id, rev=None):
+        """Return the vertex of the specified ID in this graph.
+
+        :param vertex_id: the ID of the vertex to retrieve
+        :type vertex_id: str
+        :param rev: the vertex revision must match this value
+        :type rev: str or None
+        :returns: the requested vertex or None if not found
+        :rtype: dict or None
+        :raises: VertexRevisionError, VertexGetError
+        """
+        res = await self.api.get(
+            "/_api/gharial/{}/vertex/{}".format(self.name, vertex_id),
+            params={"rev": rev} if rev is not None else {}
+        )
+        if res.status_code == 412:
+            raise VertexRevisionError(res)
+        elif res.status_code == 404:
+            return None
+        elif res.status_code not in HTTP_OK:
+            raise VertexGetError(res)
+        return res.obj["vertex"]
+
+    async def create_vertex(self, collection, data, wait_for_sync=False):
+        """Create a vertex to the specified vertex collection if this graph.
+
+        :param collection: the name of the vertex collection
+        :type collection: str
+        :param data: the body of the new vertex
+        :type data: dict
+        :param wait_for_sync: wait for the create to sync to disk
+        :type wait_for_sync: bool
+        :return: the id, rev and key of the new vertex
+        :rtype: dict
+        :raises: VertexCreateError
+        """
+        res = await self.api.post(
+            "/_api/gharial/{}/vertex/{}".format(self.name, collection),
+            data=data,
+            params={"waitForSync": wait_for_sync}
+        )
+        if res.status_code not in HTTP_OK:
+            raise VertexCreateError(res)
+        return res.obj["vertex"]
+
+    async def update_vertex(self, vertex_id, data, rev=None, keep_none=True,
+                            wait_for_sync=False):
+        """Update a vertex of the specified ID in this graph.
+
+        :param vertex_id: the ID of the vertex to be updated
+        :type vertex_id: str
+        :param data: the body to update the vertex with
+        :type data: dict
+        :param rev: the vertex revision must match this value
+        :type rev: str or None
+        :param keep_none: whether or not to keep the keys with value None
+        :type keep_none: bool
+        :param wait_for_sync: wait for the update to sync to disk
+        :type wait_for_sync: bool
+        :return: the id, rev and key of the updated vertex
+        :rtype: dict
+        :raises: VertexRevisionError, VertexUpdateError
+        """
+        params = {
+            "waitForSync": wait_for_sync,
+            "keepNull": keep_none
+        }
+        if rev is not None:
+            params["rev"] = rev
+        elif "_rev" in data:
+            params["rev"] = data["_rev"]
+        res = await self.api.patch(
+            "/_api/gharial/{}/vertex/{}".format(self.name, vertex_id),
+            data=data,
+            params=params
+        )
+        if res.status_code == 412:
+            raise VertexRevisionError(res)
+        elif res.status_code not in {200, 202}:
+            raise VertexUpdateError(res)
+        return res.obj["vertex"]
+
+    async def replace_vertex(self, vertex_id, data, rev=None,
+                             wait_for_sync=False):
+        """Replace a vertex of the specified ID in this graph.
+
+        :param vertex_id: the ID of the vertex to be replaced
+        :type vertex_id: str
+        :param data: the body to replace the vertex with
+        :type data: dict
+        :param rev: the vertex revision must match this value
+        :type rev: str or None
+        :param wait_for_sync: wait for replace to sync to disk
+        :type wait_for_sync: bool
+        :return: the id, rev and key of the replaced vertex
+        :rtype: dict
+        :raises: VertexRevisionError, VertexReplaceError
+        """
+        params = {"waitForSync": wait_for_sync}
+        if rev is not None:
+            params["rev"] = rev
+        elif "_rev" in data:
+            params["rev"] = data["_rev"]
+        res = await self.api.put(
+            "/_api/gharial/{}/vertex/{}".format(self.name, vertex_id),
+            data=data,
+            params=params
+        )
+        if res.status_code == 412:
+            raise VertexRevisionError(res)
+        elif res.status_code not in {200, 202}:
+            raise VertexReplaceError(res)
+        return res.obj["vertex"]
+
+    async def delete_vertex(self, vertex_id, rev=None, wait_for_sync=False):
+        """Delete the vertex of the specified ID from this graph.
+
+        :param vertex_id: the ID of the vertex to be deleted
+        :type vertex_id: str
+        :param rev: the vertex revision must match this value
+        :type rev: str or None
+        :raises: VertexRevisionError, VertexDeleteError
+        """
+        params = {"waitForSync": wait_for_sync}
+        if rev is not None:
+            params["rev"] = rev
+        res = await self.api.delete(
+            "/_api/gharial/{}/vertex/{}".format(self.name, vertex_id),
+            params=params
+        )
+        if res.status_code == 412:
+            raise VertexRevisionError(res)
+        if res.status_code not in {200, 202}:
+            raise VertexDeleteError(res)
+
+    ###################
+    # Edge Management #
+    ###################
+
+    async def get_edge(self, edge_id, rev=None):
+        """Return the edge of the specified ID in this graph.
+
+        :param edge_id: the ID of the edge to retrieve
+        :type edge_id: str
+        :param rev: the edge revision must match this value
+        :type rev: str or None
+        :returns: the requested edge or None if not found
+        :rtype: dict or None
+        :raises: EdgeRevisionError, EdgeGetError
+        """
+        res = await self.api.get(
+            "/_api/gharial/{}/edge/{}".format(self.name, edge_id),
+            params={} if rev is None else {"rev": rev}
+        )
+        if res.status_code == 412:
+            raise EdgeRevisionError(res)
+        elif res.status_code == 404:
+            return None
+        elif res.status_code not in HTTP_OK:
+            raise EdgeGetError(res)
+        return res.obj["edge"]
+
+    async def create_edge(self, collection, data, wait_for_sync=False):
+        """Create an edge to the specified edge collection of this graph.
+
+        The ``data`` must contain ``_from`` and ``_to`` keys with valid
+        vertex IDs as their values.
+
+        :param collection: the name of the edge collection
+        :type collection: str
+        :param data: the body of the new edge
+        :type data: dict
+        :param wait_for_sync: wait for the create to sync to disk
+        :type wait_for_sync: bool
+        :return: the id, rev and key of the new edge
+        :rtype: dict
+        :raises: DocumentInvalidError, EdgeCreateError
+        """
+        if "_to" not in data:
+            raise DocumentInvalidError(
+                "the new edge data is missing the '_to' key")
+        if "_from" not in data:
+            raise DocumentInvalidError(
+                "the new edge data is missing the '_from' key")
+        res = await self.api.post(
+            "/_api/gharial/{}/edge/{}".format(self.name, collection),
+            data=data,
+            params={"waitForSync": wait_for_sync}
+        )
+        if res.status_code not in HTTP_OK:
+            raise EdgeCreateError(res)
+        return res.obj["edge"]
+
+    async def update_edge(self, edge_id, data, rev=None, keep_none=True,
+                          wait_for_sync=False):
+        """Update the edge of the specified ID in this graph.
+
+        :param edge_id: the ID of the edge to be updated
+        :type edge_id: str
+        :param data: the body to update the edge with
+        :type data: dict
+        :param rev: the edge revision must match this value
+        :type rev: str or None
+        :param keep_none: whether or not to keep the keys with value None
+        :type keep_none: bool
+        :param wait_for_sync: wait for the update to sync to disk
+        :type wait_for_sync: bool
+        :return: the id, rev and key of the updated edge
+        :rtype: dict
+        :raises: EdgeRevisionError, EdgeUpdateError
+        """
+        params = {
+            "waitForSync": wait_for_sync,
+            "keepNull": keep_none
+        }
+        if rev is not None:
+            params["rev"] = rev
+        elif "_rev" in data:
+            params["rev"] = data["_rev"]
+        res = await self.api.patch(
+            "/_api/gharial/{}/edge/{}".format(self.name, edge_id),
+            data=data,
+            params=params
+        )
+        if res.status_code == 412:
+            raise EdgeRevisionError(res)
+        elif res.status_code not in {200, 202}:
+            raise EdgeUpdateError(res)
+        return res.obj["edge"]
+
+    async def replace_edge(self, edge_id, data, rev=None,
+                           wait_for_sync=False):
+        """Replace the edge of the specified ID in this graph.
+
+        :param edge_id: the ID of the edge to be replaced
+        :type edge_id: str
+        :param data: the body to replace the edge with
+        :type data: dict
+        :param rev: the edge revision must match this value
+        :type rev: str or None
+        :param wait_for_sync: wait for the replace to sync to disk
+        :type wait_for_sync: bool
+        :returns: the id, rev and key of the replaced edge
+        :rtype: dict
+        :raises: EdgeRevisionError, EdgeReplaceError
+        """
+        params = {"waitForSync": wait_for_sync}
+        if rev is not None:
+            params["rev"] = rev
+        elif "_rev" in data:
+            params["rev"] = data["_rev"]
+        res = await self.api.put(
+            "/_api/gharial/{}/edge/{}".format(self.name, edge_id),
+            data=data,
+            params=params
+        )
+        if res.status_code == 412:
+            raise EdgeRevisionError(res)
+        elif res.status_code not in {200, 202}:
+            raise EdgeReplaceError(res)
+        return res.obj["edge"]
+
+    async def delete_edge(self, edge_id, rev=None, wait_for_sync=False):
+        """Delete the edge of the specified ID from this graph.
+
+        :param edge_id: the ID of the edge to be deleted
+        :type edge_id: str
+        :param rev: the edge revision must match this value
+        :type rev: str or None
+        :raises: EdgeRevisionError, EdgeDeleteError
+        """
+        params = {"waitForSync": wait_for_sync}
+        if rev is not None:
+            params["rev"] = rev
+        res = await self.api.delete(
+            "/_api/gharial/{}/edge/{}".format(self.name, edge_id),
+            params=params
+        )
+        if res.status_code == 412:
+            raise EdgeRevisionError(res)
+        elif res.status_code not in {200, 202}:
+            raise EdgeDeleteError(res)
+
+    ####################
+    # Graph Traversals #
+    ####################
+
+    async def execute_traversal(self, start_vertex, **kwargs):
+        """Execute a graph traversal and return the visited vertices.
+
+        The keyword arguments are the same as the ones accepted by
+        ``arango.graph.Graph.execute_traversal``.
+
+        :param start_vertex: the ID of the start vertex
+        :type start_vertex: str
+        :returns: the traversal results
+        :rtype: dict
+        :raises: GraphTraversalError
+        """
+        names = {
+            "direction": "direction",
+            "strategy": "strategy",
+            "order": "order",
+            "item_order": "itemOrder",
+            "uniqueness": "uniqueness",
+            "max_iterations": "maxIterations",
+            "min_depth": "minDepth",
+            "max_depth": "maxDepth",
+            "init": "init",
+            "filters": "filter",
+            "visitor": "visitor",
+            "expander": "expander",
+            "sort": "sort",
+        }
+        data = {"startVertex": start_vertex, "graphName": self.name}
+        for arg, value in kwargs.items():
+            if arg not in names:
+                raise TypeError("unexpected keyword argument '{}'".format(arg))
+            if value is not None:
+                data[names[arg]] = value
+        res = await self.api.post("/_api/traversal", data=data)
+        if res.status_code not in HTTP_OK:
+            raise GraphTraversalError(res)
+        return res.obj["result"]
@@ -1,13 +1,231 @@
 """Wrapper for making REST API calls to ArangoDB."""
 
-import json
+import time
 
-from arango.constants import DEFAULT_DATABASE
+from arango import forksafe
+from arango.constants import BODY_METHODS, DEFAULT_DATABASE
 from arango.clients import DefaultClient
+from arango.clients.pipeline import PipelineClient
+from arango.clients.unix import UnixSocketClient, unix_socket_url
+from arango.codec import get_codec
+from arango.deadline import current
+from arango.exceptions import DeadlineExceededError
+from arango.interceptors import Request
+from arango.pipeline import Pipeline
+from arango.retry import CONNECTION_ERRORS
+from arango.steps import drive
 from arango.utils import is_string
 
+# URL schemes of the ArangoDB endpoint notation
+ENDPOINT_SCHEMES = {
+    "tcp://": "http://",
+    "http+tcp://": "http://",
+    "ssl://": "https://",
+    "http+ssl://": "https://",
+}
 
-class API(object):
+
+def endpoint_url(endpoint):
+    """Return the base URL of the requests to an ArangoDB endpoint.
+
+    Endpoints are given as URLs (e.g. 'http://localhost:8529') or in the
+    notation of the server (e.g. 'tcp://127.0.0.1:8529' or
+    'unix:///tmp/arangodb.sock').
+
+    :param endpoint: the ArangoDB endpoint
+    :type endpoint: str
+    :returns: the base URL
+    :rtype: str
+    """
+    if endpoint.startswith("unix://"):
+        return unix_socket_url(endpoint)
+    for prefix, scheme in ENDPOINT_SCHEMES.items():
+        if endpoint.startswith(prefix):
+            endpoint = scheme + endpoint[len(prefix):]
+    return endpoint.rstrip("/")
+
+
+class BaseAPI(object):
+    """Transport-independent part of the API wrappers.
+
+    Encodes the payloads, adds the content negotiation headers, compresses
+    the bodies and runs the interceptors and the retry policy, the same
+    way for ``API`` and ``arango.aio.api.AsyncAPI``. Subclasses set the
+    client, and the functions driving the step generators (see
+    ``arango.steps``) and waiting between retries.
+    """
+
+    # The runner of the step generators and the retry wait
+    _drive = staticmethod(drive)
+    _sleep = staticmethod(time.sleep)
+
+    def __init__(self, protocol, host, port, username, password, database,
+                 codec, compression, retry, interceptors, endpoint=None):
+        self.protocol = protocol
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.database = DEFAULT_DATABASE if database is None else database
+        if endpoint is not None:
+            self.endpoint = endpoint_url(endpoint)
+        else:
+            self.endpoint = "{protocol}://{host}:{port}".format(
+                protocol=self.protocol,
+                host=self.host,
+                port=self.port,
+            )
+        self.url_prefix = "{endpoint}/_db/{database}".format(
+            endpoint=self.endpoint,
+            database=self.database,
+        )
+        self.codec = get_codec(codec)
+        self.compression = compression
+        self.retry = retry
+        self.interceptors = [] if interceptors is None else interceptors
+
+    def _headers(self, headers, content_type=None, content_encoding=None):
+        """Add the content negotiation headers of the codec and compression.
+
+        Headers given by the caller take precedence.
+        """
+        extra = {}
+        if self.codec.binary:
+            extra["Accept"] = self.codec.content_type
+            if content_type is not None:
+                extra["Content-Type"] = content_type
+        if self.compression is not None:
+            if self.compression.accept_encoding:
+                extra["Accept-Encoding"] = self.compression.accept_encoding
+            if content_encoding is not None:
+                extra["Content-Encoding"] = content_encoding
+        if not extra:
+            return headers
+        extra.update(headers or {})
+        return extra
+
+    def _serialize(self, data):
+        """Encode the request payload with the codec.
+
+        Strings, bytes and iterators (streamed bodies) are already encoded.
+        Returns the body and its content type (None if left as is).
+        """
+        if (is_string(data) or isinstance(data, bytes) or
+                hasattr(data, "__next__") or hasattr(data, "next")):
+            return data, None
+        return self.codec.encode(data), self.codec.content_type
+
+    def _compress(self, body):
+        """Compress the request body as configured.
+
+        Returns the body and its content encoding (None if uncompressed).
+        """
+        if (self.compression is not None and
+                self.compression.should_compress(body)):
+            return self.compression.compress(body), self.compression.encoding
+        return body, None
+
+    def _response(self, res):
+        """Attach the codec to the response and count its compression."""
+        res.codec = self.codec
+        if self.compression is not None:
+            self.compression.record_response(res)
+        return res
+
+    def _prepare(self, method, path, data=None, params=None, headers=None):
+        """Return the request seen by the interceptors.
+
+        The payload of the methods with a body is encoded once, here.
+        Returns the request and the content type of its payload.
+        """
+        forksafe.check()
+        content_type = None
+        if method in BODY_METHODS:
+            data, content_type = self._serialize(data)
+        request = Request(
+            method, path, self.url_prefix + path, params, headers, data
+        )
+        return request, content_type
+
+    def _attempt(self, request, content_type, timeout, active):
+        """Return the keyword arguments of the client call for one attempt.
+
+        Compression is applied to each attempt so that retries send the
+        whole body again. The active deadline caps the timeout and the
+        time spent producing a streamed body.
+        """
+        if active is not None:
+            timeout = active.timeout(timeout)
+        body, content_encoding = self._compress(request.data)
+        kwargs = {
+            "url": request.url,
+            "params": request.params,
+            "headers": self._headers(
+                request.headers, content_type, content_encoding
+            ),
+            "auth": (self.username, self.password),
+        }
+        if request.method in BODY_METHODS:
+            if active is not None and (
+                    hasattr(body, "__next__") or hasattr(body, "next")):
+                body = active.guard(body)
+            kwargs["data"] = body
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        return kwargs
+
+    @staticmethod
+    def _expired(active):
+        """Raise DeadlineExceededError if the connection error is ours.
+
+        Called when an attempt fails with a connection error, which is
+        then due to the timeout capped by the deadline.
+        """
+        if active is not None and active.expired:
+            raise DeadlineExceededError(active.seconds)
+
+    def _send(self, request, send, retry=True):
+        """Return the step sending the request, retried as configured."""
+        if self.retry is None or not retry:
+            return send, ()
+        return self._drive, (self.retry.steps(
+            self.endpoint, request.method, send, request.data, self._sleep
+        ),)
+
+    def _steps(self, request, send, retry=True):
+        """Run the request through the interceptors and the retry policy.
+
+        This is a step generator (see ``arango.steps``): it yields the
+        calls to the interceptor hooks, to ``send`` (once per attempt,
+        returning the response) and to the retry wait. ``send`` is called
+        once, without retries, if ``retry`` is not set.
+        """
+        called = []
+        response = None
+        for interceptor in self.interceptors:
+            called.append(interceptor)
+            response = yield interceptor.before, (request,)
+            if response is not None:
+                break
+        start = time.time()
+        try:
+            if response is None:
+                response = yield self._send(request, send, retry)
+        except Exception as error:
+            request.elapsed = time.time() - start
+            for interceptor in reversed(called):
+                yield interceptor.failed, (request, error)
+            raise
+        request.elapsed = time.time() - start
+        request.status_code = response.status_code
+        for interceptor in reversed(called):
+            replacement = yield interceptor.after, (request, response)
+            if replacement is not None:
+                response = replacement
+        yield None, (response,)
+
+
+class API(BaseAPI):
     """Wrapper object which makes REST API calls to ArangoDB.
 
     :param protocol: the internet transfer protocol (default: 'http')
@@ -24,29 +242,115 @@ class API(object):
     :type database: str
     :param client: HTTP client for this wrapper to use
     :type client: arango.clients.base.BaseClient or None
+    :param pool_size: max number of connections kept open per host
+    :type pool_size: int
+    :param pool_block: wait for a free connection when the pool is exhausted
+    :type pool_block: bool
+    :param keep_alive: whether or not to reuse connections between requests
+    :type keep_alive: bool
+    :param idle_timeout: close pooled connections idle for longer (in sec)
+    :type idle_timeout: int or float or None
+    :param timeout: the default connect and read timeouts of the requests
+        in seconds, a number for both or a (connect, read) tuple (default:
+        no timeout)
+    :type timeout: int or float or tuple or None
+    :param codec: the JSON codec name or instance (default: the fastest
+        installed, see ``arango.codec.get_codec``)
+    :type codec: str or arango.codec.Codec or None
+    :param compression: the compression settings for request and response
+        bodies (default: no compression)
+    :type compression: arango.compression.Compression or None
+    :param retry: the retry policy with the circuit breakers (default: no
+        retries)
+    :type retry: arango.retry.RetryPolicy or None
+    :param interceptors: the interceptors called around every request, in
+        order (see ``arango.interceptors.Interceptor``)
+    :type interceptors: list or None
+    :param endpoint: the ArangoDB endpoint, used instead of ``protocol``,
+        ``host`` and ``port`` if given (e.g. 'unix:///tmp/arangodb.sock'
+        to talk to the server over a Unix domain socket)
+    :type endpoint: str or None
+    :param profiler: the recorder of slow AQL queries (default: None)
+    :type profiler: arango.profiler.QueryProfiler or None
+
+    The connection pool settings and ``timeout`` only apply if ``client``
+    is not given. Requests made while a deadline is active (see
+    ``arango.deadline``) have their timeouts capped by the time left.
     """
 
     def __init__(self, protocol="http", host="localhost", port=8529,
-                 username="root", password="", database=None, client=None):
-        self.protocol = protocol
-        self.host = host
-        self.port = port
-        self.username = username
-        self.password = password
-        self.database = DEFAULT_DATABASE if database is None else database
-        self.url_prefix = "{protocol}://{host}:{port}/_db/{database}".format(
-            protocol=self.protocol,
-            host=self.host,
-            port=self.port,
-            database=self.database,
+                 username="root", password="", database=None, client=None,
+                 pool_size=10, pool_block=False, keep_alive=True,
+                 idle_timeout=None, timeout=None, codec=None, compression=None,
+                 retry=None, interceptors=None, endpoint=None,
+                 profiler=None):
+        super(API, self).__init__(
+            protocol, host, port, username, password, database, codec,
+            compression, retry, interceptors, endpoint
         )
         if client is not None:
             self.client = client
         else:
-            client_init_data = {"auth": (self.username, self.password)}
-            self.client = DefaultClient(client_init_data)
+            client_init_data = {
+                "auth": (self.username, self.password),
+                "pool_size": pool_size,
+                "pool_block": pool_block,
+                "keep_alive": keep_alive,
+                "idle_timeout": idle_timeout,
+                "timeout": timeout,
+            }
+            if endpoint is not None and endpoint.startswith("unix://"):
+                self.client = UnixSocketClient(client_init_data)
+            else:
+                self.client = DefaultClient(client_init_data)
+        self.profiler = profiler
+        # Created on the first call to pipeline()
+        self.pipeline_client = None
+
+    def _request(self, method, path, data=None, params=None, headers=None,
+                 timeout=None, stream=False):
+        """Make the request through the interceptors and the retry policy.
+
+        Every call to the REST API goes through here. The deadline active
+        when the request is made caps the timeout of each attempt.
+
+        :returns: the response, or the response and the body iterator if
+            ``stream`` is set
+        """
+        request, content_type = self._prepare(
+            method, path, data, params, headers
+        )
+        chunks = []
+        active = current()
 
-    def head(self, path, params=None, headers=None):
+        def send():
+            kwargs = self._attempt(request, content_type, timeout, active)
+            try:
+                if not stream:
+                    return self._response(
+                        getattr(self.client, method)(**kwargs)
+                    )
+                if hasattr(self.client, "stream"):
+                    res, body = self.client.stream(method, **kwargs)
+                else:
+                    res = getattr(self.client, method)(**kwargs)
+                    body = iter([res.content or b""])
+                    res.content = None
+            except CONNECTION_ERRORS:
+                self._expired(active)
+                raise
+            chunks[:] = [body]
+            return self._response(res)
+
+        response = drive(self._steps(request, send))
+        if not stream:
+            return response
+        if not chunks:
+            # Answered by an interceptor without sending the request
+            chunks.append(iter([response.content or b""]))
+        return response, chunks[0]
+
+    def head(self, path, params=None, headers=None, timeout=None):
         """Call a HEAD method in ArangoDB's REST API.
 
         :param path: the API path (e.g. '/_api/version')
@@ -55,17 +359,17 @@ class API(object):
         :type params: dict or None
         :param headers: the request headers
         :type headers: dict or None
+        :param timeout: the connect and read timeouts of the request in
+            seconds (default: the timeout of the client)
+        :type timeout: int or float or tuple or None
         :returns: the ArangoDB http response
         :rtype: arango.response.Response
         """
-        return self.client.head(
-            url=self.url_prefix + path,
-            params=params,
-            headers=headers,
-            auth=(self.username, self.password)
+        return self._request(
+            "head", path, params=params, headers=headers, timeout=timeout
         )
 
-    def get(self, path, params=None, headers=None):
+    def get(self, path, params=None, headers=None, timeout=None):
         """Call a GET method in ArangoDB's REST API.
 
         :param path: the API path (e.g. '/_api/version')
@@ -74,17 +378,17 @@ class API(object):
         :type params: dict or None
         :param headers: the request headers
         :type headers: dict or None
+        :param timeout: the connect and read timeouts of the request in
+            seconds (default: the timeout of the client)
+        :type timeout: int or float or tuple or None
         :returns: the ArangoDB http response
         :rtype: arango.response.Response
         """
-        return self.client.get(
-            url=self.url_prefix + path,
-            params=params,
-            headers=headers,
-            auth=(self.username, self.password),
+        return self._request(
+            "get", path, params=params, headers=headers, timeout=timeout
         )
 
-    def put(self, path, data=None, params=None, headers=None):
+    def put(self, path, data=None, params=None, headers=None, timeout=None):
         """Call a PUT method in ArangoDB's REST API.
 
         :param path: the API path (e.g. '/_api/version')
@@ -95,18 +399,17 @@ class API(object):
         :type params: dict or None
         :param headers: the request headers
         :type headers: dict or None
+        :param timeout: the connect and read timeouts of the request in
+            seconds (default: the timeout of the client)
+        :type timeout: int or float or tuple or None
         :returns: the ArangoDB http response
         :rtype: arango.response.Response
         """
-        return self.client.put(
-            url=self.url_prefix + path,
-            data=data if is_string(data) else json.dumps(data),
-            params=params,
-            headers=headers,
-            auth=(self.username, self.password)
+        return self._request(
+            "put", path, data, params, headers, timeout
         )
 
-    def post(self, path, data=None, params=None, headers=None):
+    def post(self, path, data=None, params=None, headers=None, timeout=None):
         """Call a POST method in ArangoDB's REST API.
 
         :param path: the API path (e.g. '/_api/version')
@@ -117,18 +420,17 @@ class API(object):
         :type params: dict or None
         :param headers: the request headers
         :type headers: dict or None
+        :param timeout: the connect and read timeouts of the request in
+            seconds (default: the timeout of the client)
+        :type timeout: int or float or tuple or None
         :returns: the ArangoDB http response
         :rtype: arango.response.Response
         """
-        return self.client.post(
-            url=self.url_prefix + path,
-            data=data if is_string(data) else json.dumps(data),
-            params=params,
-            headers=headers,
-            auth=(self.username, self.password)
+        return self._request(
+            "post", path, data, params, headers, timeout
         )
 
-    def patch(self, path, data=None, params=None, headers=None):
+    def patch(self, path, data=None, params=None, headers=None, timeout=None):
         """Call a PATCH method in ArangoDB's REST API.
 
         :param path: the API path (e.g. '/_api/version')
@@ -139,18 +441,17 @@ class API(object):
         :type params: dict or None
         :param headers: the request headers
         :type headers: dict or None
+        :param timeout: the connect and read timeouts of the request in
+            seconds (default: the timeout of the client)
+        :type timeout: int or float or tuple or None
         :returns: the ArangoDB http response
         :rtype: arango.response.Response
         """
-        return self.client.patch(
-            url=self.url_prefix + path,
-            data=data if is_string(data) else json.dumps(data),
-            params=params,
-            headers=headers,
-            auth=(self.username, self.password)
+        return self._request(
+            "patch", path, data, params, headers, timeout
         )
 
-    def delete(self, path, params=None, headers=None):
+    def delete(self, path, params=None, headers=None, timeout=None):
         """Call a DELETE method in ArangoDB's REST API.
 
         :param path: the API path (e.g. '/_api/version')
@@ -159,17 +460,47 @@ class API(object):
         :type params: dict or None
         :param headers: the request headers
         :type headers: dict or None
+        :param timeout: the connect and read timeouts of the request in
+            seconds (default: the timeout of the client)
+        :type timeout: int or float or tuple or None
         :returns: the ArangoDB http response
         :rtype: arango.response.Response
         """
-        return self.client.delete(
-            url=self.url_prefix + path,
-            params=params,
-            headers=headers,
-            auth=(self.username, self.password)
+        return self._request(
+            "delete", path, params=params, headers=headers, timeout=timeout
         )
 
-    def options(self, path, data=None, params=None, headers=None):
+    def stream(self, method, path, data=None, params=None, headers=None,
+               timeout=None):
+        """Call a method in ArangoDB's REST API without reading the body.
+
+        The content of the returned response is None and the body is read
+        through the returned iterator of bytes. Clients without support for
+        streamed responses read the body at once and the iterator yields it
+        in one piece.
+
+        :param method: the HTTP method (e.g. 'put')
+        :type method: str
+        :param path: the API path (e.g. '/_api/cursor')
+        :type path: str
+        :param data: the request payload
+        :type data: str or dict or None
+        :param params: the request parameters
+        :type params: dict or None
+        :param headers: the request headers
+        :type headers: dict or None
+        :param timeout: the connect and read timeouts of the request in
+            seconds (default: the timeout of the client)
+        :type timeout: int or float or tuple or None
+        :returns: the ArangoDB http response and the body iterator
+        :rtype: tuple
+        """
+        return self._request(
+            method, path, data, params, headers, timeout, stream=True
+        )
+
+    def options(self, path, data=None, params=None, headers=None,
+                timeout=None):
         """Call an OPTIONS method in ArangoDB's REST API.
 
         :param path: the API path (e.g. '/_api/version')
@@ -180,13 +511,38 @@ class API(object):
         :type params: dict or None
         :param headers: the request headers
         :type headers: dict or None
+        :param timeout: the connect and read timeouts of the request in
+            seconds (default: the timeout of the client)
+        :type timeout: int or float or tuple or None
         :returns: the ArangoDB http response
         :rtype: arango.response.Response
         """
-        return self.client.options(
-            url=self.url_prefix + path,
-            data=data if is_string(data) else json.dumps(data),
-            params=params,
-            headers=headers,
-            auth=(self.username, self.password)
-        )
\ No newline at end of file
+        return self._request(
+            "options", path, data, params, headers, timeout
+        )
+
+    def pipeline(self, connections=4, depth=32):
+        """Return a context pipelining the requests queued through it.
+
+        The methods of the returned ``arango.pipeline.Pipeline`` take the
+        same arguments as those of this wrapper but return futures of the
+        responses. The sockets of the pipelining client are kept open
+        between pipelines.
+
+        :param connections: the number of sockets to spread the requests
+            over (only used by the first call)
+        :type connections: int
+        :param depth: the max number of requests in flight per socket
+            (only used by the first call)
+        :type depth: int
+        :returns: the pipeline
+        :rtype: arango.pipeline.Pipeline
+        """
+        if self.pipeline_client is None:
+            self.pipeline_client = PipelineClient({
+                "auth": (self.username, self.password),
+                "connections": connections,
+                "depth": depth,
+                "timeout": getattr(self.client, "timeout", None),
+            })
+        return Pipeline(self, self.pipeline_client)
@@ -0,0 +1,409 @@
+"""Builder of parameterized AQL queries.
+
+The values given to the builder never become part of the query string:
+every one of them is passed as a bind variable, named after its position
+in the query (``@value0``, ``@value1``, ... and ``@@collection0``, ...).
+Queries of the same structure therefore have the same query string
+whatever their values are, and share the entries of the query caches of
+the server and of the client (see ``arango.cache``).
+
+Variable names, attribute paths and other expressions are part of the
+structure and are written into the query as given; wrap a string in
+``Expr`` to use it as an expression where a value is expected.
+
+    >>> query = (
+    ...     for_("u", "users")
+    ...     .filter("u.age", ">=", 18)
+    ...     .sort(("u.name", "DESC"))
+    ...     .limit(10)
+    ...     .return_("u")
+    ... )
+    >>> query.build()
+    ('FOR u IN @@collection0 FILTER u.age >= @value0 SORT u.name DESC '
+     'LIMIT @value1 RETURN u', {'@collection0': 'users', 'value0': 18,
+     'value1': 10})
+
+``Database.execute_query`` accepts the built queries directly.
+"""
+
+import re
+
+from arango.exceptions import InvalidArgumentError
+
+# Names of the AQL variables
+_VARIABLE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+# String literals, quoted names and comments (which may contain "@"), and
+# the bind parameters, with the dot of an attribute access before them
+# (collection bind parameters are not captured)
+_TOKENS = re.compile(
+    r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|`[^`]*`"
+    r"|//[^\n]*|/\*.*?\*/|@@\w+|((?<!\.)\.\s*)?@(\w+)",
+    re.DOTALL
+)
+
+# Comparison operators of FILTER
+OPERATORS = frozenset([
+    "==", "!=", "<", "<=", ">", ">=", "IN", "NOT IN", "LIKE", "=~", "!~",
+])
+
+
+class Expr(object):
+    """AQL expression written into the query as given.
+
+    :param text: the expression
+    :type text: str
+    """
+
+    def __init__(self, text):
+        self.text = text
+
+    def __repr__(self):
+        return "Expr({!r})".format(self.text)
+
+
+class _Value(object):
+    """Value passed as a bind variable."""
+
+    __slots__ = ("value",)
+    prefix = "value"
+    marker = "@"
+
+    def __init__(self, value):
+        self.value = value
+
+
+class _Collection(_Value):
+    """Collection name passed as a collection bind variable."""
+
+    __slots__ = ()
+    prefix = "collection"
+    marker = "@@"
+
+
+def _variable(name):
+    """Return the variable name, or raise InvalidArgumentError."""
+    if not _VARIABLE.match(name):
+        raise InvalidArgumentError("invalid AQL variable: {!r}".format(name))
+    return name
+
+
+def _expr(expr):
+    """Return the text of the expression."""
+    return expr.text if isinstance(expr, Expr) else expr
+
+
+def _value(value):
+    """Return the part of the query standing for the value."""
+    if isinstance(value, Expr):
+        return value.text
+    return _Value(value)
+
+
+def _collection(collection):
+    """Return the part of the query standing for the collection."""
+    if isinstance(collection, Expr):
+        return collection.text
+    return _Collection(collection)
+
+
+def _projection(expr):
+    """Return the part of the query standing for a RETURN expression."""
+    if isinstance(expr, dict):
+        parts = []
+        for key in sorted(expr):
+            parts.extend([", " if parts else "", _variable(key), ": "])
+            parts.append(_value(expr[key]))
+        return ["{"] + parts + ["}"]
+    return [_expr(expr)]
+
+
+class Query(object):
+    """Parameterized AQL query made of operations.
+
+    Queries are immutable: every operation returns a new query, so a query
+    can be the common start of several others.
+
+    :param parts: the strings and the values of the query, in order
+    :type parts: tuple
+    """
+
+    def __init__(self, parts=()):
+        self._parts = tuple(parts)
+
+    def __repr__(self):
+        return "<ArangoDB AQL query '{}'>".format(self.build()[0])
+
+    def _extend(self, *parts):
+        separator = (" ",) if self._parts else ()
+        return Query(self._parts + separator + parts)
+
+    def for_(self, variable, collection):
+        """Add a FOR operation iterating over a collection.
+
+        :param variable: the name of the variable
+        :type variable: str
+        :param collection: the name of the collection (passed as a bind
+            variable), or an ``Expr`` to iterate over (e.g. an array or a
+            graph traversal)
+        :type collection: str or Expr
+        :returns: the extended query
+        :rtype: arango.aql.Query
+        :raises: InvalidArgumentError
+        """
+        return self._extend(
+            "FOR ", _variable(variable), " IN ", _collection(collection)
+        )
+
+    def filter(self, expr, operator=None, value=None):
+        """Add a FILTER operation.
+
+        ``filter("d.age", ">=", 18)`` compares the expression with a value
+        and ``filter("d.active")`` uses the expression as the condition.
+
+        :param expr: the expression to compare, or the whole condition
+        :type expr: str or Expr
+        :param operator: the comparison operator (see ``OPERATORS``)
+        :type operator: str or None
+        :param value: the value to compare with, or an ``Expr``
+        :type value: object
+        :returns: the extended query
+        :rtype: arango.aql.Query
+        :raises: InvalidArgumentError
+        """
+        if operator is None:
+            return self._extend("FILTER ", _expr(expr))
+        if operator.upper() not in OPERATORS:
+            raise InvalidArgumentError(
+                "invalid AQL operator: {!r}".format(operator)
+            )
+        return self._extend(
+            "FILTER ", _expr(expr), " ", operator.upper(), " ",
+            _value(value)
+        )
+
+    def let(self, variable, value):
+        """Add a LET operation.
+
+        :param variable: the name of the variable
+        :type variable: str
+        :param value: the value of the variable, or an ``Expr``
+        :type value: object
+        :returns: the extended query
+        :rtype: arango.aql.Query
+        :raises: InvalidArgumentError
+        """
+        return self._extend("LET ", _variable(variable), " = ", _value(value))
+
+    def sort(self, *keys):
+        """Add a SORT operation.
+
+        :param keys: the expressions to sort by, or (expression, "ASC" or
+            "DESC") pairs
+        :type keys: str or tuple
+        :returns: the extended query
+        :rtype: arango.aql.Query
+        :raises: InvalidArgumentError
+        """
+        if not keys:
+            raise InvalidArgumentError("SORT needs at least one key")
+        parts = ["SORT "]
+        for index, key in enumerate(keys):
+            if index:
+                parts.append(", ")
+            if isinstance(key, tuple):
+                key, direction = key
+                if direction.upper() not in {"ASC", "DESC"}:
+                    raise InvalidArgumentError(
+                        "invalid sort direction: {!r}".format(direction)
+                    )
+                parts.extend([_expr(key), " ", direction.upper()])
+            else:
+                parts.append(_expr(key))
+        return self._extend(*parts)
+
+    def limit(self, count, offset=None):
+        """Add a LIMIT operation.
+
+        :param count: the max number of results
+        :type count: int
+        :param offset: the number of results to skip
+        :type offset: int or None
+        :returns: the extended query
+        :rtype: arango.aql.Query
+        """
+        if offset is None:
+            return self._extend("LIMIT ", _value(count))
+        return self._extend("LIMIT ", _value(offset), ", ", _value(count))
+
+    def collect(self, groups=(), into=None, count_into=None):
+        """Add a COLLECT operation.
+
+        :param groups: the (variable, expression) pairs to group by, or a
+            dictionary of them
+        :type groups: list or dict
+        :param into: the name of the variable holding the group members
+        :type into: str or None
+        :param count_into: the name of the variable holding the group sizes
+            (exclusive with ``into``)
+        :type count_into: str or None
+        :returns: the extended query
+        :rtype: arango.aql.Query
+        :raises: InvalidArgumentError
+        """
+        if isinstance(groups, dict):
+            groups = sorted(groups.items())
+        if into is not None and count_into is not None:
+            raise InvalidArgumentError("into and count_into are exclusive")
+        parts = ["COLLECT"]
+        for index, (variable, expr) in enumerate(groups):
+            parts.append(", " if index else " ")
+            parts.extend([_variable(variable), " = ", _expr(expr)])
+        if into is not None:
+            parts.extend([" INTO ", _variable(into)])
+        if count_into is not None:
+            parts.extend([" WITH COUNT INTO ", _variable(count_into)])
+        return self._extend(*parts)
+
+    def return_(self, expr, distinct=False):
+        """Add a RETURN operation.
+
+        :param expr: the expression to return, or a dictionary of the
+            attributes of the object to return (their values are values,
+            or ``Expr`` expressions)
+        :type expr: str or Expr or dict
+        :param distinct: return the distinct results only
+        :type distinct: bool
+        :returns: the extended query
+        :rtype: arango.aql.Query
+        :raises: InvalidArgumentError
+        """
+        keyword = "RETURN DISTINCT " if distinct else "RETURN "
+        return self._extend(keyword, *_projection(expr))
+
+    def insert(self, document, collection):
+        """Add an INSERT operation.
+
+        :param document: the document to insert, or an ``Expr``
+        :type document: dict or Expr
+        :param collection: the name of the collection
+        :type collection: str
+        :returns: the extended query
+        :rtype: arango.aql.Query
+        """
+        return self._extend(
+            "INSERT ", _value(document), " INTO ", _collection(collection)
+        )
+
+    def update(self, document, changes, collection):
+        """Add an UPDATE operation.
+
+        :param document: the expression of the document (or its key) to
+            update, e.g. the variable of a FOR operation
+        :type document: str or Expr
+        :param changes: the attributes to update, or an ``Expr``
+        :type changes: dict or Expr
+        :param collection: the name of the collection
+        :type collection: str
+        :returns: the extended query
+        :rtype: arango.aql.Query
+        """
+        return self._extend(
+            "UPDATE ", _expr(document), " WITH ", _value(changes), " IN ",
+            _collection(collection)
+        )
+
+    def build(self, bind_vars=None):
+        """Return the query string and its bind variables.
+
+        :param bind_vars: other bind variables of the query (e.g. of the
+            expressions given as strings)
+        :type bind_vars: dict or None
+        :returns: the query string and the bind variables
+        :rtype: tuple
+        :raises: InvalidArgumentError
+        """
+        text = []
+        values = dict(bind_vars or {})
+        counts = {}
+        for part in self._parts:
+            if isinstance(part, _Value):
+                index = counts.get(part.prefix, 0)
+                counts[part.prefix] = index + 1
+                name = "{}{}".format(part.prefix, index)
+                key = name if part.marker == "@" else "@" + name
+                if key in values:
+                    raise InvalidArgumentError(
+                        "bind variable {!r} given twice".format(key)
+                    )
+                values[key] = part.value
+                text.append(part.marker + name)
+            else:
+                text.append(part)
+        return "".join(text), values
+
+
+def for_(variable, collection):
+    """Return a query starting with a FOR operation.
+
+    See ``Query.for_``.
+
+    :rtype: arango.aql.Query
+    """
+    return Query().for_(variable, collection)
+
+
+def unpack(query, bind_vars=None):
+    """Return the query string and the bind variables of a query.
+
+    :param query: the AQL query, built or not
+    :type query: str or arango.aql.Query
+    :param bind_vars: the bind variables given with the query
+    :type bind_vars: dict or None
+    :returns: the query string and the bind variables (or None)
+    :rtype: tuple
+    :raises: InvalidArgumentError
+    """
+    if isinstance(query, Query):
+        return query.build(bind_vars)
+    return query, bind_vars
+
+
+def bind_parameters(query):
+    """Return the names of the bind parameters of the AQL query string.
+
+    Collection bind parameters (``@@name``) are left out.
+
+    :param query: the AQL query
+    :type query: str
+    :returns: the names, in the order of their first use
+    :rtype: list
+    """
+    names = []
+    for match in _TOKENS.finditer(query):
+        name = match.group(2)
+        if name is not None and name not in names:
+            names.append(name)
+    return names
+
+
+def substitute(query, expressions):
+    """Replace bind parameters of the AQL query string with expressions.
+
+    :param query: the AQL query
+    :type query: str
+    :param expressions: the expressions by bind parameter name; other bind
+        parameters are left as they are
+    :type expressions: dict
+    :returns: the query with the expressions
+    :rtype: str
+    """
+    def replace(match):
+        name = match.group(2)
+        if name is None or name not in expressions:
+            return match.group(0)
+        if match.group(1) is not None:
+            # Attribute names given by bind parameters (doc.@name)
+            return "[{}]".format(expressions[name])
+        return expressions[name]
+    return _TOKENS.sub(replace, query)
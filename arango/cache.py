@@ -0,0 +1,292 @@
+"""Client-side cache of AQL query results."""
+
+import json
+import re
+import threading
+from collections import OrderedDict
+
+from arango import forksafe, vpack
+from arango.deadline import clock
+from arango.interceptors import Interceptor
+
+try:
+    from urllib import unquote
+except ImportError:
+    from urllib.parse import unquote
+
+# Keywords of the AQL data modification operations
+MODIFYING_QUERY = re.compile(
+    r"(?<![.\w])(INSERT|UPDATE|REPLACE|REMOVE|UPSERT)\b", re.IGNORECASE
+)
+
+# Requests naming the single collection they write to
+_COLLECTION_PATH = re.compile(r"^/_api/(?:document|edge|collection)/([^/?]+)")
+
+# Requests with a body which read without writing
+_READ_PATH = re.compile(
+    r"^/_api/(?:cursor/|export|query|explain|index"
+    r"|simple/(?:all|any|by-example|first|first-example|fulltext|last"
+    r"|lookup-by-keys|near|range|within)$)"
+)
+
+
+def is_modifying(query):
+    """Return True if the AQL query may modify documents.
+
+    :param query: the AQL query
+    :type query: str
+    :rtype: bool
+    """
+    return MODIFYING_QUERY.search(query) is not None
+
+
+def _decode(data):
+    """Decode a request payload (None if it is not a JSON/VPack object)."""
+    if hasattr(data, "encode") and not isinstance(data, bytes):
+        data = data.encode("utf-8")
+    if not isinstance(data, bytes):
+        return None
+    try:
+        if data.lstrip()[:1] == b"{":
+            return json.loads(data.decode("utf-8"))
+        return vpack.loads(data)
+    except Exception:
+        return None
+
+
+class _Entry(object):
+    """A cached query result."""
+
+    __slots__ = ("value", "collections", "revisions", "size", "expires")
+
+    def __init__(self, value, collections, revisions, size, expires):
+        self.value = value
+        self.collections = collections
+        self.revisions = revisions
+        self.size = size
+        self.expires = expires
+
+
+class QueryCache(Interceptor):
+    """Least-recently-used cache of AQL query results.
+
+    The cache is used by ``Database.execute_query(..., cache=True)`` once
+    it is one of the interceptors of the API wrapper (e.g. with
+    ``Arango(interceptors=[QueryCache()])``). The results are cached by
+    database, query, bind variables and count options, and hold the
+    encoded response, so every hit returns documents of its own.
+
+    As an interceptor, the cache sees the writes made through the API
+    wrapper: the entries of the collections written to are dropped as soon
+    as the write succeeded. Writes it cannot attribute to collections
+    (e.g. transactions or data modification queries) drop all entries of
+    the database. Writes made by other clients are only noticed after
+    ``ttl``, or, with ``check_revisions``, by comparing the revisions of
+    the collections of the query on every hit (one request per collection,
+    which is still cheaper than running most queries). The collections of
+    a query are found by parsing it on the server once per query string.
+
+    :param max_entries: the max number of cached results
+    :type max_entries: int
+    :param max_bytes: the max total size of the cached results in bytes
+    :type max_bytes: int or None
+    :param ttl: the max age of the cached results in seconds
+    :type ttl: int or float or None
+    :param check_revisions: check the revisions of the collections of a
+        query before returning its cached result
+    :type check_revisions: bool
+    """
+
+    def __init__(self, max_entries=1000, max_bytes=None, ttl=None,
+                 check_revisions=False):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.check_revisions = check_revisions
+        self._entries = OrderedDict()
+        self._parsed = OrderedDict()
+        self._bytes = 0
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._after_fork()
+        forksafe.register(self)
+
+    def _after_fork(self):
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def stats(self):
+        """Return the counters of the cache.
+
+        :returns: the hits, misses, entries and bytes
+        :rtype: dict
+        """
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+        }
+
+    @property
+    def generation(self):
+        """Return the number of invalidations so far.
+
+        Results read before an invalidation are not stored (see ``put``).
+
+        :rtype: int
+        """
+        return self._generation
+
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def get(self, key, revisions=None):
+        """Return the cached value of the key.
+
+        :param key: the cache key
+        :type key: tuple
+        :param revisions: function returning the current revisions of the
+            collections given, by name (only called with
+            ``check_revisions``)
+        :type revisions: callable or None
+        :returns: the cached value or None
+        :rtype: object
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires is not None and \
+                    entry.expires <= clock():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            # Move the entry to the most recently used end
+            del self._entries[key]
+            self._entries[key] = entry
+        if self.check_revisions and revisions is not None and \
+                entry.collections:
+            if revisions(entry.collections) != entry.revisions:
+                with self._lock:
+                    if self._entries.get(key) is entry:
+                        self._remove(key)
+                    self._misses += 1
+                return None
+        with self._lock:
+            self._hits += 1
+        return entry.value
+
+    def collections(self, database, query, parse):
+        """Return the names of the collections read by the query.
+
+        The result of ``parse`` is kept for the last ``max_entries`` query
+        strings of every database.
+
+        :param database: the URL prefix of the database
+        :type database: str
+        :param query: the AQL query
+        :type query: str
+        :param parse: function returning the names of the collections of
+            the query (called once per query string)
+        :type parse: callable
+        :returns: the names of the collections
+        :rtype: list
+        """
+        key = (database, query)
+        with self._lock:
+            collections = self._parsed.get(key)
+        if collections is None:
+            collections = parse()
+            with self._lock:
+                self._parsed[key] = collections
+                while len(self._parsed) > self.max_entries:
+                    self._parsed.popitem(last=False)
+        return collections
+
+    def put(self, key, value, size, collections=(), revisions=None,
+            generation=None):
+        """Store the value of the key.
+
+        :param key: the cache key
+        :type key: tuple
+        :param value: the value to cache
+        :type value: object
+        :param size: the size of the value in bytes
+        :type size: int
+        :param collections: the names of the collections the value depends on
+        :type collections: collections.Iterable
+        :param revisions: the revisions of the collections, by name
+        :type revisions: dict or None
+        :param generation: the ``generation`` read before the value was
+            read from the server; the value is not stored if there was an
+            invalidation since
+        :type generation: int or None
+        """
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        expires = None if self.ttl is None else clock() + self.ttl
+        entry = _Entry(value, frozenset(collections), revisions, size,
+                       expires)
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._bytes += size
+            while len(self._entries) > self.max_entries or (
+                    self.max_bytes is not None and
+                    self._bytes > self.max_bytes):
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, database=None, collection=None):
+        """Drop the cached results.
+
+        :param database: the URL prefix of the database (see
+            ``arango.api.API.url_prefix``), or None for all databases
+        :type database: str or None
+        :param collection: the name of the collection the results depend
+            on, or None for all collections
+        :type collection: str or None
+        """
+        with self._lock:
+            self._generation += 1
+            for key in list(self._entries):
+                if database is not None and key[0] != database:
+                    continue
+                if collection is not None and \
+                        collection not in self._entries[key].collections:
+                    continue
+                self._remove(key)
+
+    def clear(self):
+        """Drop all cached results."""
+        self.invalidate()
+
+    def after(self, request, response):
+        """Drop the cached results the successful write may change."""
+        if request.method in {"get", "head", "options"} or \
+                response.status_code >= 300:
+            return None
+        database = request.url[:len(request.url) - len(request.path)]
+        path = request.path.split("?", 1)[0]
+        match = _COLLECTION_PATH.match(path)
+        if match is not None:
+            self.invalidate(database, unquote(match.group(1)))
+        elif path in {"/_api/document", "/_api/edge", "/_api/import"} and \
+                (request.params or {}).get("collection"):
+            self.invalidate(database, request.params["collection"])
+        elif path == "/_api/cursor":
+            data = _decode(request.data)
+            query = data.get("query") if isinstance(data, dict) else None
+            if query is None or is_modifying(query):
+                self.invalidate(database)
+        elif _READ_PATH.match(path) is None:
+            self.invalidate(database)
+        return None
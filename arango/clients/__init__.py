@@ -1 +1,4 @@
 from arango.clients.default import DefaultClient
+from arango.clients.balanced import LoadBalancingClient
+from arango.clients.unix import UnixSocketClient
+from arango.clients.pipeline import PipelineClient
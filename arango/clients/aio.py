@@ -0,0 +1,389 @@
+"""Asyncio based client (requires Python 3.6+)."""
+
+import asyncio
+
+from arango import forksafe
+from arango.response import Response
+from arango.clients.base import BaseClient
+from arango.compression import WBITS, decompress
+from arango.clients.wire import (
+    REPLAYABLE_METHODS,
+    basic_auth,
+    build_request,
+    encode_body,
+    encode_chunks,
+    is_stream,
+    keeps_alive,
+    parse_header_lines,
+    parse_status_line,
+    response_has_body,
+    split_url,
+)
+
+
+class AsyncioClient(BaseClient):
+    """Asyncio based HTTP client for ArangoDB.
+
+    All HTTP methods are coroutines. Connections are kept alive and pooled
+    per host, and at most ``pool_size`` connections are opened to the same
+    host at any given time. Requests beyond that wait for a free connection.
+    Iterable request bodies are sent with chunked transfer encoding as
+    their pieces are produced, and gzip or deflate encoded responses are
+    decompressed.
+
+    ``timeout`` in ``init_data`` sets the default request timeout in
+    seconds, either one number or a tuple of the connect and read timeouts
+    (default: None, wait forever). Every method also accepts a ``timeout``
+    for the single call.
+    """
+
+    def __init__(self, init_data):
+        """Initialize the client with the credentials.
+
+        :param init_data: data for client initialization
+        :type init_data: dict
+        """
+        self.auth = init_data.get("auth")
+        self.pool_size = init_data.get("pool_size", 100)
+        self.ssl_context = init_data.get("ssl_context")
+        self.timeout = init_data.get("timeout")
+        self._authorization = basic_auth(self.auth)
+        self._idle = {}
+        self._semaphores = {}
+        forksafe.register(self)
+
+    def _after_fork(self):
+        """Drop the connections inherited from the parent process."""
+        self._idle = {}
+        self._semaphores = {}
+
+    async def _open(self, scheme, host, port):
+        """Open a new connection to the given address."""
+        ssl = None
+        if scheme == "https":
+            ssl = self.ssl_context if self.ssl_context is not None else True
+        return await asyncio.open_connection(host, port, ssl=ssl)
+
+    @staticmethod
+    async def _read_body(reader, headers):
+        """Read the response body and return it with the reusability flag."""
+        encoding = headers.get("Transfer-Encoding", "").lower()
+        if "chunked" in encoding:
+            chunks = []
+            while True:
+                size_line = await reader.readline()
+                size = int(size_line.split(b";", 1)[0].strip(), 16)
+                if size == 0:
+                    # Skip the trailer section
+                    line = await reader.readline()
+                    while line not in {b"\r\n", b"\n", b""}:
+                        line = await reader.readline()
+                    return b"".join(chunks), True
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+        length = headers.get("Content-Length")
+        if length is not None:
+            return await reader.readexactly(int(length)), True
+        return await reader.read(), False
+
+    async def _exchange(self, reader, writer, method, request, chunks,
+                        progress):
+        """Write the request and read back the response.
+
+        ``chunks`` are the pieces of a streamed body (or None), written and
+        drained one at a time. ``progress`` records whether any part of the
+        request has been written.
+        """
+        progress["sent"] = True
+        writer.write(request)
+        await writer.drain()
+        if chunks is not None:
+            for chunk in chunks:
+                writer.write(chunk)
+                await writer.drain()
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("connection closed by the server")
+        status_code, status_text = parse_status_line(status_line)
+        header_lines = []
+        while True:
+            line = await reader.readline()
+            if line in {b"\r\n", b"\n", b""}:
+                break
+            header_lines.append(line)
+        headers = parse_header_lines(header_lines)
+        if response_has_body(method, status_code):
+            body, reusable = await self._read_body(reader, headers)
+        else:
+            body, reusable = b"", True
+        reusable = reusable and keeps_alive(headers)
+        return status_code, status_text, headers, body, reusable
+
+    async def _request(self, method, url, data=None, params=None,
+                       headers=None, auth=None, timeout=None):
+        """Send the HTTP request and return the ArangoDB response."""
+        if timeout is None:
+            timeout = self.timeout
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+        else:
+            connect_timeout = read_timeout = timeout
+        scheme, host, port, target = split_url(url, params)
+        key = (scheme, host, port)
+        if key not in self._semaphores:
+            self._semaphores[key] = asyncio.Semaphore(self.pool_size)
+            self._idle[key] = []
+
+        request_headers = {"Connection": "keep-alive"}
+        authorization = basic_auth(auth) if auth else self._authorization
+        if authorization is not None:
+            request_headers["Authorization"] = authorization
+        if headers:
+            request_headers.update(headers)
+        chunks = encode_chunks(data) if is_stream(data) else None
+        request = build_request(
+            method=method,
+            target=target,
+            host="{}:{}".format(host, port),
+            headers=request_headers,
+            body=b"" if chunks is not None else encode_body(data),
+            chunked=chunks is not None,
+        )
+        progress = {"sent": False}
+
+        async with self._semaphores[key]:
+            idle = self._idle[key]
+            while True:
+                reused = bool(idle)
+                if reused:
+                    reader, writer = idle.pop()
+                    if reader.at_eof():
+                        # Closed by the server while idle
+                        writer.close()
+                        continue
+                else:
+                    try:
+                        reader, writer = await asyncio.wait_for(
+                            self._open(scheme, host, port), connect_timeout
+                        )
+                    except asyncio.TimeoutError:
+                        raise TimeoutError("timed out connecting to ArangoDB")
+                try:
+                    result = await asyncio.wait_for(
+                        self._exchange(
+                            reader, writer, method, request, chunks, progress
+                        ),
+                        read_timeout
+                    )
+                except asyncio.TimeoutError:
+                    writer.close()
+                    raise TimeoutError("timed out waiting for ArangoDB")
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    writer.close()
+                    # A pooled connection may have been closed by the server
+                    # while idle, so try once more on a fresh connection,
+                    # unless the server may have processed a write already
+                    if reused and (not progress["sent"] or (
+                            method in REPLAYABLE_METHODS and chunks is None)):
+                        continue
+                    raise
+                except BaseException:
+                    writer.close()
+                    raise
+                break
+            status_code, status_text, res_headers, body, reusable = result
+            if reusable:
+                idle.append((reader, writer))
+            else:
+                writer.close()
+
+        encoding = res_headers.get("Content-Encoding")
+        if body and encoding in WBITS:
+            body = decompress(body, encoding)
+
+        return Response(
+            method=method,
+            url=url,
+            headers=res_headers,
+            status_code=status_code,
+            content=body,
+            status_text=status_text
+        )
+
+    async def head(self, url, params=None, headers=None, auth=None,
+                   timeout=None):
+        """HTTP HEAD method.
+
+        :param url: request URL
+        :type url: str
+        :param params: request parameters
+        :type params: dict or None
+        :param headers: request headers
+        :type headers: dict or None
+        :param auth: username and password tuple
+        :type auth: tuple or None
+        :param timeout: the connect and read timeouts (default: the timeout
+            of the client)
+        :type timeout: int or float or tuple or None
+        :returns: ArangoDB http response object
+        :rtype: arango.response.Response
+        """
+        return await self._request(
+            "head", url, params=params, headers=headers, auth=auth,
+            timeout=timeout
+        )
+
+    async def get(self, url, params=None, headers=None, auth=None,
+                  timeout=None):
+        """HTTP GET method.
+
+        :param url: request URL
+        :type url: str
+        :param params: request parameters
+        :type params: dict or None
+        :param headers: request headers
+        :type headers: dict or None
+        :param auth: username and password tuple
+        :type auth: tuple or None
+        :param timeout: the connect and read timeouts (default: the timeout
+            of the client)
+        :type timeout: int or float or tuple or None
+        :returns: ArangoDB http response object
+        :rtype: arango.response.Response
+        """
+        return await self._request(
+            "get", url, params=params, headers=headers, auth=auth,
+            timeout=timeout
+        )
+
+    async def put(self, url, data=None, params=None, headers=None, auth=None,
+                  timeout=None):
+        """HTTP PUT method.
+
+        :param url: request URL
+        :type url: str
+        :param data: request payload
+        :type data: str or dict or None
+        :param params: request parameters
+        :type params: dict or None
+        :param headers: request headers
+        :type headers: dict or None
+        :param auth: username and password tuple
+        :type auth: tuple or None
+        :param timeout: the connect and read timeouts (default: the timeout
+            of the client)
+        :type timeout: int or float or tuple or None
+        :returns: ArangoDB http response object
+        :rtype: arango.response.Response
+        """
+        return await self._request(
+            "put", url, data=data, params=params, headers=headers, auth=auth,
+            timeout=timeout
+        )
+
+    async def post(self, url, data=None, params=None, headers=None,
+                   auth=None,
+                   timeout=None):
+        """HTTP POST method.
+
+        :param url: request URL
+        :type url: str
+        :param data: request payload
+        :type data: str or dict or None
+        :param params: request parameters
+        :type params: dict or None
+        :param headers: request headers
+        :type headers: dict or None
+        :param auth: username and password tuple
+        :type auth: tuple or None
+        :param timeout: the connect and read timeouts (default: the timeout
+            of the client)
+        :type timeout: int or float or tuple or None
+        :returns: ArangoDB http response object
+        :rtype: arango.response.Response
+        """
+        return await self._request(
+            "post", url, data=data, params=params, headers=headers, auth=auth,
+            timeout=timeout
+        )
+
+    async def patch(self, url, data=None, params=None, headers=None,
+                    auth=None,
+                    timeout=None):
+        """HTTP PATCH method.
+
+        :param url: request URL
+        :type url: str
+        :param data: request payload
+        :type data: str or dict or None
+        :param params: request parameters
+        :type params: dict or None
+        :param headers: request headers
+        :type headers: dict or None
+        :param auth: username and password tuple
+        :type auth: tuple or None
+        :param timeout: the connect and read timeouts (default: the timeout
+            of the client)
+        :type timeout: int or float or tuple or None
+        :returns: ArangoDB http response object
+        :rtype: arango.response.Response
+        """
+        return await self._request(
+            "patch", url, data=data, params=params, headers=headers, auth=auth,
+            timeout=timeout
+        )
+
+    async def delete(self, url, params=None, headers=None, auth=None,
+                     timeout=None):
+        """HTTP DELETE method.
+
+        :param url: request URL
+        :type url: str
+        :param params: request parameters
+        :type params: dict or None
+        :param headers: request headers
+        :type headers: dict or None
+        :param auth: username and password tuple
+        :type auth: tuple or None
+        :param timeout: the connect and read timeouts (default: the timeout
+            of the client)
+        :type timeout: int or float or tuple or None
+        :returns: ArangoDB http response object
+        :rtype: arango.response.Response
+        """
+        return await self._request(
+            "delete", url, params=params, headers=headers, auth=auth,
+            timeout=timeout
+        )
+
+    async def options(self, url, data=None, params=None, headers=None,
+                      auth=None, timeout=None):
+        """HTTP OPTIONS method.
+
+        :param url: request URL
+        :type url: str
+        :param data: request payload
+        :type data: str or dict or None
+        :param params: request parameters
+        :type params: dict or None
+        :param headers: request headers
+        :type headers: dict or None
+        :param auth: username and password tuple
+        :type auth: tuple or None
+        :param timeout: the connect and read timeouts (default: the timeout
+            of the client)
+        :type timeout: int or float or tuple or None
+        :returns: ArangoDB http response object
+        :rtype: arango.response.Response
+        """
+        return await self._request(
+            "options", url, data=data, params=params, headers=headers,
+            auth=auth, timeout=timeout
+        )
+
+    async def close(self):
+        """Close all pooled connections."""
+        for idle in self._idle.values():
+            while idle:
+                _, writer = idle.pop()
+                writer.close()
@@ -0,0 +1,447 @@
+"""Client spreading the requests over multiple ArangoDB coordinators."""
+
+import random
+import threading
+import time
+
+try:
+    from urlparse import urlsplit, urlunsplit
+except ImportError:
+    from urllib.parse import urlsplit, urlunsplit
+
+from arango import forksafe
+from arango.clients.base import BaseClient
+from arango.clients.default import DefaultClient
+from arango.constants import HTTP_OK
+
+# Valid load balancing strategies
+STRATEGIES = {"round_robin", "random", "least_outstanding"}
+
+# Methods which are safe to send again to another endpoint on failure
+IDEMPOTENT_METHODS = {"head", "get", "options"}
+
+# HTTP status codes counted as endpoint failures
+FAILURE_STATUSES = {502, 503, 504}
+
+
+class Endpoint(object):
+    """The state of a single coordinator endpoint.
+
+    :param url: the endpoint URL (e.g. 'http://10.0.0.1:8529')
+    :type url: str
+    """
+
+    def __init__(self, url):
+        parts = urlsplit(url)
+        self.url = url
+        self.scheme = parts.scheme or "http"
+        self.netloc = parts.netloc
+        self.outstanding = 0
+        self.failures = 0
+        self.ejected_until = None
+
+    def is_available(self, now):
+        """Return True if requests may be sent to this endpoint."""
+        return self.ejected_until is None or self.ejected_until <= now
+
+    def status(self):
+        """Return the state of this endpoint as a dictionary."""
+        return {
+            "url": self.url,
+            "healthy": self.ejected_until is None,
+            "outstanding": self.outstanding,
+            "failures": self.failures,
+        }
+
+
+class LoadBalancingClient(BaseClient):
+    """HTTP client which spreads requests over multiple coordinators.
+
+    The host part of every request URL is replaced by the endpoint chosen
+    by the load balancing strategy:
+
+    ``round_robin``: cycle through the endpoints in order
+    ``random``: pick an endpoint at random
+    ``least_outstanding``: pick the endpoint with the fewest requests in
+        flight (ties are broken in round robin order)
+
+    Endpoints are health-checked passively: connection errors and 502, 503
+    and 504 responses count as failures, and an endpoint is ejected after
+    ``max_failures`` consecutive ones. An ejected endpoint receives a trial
+    request again after ``eject_time`` seconds and is brought back on the
+    first success. If ``health_check_interval`` is set, a background thread
+    also sends ``HEAD /_api/version`` to every endpoint on that interval,
+    ejecting and restoring endpoints based on the result.
+
+    Failed HEAD, GET and OPTIONS requests are retried on the remaining
+    endpoints. Writes are never resent since they may have been applied.
+
+    The following keys are read from ``init_data``:
+
+    ``auth``: the username and password tuple
+    ``endpoints``: the list of endpoint URLs (e.g. ['http://host1:8529'])
+    ``strategy``: the load balancing strategy (default: 'round_robin')
+    ``max_failures``: failures before an endpoint is ejected (default: 3)
+    ``eject_time``: seconds before an ejected endpoint is retried
+        (default: 10)
+    ``health_check_interval``: seconds between active health checks
+        (default: None, no active checks)
+    ``health_check_timeout``: the timeout of the health check requests in
+        seconds (default: 5)
+    ``client``: the HTTP client sending the requests (default: a new
+        DefaultClient built from ``init_data``)
+    """
+
+    def __init__(self, init_data):
+        """Initialize the client with the endpoints.
+
+        :param init_data: data for client initialization
+        :type init_data: dict
+        :raises: ValueError
+        """
+        endpoints = init_data.get("endpoints")
+        if not endpoints:
+            raise ValueError("at least one endpoint is required")
+        self.strategy = init_data.get("strategy", "round_robin")
+        if self.strategy not in STRATEGIES:
+            raise ValueError(
+                "invalid load balancing strategy '{}'".format(self.strategy)
+            )
+        self.endpoints = [Endpoint(url) for url in endpoints]
+        self.max_failures = init_data.get("max_failures", 3)
+        self.eject_time = init_data.get("eject_time", 10)
+        self.health_check_interval = init_data.get("health_check_interval")
+        self.health_check_timeout = init_data.get("health_check_timeout", 5)
+        self.client = init_data.get("client") or DefaultClient(init_data)
+        self._next = 0
+        self._stopped = threading.Event()
+        self._start()
+        forksafe.register(self)
+
+    def _start(self):
+        """Create the lock and start the health checks if enabled."""
+        self._lock = threading.Lock()
+        self._health_checker = None
+        if self.health_check_interval and not self._stopped.is_set():
+            self._health_checker = threading.Thread(
+                target=self._run_health_checks
+            )
+            self._health_checker.daemon = True
+            self._health_checker.start()
+
+    def _after_fork(self):
+        """Restart the health checks, whose thread was not forked."""
+        stopped = self._stopped.is_set()
+        self._stopped = threading.Event()
+        if stopped:
+            self._stopped.set()
+        self._start()
+
+    @property
+    def endpoint_status(self):
+        """Return the state of every endpoint.
+
+        :returns: the url, healthy flag, outstanding requests and failures
+        :rtype: list
+        """
+        with self._lock:
+            return [endpoint.status() for endpoint in self.endpoints]
+
+    def _choose(self, exclude):
+        """Choose the endpoint for the next request and reserve it."""
+        with self._lock:
+            now = time.time()
+            candidates = [
+                endpoint for endpoint in self.endpoints
+                if endpoint not in exclude and endpoint.is_available(now)
+            ]
+            if not candidates:
+                # Every endpoint is ejected, so fall back to the one whose
+                # ejection ends first rather than failing outright
+                candidates = sorted(
+                    [e for e in self.endpoints if e not in exclude],
+                    key=lambda e: e.ejected_until
+                )[:1]
+                if not candidates:
+                    return None
+            start = self._next
+            self._next += 1
+            if self.strategy == "random":
+                endpoint = random.choice(candidates)
+            elif self.strategy == "least_outstanding":
+                count = len(candidates)
+                endpoint = min(
+                    (candidates[(start + i) % count] for i in range(count)),
+                    key=lambda e: e.outstanding
+                )
+            else:
+                endpoint = candidates[start % len(candidates)]
+            endpoint.outstanding += 1
+            return endpoint
+
+    def _record(self, endpoint, success):
+        """Release the endpoint and record the outcome of the request."""
+        with self._lock:
+            endpoint.outstanding -= 1
+            self._mark(endpoint, success)
+
+    def _mark(self, endpoint, success):
+        """Update the health of the endpoint (the lock must be held)."""
+        if success:
+            endpoint.failures = 0
+            endpoint.ejected_until = None
+        else:
+            endpoint.failures += 1
+            if (endpoint.ejected_until is not None or
+                    endpoint.failures >= self.max_failures):
+                endpoint.ejected_until = time.time() + self.eject_time
+
+    @staticmethod
+    def _rewrite(url, endpoint):
+        """Point the request URL to the given endpoint."""
+        parts = urlsplit(url)
+        return urlunsplit((
+            endpoint.scheme, endpoint.netloc, parts.path, parts.query,
+            parts.fragment
+        ))
+
+    def _send(self, method, url, **kwargs):
+        """Send the request to the chosen endpoint, failing over if safe."""
+        if kwargs.get("timeout") is None:
+            # Leave the timeout to the wrapped client
+            kwargs.pop("timeout", None)
+        tried = []
+        while True:
+            endpoint = self._choose(tried)
+            if endpoint is None:
+                raise last_error
+            tried.append(endpoint)
+            try:
+                res = getattr(self.client, method)(
+                    url=self._rewrite(url, endpoint), **kwargs
+                )
+            except (IOError, OSError) as error:
+                self._record(endpoint, success=False)
+                if method not in IDEMPOTENT_METHODS:
+                    raise
+                last_error = error
+                continue
+            failed = res.status_code in FAILURE_STATUSES
+            self._record(endpoint, success=not failed)
+            if failed and method in IDEMPOTENT_METHODS:
+                if len(tried) < len(self.endpoints):
+                    continue
+            return res
+
+    def check_health(self):
+        """Send ``HEAD /_api/version`` to every endpoint and update them."""
+        for endpoint in list(self.endpoints):
+            url = "{}://{}/_api/version".format(
+                endpoint.scheme, endpoint.netloc
+            )
+            try:
+                success = self.client.head(
+                    url, timeout=self.health_check_timeout
+                ).status_code in HTTP_OK
+            except (IOError, OSError):
+                success = False
+            with self._lock:
+                if success or endpoint.failures + 1 >= self.max_failures:
+                    self._mark(endpoint, success)
+                else:
+                    endpoint.failures += 1
+
+    def _run_health_checks(self):
+        """Run the active health checks until the client is closed."""
+        while not self._stopped.wait(self.health_check_interval):
+            self.check_health()
+
+    def head(self, url, params=None, headers=None, auth=None,
+             timeout=None):
+        """HTTP HEAD method.
+
+        :param url: request URL
+        :type url: str
+        :param params: request parameters
+        :type params: dict or None
+        :param headers: request headers
+        :type headers: dict or None
+        :param auth: username and password tuple
+        :type auth: tuple or None
+        :param timeout: the connect and read timeouts of the request
+        :type timeout: int or float or tuple or None
+        :returns: ArangoDB http response object
+        :rtype: arango.response.Response
+        """
+        return self._send(
+            "head", url, params=params, headers=headers, auth=auth,
+            timeout=timeout
+        )
+
+    def get(self, url, params=None, headers=None, auth=None,
+            timeout=None):
+        """HTTP GET method.
+
+        :param url: request URL
+        :type url: str
+        :param params: request parameters
+        :type params: dict or None
+        :param headers: request headers
+        :type headers: dict or None
+        :param auth: username and password tuple
+        :type auth: tuple or None
+        :param timeout: the connect and read timeouts of the request
+        :type timeout: int or float or tuple or None
+        :returns: ArangoDB http response object
+        :rtype: arango.response.Response
+        """
+        return self._send(
+            "get", url, params=params, headers=headers, auth=auth,
+            timeout=timeout
+        )
+
+    def put(self, url, data=None, params=None, headers=None, auth=None,
+            timeout=None):
+        """HTTP PUT method.
+
+        :param url: request URL
+        :type url: str
+        :param data: request payload
+        :type data: str or dict or None
+        :param params: request parameters
+        :type params: dict or None
+        :param headers: request headers
+        :type headers: dict or None
+        :param auth: username and password tuple
+        :type auth: tuple or None
+        :param timeout: the connect and read timeouts of the request
+        :type timeout: int or float or tuple or None
+        :returns: ArangoDB http response object
+        :rtype: arango.response.Response
+        """
+        return self._send(
+            "put", url, data=data, params=params, headers=headers, auth=auth,
+            timeout=timeout
+        )
+
+    def post(self, url, data=None, params=None, headers=None, auth=None,
+             timeout=None):
+        """HTTP POST method.
+
+        :param url: request URL
+        :type url: str
+        :param data: request payload
+        :type data: str or dict or None
+        :param params: request parameters
+        :type params: dict or None
+        :param headers: request headers
+        :type headers: dict or None
+        :param auth: username and password tuple
+        :type auth: tuple or None
+        :param timeout: the connect and read timeouts of the request
+        :type timeout: int or float or tuple or None
+        :returns: ArangoDB http response object
+        :rtype: arango.response.Response
+        """
+        return self._send(
+            "post", url, data=data, params=params, headers=headers, auth=auth,
+            timeout=timeout
+        )
+
+    def patch(self, url, data=None, params=None, headers=None, auth=None,
+              timeout=None):
+        """HTTP PATCH method.
+
+        :param url: request URL
+        :type url: str
+        :param data: request payload
+        :type data: str or dict or None
+        :param params: request parameters
+        :type params: dict or None
+        :param headers: request headers
+        :type headers: dict or None
+        :param auth: username and password tuple
+        :type auth: tuple or None
+        :param timeout: the connect and read timeouts of the request
+        :type timeout: int or float or tuple or None
+        :returns: ArangoDB http response object
+        :rtype: arango.response.Response
+        """
+        return self._send(
+            "patch", url, data=data, params=params, headers=headers, auth=auth,
+            timeout=timeout
+        )
+
+    def delete(self, url, params=None, headers=None, auth=None,
+               timeout=None):
+        """HTTP DELETE method.
+
+        :param url: request URL
+        :type url: str
+        :param params: request parameters
+        :type params: dict or None
+        :param headers: request headers
+        :type headers: dict or None
+        :param auth: username and password tuple
+        :type auth: tuple or None
+        :param timeout: the connect and read timeouts of the request
+        :type timeout: int or float or tuple or None
+        :returns: ArangoDB http response object
+        :rtype: arango.response.Response
+        """
+        return self._send(
+            "delete", url, params=params, headers=headers, auth=auth,
+            timeout=timeout
+        )
+
+    def options(self, url, data=None, params=None, headers=None, auth=None,
+                timeout=None):
+        """HTTP OPTIONS method.
+
+        :param url: request URL
+        :type url: str
+        :param data: request payload
+        :type data: str or dict or None
+        :param params: request parameters
+        :type params: dict or None
+        :param headers: request headers
+        :type headers: dict or None
+        :param auth: username and password tuple
+        :type auth: tuple or None
+        :param timeout: the connect and read timeouts of the request
+        :type timeout: int or float or tuple or None
+        :returns: ArangoDB http response object
+        :rtype: arango.response.Response
+        """
+        return self._send(
+            "options", url, data=data, params=params, headers=headers,
+            auth=auth, timeout=timeout
+        )
+
+    def prewarm(self, url, count):
+        """Open up to ``count`` pooled connections to every endpoint.
+
+        :param url: any URL on the cluster (its host part is replaced)
+        :type url: str
+        :param count: the number of connections to open per endpoint
+        :type count: int
+        """
+        if not hasattr(self.client, "prewarm"):
+            return
+        for endpoint in self.endpoints:
+            try:
+                self.client.prewarm(self._rewrite(url, endpoint), count)
+            except (IOError, OSError):
+                with self._lock:
+                    self._mark(endpoint, success=False)
+
+    @property
+    def pool_stats(self):
+        """Return the connection pool counters of the underlying client."""
+        return getattr(self.client, "pool_stats", None)
+
+    def close(self):
+        """Stop the health checks and close the underlying client."""
+        self._stopped.set()
+        if hasattr(self.client, "close"):
+            self.client.close()
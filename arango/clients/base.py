@@ -6,13 +6,16 @@ from abc import ABCMeta, abstractmethod
 class BaseClient(object):
     """Base class for ArangoDB clients.
 
-    The methods MUST return an ``arango.response.Response`` object.
+    The methods MUST return an ``arango.response.Response`` object. They
+    are given a ``timeout`` when the call has its own timeout or a deadline
+    is active (see ``arango.deadline``).
     """
 
     __metaclass__ = ABCMeta
 
     @abstractmethod
-    def head(self, url, params=None, headers=None, auth=None):
+    def head(self, url, params=None, headers=None, auth=None,
+             timeout=None):
         """HTTP HEAD method.
 
         :param url: request URL
@@ -23,13 +26,17 @@ class BaseClient(object):
         :type headers: dict or None
         :param auth: username and password tuple
         :type auth: tuple or None
+        :param timeout: the connect and read timeouts (default: the timeout
+            of the client)
+        :type timeout: int or float or tuple or None
         :returns: ArangoDB http response object
         :rtype: arango.response.Response
         """
         raise NotImplementedError
 
     @abstractmethod
-    def get(self, url, params=None, headers=None, auth=None):
+    def get(self, url, params=None, headers=None, auth=None,
+            timeout=None):
         """HTTP GET method.
 
         :param url: request URL
@@ -40,13 +47,17 @@ class BaseClient(object):
         :type headers: dict or None
         :param auth: username and password tuple
         :type auth: tuple or None
+        :param timeout: the connect and read timeouts (default: the timeout
+            of the client)
+        :type timeout: int or float or tuple or None
         :returns: ArangoDB http response object
         :rtype: arango.response.Response
         """
         raise NotImplementedError
 
     @abstractmethod
-    def post(self, url, data=None, params=None, headers=None, auth=None):
+    def post(self, url, data=None, params=None, headers=None, auth=None,
+             timeout=None):
         """HTTP POST method.
 
         :param url: request URL
@@ -59,13 +70,17 @@ class BaseClient(object):
         :type headers: dict or None
         :param auth: username and password tuple
         :type auth: tuple or None
+        :param timeout: the connect and read timeouts (default: the timeout
+            of the client)
+        :type timeout: int or float or tuple or None
         :returns: ArangoDB http response object
         :rtype: arango.response.Response
         """
         raise NotImplementedError
 
     @abstractmethod
-    def put(self, url, data=None, params=None, headers=None, auth=None):
+    def put(self, url, data=None, params=None, headers=None, auth=None,
+            timeout=None):
         """HTTP PUT method.
 
         :param url: request URL
@@ -78,13 +93,17 @@ class BaseClient(object):
         :type headers: dict or None
         :param auth: username and password tuple
         :type auth: tuple or None
+        :param timeout: the connect and read timeouts (default: the timeout
+            of the client)
+        :type timeout: int or float or tuple or None
         :returns: ArangoDB http response object
         :rtype: arango.response.Response
         """
         raise NotImplementedError
 
     @abstractmethod
-    def patch(self, url, data=None, params=None, headers=None, auth=None):
+    def patch(self, url, data=None, params=None, headers=None, auth=None,
+              timeout=None):
         """HTTP PATCH method.
 
         :param url: request URL
@@ -97,13 +116,17 @@ class BaseClient(object):
         :type headers: dict or None
         :param auth: username and password tuple
         :type auth: tuple or None
+        :param timeout: the connect and read timeouts (default: the timeout
+            of the client)
+        :type timeout: int or float or tuple or None
         :returns: ArangoDB http response object
         :rtype: arango.response.Response
         """
         raise NotImplementedError
 
     @abstractmethod
-    def delete(self, url, params=None, headers=None, auth=None):
+    def delete(self, url, params=None, headers=None, auth=None,
+               timeout=None):
         """HTTP DELETE method.
 
         :param url: request URL
@@ -114,13 +137,17 @@ class BaseClient(object):
         :type headers: dict or None
         :param auth: username and password tuple
         :type auth: tuple or None
+        :param timeout: the connect and read timeouts (default: the timeout
+            of the client)
+        :type timeout: int or float or tuple or None
         :returns: ArangoDB http response object
         :rtype: arango.response.Response
         """
         raise NotImplementedError
 
     @abstractmethod
-    def options(self, url, data=None, params=None, headers=None, auth=None):
+    def options(self, url, data=None, params=None, headers=None, auth=None,
+                timeout=None):
         """HTTP OPTIONS method.
 
         :param url: request URL
@@ -133,6 +160,9 @@ class BaseClient(object):
         :type headers: dict or None
         :param auth: username and password tuple
         :type auth: tuple or None
+        :param timeout: the connect and read timeouts (default: the timeout
+            of the client)
+        :type timeout: int or float or tuple or None
         :returns: ArangoDB http response object
         :rtype: arango.response.Response
         """
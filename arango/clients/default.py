@@ -1,13 +1,184 @@
 """Session based client using requests."""
 
-from requests import Session
+import socket
+import threading
+import time
 
+from requests import Request, Session
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.connection import HTTPConnection
+from requests.packages.urllib3.connectionpool import (
+    HTTPConnectionPool,
+    HTTPSConnectionPool,
+)
+from requests.packages.urllib3.poolmanager import PoolManager
+
+from arango import forksafe
 from arango.response import Response
 from arango.clients.base import BaseClient
 
 
+class PoolStats(object):
+    """Thread-safe counters of the connection pool activity.
+
+    ``hits``: requests served by an already open pooled connection
+    ``new_connections``: sockets opened (including re-opened ones)
+    ``waits``: requests which had to wait for a free connection
+    ``evictions``: idle connections closed by the idle timeout
+    ``discards``: connections closed because the pool was already full
+    """
+
+    FIELDS = ("hits", "new_connections", "waits", "evictions", "discards")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(self.FIELDS, 0)
+
+    def incr(self, field):
+        """Increment the given counter by one.
+
+        :param field: the name of the counter
+        :type field: str
+        """
+        with self._lock:
+            self._counts[field] += 1
+
+    def snapshot(self):
+        """Return the current values of the counters.
+
+        :returns: the mapping of the counter names to their values
+        :rtype: dict
+        """
+        with self._lock:
+            return dict(self._counts)
+
+
+class _InstrumentedPoolMixin(object):
+    """Connection pool which records its activity in a PoolStats object.
+
+    Connections idle for longer than ``arango_idle_timeout`` seconds are
+    closed and re-opened before being handed out again.
+    """
+
+    arango_stats = None
+    arango_idle_timeout = None
+
+    def _get_conn(self, timeout=None):
+        stats = self.arango_stats
+        if self.block and self.pool is not None and self.pool.empty():
+            stats.incr("waits")
+        conn = super(_InstrumentedPoolMixin, self)._get_conn(timeout)
+        if getattr(conn, "sock", None) is not None:
+            last_used = getattr(conn, "arango_last_used", None)
+            if (self.arango_idle_timeout is not None and
+                    last_used is not None and
+                    time.time() - last_used > self.arango_idle_timeout):
+                conn.close()
+                stats.incr("evictions")
+                stats.incr("new_connections")
+            else:
+                stats.incr("hits")
+        else:
+            stats.incr("new_connections")
+        return conn
+
+    def _put_conn(self, conn):
+        if conn is not None:
+            conn.arango_last_used = time.time()
+            if self.pool is not None and self.pool.full():
+                self.arango_stats.incr("discards")
+        super(_InstrumentedPoolMixin, self)._put_conn(conn)
+
+
+class _InstrumentedHTTPConnectionPool(_InstrumentedPoolMixin,
+                                      HTTPConnectionPool):
+    """HTTP connection pool with activity counters."""
+
+
+class _InstrumentedHTTPSConnectionPool(_InstrumentedPoolMixin,
+                                       HTTPSConnectionPool):
+    """HTTPS connection pool with activity counters."""
+
+
+class _InstrumentedPoolManager(PoolManager):
+    """Pool manager which creates instrumented connection pools."""
+
+    def __init__(self, stats, idle_timeout, *args, **kwargs):
+        super(_InstrumentedPoolManager, self).__init__(*args, **kwargs)
+        self.pool_classes_by_scheme = {
+            "http": _InstrumentedHTTPConnectionPool,
+            "https": _InstrumentedHTTPSConnectionPool,
+        }
+        self.arango_stats = stats
+        self.arango_idle_timeout = idle_timeout
+
+    def _new_pool(self, *args, **kwargs):
+        pool = super(_InstrumentedPoolManager, self)._new_pool(
+            *args, **kwargs
+        )
+        pool.arango_stats = self.arango_stats
+        pool.arango_idle_timeout = self.arango_idle_timeout
+        return pool
+
+
+class _PoolAdapter(HTTPAdapter):
+    """Transport adapter using the instrumented pool manager."""
+
+    arango_idle_timeout = None
+    arango_keep_alive = True
+
+    def __init__(self, stats, idle_timeout=None, keep_alive=True, **kwargs):
+        self.arango_stats = stats
+        self.arango_idle_timeout = idle_timeout
+        self.arango_keep_alive = keep_alive
+        super(_PoolAdapter, self).__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False,
+                         **pool_kwargs):
+        if self.arango_keep_alive:
+            pool_kwargs["socket_options"] = (
+                HTTPConnection.default_socket_options +
+                [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+            )
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = _InstrumentedPoolManager(
+            self.arango_stats,
+            self.arango_idle_timeout,
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            **pool_kwargs
+        )
+
+    def __setstate__(self, state):
+        self.arango_stats = PoolStats()
+        super(_PoolAdapter, self).__setstate__(state)
+
+
 class DefaultClient(BaseClient):
-    """Session based HTTP (default) client for ArangoDB."""
+    """Session based HTTP (default) client for ArangoDB.
+
+    The following optional keys in ``init_data`` configure the pool of
+    persistent connections kept by the session:
+
+    ``pool_size``: max number of connections kept open per host (default: 10)
+    ``pool_block``: wait for a free connection instead of opening a
+        throwaway one when all pooled connections are busy (default: False)
+    ``keep_alive``: reuse connections and enable TCP keep-alive probes on
+        them; if False, every request uses a new connection (default: True)
+    ``idle_timeout``: close pooled connections idle for longer than this
+        number of seconds before reusing them (default: None)
+
+    ``timeout`` sets the default request timeout in seconds, either one
+    number or a tuple of the connect and read timeouts (default: None, wait
+    forever). Every method also accepts a ``timeout`` for the single call.
+
+    The client can be shared by threads. In a child process, the pooled
+    connections inherited from the parent are dropped (see
+    ``arango.forksafe``).
+    """
 
     def __init__(self, init_data):
         """Initialize the session with the credentials.
@@ -17,8 +188,75 @@ class DefaultClient(BaseClient):
         """
         self.session = Session()
         self.session.auth = init_data["auth"]
+        self.stats = PoolStats()
+        self.timeout = init_data.get("timeout")
+        keep_alive = init_data.get("keep_alive", True)
+        adapter = _PoolAdapter(
+            stats=self.stats,
+            idle_timeout=init_data.get("idle_timeout"),
+            keep_alive=keep_alive,
+            pool_maxsize=init_data.get("pool_size", 10),
+            pool_block=init_data.get("pool_block", False),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+        forksafe.register(self)
+
+    def _after_fork(self):
+        """Start over with new connection pools in the child process."""
+        self.stats = PoolStats()
+        for adapter in self.session.adapters.values():
+            if isinstance(adapter, _PoolAdapter):
+                adapter.arango_stats = self.stats
+                adapter.proxy_manager = {}
+                adapter.init_poolmanager(
+                    adapter._pool_connections,
+                    adapter._pool_maxsize,
+                    block=adapter._pool_block,
+                )
+
+    @property
+    def pool_stats(self):
+        """Return the counters of the connection pool activity.
+
+        :returns: the hits, new_connections, waits, evictions and discards
+        :rtype: dict
+        """
+        return self.stats.snapshot()
+
+    def prewarm(self, url, count):
+        """Open up to ``count`` pooled connections to the host of ``url``.
+
+        :param url: any URL on the host to connect to
+        :type url: str
+        :param count: the number of connections to open
+        :type count: int
+        """
+        adapter = self.session.get_adapter(url)
+        if hasattr(adapter, "get_connection_with_tls_context"):
+            settings = self.session.merge_environment_settings(
+                url, {}, None, None, None
+            )
+            pool = adapter.get_connection_with_tls_context(
+                Request("GET", url).prepare(), settings["verify"]
+            )
+        else:
+            pool = adapter.get_connection(url)
+        connections = []
+        try:
+            for _ in range(min(count, pool.pool.maxsize)):
+                conn = pool._get_conn()
+                connections.append(conn)
+                if getattr(conn, "sock", None) is None:
+                    conn.connect()
+        finally:
+            for conn in connections:
+                pool._put_conn(conn)
 
-    def head(self, url, params=None, headers=None, auth=None):
+    def head(self, url, params=None, headers=None, auth=None,
+             timeout=None):
         """HTTP HEAD method.
 
         :param url: request URL
@@ -29,6 +267,9 @@ class DefaultClient(BaseClient):
         :type headers: dict or None
         :param auth: username and password tuple
         :type auth: tuple or None
+        :param timeout: the connect and read timeouts (default: the timeout
+            of the client)
+        :type timeout: int or float or tuple or None
         :returns: ArangoDB http response object
         :rtype: arango.response.Response
         """
@@ -36,17 +277,19 @@ class DefaultClient(BaseClient):
             url=url,
             params=params,
             headers=headers,
+            timeout=self.timeout if timeout is None else timeout,
         )
         return Response(
             method="head",
             url=url,
             headers=res.headers,
             status_code=res.status_code,
-            content=res.text,
+            content=res.content,
             status_text=res.reason
         )
 
-    def get(self, url, params=None, headers=None, auth=None):
+    def get(self, url, params=None, headers=None, auth=None,
+            timeout=None):
         """HTTP GET method.
 
         :param url: request URL
@@ -57,6 +300,9 @@ class DefaultClient(BaseClient):
         :type headers: dict or None
         :param auth: username and password tuple
         :type auth: tuple or None
+        :param timeout: the connect and read timeouts (default: the timeout
+            of the client)
+        :type timeout: int or float or tuple or None
         :returns: ArangoDB http response object
         :rtype: arango.response.Response
         """
@@ -64,17 +310,19 @@ class DefaultClient(BaseClient):
             url=url,
             params=params,
             headers=headers,
+            timeout=self.timeout if timeout is None else timeout,
         )
         return Response(
             method="get",
             url=url,
             headers=res.headers,
             status_code=res.status_code,
-            content=res.text,
+            content=res.content,
             status_text=res.reason
         )
 
-    def put(self, url, data=None, params=None, headers=None, auth=None):
+    def put(self, url, data=None, params=None, headers=None, auth=None,
+            timeout=None):
         """HTTP PUT method.
 
         :param url: request URL
@@ -87,6 +335,9 @@ class DefaultClient(BaseClient):
         :type headers: dict or None
         :param auth: username and password tuple
         :type auth: tuple or None
+        :param timeout: the connect and read timeouts (default: the timeout
+            of the client)
+        :type timeout: int or float or tuple or None
         :returns: ArangoDB http response object
         :rtype: arango.response.Response
         """
@@ -95,17 +346,19 @@ class DefaultClient(BaseClient):
             data=data,
             params=params,
             headers=headers,
+            timeout=self.timeout if timeout is None else timeout,
         )
         return Response(
             method="put",
             url=url,
             headers=res.headers,
             status_code=res.status_code,
-            content=res.text,
+            content=res.content,
             status_text=res.reason
         )
 
-    def post(self, url, data=None, params=None, headers=None, auth=None):
+    def post(self, url, data=None, params=None, headers=None, auth=None,
+             timeout=None):
         """HTTP POST method.
 
         :param url: request URL
@@ -118,6 +371,9 @@ class DefaultClient(BaseClient):
         :type headers: dict or None
         :param auth: username and password tuple
         :type auth: tuple or None
+        :param timeout: the connect and read timeouts (default: the timeout
+            of the client)
+        :type timeout: int or float or tuple or None
         :returns: ArangoDB http response object
         :rtype: arango.response.Response
         """
@@ -126,17 +382,19 @@ class DefaultClient(BaseClient):
             data="" if data is None else data,
             params={} if params is None else params,
             headers={} if headers is None else headers,
+            timeout=self.timeout if timeout is None else timeout,
         )
         return Response(
             method="post",
             url=url,
             headers=res.headers,
             status_code=res.status_code,
-            content=res.text,
+            content=res.content,
             status_text=res.reason
         )
 
-    def patch(self, url, data=None, params=None, headers=None, auth=None):
+    def patch(self, url, data=None, params=None, headers=None, auth=None,
+              timeout=None):
         """HTTP PATCH method.
 
         :param url: request URL
@@ -149,6 +407,9 @@ class DefaultClient(BaseClient):
         :type headers: dict or None
         :param auth: username and password tuple
         :type auth: tuple or None
+        :param timeout: the connect and read timeouts (default: the timeout
+            of the client)
+        :type timeout: int or float or tuple or None
         :returns: ArangoDB http response object
         :rtype: arango.response.Response
         """
@@ -157,17 +418,19 @@ class DefaultClient(BaseClient):
             data=data,
             params=params,
             headers=headers,
+            timeout=self.timeout if timeout is None else timeout,
         )
         return Response(
             method="patch",
             url=url,
             headers=res.headers,
             status_code=res.status_code,
-            content=res.text,
+            content=res.content,
             status_text=res.reason
         )
 
-    def delete(self, url, params=None, headers=None, auth=None):
+    def delete(self, url, params=None, headers=None, auth=None,
+               timeout=None):
         """HTTP DELETE method.
 
         :param url: request URL
@@ -178,6 +441,9 @@ class DefaultClient(BaseClient):
         :type headers: dict or None
         :param auth: username and password tuple
         :type auth: tuple or None
+        :param timeout: the connect and read timeouts (default: the timeout
+            of the client)
+        :type timeout: int or float or tuple or None
         :returns: ArangoDB http response object
         :rtype: arango.response.Response
         """
@@ -186,17 +452,19 @@ class DefaultClient(BaseClient):
             params=params,
             headers=headers,
             auth=auth,
+            timeout=self.timeout if timeout is None else timeout,
         )
         return Response(
             method="delete",
             url=url,
             headers=res.headers,
             status_code=res.status_code,
-            content=res.text,
+            content=res.content,
             status_text=res.reason
         )
 
-    def options(self, url, data=None, params=None, headers=None, auth=None):
+    def options(self, url, data=None, params=None, headers=None, auth=None,
+                timeout=None):
         """HTTP OPTIONS method.
 
         :param url: request URL
@@ -209,6 +477,9 @@ class DefaultClient(BaseClient):
         :type headers: dict or None
         :param auth: username and password tuple
         :type auth: tuple or None
+        :param timeout: the connect and read timeouts (default: the timeout
+            of the client)
+        :type timeout: int or float or tuple or None
         :returns: ArangoDB http response object
         :rtype: arango.response.Response
         """
@@ -217,15 +488,63 @@ class DefaultClient(BaseClient):
             data="" if data is None else data,
             params={} if params is None else params,
             headers={} if headers is None else headers,
+            timeout=self.timeout if timeout is None else timeout,
         )
         return Response(
             method="options",
             url=url,
             headers=res.headers,
             status_code=res.status_code,
-            content=res.text,
+            content=res.content,
+            status_text=res.reason
+        )
+
+    def stream(self, method, url, data=None, params=None, headers=None,
+               auth=None, timeout=None, chunk_size=65536):
+        """Send the request and return the response before reading its body.
+
+        The content of the returned response is None; the body is read
+        (and decompressed) piece by piece through the returned iterator.
+        The connection goes back to the pool once the iterator is exhausted.
+
+        :param method: HTTP method (e.g. 'put')
+        :type method: str
+        :param url: request URL
+        :type url: str
+        :param data: request payload
+        :type data: str or dict or None
+        :param params: request parameters
+        :type params: dict or None
+        :param headers: request headers
+        :type headers: dict or None
+        :param auth: username and password tuple
+        :type auth: tuple or None
+        :param timeout: the connect and read timeouts (default: the timeout
+            of the client)
+        :type timeout: int or float or tuple or None
+        :param chunk_size: the size of the body pieces read at a time
+        :type chunk_size: int
+        :returns: ArangoDB http response object and the body iterator
+        :rtype: tuple
+        """
+        res = self.session.request(
+            method=method.upper(),
+            url=url,
+            data=data,
+            params=params,
+            headers=headers,
+            timeout=self.timeout if timeout is None else timeout,
+            stream=True,
+        )
+        response = Response(
+            method=method,
+            url=url,
+            headers=res.headers,
+            status_code=res.status_code,
+            content=None,
             status_text=res.reason
         )
+        return response, res.iter_content(chunk_size)
 
     def close(self):
         """Close the HTTP session."""
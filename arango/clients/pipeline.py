@@ -0,0 +1,348 @@
+"""Socket based client pipelining HTTP/1.1 requests."""
+
+import select
+import socket
+import ssl
+import threading
+
+from arango import forksafe
+from arango.response import Response
+from arango.compression import WBITS, decompress
+from arango.clients.wire import (
+    REPLAYABLE_METHODS,
+    basic_auth,
+    build_request,
+    encode_body,
+    encode_chunks,
+    is_stream,
+    keeps_alive,
+    parse_header_lines,
+    parse_status_line,
+    response_has_body,
+    split_url,
+)
+
+try:
+    from urllib import unquote
+    from urlparse import urlsplit
+except ImportError:
+    from urllib.parse import unquote, urlsplit
+
+
+def _replayable(window):
+    """Return True if the window may be sent again after it was written."""
+    return all(
+        method in REPLAYABLE_METHODS and chunks is None
+        for _, method, (_, chunks) in window
+    )
+
+
+class _Connection(object):
+    """A persistent socket and the buffered reader of its responses."""
+
+    def __init__(self, sock):
+        self.sock = sock
+        self.reader = sock.makefile("rb")
+
+    def close(self):
+        self.reader.close()
+        self.sock.close()
+
+    def stale(self):
+        """Return True if the idle connection was closed by the server.
+
+        An idle connection is readable only once the server closed it (or
+        sent data which was not asked for), so it cannot be reused.
+        """
+        return bool(select.select([self.sock], [], [], 0)[0])
+
+    def read_response(self, method):
+        """Read the next response from the connection.
+
+        :returns: the status code, status text, headers, body and whether
+            the connection can be reused
+        :rtype: tuple
+        """
+        status_line = self.reader.readline()
+        if not status_line:
+            raise EOFError("connection closed by the server")
+        status_code, status_text = parse_status_line(status_line)
+        header_lines = []
+        while True:
+            line = self.reader.readline()
+            if line in {b"\r\n", b"\n", b""}:
+                break
+            header_lines.append(line)
+        headers = parse_header_lines(header_lines)
+        if not response_has_body(method, status_code):
+            return status_code, status_text, headers, b"", \
+                keeps_alive(headers)
+        encoding = headers.get("Transfer-Encoding", "").lower()
+        if "chunked" in encoding:
+            chunks = []
+            while True:
+                size_line = self.reader.readline()
+                size = int(size_line.split(b";", 1)[0].strip(), 16)
+                if size == 0:
+                    # Skip the trailer section
+                    line = self.reader.readline()
+                    while line not in {b"\r\n", b"\n", b""}:
+                        line = self.reader.readline()
+                    break
+                chunks.append(self._read_exactly(size))
+                self.reader.readline()
+            body, reusable = b"".join(chunks), True
+        elif headers.get("Content-Length") is not None:
+            body = self._read_exactly(int(headers["Content-Length"]))
+            reusable = True
+        else:
+            body, reusable = self.reader.read(), False
+        return status_code, status_text, headers, body, \
+            reusable and keeps_alive(headers)
+
+    def _read_exactly(self, size):
+        data = self.reader.read(size)
+        if len(data) < size:
+            raise EOFError("connection closed by the server")
+        return data
+
+
+class PipelineClient(object):
+    """HTTP client pipelining independent requests on persistent sockets.
+
+    ``send`` spreads the requests over up to ``connections`` sockets per
+    host. Each socket writes a window of up to ``depth`` requests without
+    waiting for the responses, then reads the responses back in the order
+    of the requests, so a window costs a single round trip. The sockets
+    are served by one thread each and are kept open between calls.
+
+    The following optional keys are read from ``init_data``:
+
+    ``auth``: the username and password tuple
+    ``connections``: the number of sockets per host (default: 4)
+    ``depth``: the max number of requests in flight per socket; the
+        windows should be small enough for the requests or the responses
+        of one window to fit into the socket buffers (default: 32)
+    ``timeout``: the socket timeout in seconds, or a tuple of the connect
+        and read timeouts (default: None, wait forever)
+    ``ssl_context``: the SSL context for https (default: the default
+        context of the ``ssl`` module)
+
+    Iterable request bodies are sent with chunked transfer encoding as
+    their pieces are produced.
+
+    URLs with the ``http+unix`` scheme (see ``arango.clients.unix``) are
+    sent over the Unix domain socket named in their host part.
+    """
+
+    def __init__(self, init_data):
+        """Initialize the client with the credentials.
+
+        :param init_data: data for client initialization
+        :type init_data: dict
+        """
+        self.auth = init_data.get("auth")
+        self.connections = init_data.get("connections", 4)
+        self.depth = init_data.get("depth", 32)
+        self.timeout = init_data.get("timeout")
+        self.ssl_context = init_data.get("ssl_context")
+        self._authorization = basic_auth(self.auth)
+        self._after_fork()
+        forksafe.register(self)
+
+    def _after_fork(self):
+        """Drop the connections inherited from the parent process."""
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def _timeouts(self, timeout):
+        if timeout is None:
+            timeout = self.timeout
+        if isinstance(timeout, tuple):
+            return timeout
+        return timeout, timeout
+
+    def _open(self, url, connect_timeout):
+        """Open a new connection to the server of the URL."""
+        parts = urlsplit(url)
+        if parts.scheme == "http+unix":
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(connect_timeout)
+            try:
+                sock.connect(unquote(parts.netloc))
+            except socket.error:
+                sock.close()
+                raise
+        else:
+            scheme, host, port, _ = split_url(url)
+            sock = socket.create_connection((host, port), connect_timeout)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if scheme == "https":
+                context = self.ssl_context
+                if context is None:
+                    context = ssl.create_default_context()
+                sock = context.wrap_socket(sock, server_hostname=host)
+        return _Connection(sock)
+
+    def _encode(self, method, url, data=None, params=None, headers=None,
+                auth=None):
+        """Serialize one request.
+
+        Returns the serialized request (only its head if the body is
+        streamed) and the chunks of the streamed body (or None).
+        """
+        _, host, port, target = split_url(url, params)
+        request_headers = {"Connection": "keep-alive"}
+        authorization = basic_auth(auth) if auth else self._authorization
+        if authorization is not None:
+            request_headers["Authorization"] = authorization
+        if headers:
+            request_headers.update(headers)
+        chunks = encode_chunks(data) if is_stream(data) else None
+        request = build_request(
+            method=method,
+            target=target,
+            host="{}:{}".format(host, port),
+            headers=request_headers,
+            body=b"" if chunks is not None else encode_body(data),
+            chunked=chunks is not None,
+        )
+        return request, chunks
+
+    @staticmethod
+    def _write(connection, window, progress):
+        """Write the requests of the window, streaming their chunked bodies.
+
+        Consecutive requests without streamed bodies are written at once.
+        ``progress`` records whether any part of the window was written.
+        """
+        progress["sent"] = True
+        pending = []
+        for _, _, (request, chunks) in window:
+            pending.append(request)
+            if chunks is None:
+                continue
+            connection.sock.sendall(b"".join(pending))
+            pending = []
+            for chunk in chunks:
+                connection.sock.sendall(chunk)
+        if pending:
+            connection.sock.sendall(b"".join(pending))
+
+    def _run(self, key, url, queue, results, timeouts):
+        """Send the queued (index, method, request) tuples on one socket."""
+        connect_timeout, read_timeout = timeouts
+        connection = None
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            while idle and connection is None:
+                connection = idle.pop()
+                if connection.stale():
+                    connection.close()
+                    connection = None
+        reused = connection is not None
+        progress = {"sent": False}
+        position = 0
+        try:
+            while position < len(queue):
+                window = queue[position:position + self.depth]
+                if connection is None:
+                    connection = self._open(url, connect_timeout)
+                connection.sock.settimeout(read_timeout)
+                received = 0
+                try:
+                    self._write(connection, window, progress)
+                    for index, method, _ in window:
+                        result = connection.read_response(method)
+                        results[index] = result
+                        received += 1
+                        if not result[4]:
+                            break
+                except (IOError, OSError, EOFError):
+                    connection.close()
+                    connection = None
+                    # A pooled connection may have been closed by the
+                    # server while idle, so try once more on a fresh one,
+                    # unless the server may have processed a write already
+                    if not (reused and received == 0 and position == 0 and
+                            (not progress["sent"] or _replayable(window))):
+                        raise
+                else:
+                    if not results[window[received - 1][0]][4]:
+                        connection.close()
+                        connection = None
+                position += received
+                reused = False
+        except Exception as error:
+            for index, _, _ in queue[position:]:
+                results[index] = error
+        finally:
+            if connection is not None:
+                with self._lock:
+                    idle.append(connection)
+
+    def send(self, requests, timeout=None):
+        """Send the requests pipelined and return their responses.
+
+        :param requests: the requests, as dictionaries with the method,
+            url, data, params, headers and auth keyword arguments of the
+            other clients' methods
+        :type requests: list
+        :param timeout: the connect and read timeouts (default: the timeout
+            of the client)
+        :type timeout: int or float or tuple or None
+        :returns: the responses (or the exceptions raised while sending
+            the requests) in the order of the requests
+        :rtype: list
+        """
+        timeouts = self._timeouts(timeout)
+        results = [None] * len(requests)
+        queues = {}
+        for index, request in enumerate(requests):
+            url = request["url"]
+            parts = urlsplit(url)
+            key = (parts.scheme, parts.netloc)
+            queues.setdefault(key, (url, []))[1].append(
+                (index, request["method"], self._encode(**request))
+            )
+        threads = []
+        for key, (url, queue) in queues.items():
+            # Deal the requests out to the sockets of the host
+            count = min(self.connections, len(queue))
+            for offset in range(count):
+                thread = threading.Thread(
+                    target=self._run,
+                    args=(key, url, queue[offset::count], results, timeouts)
+                )
+                thread.daemon = True
+                thread.start()
+                threads.append(thread)
+        for thread in threads:
+            thread.join()
+
+        responses = []
+        for request, result in zip(requests, results):
+            if isinstance(result, Exception):
+                responses.append(result)
+                continue
+            status_code, status_text, headers, body, _ = result
+            encoding = headers.get("Content-Encoding")
+            if body and encoding in WBITS:
+                body = decompress(body, encoding)
+            responses.append(Response(
+                method=request["method"],
+                url=request["url"],
+                headers=headers,
+                status_code=status_code,
+                content=body,
+                status_text=status_text
+            ))
+        return responses
+
+    def close(self):
+        """Close the idle connections."""
+        with self._lock:
+            for idle in self._idle.values():
+                for connection in idle:
+                    connection.close()
+            self._idle.clear()
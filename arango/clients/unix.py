@@ -0,0 +1,126 @@
+"""Session based client talking HTTP over a Unix domain socket."""
+
+import socket
+
+from requests.packages.urllib3.connection import HTTPConnection
+from requests.packages.urllib3.connectionpool import HTTPConnectionPool
+from requests.packages.urllib3.poolmanager import SSL_KEYWORDS
+
+from arango.clients.default import (
+    DefaultClient,
+    _InstrumentedPoolManager,
+    _InstrumentedPoolMixin,
+    _PoolAdapter,
+)
+
+try:
+    from urllib import quote, unquote
+except ImportError:
+    from urllib.parse import quote, unquote
+
+# URL scheme of the requests sent over a Unix domain socket
+SCHEME = "http+unix"
+
+
+def unix_socket_url(endpoint):
+    """Return the base URL of the requests to a ``unix://`` endpoint.
+
+    The socket path is percent-encoded into the host part of the URL
+    (e.g. 'unix:///tmp/arangodb.sock' becomes
+    'http+unix://%2Ftmp%2Farangodb.sock').
+
+    :param endpoint: the ArangoDB endpoint (e.g. 'unix:///tmp/arangodb.sock')
+    :type endpoint: str
+    :returns: the base URL
+    :rtype: str
+    """
+    path = endpoint[len("unix://"):]
+    return "{}://{}".format(SCHEME, quote(path, safe=""))
+
+
+class _UnixSocketConnection(HTTPConnection):
+    """HTTP connection to the Unix socket named by its (encoded) host."""
+
+    def _new_conn(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not socket._GLOBAL_DEFAULT_TIMEOUT:
+            sock.settimeout(self.timeout)
+        try:
+            sock.connect(unquote(self.host))
+        except socket.error:
+            sock.close()
+            raise
+        return sock
+
+
+class _UnixSocketConnectionPool(_InstrumentedPoolMixin, HTTPConnectionPool):
+    """Unix socket connection pool with activity counters."""
+
+    scheme = SCHEME
+    ConnectionCls = _UnixSocketConnection
+
+
+class _UnixSocketPoolManager(_InstrumentedPoolManager):
+    """Pool manager which also creates Unix socket connection pools."""
+
+    def __init__(self, *args, **kwargs):
+        super(_UnixSocketPoolManager, self).__init__(*args, **kwargs)
+        self.pool_classes_by_scheme[SCHEME] = _UnixSocketConnectionPool
+        self.key_fn_by_scheme = dict(self.key_fn_by_scheme)
+        self.key_fn_by_scheme[SCHEME] = self.key_fn_by_scheme["http"]
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        if scheme == SCHEME and request_context is not None:
+            request_context = dict(request_context)
+            for keyword in SSL_KEYWORDS:
+                request_context.pop(keyword, None)
+            # The TCP socket options do not apply to Unix sockets
+            request_context.pop("socket_options", None)
+        return super(_UnixSocketPoolManager, self)._new_pool(
+            scheme, host, port, request_context
+        )
+
+
+class _UnixSocketAdapter(_PoolAdapter):
+    """Transport adapter using the Unix socket pool manager."""
+
+    def init_poolmanager(self, connections, maxsize, block=False,
+                         **pool_kwargs):
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = _UnixSocketPoolManager(
+            self.arango_stats,
+            self.arango_idle_timeout,
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            **pool_kwargs
+        )
+
+
+class UnixSocketClient(DefaultClient):
+    """Session based HTTP client for an ArangoDB on a Unix domain socket.
+
+    Requests go to URLs built by ``unix_socket_url`` from the ``unix://``
+    endpoint of the server, which skips the TCP/IP stack of the loopback
+    interface for servers on the same host. Connections are pooled and
+    configured by ``init_data`` like those of ``DefaultClient``, except that
+    there are no TCP keep-alive probes.
+    """
+
+    def __init__(self, init_data):
+        """Initialize the session with the credentials.
+
+        :param init_data: data for client initialization
+        :type init_data: dict
+        """
+        super(UnixSocketClient, self).__init__(init_data)
+        adapter = _UnixSocketAdapter(
+            stats=self.stats,
+            idle_timeout=init_data.get("idle_timeout"),
+            keep_alive=init_data.get("keep_alive", True),
+            pool_maxsize=init_data.get("pool_size", 10),
+            pool_block=init_data.get("pool_block", False),
+        )
+        self.session.mount(SCHEME + "://", adapter)
@@ -0,0 +1,230 @@
+"""HTTP/1.1 wire format helpers for the socket based clients."""
+
+from base64 import b64encode
+
+from requests.structures import CaseInsensitiveDict
+
+try:
+    from urllib import urlencode, quote
+    from urlparse import urlsplit
+except ImportError:
+    from urllib.parse import urlencode, quote, urlsplit
+
+
+# Status codes whose responses never carry a body
+NO_BODY_STATUSES = {204, 304}
+
+# Methods which may be sent again if the connection dropped after the
+# request was written (the server may have processed it already)
+REPLAYABLE_METHODS = {"head", "get", "options", "delete"}
+
+
+def encode_params(params):
+    """Encode the request parameters into a query string.
+
+    Boolean values are sent as lowercase "true"/"false", and parameters
+    whose values are None are omitted entirely.
+
+    :param params: the request parameters
+    :type params: dict or None
+    :returns: the URL encoded query string (without the leading '?')
+    :rtype: str
+    """
+    if not params:
+        return ""
+    pairs = []
+    for key, value in params.items():
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            value = "true" if value else "false"
+        pairs.append((key, value))
+    return urlencode(pairs)
+
+
+def split_url(url, params=None):
+    """Split the request URL into its address and request target.
+
+    :param url: the request URL (e.g. 'http://localhost:8529/_api/version')
+    :type url: str
+    :param params: the request parameters
+    :type params: dict or None
+    :returns: the scheme, host, port and request target
+    :rtype: tuple
+    """
+    parts = urlsplit(url)
+    scheme = parts.scheme or "http"
+    port = parts.port or (443 if scheme == "https" else 80)
+    target = quote(parts.path or "/", safe="/%:@!$&'()*+,;=-._~")
+    query = parts.query
+    extra = encode_params(params)
+    if extra:
+        query = query + "&" + extra if query else extra
+    if query:
+        target += "?" + query
+    return scheme, parts.hostname, port, target
+
+
+def basic_auth(auth):
+    """Return the value of the HTTP basic authorization header.
+
+    :param auth: the username and password tuple
+    :type auth: tuple or None
+    :returns: the authorization header value or None if not applicable
+    :rtype: str or None
+    """
+    if not auth:
+        return None
+    credentials = "{}:{}".format(*auth).encode("utf-8")
+    return "Basic " + b64encode(credentials).decode("ascii")
+
+
+def is_stream(data):
+    """Return True if the request payload is streamed (an iterable).
+
+    :param data: the request payload
+    :type data: str or unicode or bytes or collections.Iterable or None
+    :returns: True if the payload is an iterable of its pieces
+    :rtype: bool
+    """
+    return not (
+        data is None or isinstance(data, bytes) or hasattr(data, "encode")
+    )
+
+
+def encode_body(data):
+    """Encode the request payload into bytes.
+
+    Iterable payloads are joined, so streamed bodies should be sent with
+    ``encode_chunks`` instead.
+
+    :param data: the request payload
+    :type data: str or unicode or bytes or collections.Iterable or None
+    :returns: the request payload in bytes
+    :rtype: bytes
+    """
+    if data is None:
+        return b""
+    if isinstance(data, bytes):
+        return data
+    if hasattr(data, "encode"):
+        return data.encode("utf-8")
+    return b"".join(encode_body(piece) for piece in data)
+
+
+def encode_chunks(data):
+    """Encode a streamed request payload with chunked transfer encoding.
+
+    The pieces are encoded one at a time as they are produced, so the
+    payload is never held in memory as a whole.
+
+    :param data: the pieces of the request payload
+    :type data: collections.Iterable
+    :returns: a generator of the chunks, ending with the last (empty) chunk
+    :rtype: types.GeneratorType
+    """
+    for piece in data:
+        piece = encode_body(piece)
+        if piece:
+            yield "{:x}\r\n".format(len(piece)).encode("ascii") + piece + \
+                b"\r\n"
+    yield b"0\r\n\r\n"
+
+
+def build_request(method, target, host, headers=None, body=b"",
+                  chunked=False):
+    """Serialize an HTTP/1.1 request into bytes.
+
+    If ``chunked`` is set, only the request head is returned and the body
+    must follow it as produced by ``encode_chunks``.
+
+    :param method: the HTTP method (e.g. 'get')
+    :type method: str
+    :param target: the request target (path and query string)
+    :type target: str
+    :param host: the value of the Host header
+    :type host: str
+    :param headers: the request headers
+    :type headers: dict or None
+    :param body: the encoded request payload
+    :type body: bytes
+    :param chunked: whether or not the body is sent in chunks
+    :type chunked: bool
+    :returns: the serialized request
+    :rtype: bytes
+    """
+    lines = ["{} {} HTTP/1.1".format(method.upper(), target)]
+    request_headers = CaseInsensitiveDict({"Host": host})
+    if headers:
+        request_headers.update(headers)
+    if chunked:
+        request_headers["Transfer-Encoding"] = "chunked"
+    elif body or method.lower() in {"post", "put", "patch"}:
+        request_headers["Content-Length"] = str(len(body))
+    for key, value in request_headers.items():
+        if value is not None:
+            lines.append("{}: {}".format(key, value))
+    head = "\r\n".join(lines) + "\r\n\r\n"
+    return head.encode("latin-1") + body
+
+
+def parse_status_line(line):
+    """Parse the HTTP status line of a response.
+
+    :param line: the raw status line (e.g. b'HTTP/1.1 200 OK\\r\\n')
+    :type line: bytes
+    :returns: the status code and the status text
+    :rtype: tuple
+    :raises: ValueError
+    """
+    parts = line.decode("latin-1").strip().split(" ", 2)
+    if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+        raise ValueError("malformed status line: {!r}".format(line))
+    return int(parts[1]), parts[2] if len(parts) > 2 else ""
+
+
+def parse_header_lines(lines):
+    """Parse the raw HTTP response header lines.
+
+    :param lines: the raw header lines without the terminating blank line
+    :type lines: list
+    :returns: the response headers
+    :rtype: requests.structures.CaseInsensitiveDict
+    """
+    headers = CaseInsensitiveDict()
+    for line in lines:
+        key, _, value = line.decode("latin-1").partition(":")
+        key, value = key.strip(), value.strip()
+        if key in headers:
+            headers[key] = headers[key] + ", " + value
+        else:
+            headers[key] = value
+    return headers
+
+
+def response_has_body(method, status_code):
+    """Return True if a response to the request may carry a body.
+
+    :param method: the HTTP method of the request
+    :type method: str
+    :param status_code: the HTTP status code of the response
+    :type status_code: int
+    :returns: True if the response may carry a body, False otherwise
+    :rtype: bool
+    """
+    return not (
+        method.lower() == "head" or
+        100 <= status_code < 200 or
+        status_code in NO_BODY_STATUSES
+    )
+
+
+def keeps_alive(headers):
+    """Return True if the connection can be reused after the response.
+
+    :param headers: the response headers
+    :type headers: requests.structures.CaseInsensitiveDict
+    :returns: True if the connection can be reused, False otherwise
+    :rtype: bool
+    """
+    return headers.get("Connection", "").lower() != "close"
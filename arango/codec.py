@@ -0,0 +1,263 @@
+"""Codecs for encoding requests and decoding responses."""
+
+import json
+
+from arango import vpack
+from arango.exceptions import InvalidArgumentError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+
+class Codec(object):
+    """Base class for the JSON codecs.
+
+    Objects which the JSON library cannot serialize are handed over to the
+    hook registered for their type (or the closest base class of their
+    type). The hook must return a serializable object. The hook found for
+    each type is cached, so the lookup through the class hierarchy happens
+    once per type.
+
+    :param hooks: a mapping of types to hook functions
+    :type hooks: dict or None
+    """
+
+    name = None
+
+    # The media type of the request bodies produced by ``encode``
+    content_type = "application/json"
+
+    # Whether ``encode`` produces a binary format instead of JSON
+    binary = False
+
+    def __init__(self, hooks=None):
+        self._hooks = dict(hooks or {})
+        self._dispatch = {}
+
+    def register(self, cls, hook):
+        """Register a hook for serializing instances of ``cls``.
+
+        :param cls: the type (instances of subclasses are included)
+        :type cls: type
+        :param hook: function returning a serializable object
+        :type hook: callable
+        """
+        self._hooks[cls] = hook
+        self._dispatch = {}
+
+    def default(self, obj):
+        """Serialize ``obj`` with the hook registered for its type.
+
+        :param obj: the object the JSON library could not serialize
+        :type obj: object
+        :returns: the serializable replacement of ``obj``
+        :rtype: object
+        :raises: TypeError
+        """
+        cls = type(obj)
+        try:
+            hook = self._dispatch[cls]
+        except KeyError:
+            hook = None
+            for base in getattr(cls, "__mro__", (cls,)):
+                if base in self._hooks:
+                    hook = self._hooks[base]
+                    break
+            self._dispatch[cls] = hook
+        if hook is None:
+            raise TypeError(
+                "{!r} is not JSON serializable".format(obj)
+            )
+        return hook(obj)
+
+    def dumps(self, obj):
+        """Serialize ``obj`` to a JSON string.
+
+        :param obj: the object to serialize
+        :type obj: object
+        :returns: the JSON string
+        :rtype: str or unicode
+        """
+        raise NotImplementedError
+
+    def encode(self, obj):
+        """Serialize ``obj`` to UTF-8 encoded JSON for a request body.
+
+        :param obj: the object to serialize
+        :type obj: object
+        :returns: the UTF-8 encoded JSON
+        :rtype: bytes
+        """
+        return self.dumps(obj).encode("utf-8")
+
+    def loads(self, data):
+        """Deserialize the JSON document in ``data``.
+
+        :param data: the JSON document (UTF-8 if bytes)
+        :type data: bytes or str or unicode
+        :returns: the deserialized object
+        :rtype: object
+        :raises: ValueError
+        """
+        raise NotImplementedError
+
+    def decode(self, data, content_type=None):
+        """Deserialize a response body of the given content type.
+
+        :param data: the response body
+        :type data: bytes or str or unicode
+        :param content_type: the value of the Content-Type header
+        :type content_type: str or None
+        :returns: the deserialized object
+        :rtype: object
+        :raises: ValueError
+        """
+        return self.loads(data)
+
+
+class StandardCodec(Codec):
+    """JSON codec using the standard library."""
+
+    name = "json"
+
+    def dumps(self, obj):
+        return json.dumps(obj, default=self.default)
+
+    def loads(self, data):
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        return json.loads(data)
+
+
+class OrjsonCodec(Codec):
+    """JSON codec using orjson.
+
+    Datetime objects go through the registered hooks like with the other
+    codecs instead of orjson's built-in serialization.
+    """
+
+    name = "orjson"
+
+    def __init__(self, hooks=None):
+        if orjson is None:
+            raise InvalidArgumentError("orjson is not installed")
+        super(OrjsonCodec, self).__init__(hooks)
+        self._options = (
+            orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+
+    def dumps(self, obj):
+        return self.encode(obj).decode("utf-8")
+
+    def encode(self, obj):
+        return orjson.dumps(obj, default=self.default, option=self._options)
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+
+class UjsonCodec(Codec):
+    """JSON codec using ujson (version 5.2 or later for the hooks)."""
+
+    name = "ujson"
+
+    def __init__(self, hooks=None):
+        if ujson is None:
+            raise InvalidArgumentError("ujson is not installed")
+        super(UjsonCodec, self).__init__(hooks)
+
+    def dumps(self, obj):
+        if not self._hooks:
+            return ujson.dumps(obj, escape_forward_slashes=False)
+        return ujson.dumps(
+            obj, default=self.default, escape_forward_slashes=False
+        )
+
+    def loads(self, data):
+        return ujson.loads(data)
+
+
+class VPackCodec(Codec):
+    """Codec sending and receiving VelocyPack instead of JSON.
+
+    Request bodies are encoded to VelocyPack and responses sent back as
+    VelocyPack are decoded accordingly. ``dumps`` and ``loads`` still deal
+    in JSON text (for batch request parts and other text payloads) and are
+    delegated to ``json_codec``.
+
+    :param hooks: a mapping of types to hook functions
+    :type hooks: dict or None
+    :param json_codec: the codec for JSON text (default: the fastest
+        installed)
+    :type json_codec: arango.codec.Codec or None
+    """
+
+    name = "vpack"
+    content_type = vpack.CONTENT_TYPE
+    binary = True
+
+    def __init__(self, hooks=None, json_codec=None):
+        super(VPackCodec, self).__init__(hooks)
+        self.json_codec = json_codec or get_codec("auto", hooks)
+
+    def register(self, cls, hook):
+        super(VPackCodec, self).register(cls, hook)
+        self.json_codec.register(cls, hook)
+
+    def dumps(self, obj):
+        return self.json_codec.dumps(obj)
+
+    def encode(self, obj):
+        return vpack.dumps(obj, self.default)
+
+    def loads(self, data):
+        return self.json_codec.loads(data)
+
+    def decode(self, data, content_type=None):
+        if content_type and content_type.startswith(self.content_type):
+            return vpack.loads(data)
+        return self.json_codec.loads(data)
+
+
+# Codecs by name, in the order of preference for automatic selection
+CODECS = [
+    ("orjson", OrjsonCodec, orjson),
+    ("ujson", UjsonCodec, ujson),
+    ("json", StandardCodec, json),
+]
+
+
+def get_codec(codec=None, hooks=None):
+    """Return the JSON codec for the given name.
+
+    If ``codec`` is None or 'auto', the fastest codec installed is used:
+    orjson, then ujson, then the standard library. The 'vpack' codec is
+    only used if requested explicitly.
+
+    :param codec: the codec name ('auto', 'orjson', 'ujson', 'json' or
+        'vpack') or a codec instance which is returned as is
+    :type codec: str or arango.codec.Codec or None
+    :param hooks: a mapping of types to hook functions (see ``Codec``)
+    :type hooks: dict or None
+    :returns: the JSON codec
+    :rtype: arango.codec.Codec
+    :raises: InvalidArgumentError
+    """
+    if isinstance(codec, Codec):
+        return codec
+    if codec == VPackCodec.name:
+        return VPackCodec(hooks)
+    for name, codec_class, module in CODECS:
+        if codec in {None, "auto"}:
+            if module is not None:
+                return codec_class(hooks)
+        elif codec == name:
+            return codec_class(hooks)
+    raise InvalidArgumentError("unknown JSON codec '{}'".format(codec))
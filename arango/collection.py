@@ -1,10 +1,8 @@
 """ArangoDB Collection."""
 
-import json
-
-from arango.utils import camelify, uncamelify
+from arango.utils import camelify, uncamelify, stream_lines
 from arango.exceptions import *
-from arango.cursor import arango_cursor
+from arango.cursor import Cursor, KeysetCursor, ParallelScan
 from arango.constants import COLLECTION_STATUSES, HTTP_OK
 
 
@@ -566,8 +564,15 @@ class Collection(object):
         If ``details`` parameter is set to True, the response will also contain
         ``details`` attribute which is a list of detailed error messages.
 
-        :param documents: list of documents to import
-        :type documents: list
+        Lists and tuples of documents are sent as a single encoded array,
+        which the retry policy can send again and which is compressed only
+        above the size threshold. Other iterables (e.g. generators) are
+        encoded lazily and streamed to the server, so the memory use stays
+        constant regardless of the number of documents, but streamed bodies
+        are never retried and are always compressed if compression is on.
+
+        :param documents: the documents to import
+        :type documents: list or collections.Iterable
         :param complete: entire import fails if any document is invalid
         :type complete: bool
         :param details: return details about invalid documents
@@ -576,11 +581,22 @@ class Collection(object):
         :rtype: dict
         :raises: DocumentsImportError
         """
+        if isinstance(documents, (list, tuple)):
+            # Encoded by the API wrapper with its codec, as one array
+            data = list(documents)
+            import_type = "list"
+        else:
+            # Stream one JSON document per line
+            codec = self.api.codec
+            data = stream_lines(
+                documents, getattr(codec, "json_codec", codec).encode
+            )
+            import_type = "documents"
         res = self.api.post(
             "/_api/import",
-            data="\r\n".join([json.dumps(d) for d in documents]),
+            data=data,
             params={
-                "type": "documents",
+                "type": import_type,
                 "collection": self.name,
                 "complete": complete,
                 "details": details
@@ -593,7 +609,8 @@ class Collection(object):
 
     # TODO look into this endpoint for better documentation and testing
     def export_documents(self, flush=None, flush_wait=None, count=None,
-                         batch_size=None, limit=None, ttl=None, restrict=None):
+                         batch_size=None, limit=None, ttl=None, restrict=None,
+                         prefetch=0, keep_alive=None):
         """"Export all documents from this collection using a cursor.
 
         :param flush: trigger a WAL flush operation prior to the export
@@ -610,8 +627,14 @@ class Collection(object):
         :type ttl: int or None
         :param restrict: object with attributes to be excluded/included
         :type restrict: dict
-        :return: the generator of documents in this collection
-        :rtype: generator
+        :param prefetch: the number of batches to fetch on a background
+            thread while the current one is consumed
+        :type prefetch: int
+        :param keep_alive: renew the time-to-live of the cursor once it was
+            not accessed for this many seconds (see ``Cursor``)
+        :type keep_alive: int or float or None
+        :return: the cursor over the documents in this collection
+        :rtype: arango.cursor.Cursor
         :raises: DocumentsExportError
         """
         params = {"collection": self.name}
@@ -635,7 +658,68 @@ class Collection(object):
         res = self.api.post("/_api/export", params=params, data=data)
         if res.status_code not in HTTP_OK:
             raise DocumentsExportError(res)
-        return arango_cursor(self.api, res)
+        return Cursor(
+            self.api, res, cursor_type="export", prefetch=prefetch,
+            keep_alive=keep_alive
+        )
+
+    def scan(self, batch_size=1000, checkpoint=None):
+        """Return all documents in this collection in the order of their keys.
+
+        Unlike with ``export_documents``, no server cursor is kept alive
+        while the documents are consumed, and the scan can be continued
+        from the checkpoint of a previous one (see
+        ``arango.cursor.KeysetCursor``).
+
+        :param batch_size: the number of documents in one batch
+        :type batch_size: int
+        :param checkpoint: the ``checkpoint()`` of the cursor of a previous
+            scan of this collection, to continue after its last document
+        :type checkpoint: dict or None
+        :returns: the cursor over the documents
+        :rtype: arango.cursor.KeysetCursor
+        :raises: InvalidArgumentError, AQLQueryExecuteError
+        """
+        if checkpoint and checkpoint.get("collection") != self.name:
+            raise InvalidArgumentError(
+                "checkpoint of collection '{}'".format(
+                    checkpoint.get("collection")
+                )
+            )
+        return KeysetCursor(self.api, self.name, batch_size, checkpoint)
+
+    def parallel_scan(self, partitions=4, batch_size=1000, boundaries=None,
+                      checkpoint=None):
+        """Return all documents in this collection, read in partitions.
+
+        The partitions are read at the same time, each on a thread of its
+        own (see ``arango.cursor.ParallelScan``).
+
+        :param partitions: the number of partitions (by the hash of the
+            keys)
+        :type partitions: int
+        :param batch_size: the number of documents in one batch
+        :type batch_size: int
+        :param boundaries: the keys splitting the collection into key
+            ranges instead (``len(boundaries) + 1`` partitions)
+        :type boundaries: list or None
+        :param checkpoint: the ``checkpoint()`` of a previous parallel scan
+            of this collection, to continue after its last documents
+        :type checkpoint: dict or None
+        :returns: the scan (iterable over all documents)
+        :rtype: arango.cursor.ParallelScan
+        :raises: InvalidArgumentError, AQLQueryExecuteError
+        """
+        if checkpoint and checkpoint.get("collection") != self.name:
+            raise InvalidArgumentError(
+                "checkpoint of collection '{}'".format(
+                    checkpoint.get("collection")
+                )
+            )
+        return ParallelScan(
+            self.api, self.name, partitions, batch_size, boundaries,
+            checkpoint
+        )
 
     ##################
     # Simple Queries #
@@ -675,7 +759,7 @@ class Collection(object):
             raise SimpleQueryLastError(res)
         return res.obj["result"]
 
-    def all(self, skip=None, limit=None):
+    def all(self, skip=None, limit=None, keep_alive=None):
         """Return all documents in this collection.
 
         ``skip`` is applied before ``limit`` if both are provided.
@@ -684,8 +768,11 @@ class Collection(object):
         :type skip: int
         :param limit: maximum number of documents to return
         :type limit: int
-        :returns: the list of all documents
-        :rtype: list
+        :param keep_alive: renew the time-to-live of the cursor once it was
+            not accessed for this many seconds (see ``Cursor``)
+        :type keep_alive: int or float or None
+        :returns: the cursor over all documents
+        :rtype: arango.cursor.Cursor
         :raises: SimpleQueryAllError
         """
         data = {"collection": self.name}
@@ -696,7 +783,7 @@ class Collection(object):
         res = self.api.put("/_api/simple/all", data=data)
         if res.status_code not in HTTP_OK:
             raise SimpleQueryAllError(res)
-        return arango_cursor(self.api, res)
+        return Cursor(self.api, res, keep_alive=keep_alive)
 
     def any(self):
         """Return a random document from this collection.
@@ -741,8 +828,8 @@ class Collection(object):
         :type skip: int
         :param limit: maximum number of documents to return
         :type limit: int
-        :returns: the list of matching documents
-        :rtype: list
+        :returns: the cursor over the matching documents
+        :rtype: arango.cursor.Cursor
         :raises: SimpleQueryGetByExampleError
         """
         data = {"collection": self.name, "example": example}
@@ -753,7 +840,7 @@ class Collection(object):
         res = self.api.put("/_api/simple/by-example", data=data)
         if res.status_code not in HTTP_OK:
             raise SimpleQueryGetByExampleError(res)
-        return arango_cursor(self.api, res)
+        return Cursor(self.api, res)
 
     def update_by_example(self, example, new_value, keep_none=True, limit=None,
                           wait_for_sync=False):
@@ -862,8 +949,8 @@ class Collection(object):
         :type skip: int
         :param limit: maximum number of documents to return
         :type limit: int
-        :returns: the list of documents
-        :rtype: list
+        :returns: the cursor over the documents
+        :rtype: arango.cursor.Cursor
         :raises: SimpleQueryRangeError
         """
         data = {
@@ -880,7 +967,7 @@ class Collection(object):
         res = self.api.put("/_api/simple/range", data=data)
         if res.status_code not in HTTP_OK:
             raise SimpleQueryRangeError(res)
-        return arango_cursor(self.api, res)
+        return Cursor(self.api, res)
 
     def near(self, latitude, longitude, distance=None, radius=None, skip=None,
              limit=None, geo=None):
@@ -909,8 +996,8 @@ class Collection(object):
         :type limit: int
         :param geo: the identifier of the geo-index to use
         :type geo: str
-        :returns: the list of documents that are near the coordinate
-        :rtype: list
+        :returns: the cursor over the documents near the coordinate
+        :rtype: arango.cursor.Cursor
         :raises: SimpleQueryNearError
         """
         data = {
@@ -932,7 +1019,7 @@ class Collection(object):
         res = self.api.put("/_api/simple/near", data=data)
         if res.status_code not in HTTP_OK:
             raise SimpleQueryNearError(res)
-        return arango_cursor(self.api, res)
+        return Cursor(self.api, res)
 
     # TODO this endpoint does not seem to work
     def within(self, latitude, longitude, radius, distance=None, skip=None,
@@ -961,8 +1048,8 @@ class Collection(object):
         :type limit: int
         :param geo: the identifier of the geo-index to use
         :type geo: str
-        :returns: the list of documents are within the radius
-        :rtype: list
+        :returns: the cursor over the documents within the radius
+        :rtype: arango.cursor.Cursor
         :raises: SimpleQueryWithinError
         """
         data = {
@@ -983,7 +1070,7 @@ class Collection(object):
         res = self.api.put("/_api/simple/within", data=data)
         if res.status_code not in HTTP_OK:
             raise SimpleQueryWithinError(res)
-        return arango_cursor(self.api, res)
+        return Cursor(self.api, res)
 
     def fulltext(self, attribute, query, skip=None, limit=None, index=None):
         """Return all documents that match the specified fulltext ``query``.
@@ -1002,8 +1089,8 @@ class Collection(object):
         :type skip: int
         :param limit: maximum number of documents to return
         :type limit: int
-        :returns: the list of documents
-        :rtype: list
+        :returns: the cursor over the documents
+        :rtype: arango.cursor.Cursor
         :raises: SimpleQueryFullTextError
         """
         data = {
@@ -1020,7 +1107,7 @@ class Collection(object):
         res = self.api.put("/_api/simple/fulltext", data=data)
         if res.status_code not in HTTP_OK:
             raise SimpleQueryFullTextError(res)
-        return arango_cursor(self.api, res)
+        return Cursor(self.api, res)
 
     def lookup_by_keys(self, keys):
         """Return all documents whose key is in ``keys``.
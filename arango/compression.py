@@ -0,0 +1,185 @@
+"""Compression of request bodies and accounting of compressed traffic."""
+
+import threading
+import zlib
+
+from arango import forksafe
+from arango.exceptions import InvalidArgumentError
+from arango.utils import is_string
+
+# The zlib window bits producing each content encoding
+WBITS = {
+    "gzip": 16 + zlib.MAX_WBITS,
+    "deflate": zlib.MAX_WBITS,
+}
+
+# The size of the pieces fed to the compressor
+CHUNK_SIZE = 64 * 1024
+
+
+class Compression(object):
+    """Compression settings shared by the API wrappers, with counters.
+
+    Request bodies of at least ``threshold`` bytes are compressed on the
+    fly: the compressed body is a generator producing the output as the
+    input is consumed (and is therefore sent with chunked transfer
+    encoding), so the compressed copy of the body is never held in memory
+    as a whole. Iterable bodies of unknown size are compressed if
+    ``stream`` is True, unless compression of request bodies is turned off
+    with a ``threshold`` of None (or infinity).
+
+    Compressed responses are negotiated with the Accept-Encoding header and
+    decompressed by the HTTP client.
+
+    The counters (see ``stats``) are:
+
+    ``requests_compressed``: request bodies which were compressed
+    ``request_bytes``: request body bytes before compression
+    ``request_bytes_compressed``: request body bytes after compression
+    ``responses_compressed``: responses which arrived compressed
+    ``response_bytes``: response body bytes after decompression
+    ``response_bytes_compressed``: response body bytes on the wire
+
+    :param threshold: the minimum size of the request bodies to compress,
+        or None to never compress request bodies
+    :type threshold: int or None
+    :param encoding: the content encoding ('gzip' or 'deflate')
+    :type encoding: str
+    :param level: the compression level from 1 (fastest) to 9 (smallest)
+    :type level: int
+    :param accept_encoding: the Accept-Encoding header value sent, or None
+        to leave the header of the HTTP client as is
+    :type accept_encoding: str or None
+    :param stream: whether or not to compress iterable (streamed) bodies
+    :type stream: bool
+    :raises: InvalidArgumentError
+    """
+
+    FIELDS = (
+        "requests_compressed",
+        "request_bytes",
+        "request_bytes_compressed",
+        "responses_compressed",
+        "response_bytes",
+        "response_bytes_compressed",
+    )
+
+    def __init__(self, threshold=1024, encoding="gzip", level=6,
+                 accept_encoding="gzip, deflate", stream=True):
+        if encoding not in WBITS:
+            raise InvalidArgumentError(
+                "unsupported content encoding '{}'".format(encoding)
+            )
+        self.threshold = threshold
+        self.encoding = encoding
+        self.level = level
+        self.accept_encoding = accept_encoding
+        self.stream = stream
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(self.FIELDS, 0)
+        forksafe.register(self)
+
+    def _after_fork(self):
+        """Replace the lock, which a thread of the parent may have held."""
+        self._lock = threading.Lock()
+
+    def _incr(self, field, value=1):
+        with self._lock:
+            self._counts[field] += value
+
+    @property
+    def stats(self):
+        """Return the current values of the counters.
+
+        :returns: the mapping of the counter names to their values
+        :rtype: dict
+        """
+        with self._lock:
+            return dict(self._counts)
+
+    def should_compress(self, body):
+        """Return True if the request body should be compressed.
+
+        :param body: the request body
+        :type body: str or unicode or bytes or collections.Iterable or None
+        :returns: whether or not to compress the body
+        :rtype: bool
+        """
+        if body is None or self.threshold is None:
+            return False
+        if is_string(body) or isinstance(body, bytes):
+            return len(body) >= self.threshold
+        return self.stream and self.threshold != float("inf")
+
+    def compress(self, body):
+        """Compress the request body on the fly.
+
+        :param body: the request body or an iterable of its pieces
+        :type body: str or unicode or bytes or collections.Iterable
+        :returns: a generator of the compressed pieces
+        :rtype: types.GeneratorType
+        """
+        if is_string(body) or isinstance(body, bytes):
+            if not isinstance(body, bytes):
+                body = body.encode("utf-8")
+            pieces = (
+                body[start:start + CHUNK_SIZE]
+                for start in range(0, len(body), CHUNK_SIZE)
+            )
+        else:
+            pieces = body
+        compressor = zlib.compressobj(
+            self.level, zlib.DEFLATED, WBITS[self.encoding]
+        )
+        self._incr("requests_compressed")
+        for piece in pieces:
+            if not isinstance(piece, bytes):
+                piece = piece.encode("utf-8")
+            self._incr("request_bytes", len(piece))
+            output = compressor.compress(piece)
+            if output:
+                self._incr("request_bytes_compressed", len(output))
+                yield output
+        output = compressor.flush()
+        self._incr("request_bytes_compressed", len(output))
+        yield output
+
+    def record_response(self, res):
+        """Count the response if it arrived compressed.
+
+        The size on the wire is taken from the Content-Length header, which
+        refers to the compressed body.
+
+        :param res: the ArangoDB http response
+        :type res: arango.response.Response
+        """
+        headers = res.headers
+        if not headers:
+            return
+        encoding = headers.get("Content-Encoding")
+        if encoding not in WBITS:
+            return
+        self._incr("responses_compressed")
+        self._incr("response_bytes", len(res.content or b""))
+        length = headers.get("Content-Length")
+        if length is not None:
+            self._incr("response_bytes_compressed", int(length))
+
+
+def decompress(body, encoding):
+    """Decompress a response body of the given content encoding.
+
+    :param body: the compressed body
+    :type body: bytes
+    :param encoding: the content encoding ('gzip' or 'deflate')
+    :type encoding: str
+    :returns: the decompressed body
+    :rtype: bytes
+    """
+    if encoding == "deflate":
+        # Some servers send raw deflate streams without the zlib header
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return zlib.decompress(body, WBITS[encoding])
@@ -26,6 +26,9 @@ HTTP_OK = {
     206, "206",
 }
 
+# HTTP methods sending a request body
+BODY_METHODS = {"put", "post", "patch", "options"}
+
 LOG_LEVELS = {
     "fatal": 0,
     "error": 1,
@@ -1,33 +1,1004 @@
 """ArangoDB Cursor."""
 
+import threading
+from abc import ABCMeta, abstractmethod
+from array import array
+from collections import deque
+
+from arango.codec import StandardCodec
 from arango.constants import HTTP_OK
+from arango.deadline import activate, clock, current
 from arango.exceptions import (
+    AQLQueryExecuteError,
     CursorGetNextError,
     CursorDeleteError,
+    InvalidArgumentError,
 )
+from arango.streaming import ResultParser
+from arango.utils import uncamelify
+
+try:
+    from queue import Queue, Empty
+except ImportError:
+    from Queue import Queue, Empty
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+# Base class of the abstract classes (on Python 2 and 3)
+_Abstract = ABCMeta("_Abstract", (object,), {})
+
+# The max number of batches fetched ahead of the consumer of a cursor to
+# renew its time-to-live (see ``Cursor``)
+KEEP_ALIVE_BATCHES = 4
 
 
-def arango_cursor(api, response):
-    """Continuously read from the server cursor and yield the result.
+def stream_batch(api, method, path, data=None):
+    """Send a cursor request with the response body left unread.
+
+    If the request failed, the body is read so that the response can be
+    inspected (and passed to an exception) as usual.
 
     :param api: ArangoDB API wrapper object
     :type api: arango.api.API
-    :param response: ArangoDB response object
+    :param method: the HTTP method (e.g. 'post')
+    :type method: str
+    :param path: the API path (e.g. '/_api/cursor')
+    :type path: str
+    :param data: the request payload
+    :type data: dict or None
+    :returns: the ArangoDB response and the body iterator (None on error)
+    :rtype: tuple
+    """
+    response, chunks = api.stream(method, path, data=data)
+    if response.status_code not in HTTP_OK:
+        response.content = b"".join(chunks)
+        return response, None
+    return response, chunks
+
+
+def _split(obj):
+    """Return the result items and the other members of a batch object."""
+    fields = dict(obj)
+    return fields.pop("result"), fields
+
+
+def _batch(api, response, chunks):
+    """Return the result items and the other members of a batch.
+
+    If ``chunks`` is given, the items are parsed as the body streams in,
+    each decoded by the JSON codec of the API wrapper. Bodies which are not
+    JSON (e.g. VelocyPack) are decoded as a whole.
+    """
+    if chunks is None:
+        return _split(response.obj)
+    content_type = (response.headers or {}).get("Content-Type") or ""
+    if "json" not in content_type:
+        response.content = b"".join(chunks)
+        return _split(response.obj)
+    codec = getattr(api.codec, "json_codec", api.codec)
+    if isinstance(codec, StandardCodec):
+        # The standard library decoder finds the end of the items itself
+        parser = ResultParser()
+    else:
+        parser = ResultParser(loads=codec.loads)
+    return parser.parse(chunks), parser.fields
+
+
+class _Columns(_Abstract):
+    """Columns of field values filled from the batches of a cursor.
+
+    Results which are objects have their values read by attribute name,
+    results which are arrays (e.g. from ``RETURN [d.x, d.y]``) by the
+    position of the field in ``fields``. Other results (e.g. from
+    ``RETURN d.x``) are the values of the only field. The columns are
+    allocated for ``size`` results (if known) when the first batch
+    arrives, grown if more results arrive and truncated to the actual
+    number in the end.
+
+    :param fields: the names of the fields
+    :type fields: list
+    :param size: the expected number of results
+    :type size: int or None
+    """
+
+    def __init__(self, fields, size):
+        self.fields = list(fields)
+        self.size = size or 0
+        self.columns = None
+        self.length = 0
+
+    @abstractmethod
+    def _allocate(self, field, values):
+        """Return the column of the field, with room for ``size`` values.
+
+        ``values`` are those of the first batch.
+        """
+
+    @abstractmethod
+    def _write(self, field, column, position, values):
+        """Write the values at ``position`` and return the column.
+
+        The column returned replaces ``column`` if it had to be grown (or
+        converted to hold the values).
+        """
+
+    @abstractmethod
+    def _truncate(self, column, length):
+        """Return the column cut down to its first ``length`` values."""
+
+    def add(self, batch):
+        """Copy the field values of the results in the batch."""
+        if not batch:
+            return
+        if isinstance(batch[0], dict):
+            values = [
+                [result.get(field) for result in batch]
+                for field in self.fields
+            ]
+        elif isinstance(batch[0], (list, tuple)):
+            values = [
+                [result[index] for result in batch]
+                for index in range(len(self.fields))
+            ]
+        else:
+            values = [batch]
+        if self.columns is None:
+            self.columns = [
+                self._allocate(field, column_values)
+                for field, column_values in zip(self.fields, values)
+            ]
+        self.columns = [
+            self._write(field, column, self.length, column_values)
+            for field, column, column_values in zip(
+                self.fields, self.columns, values
+            )
+        ]
+        self.length += len(batch)
+
+    def result(self):
+        """Return the columns by field name."""
+        if self.columns is None:
+            self.size = 0
+            self.columns = [
+                self._allocate(field, []) for field in self.fields
+            ]
+        return dict(
+            (field, self._truncate(column, self.length))
+            for field, column in zip(self.fields, self.columns)
+        )
+
+
+class _ArrayColumns(_Columns):
+    """Columns stored in ``array.array`` objects or lists."""
+
+    def __init__(self, fields, size, typecodes=None):
+        super(_ArrayColumns, self).__init__(fields, size)
+        self.typecodes = typecodes or {}
+
+    def _allocate(self, field, values):
+        typecode = self.typecodes.get(field)
+        if typecode is None:
+            return [None] * self.size
+        return array(typecode, [0]) * self.size
+
+    def _write(self, field, column, position, values):
+        room = len(column) - position
+        if len(values) > room:
+            column.extend(values[room:])
+            values = values[:room]
+        if isinstance(column, array):
+            values = array(column.typecode, values)
+        column[position:position + len(values)] = values
+        return column
+
+    def _truncate(self, column, length):
+        del column[length:]
+        return column
+
+
+class _NumpyColumns(_Columns):
+    """Columns stored in NumPy arrays."""
+
+    def __init__(self, fields, size, dtypes=None):
+        if numpy is None:
+            raise InvalidArgumentError("numpy is not installed")
+        super(_NumpyColumns, self).__init__(fields, size)
+        self.dtypes = dtypes or {}
+
+    @staticmethod
+    def _dtype(values):
+        """Return the data type inferred from the values."""
+        try:
+            values = numpy.asarray(values)
+        except ValueError:
+            return numpy.dtype(object)
+        # Strings longer than the first ones must still fit
+        if values.ndim != 1 or values.dtype.kind in "OSUV":
+            return numpy.dtype(object)
+        return values.dtype
+
+    def _allocate(self, field, values):
+        dtype = self.dtypes.get(field)
+        if dtype is None:
+            dtype = self._dtype(values)
+        return numpy.empty(max(self.size, len(values)), dtype)
+
+    def _write(self, field, column, position, values):
+        if field not in self.dtypes and column.dtype != object:
+            # Widen the inferred type to the values of the later batches
+            # (e.g. ints to floats, or to objects for None)
+            dtype = numpy.result_type(column.dtype, self._dtype(values))
+            if dtype != column.dtype:
+                column = column.astype(dtype)
+        end = position + len(values)
+        if end > len(column):
+            grown = numpy.empty(max(end, 2 * len(column)), column.dtype)
+            grown[:position] = column[:position]
+            column = grown
+        if column.dtype == object:
+            for offset, value in enumerate(values):
+                column[position + offset] = value
+        else:
+            column[position:end] = values
+        return column
+
+    def _truncate(self, column, length):
+        if length < len(column):
+            column = column[:length].copy()
+        return column
+
+
+class _Buffer(object):
+    """Batches fetched ahead of the consumer of a cursor.
+
+    :param size: the number of batches to fetch ahead of the consumer
+    :type size: int
+    :param keep_alive: the max idle time of the server cursor (in seconds)
+    :type keep_alive: int or float or None
+    :param keep_alive_batches: the max number of batches fetched on top of
+        ``size`` to renew the time-to-live of the server cursor
+    :type keep_alive_batches: int
+    """
+
+    def __init__(self, size, keep_alive=None,
+                 keep_alive_batches=KEEP_ALIVE_BATCHES):
+        self.size = size
+        self.keep_alive = keep_alive
+        self.keep_alive_batches = keep_alive_batches
+        self.batches = deque()
+        self.waiting = 0
+        self.stopped = False
+        self.error = None
+        self.condition = threading.Condition(threading.Lock())
+
+    def wait_for_room(self, accessed):
+        """Wait until the next batch should be fetched.
+
+        That is once the consumer has room for it or is waiting for it,
+        or, with ``keep_alive``, once the cursor was not accessed for that
+        long since ``accessed``, to renew its time-to-live on the server.
+        The renewals stop once ``keep_alive_batches`` batches are held on
+        top of ``size``, so that the buffer stays bounded.
+
+        :returns: False if the cursor was closed in the meantime
+        :rtype: bool
+        """
+        with self.condition:
+            while not self.stopped and not self.waiting and \
+                    len(self.batches) >= self.size:
+                if self.keep_alive is None or len(self.batches) >= \
+                        self.size + self.keep_alive_batches:
+                    self.condition.wait()
+                    continue
+                remaining = accessed + self.keep_alive - clock()
+                if remaining <= 0:
+                    break
+                self.condition.wait(remaining)
+            return not self.stopped
+
+    def put(self, batch):
+        with self.condition:
+            self.batches.append(batch)
+            self.condition.notify_all()
+
+    def get(self):
+        with self.condition:
+            self.waiting += 1
+            self.condition.notify_all()
+            try:
+                while not self.batches:
+                    self.condition.wait()
+                return self.batches.popleft()
+            finally:
+                self.waiting -= 1
+                self.condition.notify_all()
+
+    def stop(self):
+        with self.condition:
+            self.stopped = True
+            self.batches.clear()
+            self.condition.notify_all()
+
+
+def _prefetch(api, path, deadline, fields, buffer):
+    """Fetch the batches of a cursor ahead of its consumer.
+
+    The batches (or the exception which ended the fetching) are put into
+    ``buffer``. Once it is stopped, no more batches are fetched and the
+    server cursor is deleted if it has results left; an error while doing
+    so is stored in the buffer. The cursor object itself is not
+    referenced, so that an abandoned cursor can still be garbage
+    collected.
+    """
+    with activate(deadline):
+        try:
+            accessed = clock()
+            while fields.get("hasMore") and buffer.wait_for_room(accessed):
+                response = api.put(path)
+                accessed = clock()
+                if response.status_code not in HTTP_OK:
+                    raise CursorGetNextError(response)
+                fields = response.obj
+                buffer.put(fields)
+            if fields.get("hasMore"):
+                response = api.delete(path)
+                if response.status_code not in HTTP_OK and \
+                        response.status_code != 404:
+                    raise CursorDeleteError(response)
+        except Exception as error:
+            if buffer.stopped:
+                buffer.error = error
+            else:
+                buffer.put(error)
+
+
+class Cursor(object):
+    """Iterator over the results of a server cursor.
+
+    The next batch is requested from the server only once the current one
+    is exhausted. If ``chunks`` (the unread body of ``response``) is given,
+    the batches are read incrementally: every document is returned as soon
+    as it has arrived, and only the part of the batch not yet consumed is
+    held in memory.
+
+    The server deletes the cursor once all its results were fetched. A
+    cursor which is not consumed to the end should be closed, either with
+    ``close`` or by using it as a context manager, so that the server
+    frees it before its time-to-live runs out. Cursors are also closed
+    when they are garbage collected, but ``on_finish`` is then not called.
+
+    With ``prefetch``, a background thread requests the following batches
+    while the current one is being consumed, holding up to ``prefetch``
+    of them ready, so that the network round trips overlap with the
+    processing of the results. Prefetched batches are received whole.
+
+    The server deletes cursors which were not accessed for their
+    time-to-live (the ``ttl`` of the query). With ``keep_alive``, a
+    background thread fetches the next batch ahead whenever the cursor
+    was not accessed for that many seconds, which renews the time-to-live,
+    so that a consumer pausing for longer does not lose the cursor. The
+    batches fetched this way are held until the consumer gets to them, up
+    to ``KEEP_ALIVE_BATCHES`` of them: the renewals then stop, and a
+    consumer pausing for longer than the time-to-live after that may find
+    the cursor expired (``CursorGetNextError``).
+
+    The deadline active when the cursor is created (see ``arango.deadline``)
+    also applies to the batches requested while it is being consumed.
+
+    :param api: ArangoDB API wrapper object
+    :type api: arango.api.API
+    :param response: ArangoDB response object with the first batch
     :type response: arango.response.Response
-    :raises: CursorExecuteError, CursorDeleteError
-    """
-    for item in response.obj["result"]:
-        yield item
-    cursor_id = None
-    while response.obj["hasMore"]:
-        if cursor_id is None:
-            cursor_id = response.obj["id"]
-        response = api.put("/_api/cursor/{}".format(cursor_id))
-        if response.status_code not in HTTP_OK:
-            raise CursorGetNextError(response)
-        for item in response.obj["result"]:
-            yield item
-    if cursor_id is not None:
-        response = api.delete("/api/cursor/{}".format(cursor_id))
-        if response.status_code not in {404, 202}:
+    :param chunks: the unread body of ``response`` (see ``stream_batch``)
+    :type chunks: collections.Iterable or None
+    :param cursor_type: the API of the cursor ('cursor' for queries and
+        simple queries, 'export' for collection exports)
+    :type cursor_type: str
+    :param prefetch: the number of batches to fetch ahead of the consumer
+        on a background thread (default: 0, fetch every batch only when
+        it is needed)
+    :type prefetch: int
+    :param keep_alive: the max idle time of the server cursor (in
+        seconds), which should be well below its time-to-live
+    :type keep_alive: int or float or None
+    :param on_finish: function called with the cursor once its results
+        were consumed to the end, or once it was closed explicitly
+    :type on_finish: callable or None
+    """
+
+    _on_finish = None
+
+    def __init__(self, api, response, chunks=None, cursor_type="cursor",
+                 prefetch=0, keep_alive=None, on_finish=None):
+        self.api = api
+        self.type = cursor_type
+        self._on_finish = on_finish
+        self._deadline = current()
+        self._incremental = chunks is not None
+        self._load(response, chunks)
+        self._first = self._fields
+        self._prefetcher = None
+        if prefetch > 0 or keep_alive is not None:
+            self._read_fields()
+            if self._fields.get("hasMore"):
+                self._start_prefetch(prefetch, keep_alive)
+
+    def _start_prefetch(self, size, keep_alive):
+        """Start fetching the following batches in the background."""
+        self._buffer = _Buffer(size, keep_alive)
+        path = "/_api/{}/{}".format(self.type, self._fields["id"])
+        self._prefetcher = threading.Thread(
+            target=_prefetch,
+            args=(self.api, path, self._deadline, self._fields,
+                  self._buffer)
+        )
+        self._prefetcher.daemon = True
+        self._prefetcher.start()
+
+    def _load(self, response, chunks):
+        """Start reading the batch of the response."""
+        items, self._fields = _batch(self.api, response, chunks)
+        self._items = iter(items)
+        # The other members of a streamed batch follow its result
+        self._complete = isinstance(items, list)
+
+    def _read_fields(self):
+        """Read the rest of a streamed batch to get its other members."""
+        if not self._complete:
+            self._items = iter(list(self._items))
+            self._complete = True
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while True:
+            try:
+                return next(self._items)
+            except StopIteration:
+                self._complete = True
+                if not self._fields.get("hasMore"):
+                    self._finish()
+                    raise
+            self._fetch_next()
+
+    next = __next__
+
+    def _finish(self):
+        """Call the ``on_finish`` function (only the first time)."""
+        on_finish, self._on_finish = self._on_finish, None
+        if on_finish is not None:
+            on_finish(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __del__(self):
+        # Finalizers may run on any thread or at interpreter shutdown, so
+        # only the server cursor is released here
+        self._on_finish = None
+        try:
+            if self._prefetcher is not None:
+                if self._fields.get("hasMore"):
+                    self._buffer.stop()
+            elif self._complete and self._fields.get("hasMore"):
+                self.close()
+        except Exception:
+            pass
+
+    def _fetch_next(self):
+        """Request the next batch from the server cursor."""
+        if self._prefetcher is not None:
+            fields = self._buffer.get()
+            if isinstance(fields, Exception):
+                self._fields = dict(self._fields, hasMore=False)
+                raise fields
+            self._items, self._fields = _split(fields)
+            self._items = iter(self._items)
+            return
+        path = "/_api/{}/{}".format(self.type, self._fields["id"])
+        chunks = None
+        with activate(self._deadline):
+            if self._incremental:
+                response, chunks = stream_batch(self.api, "put", path)
+                if chunks is None:
+                    raise CursorGetNextError(response)
+            else:
+                response = self.api.put(path)
+                if response.status_code not in HTTP_OK:
+                    raise CursorGetNextError(response)
+        self._load(response, chunks)
+
+    @property
+    def id(self):
+        """Return the ID of the server cursor.
+
+        :returns: the cursor ID, or None if all results fit into the first
+            batch (the server then creates no cursor)
+        :rtype: str or None
+        """
+        self._read_fields()
+        return self._first.get("id")
+
+    def has_more(self):
+        """Return True if the server has more batches to return.
+
+        :rtype: bool
+        """
+        self._read_fields()
+        return bool(self._fields.get("hasMore"))
+
+    def batch(self):
+        """Return the results of the current batch not yet consumed.
+
+        They are removed from the cursor: iterating continues with the
+        next batch.
+
+        :returns: the remaining results of the current batch
+        :rtype: list
+        """
+        items = list(self._items)
+        self._items = iter(())
+        self._complete = True
+        return items
+
+    def batches(self):
+        """Iterate over the remaining results one batch at a time.
+
+        :returns: the generator of batches (lists)
+        :raises: CursorGetNextError
+        """
+        while True:
+            batch = self.batch()
+            if batch:
+                yield batch
+            if not self.has_more():
+                self._finish()
+                return
+            self._fetch_next()
+
+    def to_columns(self, fields, typecodes=None):
+        """Return the values of the fields in the remaining results.
+
+        The values are copied batch by batch into one column per field,
+        without keeping the results. Columns with a type code are
+        ``array.array`` objects, which store numbers in a fraction of the
+        memory of a list. If the query was run with ``count=True``, the
+        columns are allocated for all results up front.
+
+        Results may be objects, arrays with the values in the order of
+        ``fields`` (e.g. from ``RETURN [d.x, d.y]``), which spares the
+        decoder building an object per result, or the values of a single
+        field (e.g. from ``RETURN d.x``).
+
+        :param fields: the names of the fields
+        :type fields: list
+        :param typecodes: the ``array`` type codes (e.g. 'd' or 'q') of the
+            columns by field name; other columns are lists
+        :type typecodes: dict or None
+        :returns: the columns by field name
+        :rtype: dict
+        :raises: CursorGetNextError
+        """
+        columns = _ArrayColumns(fields, self.count(), typecodes)
+        for batch in self.batches():
+            columns.add(batch)
+        return columns.result()
+
+    def to_numpy(self, fields, dtypes=None):
+        """Return the values of the fields in the remaining results.
+
+        Like ``to_columns``, but the columns are NumPy arrays.
+
+        :param fields: the names of the fields
+        :type fields: list
+        :param dtypes: the NumPy data types of the columns by field name
+            (default: inferred from the results, object for strings; the
+            inferred type is widened when later batches do not fit it,
+            e.g. to float or to object for None)
+        :type dtypes: dict or None
+        :returns: the columns by field name
+        :rtype: dict
+        :raises: InvalidArgumentError, CursorGetNextError
+        """
+        columns = _NumpyColumns(fields, self.count(), dtypes)
+        for batch in self.batches():
+            columns.add(batch)
+        return columns.result()
+
+    def count(self):
+        """Return the total number of results.
+
+        :returns: the number of results, or None if the query was not run
+            with ``count=True``
+        :rtype: int or None
+        """
+        self._read_fields()
+        return self._first.get("count")
+
+    @property
+    def extra(self):
+        """Return the extra information about the query result.
+
+        :returns: the warnings and statistics reported by the server
+        :rtype: dict
+        """
+        self._read_fields()
+        return self._first.get("extra") or {}
+
+    @property
+    def stats(self):
+        """Return the statistics of the query execution.
+
+        :returns: e.g. the number of scanned documents (``scanned_full``,
+            ``scanned_index``), ``execution_time`` and ``full_count``
+        :rtype: dict
+        """
+        return uncamelify(self.extra.get("stats") or {})
+
+    @property
+    def full_count(self):
+        """Return the number of results before the last LIMIT of the query.
+
+        :returns: the full count, or None if the query was not run with
+            ``full_count=True``
+        :rtype: int or None
+        """
+        return self.stats.get("full_count")
+
+    def close(self):
+        """Delete the server cursor if it has results left to return.
+
+        :raises: CursorDeleteError
+        """
+        self._read_fields()
+        self._finish()
+        if not self._fields.get("hasMore"):
+            return
+        self._fields = dict(self._fields, hasMore=False)
+        self._items = iter(())
+        if self._prefetcher is not None:
+            # The thread deletes the cursor
+            self._buffer.stop()
+            self._prefetcher.join()
+            if self._buffer.error is not None:
+                raise self._buffer.error
+            return
+        path = "/_api/{}/{}".format(self.type, self._fields["id"])
+        with activate(self._deadline):
+            response = self.api.delete(path)
+        # 404: the cursor expired or was already deleted
+        if response.status_code not in HTTP_OK and \
+                response.status_code != 404:
             raise CursorDeleteError(response)
+
+
+class KeysetCursor(Cursor):
+    """Cursor over the documents of a collection in the order of their keys.
+
+    Every batch is fetched by a separate query for the documents following
+    the last key of the previous batch (keyset pagination), so no server
+    cursor is kept alive in between and the consumer may pause for any
+    time. ``checkpoint`` returns the position of the consumer, and a
+    cursor started from it continues after the last document consumed,
+    e.g. when a job is restarted.
+
+    The scan can be restricted to a range of keys (``start`` inclusive,
+    ``end`` exclusive) or to one of several partitions of the keys by
+    their hash, ``partition`` being the tuple of the partition number and
+    the number of partitions (see ``ParallelScan``).
+
+    Fetching a batch only reads the documents of the batch on servers
+    with a sorted primary index (e.g. the RocksDB storage engine); with
+    hash partitions, the keys of the other partitions are read as well.
+
+    :param api: ArangoDB API wrapper object
+    :type api: arango.api.API
+    :param collection: the name of the collection
+    :type collection: str
+    :param batch_size: the number of documents in one batch
+    :type batch_size: int
+    :param checkpoint: the position to continue from (see ``checkpoint``)
+    :type checkpoint: dict or None
+    :param start: the first key of the range to scan
+    :type start: str or None
+    :param end: the key following the range to scan
+    :type end: str or None
+    :param partition: the partition number and the number of partitions
+    :type partition: tuple or None
+    :raises: AQLQueryExecuteError
+    """
+
+    def __init__(self, api, collection, batch_size=1000, checkpoint=None,
+                 start=None, end=None, partition=None):
+        self.collection = collection
+        self.batch_size = batch_size
+        self._key = (checkpoint or {}).get("key")
+        self._last_key = self._key
+        filters = ["d._key > @key"]
+        self._bind_vars = {"@collection": collection, "count": batch_size}
+        if start is not None:
+            filters.append("d._key >= @start")
+            self._bind_vars["start"] = start
+        if end is not None:
+            filters.append("d._key < @end")
+            self._bind_vars["end"] = end
+        if partition is not None:
+            filters.append("HASH(d._key) % @partitions == @partition")
+            self._bind_vars["partition"], self._bind_vars["partitions"] = \
+                partition
+        self._aql = (
+            "FOR d IN @@collection FILTER {} SORT d._key LIMIT @count "
+            "RETURN d".format(" && ".join(filters))
+        )
+        super(KeysetCursor, self).__init__(api, self._query(api))
+
+    def _query(self, api):
+        """Query the batch following the last key fetched."""
+        bind_vars = dict(self._bind_vars, key=self._last_key)
+        response = api.post("/_api/cursor", data={
+            "query": self._aql,
+            "bindVars": bind_vars,
+            "batchSize": self.batch_size,
+        })
+        if response.status_code not in HTTP_OK:
+            raise AQLQueryExecuteError(response)
+        return response
+
+    def _load(self, response, chunks):
+        super(KeysetCursor, self)._load(response, chunks)
+        result = response.obj["result"]
+        if result:
+            self._last_key = result[-1]["_key"]
+        # A full batch may be followed by more documents
+        self._fields["hasMore"] = len(result) >= self.batch_size
+
+    def _fetch_next(self):
+        with activate(self._deadline):
+            response = self._query(self.api)
+        self._load(response, None)
+
+    def __next__(self):
+        document = super(KeysetCursor, self).__next__()
+        self._key = document["_key"]
+        return document
+
+    next = __next__
+
+    def batch(self):
+        items = super(KeysetCursor, self).batch()
+        if items:
+            self._key = items[-1]["_key"]
+        return items
+
+    def checkpoint(self):
+        """Return the position of the consumer in the collection.
+
+        :returns: the collection name and the key of the last document
+            consumed, for the ``checkpoint`` argument of a new cursor
+        :rtype: dict
+        """
+        return {"collection": self.collection, "key": self._key}
+
+    def close(self):
+        """Stop the cursor (no server cursor is kept alive)."""
+        self._fields = dict(self._fields, hasMore=False)
+        self._items = iter(())
+
+
+def _scan_partition(cursor, index, queue, stop):
+    """Put the batches of the partition cursor into the queue."""
+    try:
+        for batch in cursor.batches():
+            if stop.is_set():
+                return
+            queue.put((index, batch))
+    except Exception as error:
+        queue.put((index, error))
+    else:
+        queue.put((index, None))
+
+
+class ParallelScan(object):
+    """Scan of a collection split into partitions read at the same time.
+
+    The keys are split into ranges by ``boundaries`` (a sorted list of
+    keys), or otherwise into ``partitions`` partitions by their hash (which
+    requires the AQL function HASH). Every partition is read by a
+    ``KeysetCursor``, and the first batches of all partitions are queried
+    at once.
+
+    Iterating over the scan reads all partitions on one thread each and
+    returns their documents in the order they arrive. Alternatively, the
+    ``cursors`` of the partitions can be consumed separately, e.g. by
+    worker threads of their own. ``checkpoint`` returns the position of
+    the consumer in every partition, and a scan started from it continues
+    each partition after its last document consumed.
+
+    :param api: ArangoDB API wrapper object
+    :type api: arango.api.API
+    :param collection: the name of the collection
+    :type collection: str
+    :param partitions: the number of hash partitions
+    :type partitions: int
+    :param batch_size: the number of documents in one batch
+    :type batch_size: int
+    :param boundaries: the keys splitting the collection into key ranges
+        (``len(boundaries) + 1`` partitions)
+    :type boundaries: list or None
+    :param checkpoint: the position to continue from (see ``checkpoint``)
+    :type checkpoint: dict or None
+    :raises: AQLQueryExecuteError
+    """
+
+    def __init__(self, api, collection, partitions=4, batch_size=1000,
+                 boundaries=None, checkpoint=None):
+        if checkpoint is not None:
+            partitions = checkpoint["partitions"]
+            boundaries = checkpoint["boundaries"]
+            keys = list(checkpoint["keys"])
+        elif boundaries is not None:
+            keys = [None] * (len(boundaries) + 1)
+        else:
+            keys = [None] * partitions
+        self.collection = collection
+        self.partitions = len(keys)
+        self.boundaries = boundaries
+        if boundaries is not None:
+            edges = [None] + list(boundaries) + [None]
+            options = [
+                {"start": start, "end": end}
+                for start, end in zip(edges, edges[1:])
+            ]
+        else:
+            options = [
+                {"partition": (index, partitions)}
+                for index in range(partitions)
+            ]
+        self._keys = keys
+        self._queue = None
+        self._stop = threading.Event()
+        self._threads = []
+        self.cursors = [None] * self.partitions
+        errors = []
+        active = current()
+
+        def open_cursor(index):
+            try:
+                with activate(active):
+                    self.cursors[index] = KeysetCursor(
+                        api, collection, batch_size, {"key": keys[index]},
+                        **options[index]
+                    )
+            except Exception as error:
+                errors.append(error)
+
+        self._run(open_cursor)
+        if errors:
+            raise errors[0]
+
+    def _run(self, target):
+        """Run the target for every partition on a thread of its own."""
+        threads = [
+            threading.Thread(target=target, args=(index,))
+            for index in range(self.partitions)
+        ]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __del__(self):
+        try:
+            self._stop.set()
+            self._drain()
+        except Exception:
+            pass
+
+    def _drain(self):
+        """Empty the queue so that the threads blocked on it go on."""
+        try:
+            while self._queue is not None:
+                self._queue.get_nowait()
+        except Empty:
+            pass
+
+    def _batches(self):
+        """Yield the partition numbers and batches as they arrive."""
+        if self._queue is None:
+            self._queue = Queue(2 * self.partitions)
+            for index, cursor in enumerate(self.cursors):
+                thread = threading.Thread(
+                    target=_scan_partition,
+                    args=(cursor, index, self._queue, self._stop)
+                )
+                thread.daemon = True
+                thread.start()
+                self._threads.append(thread)
+        active = self.partitions
+        while active:
+            index, batch = self._queue.get()
+            if batch is None:
+                active -= 1
+            elif isinstance(batch, Exception):
+                self.close()
+                raise batch
+            else:
+                yield index, batch
+
+    def __iter__(self):
+        for index, batch in self._batches():
+            for document in batch:
+                self._keys[index] = document["_key"]
+                yield document
+
+    def batches(self):
+        """Iterate over the batches of all partitions as they arrive.
+
+        :returns: the generator of batches (lists)
+        :raises: AQLQueryExecuteError
+        """
+        for index, batch in self._batches():
+            self._keys[index] = batch[-1]["_key"]
+            yield batch
+
+    def checkpoint(self):
+        """Return the position of the consumer in every partition.
+
+        :returns: the partitions and the key of the last document
+            consumed in each, for the ``checkpoint`` argument of a new scan
+        :rtype: dict
+        """
+        if self._queue is None:
+            keys = [cursor.checkpoint()["key"] for cursor in self.cursors]
+        else:
+            keys = list(self._keys)
+        return {
+            "collection": self.collection,
+            "partitions": self.partitions,
+            "boundaries": self.boundaries,
+            "keys": keys,
+        }
+
+    def close(self):
+        """Stop reading the partitions."""
+        self._stop.set()
+        self._drain()
+        for thread in self._threads:
+            thread.join()
+        for cursor in self.cursors:
+            cursor.close()
+
+
+def arango_cursor(api, response, chunks=None, prefetch=0, keep_alive=None):
+    """Return the cursor over the results of the response.
+
+    :param api: ArangoDB API wrapper object
+    :type api: arango.api.API
+    :param response: ArangoDB response object
+    :type response: arango.response.Response
+    :param chunks: the unread body of ``response`` (see ``stream_batch``)
+    :type chunks: collections.Iterable or None
+    :param prefetch: the number of batches to fetch in the background
+    :type prefetch: int
+    :param keep_alive: the max idle time of the server cursor (in seconds)
+    :type keep_alive: int or float or None
+    :returns: the cursor
+    :rtype: arango.cursor.Cursor
+    """
+    return Cursor(
+        api, response, chunks, prefetch=prefetch, keep_alive=keep_alive
+    )
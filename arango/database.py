@@ -1,15 +1,20 @@
 """ArangoDB Database."""
 
-import json
 import inspect
+import json
 
-
+from arango.aql import bind_parameters, substitute, unpack
 from arango.utils import uncamelify, stringify_request
 from arango.graph import Graph
 from arango.collection import Collection
-from arango.cursor import arango_cursor
+from arango.cache import QueryCache, is_modifying
+from arango.cursor import Cursor, stream_batch
+from arango.prepared import PreparedQuery
+from arango.deadline import current
+from arango.registry import Registry
 from arango.constants import HTTP_OK
 from arango.exceptions import *
+from arango.response import Response
 
 
 class Database(object):
@@ -34,30 +39,23 @@ class Database(object):
         """
         self.name = name
         self.api = api
-        self._collection_cache = {}
-        self._graph_cache = {}
+        self._collection_cache = Registry(
+            load=lambda: self.collections["all"],
+            create=lambda col_name: Collection(name=col_name, api=self.api),
+        )
+        self._graph_cache = Registry(
+            load=lambda: self.graphs,
+            create=lambda graph_name: Graph(name=graph_name, api=self.api),
+        )
+        self._prepared = {}
 
     def _update_collection_cache(self):
         """Invalidate the collection cache."""
-        real_cols = set(self.collections["all"])
-        cached_cols = set(self._collection_cache)
-        for col_name in cached_cols - real_cols:
-            del self._collection_cache[col_name]
-        for col_name in real_cols - cached_cols:
-            self._collection_cache[col_name] = Collection(
-                name=col_name, api=self.api
-            )
+        self._collection_cache.refresh()
 
     def _update_graph_cache(self):
         """Invalidate the graph cache."""
-        real_graphs = set(self.graphs)
-        cached_graphs = set(self._graph_cache)
-        for graph_name in cached_graphs - real_graphs:
-            del self._graph_cache[graph_name]
-        for graph_name in real_graphs - cached_graphs:
-            self._graph_cache[graph_name] = Graph(
-                name=graph_name, api=self.api
-            )
+        self._graph_cache.refresh()
 
     @property
     def properties(self):
@@ -107,7 +105,7 @@ class Database(object):
     ###############
 
     def explain_query(self, query, all_plans=False, max_plans=None,
-                      optimizer_rules=None):
+                      optimizer_rules=None, bind_vars=None):
         """Explain the AQL query.
 
         This method does not execute the query, but only inspect it and
@@ -120,25 +118,29 @@ class Database(object):
         https://docs.arangodb.com/HttpAqlQuery/README.html
 
         :param query: the AQL query to explain
-        :type query: str
+        :type query: str or arango.aql.Query
         :param all_plans: whether or not to return all execution plans
         :type all_plans: bool
         :param max_plans: maximum number of plans the optimizer generates
         :type max_plans: None or int
         :param optimizer_rules: list of optimizer rules
         :type optimizer_rules: list
+        :param bind_vars: the bind variables of the query
+        :type bind_vars: dict
         :returns: the query plan or list of plans (if all_plans is True)
         :rtype: dict or list
         :raises: AQLQueryExplainError
         """
+        query, bind_vars = unpack(query, bind_vars)
         options = {"allPlans": all_plans}
         if max_plans is not None:
             options["maxNumberOfPlans"] = max_plans
         if optimizer_rules is not None:
             options["optimizer"] = {"rules": optimizer_rules}
-        res = self.api.post(
-            "/_api/explain", data={"query": query, "options": options}
-        )
+        data = {"query": query, "options": options}
+        if bind_vars is not None:
+            data["bindVars"] = bind_vars
+        res = self.api.post("/_api/explain", data=data)
         if res.status_code not in HTTP_OK:
             raise AQLQueryExplainError(res)
         if "plan" in res.obj:
@@ -153,20 +155,102 @@ class Database(object):
         :type query: str
         :raises: AQLQueryValidateError
         """
+        self._parse_query(query)
+
+    def _parse_query(self, query):
+        """Return the bind variables and collections of the AQL query."""
         res = self.api.post("/_api/query", data={"query": query})
         if res.status_code not in HTTP_OK:
             raise AQLQueryValidateError(res)
+        return res.obj
+
+    def prepare(self, name, query, bind_vars=None, recheck=None,
+                on_plan_change=None, **options):
+        """Validate and explain the AQL query and register it by name.
+
+        See ``arango.prepared.PreparedQuery``. A query prepared before
+        under the same name is replaced.
+
+        :param name: the name of the prepared query
+        :type name: str
+        :param query: the AQL query
+        :type query: str
+        :param bind_vars: sample bind variables to explain the query with
+        :type bind_vars: dict or None
+        :param recheck: explain the query again when the plan is older
+            than this many seconds, before running it
+        :type recheck: int or float or None
+        :param on_plan_change: function called with the prepared query,
+            the old and the new plan when the plan changed
+        :type on_plan_change: callable or None
+        :param options: the options of ``execute_query`` to run the query
+            with (e.g. ``count`` or ``batch_size``)
+        :returns: the prepared query, which runs it when called with the
+            bind variables
+        :rtype: arango.prepared.PreparedQuery
+        :raises: AQLQueryValidateError, AQLQueryExplainError
+        """
+        prepared = PreparedQuery(
+            self, name, query, bind_vars=bind_vars, recheck=recheck,
+            on_plan_change=on_plan_change, **options
+        )
+        self._prepared[name] = prepared
+        return prepared
+
+    def prepared_query(self, name):
+        """Return the prepared AQL query of the specified name.
+
+        :param name: the name of the prepared query
+        :type name: str
+        :returns: the prepared query
+        :rtype: arango.prepared.PreparedQuery
+        :raises: PreparedQueryNotFoundError
+        """
+        try:
+            return self._prepared[name]
+        except KeyError:
+            raise PreparedQueryNotFoundError(name)
+
+    @property
+    def prepared_queries(self):
+        """Return the names of the prepared AQL queries.
+
+        :returns: the names of the prepared queries
+        :rtype: list
+        """
+        return sorted(self._prepared)
+
+    def check_plans(self):
+        """Explain the prepared AQL queries again, e.g. after index changes.
+
+        Queries not explained yet (prepared without sample bind variables
+        and never run) are skipped.
+
+        :returns: the names of the prepared queries whose plans changed
+        :rtype: list
+        :raises: AQLQueryExplainError
+        """
+        changed = []
+        for name, prepared in sorted(self._prepared.items()):
+            if prepared.plan is not None and prepared.explain():
+                changed.append(name)
+        return changed
 
     def execute_query(self, query, count=False, batch_size=None, ttl=None,
                       bind_vars=None, full_count=None, max_plans=None,
-                      optimizer_rules=None):
+                      optimizer_rules=None, max_runtime=None,
+                      incremental=False, prefetch=0, keep_alive=None,
+                      cache=False):
         """Execute the AQL query and return the result.
 
         For more information on ``full_count`` please refer to:
         https://docs.arangodb.com/HttpAqlQueryCursor/AccessingCursors.html
 
+        If the API wrapper has a profiler (see ``arango.profiler``), the
+        query is timed until its cursor is finished.
+
         :param query: the AQL query to execute
-        :type query: str
+        :type query: str or arango.aql.Query
         :param count: whether or not the document count should be returned
         :type count: bool
         :param batch_size: maximum number of documents in one round trip
@@ -180,9 +264,33 @@ class Database(object):
         :type max_plans: None or int
         :param optimizer_rules: list of optimizer rules
         :type optimizer_rules: list
+        :param max_runtime: abort the query on the server after this many
+            seconds (default: the time left before the active deadline, if
+            any, see ``arango.deadline``)
+        :type max_runtime: int or float or None
+        :param incremental: yield the documents of each batch as they arrive
+            instead of after the whole batch was received and decoded
+        :type incremental: bool
+        :param prefetch: the number of batches to fetch on a background
+            thread while the current one is consumed (batches are then
+            received whole, even with ``incremental``)
+        :type prefetch: int
+        :param keep_alive: renew the time-to-live of the cursor once it was
+            not accessed for this many seconds (see ``Cursor``)
+        :type keep_alive: int or float or None
+        :param cache: return the result from the ``QueryCache`` among the
+            interceptors of the API wrapper, or cache it there (queries
+            modifying documents are never cached); cached results are read
+            whole, so ``incremental``, ``prefetch`` and ``keep_alive``
+            cannot be combined with it
+        :type cache: bool
         :returns: the cursor from executing the query
-        :raises: AQLQueryExecuteError, CursorDeleteError
+        :rtype: arango.cursor.Cursor
+        :raises: AQLQueryExecuteError, CursorDeleteError,
+            InvalidArgumentError, AQLQueryValidateError (if ``cache`` is
+            set and the query cannot be parsed)
         """
+        query, bind_vars = unpack(query, bind_vars)
         options = {}
         if full_count is not None:
             options["fullCount"] = full_count
@@ -190,6 +298,11 @@ class Database(object):
             options["maxNumberOfPlans"] = max_plans
         if optimizer_rules is not None:
             options["optimizer"] = {"rules": optimizer_rules}
+        active = current()
+        if max_runtime is None and active is not None:
+            max_runtime = active.timeout()
+        if max_runtime is not None:
+            options["maxRuntime"] = max_runtime
 
         data = {
             "query": query,
@@ -204,10 +317,215 @@ class Database(object):
         if options:
             data["options"] = options
 
+        if cache and (incremental or prefetch or keep_alive is not None):
+            raise InvalidArgumentError(
+                "cache cannot be combined with incremental, prefetch or "
+                "keep_alive"
+            )
+        on_finish = None
+        if self.api.profiler is not None:
+            on_finish = self.api.profiler.start(self, query, bind_vars)
+        if cache and not is_modifying(query):
+            return self._cached_query(data, full_count, on_finish)
+        if incremental:
+            res, chunks = stream_batch(self.api, "post", "/_api/cursor", data)
+            if chunks is None:
+                raise AQLQueryExecuteError(res)
+            return Cursor(
+                self.api, res, chunks, prefetch=prefetch,
+                keep_alive=keep_alive, on_finish=on_finish
+            )
         res = self.api.post("/_api/cursor", data=data)
         if res.status_code not in HTTP_OK:
             raise AQLQueryExecuteError(res)
-        return arango_cursor(self.api, res)
+        return Cursor(
+            self.api, res, prefetch=prefetch, keep_alive=keep_alive,
+            on_finish=on_finish
+        )
+
+    def execute_many(self, query, bind_var_list, chunk_size=100,
+                     bind_vars=None, batch_size=None, ttl=None,
+                     max_runtime=None):
+        """Execute the AQL query once for every set of bind variables.
+
+        Instead of a request per set, the sets are sent in chunks of
+        ``chunk_size``, each run by a single query which loops over them
+        and runs the original query as a subquery per set (``FOR params IN
+        @batch RETURN (...)``). If the query of a chunk fails, the server
+        rolls it back and the sets of the chunk are run one at a time to
+        tell which of them failed (queries the server cannot run in a
+        subquery, e.g. reading a collection after modifying it, therefore
+        end up run one at a time).
+
+        Collection bind variables (e.g. ``@collection``) must be the same
+        in all sets; bind variables shared by all sets may also be given
+        in ``bind_vars`` instead.
+
+        :param query: the AQL query to execute
+        :type query: str or arango.aql.Query
+        :param bind_var_list: the sets of bind variables (dictionaries)
+        :type bind_var_list: list
+        :param chunk_size: the max number of sets sent in one query
+        :type chunk_size: int
+        :param bind_vars: the bind variables shared by all sets
+        :type bind_vars: dict or None
+        :param batch_size: maximum number of results in one round trip
+        :type batch_size: int
+        :param ttl: time-to-live for the cursors (in seconds)
+        :type ttl: int
+        :param max_runtime: abort the queries on the server after this many
+            seconds (see ``execute_query``)
+        :type max_runtime: int or float or None
+        :returns: the results of every set (lists) in the order of the
+            sets, or the exception (AQLQueryExecuteError or
+            InvalidArgumentError) of the sets which failed
+        :rtype: list
+        :raises: InvalidArgumentError, CursorGetNextError
+        """
+        query, shared = unpack(query, bind_vars)
+        if chunk_size < 1:
+            raise InvalidArgumentError("chunk_size must be at least 1")
+        shared = dict(shared or {})
+        names = [name for name in bind_parameters(query)
+                 if name not in shared]
+        variable, batch = "params", "batch"
+        while variable in query:
+            variable += "_"
+        while batch in shared:
+            batch += "_"
+        rewritten = "FOR {} IN @{} RETURN ({})".format(
+            variable, batch, substitute(query, {
+                name: "{}.`{}`".format(variable, name) for name in names
+            })
+        )
+
+        results = [None] * len(bind_var_list)
+        valid = []
+        for index, item in enumerate(bind_var_list):
+            missing = set(names) - set(item)
+            unknown = set(
+                name for name in item
+                if name not in names and not name.startswith("@")
+            )
+            if missing or unknown:
+                results[index] = InvalidArgumentError(
+                    "missing bind variables: {}, unknown bind variables: "
+                    "{}".format(", ".join(sorted(missing)) or "none",
+                                ", ".join(sorted(unknown)) or "none")
+                )
+                continue
+            conflict = False
+            for name, value in item.items():
+                if name.startswith("@"):
+                    if shared.setdefault(name, value) != value:
+                        conflict = True
+            if conflict:
+                results[index] = InvalidArgumentError(
+                    "collection bind variables differ from the other sets"
+                )
+                continue
+            valid.append(index)
+
+        options = {
+            "batch_size": batch_size, "ttl": ttl, "max_runtime": max_runtime
+        }
+        for start in range(0, len(valid), chunk_size):
+            chunk = valid[start:start + chunk_size]
+            chunk_vars = dict(shared)
+            chunk_vars[batch] = [
+                dict((name, bind_var_list[index][name]) for name in names)
+                for index in chunk
+            ]
+            try:
+                chunk_results = list(self.execute_query(
+                    rewritten, bind_vars=chunk_vars, **options
+                ))
+            except AQLQueryExecuteError:
+                chunk_results = None
+            if chunk_results is not None and \
+                    len(chunk_results) == len(chunk):
+                for index, result in zip(chunk, chunk_results):
+                    results[index] = result
+                continue
+            for index in chunk:
+                item_vars = dict(shared)
+                item_vars.update(bind_var_list[index])
+                try:
+                    results[index] = list(self.execute_query(
+                        query, bind_vars=item_vars, **options
+                    ))
+                except AQLQueryExecuteError as error:
+                    results[index] = error
+        return results
+
+    def _query_cache(self):
+        """Return the query cache among the interceptors."""
+        for interceptor in self.api.interceptors:
+            if isinstance(interceptor, QueryCache):
+                return interceptor
+        raise InvalidArgumentError("no QueryCache among the interceptors")
+
+    def _revisions(self, names):
+        """Return the revisions of the collections (None if not found)."""
+        revisions = {}
+        for name in names:
+            res = self.api.get("/_api/collection/{}/revision".format(name))
+            revisions[name] = (
+                res.obj["revision"] if res.status_code in HTTP_OK else None
+            )
+        return revisions
+
+    def _cached_query(self, data, full_count, on_finish=None):
+        """Return the cursor over the (cached) result of the query.
+
+        ``on_finish`` is only called for results read from the server.
+        """
+        cache = self._query_cache()
+        key = (
+            self.api.url_prefix,
+            data["query"],
+            json.dumps(data.get("bindVars"), sort_keys=True, default=repr),
+            data["count"],
+            full_count,
+        )
+        cached = cache.get(key, self._revisions)
+        if cached is None:
+            generation = cache.generation
+            query = data["query"]
+            collections = cache.collections(
+                self.api.url_prefix, query,
+                lambda: self._parse_query(query).get("collections", [])
+            )
+            # Collections bound with @@name are not part of the query string
+            collections = list(collections) + [
+                value for name, value in (data.get("bindVars") or {}).items()
+                if name.startswith("@")
+            ]
+            revisions = None
+            if cache.check_revisions:
+                revisions = self._revisions(collections)
+            res = self.api.post("/_api/cursor", data=data)
+            if res.status_code not in HTTP_OK:
+                raise AQLQueryExecuteError(res)
+            cursor = Cursor(self.api, res, on_finish=on_finish)
+            result = list(cursor)
+            content = self.api.codec.encode({
+                "result": result,
+                "hasMore": False,
+                "count": cursor.count(),
+                "extra": cursor.extra,
+            })
+            cached = content, self.api.codec.content_type
+            cache.put(
+                key, cached, len(content), collections, revisions, generation
+            )
+        content, content_type = cached
+        res = Response(
+            "post", self.api.url_prefix + "/_api/cursor", 201, content,
+            {"Content-Type": content_type}
+        )
+        res.codec = self.api.codec
+        return Cursor(self.api, res)
 
     #########################
     # Collection Management #
@@ -253,13 +571,10 @@ class Database(object):
         """
         if not isinstance(name, str):
             raise TypeError("Expecting a str.")
-        if name in self._collection_cache:
-            return self._collection_cache[name]
-        else:
-            self._update_collection_cache()
-            if name not in self._collection_cache:
-                raise CollectionNotFoundError(name)
-            return self._collection_cache[name]
+        col = self._collection_cache.get(name)
+        if col is None:
+            raise CollectionNotFoundError(name)
+        return col
 
     def create_collection(self, name, wait_for_sync=False, do_compact=True,
                           journal_size=None, is_system=False, is_edge=False,
@@ -386,7 +701,9 @@ class Database(object):
             data += "--XXXsubpartXXX\r\n"
             data += "Content-Type: application/x-arango-batchpart\r\n"
             data += "Content-Id: {}\r\n\r\n".format(content_id)
-            data += "{}\r\n".format(stringify_request(**res))
+            data += "{}\r\n".format(
+                stringify_request(codec=self.api.codec, **res)
+            )
         data += "--XXXsubpartXXX--\r\n\r\n"
         res = self.api.post(
             "/_api/batch",
@@ -400,8 +717,9 @@ class Database(object):
         if res.obj is None:
             return []
         return [
-            json.loads(string) for string in res.obj.split("\r\n") if
-            string.startswith("{") and string.endswith("}")
+            self.api.codec.loads(string)
+            for string in res.obj.split("\r\n")
+            if string.startswith("{") and string.endswith("}")
         ]
 
     #################
@@ -535,13 +853,10 @@ class Database(object):
         """
         if not isinstance(name, str):
             raise TypeError("Expecting a str.")
-        if name in self._graph_cache:
-            return self._graph_cache[name]
-        else:
-            self._update_graph_cache()
-            if name not in self._graph_cache:
-                raise GraphNotFoundError(name)
-            return self._graph_cache[name]
+        graph = self._graph_cache.get(name)
+        if graph is None:
+            raise GraphNotFoundError(name)
+        return graph
 
     def create_graph(self, name, edge_definitions=None,
                      orphan_collections=None):
@@ -0,0 +1,173 @@
+"""Deadlines bounding operations which span multiple requests.
+
+A deadline is activated with a ``with`` statement and applies to every
+request made inside the block, in the current thread (or asyncio task on
+Python 3.7+). Each request gets the remaining time as its timeout and
+requests started after the deadline fail with ``DeadlineExceededError``.
+Nested deadlines never extend the enclosing one.
+
+    with deadline(5):
+        for doc in db.execute_query("FOR d IN col RETURN d"):
+            ...
+
+Cursors capture the deadline active when they are created, so the pages
+they fetch later stay within it even if consumed outside the block.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+from arango.exceptions import DeadlineExceededError
+
+try:
+    import contextvars
+except ImportError:  # pragma: no cover
+    contextvars = None
+
+# Monotonic clock where available
+clock = getattr(time, "monotonic", time.time)
+
+if contextvars is not None:
+    _current = contextvars.ContextVar("arango_deadline", default=None)
+
+    def _get():
+        return _current.get()
+
+    def _set(value):
+        _current.set(value)
+else:  # pragma: no cover
+    _local = threading.local()
+
+    def _get():
+        return getattr(_local, "deadline", None)
+
+    def _set(value):
+        _local.deadline = value
+
+
+class Deadline(object):
+    """The point in time by which an operation must be done.
+
+    :param seconds: the time budget from now (in seconds)
+    :type seconds: int or float
+    """
+
+    __slots__ = ("seconds", "expires")
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.expires = clock() + seconds
+
+    def remaining(self):
+        """Return the time left before the deadline.
+
+        :returns: the seconds left (0 once expired)
+        :rtype: float
+        """
+        return max(self.expires - clock(), 0.0)
+
+    @property
+    def expired(self):
+        """Return True if the deadline has passed.
+
+        :rtype: bool
+        """
+        return clock() >= self.expires
+
+    def check(self):
+        """Raise if the deadline has passed.
+
+        :raises: DeadlineExceededError
+        """
+        if self.expired:
+            raise DeadlineExceededError(self.seconds)
+
+    def timeout(self, timeout=None):
+        """Return the request timeout capped by the remaining time.
+
+        :param timeout: the timeout of the request (a number or a tuple of
+            the connect and read timeouts) or None
+        :type timeout: int or float or tuple or None
+        :returns: the capped timeout
+        :rtype: float or tuple
+        :raises: DeadlineExceededError
+        """
+        self.check()
+        remaining = self.remaining()
+        if timeout is None:
+            return remaining
+        if isinstance(timeout, tuple):
+            return tuple(
+                remaining if value is None else min(value, remaining)
+                for value in timeout
+            )
+        return min(timeout, remaining)
+
+    def backoff(self, delay):
+        """Return the delay before a retry if it ends before the deadline.
+
+        :param delay: the delay before the retry (in seconds)
+        :type delay: int or float
+        :returns: the delay
+        :rtype: int or float
+        :raises: DeadlineExceededError
+        """
+        if delay >= self.remaining():
+            raise DeadlineExceededError(self.seconds)
+        return delay
+
+    def guard(self, iterable):
+        """Yield from ``iterable``, raising once the deadline has passed.
+
+        Used for streamed request bodies, so that an upload stops when the
+        deadline expires even if every socket write succeeds in time.
+
+        :param iterable: the iterable to guard
+        :type iterable: collections.Iterable
+        :returns: the items of ``iterable``
+        :rtype: types.GeneratorType
+        :raises: DeadlineExceededError
+        """
+        for item in iterable:
+            self.check()
+            yield item
+
+
+def current():
+    """Return the deadline active in the current context.
+
+    :returns: the active deadline or None
+    :rtype: arango.deadline.Deadline or None
+    """
+    return _get()
+
+
+@contextmanager
+def activate(active):
+    """Activate the deadline object for the block.
+
+    If the deadline of the enclosing block expires first, it stays in
+    effect. Activating None leaves the current deadline as is.
+
+    :param active: the deadline to activate
+    :type active: arango.deadline.Deadline or None
+    """
+    previous = _get()
+    if active is not None and (
+            previous is None or active.expires < previous.expires):
+        _set(active)
+    try:
+        yield _get()
+    finally:
+        _set(previous)
+
+
+def deadline(seconds):
+    """Bound the requests made in the block to ``seconds`` from now.
+
+    :param seconds: the time budget (in seconds)
+    :type seconds: int or float
+    :returns: the context manager activating the deadline
+    """
+    return activate(Deadline(seconds))
@@ -60,6 +60,39 @@ class InvalidArgumentError(Exception):
     """The given argument(s) are invalid."""
 
 
+class CircuitOpenError(Exception):
+    """The circuit breaker of the endpoint refused the request.
+
+    :param endpoint: the endpoint URL
+    :type endpoint: str
+    :param retry_after: seconds until a trial request is let through
+    :type retry_after: int or float
+    """
+
+    def __init__(self, endpoint, retry_after):
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+        super(CircuitOpenError, self).__init__(
+            "circuit open for {}, retry in {:.1f} seconds".format(
+                endpoint, retry_after
+            )
+        )
+
+
+class DeadlineExceededError(Exception):
+    """The deadline of the operation expired.
+
+    :param seconds: the time budget of the deadline (in seconds)
+    :type seconds: int or float
+    """
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        super(DeadlineExceededError, self).__init__(
+            "deadline of {} seconds exceeded".format(seconds)
+        )
+
+
 ###########################
 # Miscellaneous Functions #
 ###########################
@@ -366,6 +399,14 @@ class AQLQueryExecuteError(RequestError):
     """Failed to execute the AQL query."""
 
 
+class PreparedQueryNotFoundError(NotFoundError):
+    """Failed to find the prepared AQL query."""
+
+
+class PlanChangedWarning(UserWarning):
+    """The execution plan of a prepared AQL query changed."""
+
+
 #####################
 # Cursor Exceptions #
 #####################
@@ -0,0 +1,52 @@
+"""Resetting the state of the driver in child processes after ``fork()``.
+
+Sockets inherited by a child process are shared with the parent, and the
+locks held by other threads at the time of the fork are never released in
+the child. Objects holding either register here and have their
+``_after_fork`` method called in the child, so that a driver created
+before forking (e.g. by a pre-forking web server) opens its own
+connections in every worker process.
+
+On Python 3.7+ the reset runs right after the fork. On older versions it
+runs when the next request is made (see ``check``).
+"""
+
+import os
+import threading
+import weakref
+
+_objects = weakref.WeakSet()
+_lock = threading.Lock()
+_pid = os.getpid()
+
+
+def register(obj):
+    """Call ``obj._after_fork()`` in the child processes of future forks.
+
+    :param obj: the object to reset after forking
+    :type obj: object
+    """
+    with _lock:
+        _objects.add(obj)
+
+
+def after_fork():
+    """Reset the registered objects (called in the child process)."""
+    global _lock, _pid
+    _lock = threading.Lock()
+    _pid = os.getpid()
+    for obj in list(_objects):
+        obj._after_fork()
+
+
+def check():
+    """Reset the registered objects if the process was forked since.
+
+    Only needed on Python versions without ``os.register_at_fork``.
+    """
+    if _pid != os.getpid():
+        after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=after_fork)
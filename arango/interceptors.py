@@ -0,0 +1,102 @@
+"""Interceptors running around every request made by the API wrappers."""
+
+
+class Request(object):
+    """A request going through the interceptor chain.
+
+    ``method``: the HTTP method (e.g. 'get')
+    ``path``: the API path (e.g. '/_api/version')
+    ``url``: the full request URL
+    ``params``: the request parameters (may be changed by ``before`` hooks)
+    ``headers``: the request headers (may be changed by ``before`` hooks)
+    ``data``: the encoded request payload (bytes, text, a stream or None)
+    ``body_size``: the size of the payload in bytes or None if unknown
+        (no payload or a stream)
+    ``status_code``: the status code of the response (set before the
+        ``after`` hooks are called)
+    ``elapsed``: seconds spent sending the request and receiving the
+        response, including retries (set before the ``after`` hooks)
+    ``context``: a dictionary for the interceptors to keep their own state
+        between the hooks (e.g. the start of a tracing span)
+    """
+
+    __slots__ = (
+        "method",
+        "path",
+        "url",
+        "params",
+        "headers",
+        "data",
+        "body_size",
+        "status_code",
+        "elapsed",
+        "context",
+    )
+
+    def __init__(self, method, path, url, params=None, headers=None,
+                 data=None):
+        self.method = method
+        self.path = path
+        self.url = url
+        self.params = params
+        self.headers = headers
+        self.data = data
+        if isinstance(data, bytes):
+            self.body_size = len(data)
+        elif hasattr(data, "encode"):
+            self.body_size = len(data.encode("utf-8"))
+        else:
+            self.body_size = None
+        self.status_code = None
+        self.elapsed = None
+        self.context = {}
+
+
+class Interceptor(object):
+    """Base class for the interceptors.
+
+    The interceptors of an API wrapper form an ordered chain: the
+    ``before`` hooks are called in order before the request is sent, the
+    ``after`` (or ``failed``) hooks in reverse order once it is done. The
+    hooks of this class do nothing; subclasses override the ones they need.
+
+    With ``arango.aio.api.AsyncAPI`` the hooks may also be coroutines.
+    """
+
+    def before(self, request):
+        """Called before the request is sent.
+
+        Returning a response short-circuits the request (e.g. a cache hit):
+        the request is not sent and the ``before`` hooks of the following
+        interceptors are skipped, but the ``after`` hooks of this one and
+        the previous ones are still called.
+
+        :param request: the request about to be sent
+        :type request: arango.interceptors.Request
+        :returns: None, or the response to use instead of sending it
+        :rtype: arango.response.Response or None
+        """
+        return None
+
+    def after(self, request, response):
+        """Called with the response to the request.
+
+        :param request: the request which was sent
+        :type request: arango.interceptors.Request
+        :param response: the ArangoDB http response
+        :type response: arango.response.Response
+        :returns: None, or a response replacing ``response``
+        :rtype: arango.response.Response or None
+        """
+        return None
+
+    def failed(self, request, error):
+        """Called if sending the request raised an exception.
+
+        The exception is re-raised once every ``failed`` hook was called.
+
+        :param request: the request which failed
+        :type request: arango.interceptors.Request
+        :param error: the exception raised
+        :type error: Exception
+        """
@@ -0,0 +1,247 @@
+"""Pipelining of independent requests made through the API wrapper.
+
+    with api.pipeline() as pipe:
+        futures = [
+            pipe.get("/_api/document/col/{}".format(key)) for key in keys
+        ]
+    documents = [future.result().obj for future in futures]
+
+The requests queued in the ``with`` block are sent when it ends (or as
+soon as the result of one of them is needed) over a few persistent
+sockets, without waiting for each response before sending the next
+request (see ``arango.clients.pipeline.PipelineClient``). The requests
+must not depend on each other: their order of execution on the server is
+not guaranteed.
+
+Pipelined requests are encoded and compressed like the others, pass
+through the interceptors of the API wrapper (the ``before`` hooks when
+they are queued, the ``after`` or ``failed`` hooks once they are sent)
+and their timeouts are capped by the active deadline, but they are not
+retried.
+"""
+
+from arango import forksafe
+from arango.deadline import current
+from arango.steps import advance
+
+
+def _pending():
+    """Stand-in for sending a pipelined request, which ``flush`` does."""
+    raise RuntimeError("pipelined requests are sent by the pipeline")
+
+
+class PipelineFuture(object):
+    """The pending response to a pipelined request."""
+
+    def __init__(self, pipeline):
+        self._pipeline = pipeline
+        self._done = False
+        self._response = None
+        self._error = None
+
+    def _set(self, result):
+        if isinstance(result, Exception):
+            self._error = result
+        else:
+            self._response = result
+        self._done = True
+
+    def done(self):
+        """Return True if the response has arrived (or the request failed).
+
+        :rtype: bool
+        """
+        return self._done
+
+    def result(self):
+        """Return the response, sending the queued requests if need be.
+
+        :returns: the ArangoDB http response
+        :rtype: arango.response.Response
+        :raises: the exception raised while sending the request
+        """
+        if not self._done:
+            self._pipeline.flush()
+        if self._error is not None:
+            raise self._error
+        return self._response
+
+
+class Pipeline(object):
+    """Queue of pipelined requests (see ``arango.api.API.pipeline``).
+
+    :param api: the API wrapper encoding the requests
+    :type api: arango.api.API
+    :param client: the pipelining client sending the requests
+    :type client: arango.clients.pipeline.PipelineClient
+    """
+
+    def __init__(self, api, client):
+        self.api = api
+        self.client = client
+        self._queue = []
+        self._deadline = current()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        if exc_info[0] is None:
+            self.flush()
+
+    def __len__(self):
+        return len(self._queue)
+
+    def _queue_request(self, method, path, data=None, params=None,
+                       headers=None):
+        api = self.api
+        request, content_type = api._prepare(
+            method, path, data, params, headers
+        )
+        future = PipelineFuture(self)
+        steps = api._steps(request, _pending, retry=False)
+        step = advance(steps, next(steps), _pending)
+        if step[0] is None:
+            # Answered by an interceptor without sending the request
+            steps.close()
+            future._set(step[1][0])
+            return future
+        kwargs = api._attempt(request, content_type, None, None)
+        kwargs["method"] = method
+        self._queue.append((kwargs, future, steps))
+        return future
+
+    def flush(self):
+        """Send the queued requests and resolve their futures."""
+        if not self._queue:
+            return
+        queue, self._queue = self._queue, []
+        timeout = None
+        forksafe.check()
+        try:
+            if self._deadline is not None:
+                timeout = self._deadline.timeout(self.client.timeout)
+            results = self.client.send(
+                [request for request, _, _ in queue], timeout
+            )
+        except Exception as error:
+            results = [error] * len(queue)
+        for (_, future, steps), result in zip(queue, results):
+            # Resume the interceptor chain of the request with its result
+            try:
+                if isinstance(result, Exception):
+                    step = steps.throw(result)
+                else:
+                    step = steps.send(self.api._response(result))
+                step = advance(steps, step)
+            except Exception as error:
+                future._set(error)
+            else:
+                steps.close()
+                future._set(step[1][0])
+
+    def head(self, path, params=None, headers=None):
+        """Queue a HEAD request.
+
+        :param path: the API path (e.g. '/_api/version')
+        :type path: str
+        :param params: the request parameters
+        :type params: dict or None
+        :param headers: the request headers
+        :type headers: dict or None
+        :returns: the future of the ArangoDB http response
+        :rtype: arango.pipeline.PipelineFuture
+        """
+        return self._queue_request("head", path, None, params, headers)
+
+    def get(self, path, params=None, headers=None):
+        """Queue a GET request.
+
+        :param path: the API path (e.g. '/_api/version')
+        :type path: str
+        :param params: the request parameters
+        :type params: dict or None
+        :param headers: the request headers
+        :type headers: dict or None
+        :returns: the future of the ArangoDB http response
+        :rtype: arango.pipeline.PipelineFuture
+        """
+        return self._queue_request("get", path, None, params, headers)
+
+    def put(self, path, data=None, params=None, headers=None):
+        """Queue a PUT request.
+
+        :param path: the API path (e.g. '/_api/version')
+        :type path: str
+        :param data: the request payload
+        :type data: str or dict or None
+        :param params: the request parameters
+        :type params: dict or None
+        :param headers: the request headers
+        :type headers: dict or None
+        :returns: the future of the ArangoDB http response
+        :rtype: arango.pipeline.PipelineFuture
+        """
+        return self._queue_request("put", path, data, params, headers)
+
+    def post(self, path, data=None, params=None, headers=None):
+        """Queue a POST request.
+
+        :param path: the API path (e.g. '/_api/version')
+        :type path: str
+        :param data: the request payload
+        :type data: str or dict or None
+        :param params: the request parameters
+        :type params: dict or None
+        :param headers: the request headers
+        :type headers: dict or None
+        :returns: the future of the ArangoDB http response
+        :rtype: arango.pipeline.PipelineFuture
+        """
+        return self._queue_request("post", path, data, params, headers)
+
+    def patch(self, path, data=None, params=None, headers=None):
+        """Queue a PATCH request.
+
+        :param path: the API path (e.g. '/_api/version')
+        :type path: str
+        :param data: the request payload
+        :type data: str or dict or None
+        :param params: the request parameters
+        :type params: dict or None
+        :param headers: the request headers
+        :type headers: dict or None
+        :returns: the future of the ArangoDB http response
+        :rtype: arango.pipeline.PipelineFuture
+        """
+        return self._queue_request("patch", path, data, params, headers)
+
+    def delete(self, path, params=None, headers=None):
+        """Queue a DELETE request.
+
+        :param path: the API path (e.g. '/_api/version')
+        :type path: str
+        :param params: the request parameters
+        :type params: dict or None
+        :param headers: the request headers
+        :type headers: dict or None
+        :returns: the future of the ArangoDB http response
+        :rtype: arango.pipeline.PipelineFuture
+        """
+        return self._queue_request("delete", path, None, params, headers)
+
+    def options(self, path, data=None, params=None, headers=None):
+        """Queue an OPTIONS request.
+
+        :param path: the API path (e.g. '/_api/version')
+        :type path: str
+        :param data: the request payload
+        :type data: str or dict or None
+        :param params: the request parameters
+        :type params: dict or None
+        :param headers: the request headers
+        :type headers: dict or None
+        :returns: the future of the ArangoDB http response
+        :rtype: arango.pipeline.PipelineFuture
+        """
+        return self._queue_request("options", path, data, params, headers)
@@ -0,0 +1,159 @@
+"""Prepared AQL queries."""
+
+import warnings
+
+from arango.deadline import clock
+from arango.exceptions import InvalidArgumentError, PlanChangedWarning
+
+
+def plan_signature(plan):
+    """Return the parts of the execution plan which identify it.
+
+    These are the node types with the collections and indexes they use;
+    costs and estimates are left out.
+
+    :param plan: the execution plan (as returned by ``explain_query``)
+    :type plan: dict
+    :returns: the signature of the plan
+    :rtype: tuple
+    """
+    signature = []
+    for node in plan.get("nodes", []):
+        indexes = tuple(
+            (index.get("type"), tuple(index.get("fields", [])))
+            for index in node.get("indexes", [])
+        )
+        signature.append((node.get("type"), node.get("collection"), indexes))
+    return tuple(signature)
+
+
+class PreparedQuery(object):
+    """AQL query validated once and run with different bind variables.
+
+    The query is parsed on creation: syntax errors are raised right away
+    and the bind variables of every call are checked against the names
+    declared in the query before anything is sent. The query is explained
+    with the first bind variables known (the sample given, else those of
+    the first call) and the plan is kept. Explaining it again (``explain``,
+    ``Database.check_plans``, or automatically every ``recheck`` seconds)
+    compares the new plan with the kept one: a change, e.g. an index no
+    longer being used, is reported with a ``PlanChangedWarning`` and passed
+    to ``on_plan_change``.
+
+    The HTTP API of ArangoDB has no server-side prepared statements, so
+    every call still sends the query text with its bind variables.
+
+    :param database: the database to run the query in
+    :type database: arango.database.Database
+    :param name: the name of the prepared query
+    :type name: str
+    :param query: the AQL query
+    :type query: str
+    :param bind_vars: sample bind variables to explain the query with
+    :type bind_vars: dict or None
+    :param recheck: explain the query again when the plan is older than
+        this many seconds, before running it
+    :type recheck: int or float or None
+    :param on_plan_change: function called with the prepared query, the
+        old and the new plan when the plan changed
+    :type on_plan_change: callable or None
+    :param options: the options of ``Database.execute_query`` to run the
+        query with (e.g. ``count`` or ``batch_size``)
+    :raises: AQLQueryValidateError, AQLQueryExplainError
+    """
+
+    def __init__(self, database, name, query, bind_vars=None, recheck=None,
+                 on_plan_change=None, **options):
+        self.database = database
+        self.name = name
+        self.query = query
+        self.recheck = recheck
+        self.on_plan_change = on_plan_change
+        self.options = options
+        parsed = database._parse_query(query)
+        self.bind_var_names = frozenset(parsed.get("bindVars") or [])
+        self.collections = list(parsed.get("collections") or [])
+        self.plan = None
+        self.plan_bind_vars = None
+        self.explained_at = None
+        self.plan_changes = 0
+        if bind_vars is not None or not self.bind_var_names:
+            self.explain(bind_vars)
+
+    def __repr__(self):
+        return "<ArangoDB prepared query '{}'>".format(self.name)
+
+    def _check(self, bind_vars):
+        """Raise InvalidArgumentError unless the bind variables match."""
+        names = set(bind_vars)
+        missing = self.bind_var_names - names
+        if missing:
+            raise InvalidArgumentError(
+                "prepared query '{}': missing bind variables: {}".format(
+                    self.name, ", ".join(sorted(missing))
+                )
+            )
+        unknown = names - self.bind_var_names
+        if unknown:
+            raise InvalidArgumentError(
+                "prepared query '{}': unknown bind variables: {}".format(
+                    self.name, ", ".join(sorted(unknown))
+                )
+            )
+
+    def explain(self, bind_vars=None):
+        """Explain the query again and compare the plan with the kept one.
+
+        :param bind_vars: the bind variables to explain the query with
+            (default: those the kept plan was explained with)
+        :type bind_vars: dict or None
+        :returns: True if the plan changed, False otherwise
+        :rtype: bool
+        :raises: InvalidArgumentError, AQLQueryExplainError
+        """
+        if bind_vars is None:
+            bind_vars = self.plan_bind_vars
+        bind_vars = bind_vars or {}
+        self._check(bind_vars)
+        plan = self.database.explain_query(
+            self.query, bind_vars=bind_vars or None
+        )
+        old, self.plan = self.plan, plan
+        self.plan_bind_vars = bind_vars
+        self.explained_at = clock()
+        if old is None or plan_signature(old) == plan_signature(plan):
+            return False
+        self.plan_changes += 1
+        warnings.warn(
+            "the plan of the prepared query '{}' changed".format(self.name),
+            PlanChangedWarning,
+            stacklevel=2,
+        )
+        if self.on_plan_change is not None:
+            self.on_plan_change(self, old, plan)
+        return True
+
+    def __call__(self, *args, **kwargs):
+        """Run the query.
+
+        The bind variables are given as a dictionary, as keyword arguments,
+        or both (collection bind variables, e.g. ``@collection``, can only
+        be given in the dictionary).
+
+        :returns: the cursor from executing the query
+        :rtype: arango.cursor.Cursor
+        :raises: InvalidArgumentError, AQLQueryExecuteError,
+            AQLQueryExplainError
+        """
+        if len(args) > 1:
+            raise InvalidArgumentError("expected one dictionary of bind vars")
+        bind_vars = dict(args[0]) if args else {}
+        bind_vars.update(kwargs)
+        self._check(bind_vars)
+        if self.plan is None or (
+                self.recheck is not None and
+                clock() - self.explained_at >= self.recheck):
+            self.explain(bind_vars)
+        return self.database.execute_query(
+            self.query, bind_vars=bind_vars or None, **self.options
+        )
@@ -0,0 +1,256 @@
+"""Client-side profiler of slow AQL queries."""
+
+import json
+import threading
+import time
+from collections import deque
+
+from arango import forksafe
+from arango.deadline import clock
+
+
+def plan_indexes(plan):
+    """Return the indexes used by the execution plan.
+
+    :param plan: the execution plan (as returned by ``explain_query``)
+    :type plan: dict
+    :returns: the collection, type and fields of every index used
+    :rtype: list
+    """
+    indexes = []
+    for node in plan.get("nodes", []):
+        for index in node.get("indexes", []):
+            indexes.append({
+                "collection": node.get("collection"),
+                "type": index.get("type"),
+                "fields": index.get("fields", []),
+            })
+    return indexes
+
+
+def plan_full_scans(plan):
+    """Return the collections the execution plan reads in full.
+
+    :param plan: the execution plan (as returned by ``explain_query``)
+    :type plan: dict
+    :returns: the names of the collections
+    :rtype: list
+    """
+    return [
+        node.get("collection") for node in plan.get("nodes", [])
+        if node.get("type") == "enumerate_collection_node"
+    ]
+
+
+class QueryProfiler(object):
+    """Recorder of the AQL queries slower than a threshold.
+
+    Once given to the API wrapper (e.g. ``Arango(profiler=...)``), every
+    query run with ``Database.execute_query`` is timed from the request
+    creating its cursor until the cursor was consumed to the end, or was
+    closed (cursors garbage collected without being closed are not
+    timed). Queries which took at least ``threshold`` seconds are
+    explained with their bind variables and recorded with the plan, the
+    indexes used, the collections read in full, the documents scanned and
+    the times measured. The latest ``max_entries`` records are kept.
+
+    The wall time includes the time the results were being consumed; the
+    ``execution_time`` reported by the server does not. Queries answered
+    from the ``arango.cache.QueryCache`` are not timed.
+
+    :param threshold: the min wall time of the queries recorded (in
+        seconds)
+    :type threshold: int or float
+    :param max_entries: the max number of records kept
+    :type max_entries: int
+    :param explain: explain the queries recorded
+    :type explain: bool
+    """
+
+    def __init__(self, threshold=1.0, max_entries=100, explain=True):
+        self.threshold = threshold
+        self.explain = explain
+        self._entries = deque(maxlen=max_entries)
+        self._queries = 0
+        self._slow = 0
+        self._after_fork()
+        forksafe.register(self)
+
+    def _after_fork(self):
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def stats(self):
+        """Return the counters of the profiler.
+
+        :returns: the number of queries timed, of those at least as slow as
+            the threshold, and of the records kept
+        :rtype: dict
+        """
+        return {
+            "queries": self._queries,
+            "slow": self._slow,
+            "entries": len(self._entries),
+        }
+
+    @property
+    def entries(self):
+        """Return the records of the slow queries, the oldest first.
+
+        :returns: the records (dictionaries)
+        :rtype: list
+        """
+        with self._lock:
+            return list(self._entries)
+
+    def clear(self):
+        """Drop the records and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._queries = 0
+            self._slow = 0
+
+    def start(self, database, query, bind_vars):
+        """Start timing the query.
+
+        :param database: the database the query is run in
+        :type database: arango.database.Database
+        :param query: the AQL query
+        :type query: str
+        :param bind_vars: the bind variables of the query
+        :type bind_vars: dict or None
+        :returns: the function to call with the cursor of the query once
+            it is finished (see ``arango.cursor.Cursor``)
+        :rtype: callable
+        """
+        started = clock()
+
+        def finish(cursor):
+            self.record(database, query, bind_vars, clock() - started,
+                        cursor.stats)
+        return finish
+
+    def record(self, database, query, bind_vars, wall_time, stats=None):
+        """Record the query if it is at least as slow as the threshold.
+
+        The explanation of the query is sent from the calling thread.
+        Errors explaining it are recorded instead of the plan.
+
+        :param database: the database the query was run in
+        :type database: arango.database.Database
+        :param query: the AQL query
+        :type query: str
+        :param bind_vars: the bind variables of the query
+        :type bind_vars: dict or None
+        :param wall_time: the time the query took (in seconds)
+        :type wall_time: float
+        :param stats: the statistics of the query execution (see
+            ``arango.cursor.Cursor.stats``)
+        :type stats: dict or None
+        :returns: the record, or None if the query was not slow
+        :rtype: dict or None
+        """
+        slow = wall_time >= self.threshold
+        with self._lock:
+            self._queries += 1
+            if slow:
+                self._slow += 1
+        if not slow:
+            return None
+        stats = stats or {}
+        entry = {
+            "database": database.name,
+            "query": query,
+            "bind_vars": bind_vars,
+            "time": time.time(),
+            "wall_time": wall_time,
+            "execution_time": stats.get("execution_time"),
+            "scanned_full": stats.get("scanned_full"),
+            "scanned_index": stats.get("scanned_index"),
+            "plan": None,
+            "indexes": None,
+            "full_scans": None,
+            "error": None,
+        }
+        if self.explain:
+            try:
+                plan = database.explain_query(query, bind_vars=bind_vars)
+            except Exception as error:
+                entry["error"] = str(error)
+            else:
+                entry["plan"] = plan
+                entry["indexes"] = plan_indexes(plan)
+                entry["full_scans"] = plan_full_scans(plan)
+        with self._lock:
+            self._entries.append(entry)
+        return entry
+
+    def to_json(self, indent=None):
+        """Return the records of the slow queries as JSON.
+
+        :param indent: the indentation of the JSON document
+        :type indent: int or None
+        :returns: the JSON array of the records, the oldest first
+        :rtype: str
+        """
+        return json.dumps(self.entries, indent=indent, sort_keys=True,
+                          default=repr)
+
+    def summary(self, limit=10):
+        """Return a report of the slow queries, the slowest in total first.
+
+        The records are grouped by database and query string, with the
+        number of runs, the total and max wall time, the documents scanned
+        and the collections read in full without an index.
+
+        :param limit: the max number of queries in the report
+        :type limit: int
+        :returns: the report
+        :rtype: str
+        """
+        groups = {}
+        for entry in self.entries:
+            group = groups.setdefault((entry["database"], entry["query"]), {
+                "runs": 0, "total": 0.0, "max": 0.0, "scanned": 0,
+                "full_scans": set(), "indexes": set(),
+            })
+            group["runs"] += 1
+            group["total"] += entry["wall_time"]
+            group["max"] = max(group["max"], entry["wall_time"])
+            group["scanned"] += (entry["scanned_full"] or 0) + \
+                (entry["scanned_index"] or 0)
+            group["full_scans"].update(entry["full_scans"] or ())
+            group["indexes"].update(
+                "{}({})".format(index["type"], ", ".join(index["fields"]))
+                for index in entry["indexes"] or ()
+            )
+        stats = self.stats
+        lines = [
+            "{} queries timed, {} slower than {}s, {} recorded".format(
+                stats["queries"], stats["slow"], self.threshold,
+                stats["entries"]
+            )
+        ]
+        ranked = sorted(
+            groups.items(), key=lambda item: item[1]["total"], reverse=True
+        )
+        for (database, query), group in ranked[:limit]:
+            lines.append("")
+            lines.append("[{}] {}".format(database, " ".join(query.split())))
+            lines.append(
+                "  {} runs, total {:.3f}s, max {:.3f}s, {} documents "
+                "scanned".format(group["runs"], group["total"],
+                                 group["max"], group["scanned"])
+            )
+            if group["full_scans"]:
+                lines.append("  full collection scans: {}".format(
+                    ", ".join(sorted(group["full_scans"]))
+                ))
+            if group["indexes"]:
+                lines.append("  indexes used: {}".format(
+                    ", ".join(sorted(group["indexes"]))
+                ))
+        return "\n".join(lines)
@@ -0,0 +1,95 @@
+"""Thread-safe cache of the wrapper objects of named server resources."""
+
+import threading
+
+from arango import forksafe
+
+
+class Registry(object):
+    """Cache of wrapper objects (e.g. collections) refreshed from the server.
+
+    Lookups of cached objects take no lock. Refreshing lists the names of
+    the resources on the server and keeps the objects of those still there.
+    Refreshes are single-flight: threads asking for a refresh while one is
+    running wait for the next one, which only one of them sends, instead of
+    each listing the resources. A waiting thread always sees a listing
+    started after its own request, so changes it made are never missed.
+
+    :param load: function returning the names of the resources
+    :type load: callable
+    :param create: function returning the wrapper object of a name
+    :type create: callable
+    :param objects: the wrapper objects to start with, by name
+    :type objects: dict or None
+    """
+
+    def __init__(self, load, create, objects=None):
+        self._load = load
+        self._create = create
+        self._objects = dict(objects or {})
+        self._after_fork()
+        forksafe.register(self)
+
+    def _after_fork(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._started = 0
+        self._finished = 0
+        self._running = False
+
+    def __contains__(self, name):
+        return name in self._objects
+
+    def __iter__(self):
+        return iter(list(self._objects))
+
+    def __len__(self):
+        return len(self._objects)
+
+    def get(self, name):
+        """Return the wrapper object of the resource.
+
+        If the name is not cached, the cache is refreshed once.
+
+        :param name: the name of the resource
+        :type name: str
+        :returns: the wrapper object or None if there is no such resource
+        :rtype: object or None
+        """
+        obj = self._objects.get(name)
+        if obj is None:
+            self.refresh()
+            obj = self._objects.get(name)
+        return obj
+
+    def refresh(self):
+        """Update the cache from the resources on the server."""
+        with self._condition:
+            target = self._started + 1
+            while True:
+                if self._finished >= target:
+                    return
+                if not self._running and self._started < target:
+                    self._started += 1
+                    self._running = True
+                    break
+                self._condition.wait()
+        completed = False
+        try:
+            names = set(self._load())
+            objects = self._objects
+            # Swap the whole dictionary so that lookups need no lock
+            self._objects = dict(
+                (name, objects[name] if name in objects
+                 else self._create(name))
+                for name in names
+            )
+            completed = True
+        finally:
+            with self._condition:
+                self._running = False
+                if completed:
+                    self._finished = self._started
+                else:
+                    # Let a waiting thread try again
+                    self._started -= 1
+                self._condition.notify_all()
@@ -8,18 +8,36 @@ class Response(object):
 
     The clients in arango.clients must return an instance of this class.
 
+    The response content is kept as given and only parsed into ``obj`` when
+    ``obj`` is first accessed, so callers checking only the status code do
+    not pay for the JSON parsing. The content is decoded with ``codec``
+    according to its Content-Type if set (``arango.api.API`` sets it to its
+    own codec), otherwise it is parsed as JSON with the standard library.
+
     :param method: the HTTP method
     :type method: str
     :param url: the request URL
     :type url: str
     :param status_code: the HTTP status code
     :type status_code: int
-    :param content: the HTTP response content
-    :type content: basestring or str
+    :param content: the raw HTTP response content (UTF-8 if bytes)
+    :type content: bytes or basestring or str
     :param status_text: the HTTP status description if any
     :type status_text: str or None
     """
 
+    __slots__ = (
+        "method",
+        "url",
+        "status_code",
+        "headers",
+        "status_text",
+        "content",
+        "codec",
+        "_obj",
+        "_parsed",
+    )
+
     def __init__(self, method, url, status_code, content, headers,
                  status_text=None):
         self.method = method
@@ -27,7 +45,39 @@ class Response(object):
         self.status_code = status_code
         self.headers = headers
         self.status_text = status_text
-        try:
-            self.obj = loads(content) if content else None
-        except ValueError:
-            self.obj = None
+        self.content = content
+        self.codec = None
+        self._obj = None
+        self._parsed = False
+
+    @property
+    def obj(self):
+        """Return the JSON decoded content (parsed on first access).
+
+        :returns: the decoded content or None if it is empty or not JSON
+        :rtype: dict or list or str or int or float or bool or None
+        """
+        if not self._parsed:
+            content = self.content
+            try:
+                if not content:
+                    self._obj = None
+                elif self.codec is not None:
+                    self._obj = self.codec.decode(
+                        content,
+                        self.headers.get("Content-Type")
+                        if self.headers else None
+                    )
+                else:
+                    if isinstance(content, bytes):
+                        content = content.decode("utf-8")
+                    self._obj = loads(content)
+            except ValueError:
+                self._obj = None
+            self._parsed = True
+        return self._obj
+
+    @obj.setter
+    def obj(self, value):
+        self._obj = value
+        self._parsed = True
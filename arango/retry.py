@@ -0,0 +1,329 @@
+"""Retries with exponential backoff and per-endpoint circuit breakers."""
+
+import random
+import threading
+import time
+
+from arango import forksafe
+from arango.deadline import current
+from arango.exceptions import CircuitOpenError
+from arango.steps import drive
+
+# Methods which are always safe to send again
+IDEMPOTENT_METHODS = {"head", "get", "options"}
+
+# HTTP status codes of transient server conditions
+RETRY_STATUSES = {502, 503, 504}
+
+# ArangoDB error numbers of transient conditions (18: lock timeout)
+RETRY_ERROR_NUMS = {18}
+
+# HTTP status codes counted as endpoint failures by the circuit breakers
+FAILURE_STATUSES = {502, 503, 504}
+
+# Exceptions raised by the HTTP clients on connection failures (the
+# requests exceptions derive from IOError, the asyncio ones from OSError
+# and EOFError)
+CONNECTION_ERRORS = (IOError, OSError, EOFError)
+
+
+class CircuitBreaker(object):
+    """Thread-safe circuit breaker guarding a single endpoint.
+
+    The circuit opens after ``failure_threshold`` consecutive failures and
+    calls are then refused until ``reset_timeout`` seconds have passed.
+    After that a single trial call is let through (the circuit is half
+    open): the circuit closes again if it succeeds and re-opens otherwise.
+
+    :param endpoint: the endpoint URL (e.g. 'http://localhost:8529')
+    :type endpoint: str
+    :param failure_threshold: consecutive failures opening the circuit
+    :type failure_threshold: int
+    :param reset_timeout: seconds before a trial call is let through
+    :type reset_timeout: int or float
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, endpoint, failure_threshold=5, reset_timeout=30.0):
+        self.endpoint = endpoint
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = None
+        self._trial = None
+        forksafe.register(self)
+
+    def _after_fork(self):
+        """Replace the lock, which a thread of the parent may have held."""
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        """Return the state of the circuit.
+
+        :returns: 'closed', 'open' or 'half_open'
+        :rtype: str
+        """
+        with self._lock:
+            if (self._state == self.OPEN and
+                    time.time() - self._opened_at >= self.reset_timeout):
+                return self.HALF_OPEN
+            return self._state
+
+    def before_call(self):
+        """Check that a call may be made to the endpoint.
+
+        :raises: CircuitOpenError
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return
+            now = time.time()
+            remaining = self._opened_at + self.reset_timeout - now
+            # A trial call which never reported back is given up on after
+            # another reset timeout
+            if remaining <= 0 and (
+                    self._trial is None or
+                    now - self._trial >= self.reset_timeout):
+                self._state = self.HALF_OPEN
+                self._trial = now
+                return
+            raise CircuitOpenError(self.endpoint, max(remaining, 0))
+
+    def record_success(self):
+        """Record a successful call, closing the circuit."""
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial = None
+
+    def record_failure(self):
+        """Record a failed call, opening the circuit if need be."""
+        with self._lock:
+            self._failures += 1
+            if (self._state == self.HALF_OPEN or
+                    self._failures >= self.failure_threshold):
+                self._state = self.OPEN
+                self._opened_at = time.time()
+            self._trial = None
+
+
+class RetryPolicy(object):
+    """Retry settings shared by the API wrappers.
+
+    Requests failing with a connection error, one of the ``statuses`` or an
+    ArangoDB error number in ``error_nums`` are sent again up to
+    ``max_retries`` times. The delay before retry ``n`` (from 0) is drawn
+    uniformly between 0 and ``min(max_backoff, backoff * 2 ** n)`` (full
+    jitter), so that clients recovering from the same outage do not retry
+    in lockstep.
+
+    HEAD, GET and OPTIONS requests are always retried. Writes are only
+    retried if ``retry_writes`` is set (e.g. when every write is idempotent
+    because the document keys are given) and never if the body is a
+    stream, which cannot be sent twice.
+
+    Every endpoint gets a ``CircuitBreaker`` counting connection errors and
+    502, 503 and 504 responses. While a circuit is open, requests to the
+    endpoint fail immediately with ``CircuitOpenError`` instead of waiting
+    for timeouts. With the load balancing client, the breaker covers all
+    the coordinators, which that client already ejects individually.
+
+    :param max_retries: the maximum number of retries per request
+    :type max_retries: int
+    :param backoff: the base delay between retries (in seconds)
+    :type backoff: int or float
+    :param max_backoff: the maximum delay between retries (in seconds)
+    :type max_backoff: int or float
+    :param retry_writes: whether or not to retry PUT, POST, PATCH and
+        DELETE requests
+    :type retry_writes: bool
+    :param statuses: the HTTP status codes to retry
+    :type statuses: set
+    :param error_nums: the ArangoDB error numbers to retry
+    :type error_nums: set
+    :param failure_threshold: consecutive failures opening a circuit
+    :type failure_threshold: int
+    :param reset_timeout: seconds before an open circuit is tried again
+    :type reset_timeout: int or float
+    """
+
+    def __init__(self, max_retries=3, backoff=0.1, max_backoff=5.0,
+                 retry_writes=False, statuses=None, error_nums=None,
+                 failure_threshold=5, reset_timeout=30.0):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retry_writes = retry_writes
+        self.statuses = RETRY_STATUSES if statuses is None else statuses
+        self.error_nums = RETRY_ERROR_NUMS if error_nums is None \
+            else error_nums
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._breakers = {}
+        forksafe.register(self)
+
+    def _after_fork(self):
+        """Replace the lock, which a thread of the parent may have held."""
+        self._lock = threading.Lock()
+
+    def breaker(self, endpoint):
+        """Return the circuit breaker of the endpoint.
+
+        :param endpoint: the endpoint URL (e.g. 'http://localhost:8529')
+        :type endpoint: str
+        :returns: the circuit breaker
+        :rtype: arango.retry.CircuitBreaker
+        """
+        with self._lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    endpoint, self.failure_threshold, self.reset_timeout
+                )
+                self._breakers[endpoint] = breaker
+            return breaker
+
+    def can_retry(self, method, data=None):
+        """Return True if the request may be sent more than once.
+
+        :param method: the HTTP method (e.g. 'get')
+        :type method: str
+        :param data: the request payload
+        :type data: object
+        :returns: whether or not the request may be retried
+        :rtype: bool
+        """
+        if method in IDEMPOTENT_METHODS:
+            return True
+        if not self.retry_writes:
+            return False
+        # Streamed bodies are consumed by the first attempt
+        return not (hasattr(data, "__next__") or hasattr(data, "next"))
+
+    def is_transient(self, res):
+        """Return True if the response reports a transient failure.
+
+        :param res: the ArangoDB http response
+        :type res: arango.response.Response
+        :returns: whether or not the request should be retried
+        :rtype: bool
+        """
+        if res.status_code in self.statuses:
+            return True
+        if res.status_code < 400 or not self.error_nums:
+            return False
+        obj = res.obj
+        return isinstance(obj, dict) and obj.get("errorNum") in \
+            self.error_nums
+
+    def delay(self, attempt):
+        """Return the jittered delay before the given retry.
+
+        :param attempt: the number of the retry (from 0)
+        :type attempt: int
+        :returns: the delay in seconds
+        :rtype: float
+        """
+        return random.uniform(
+            0, min(self.max_backoff, self.backoff * 2 ** attempt)
+        )
+
+    def next_delay(self, breaker, method, data, attempt, res=None,
+                   error=None):
+        """Record the outcome of an attempt and decide whether to retry.
+
+        :param breaker: the circuit breaker of the endpoint
+        :type breaker: arango.retry.CircuitBreaker
+        :param method: the HTTP method (e.g. 'get')
+        :type method: str
+        :param data: the request payload
+        :type data: object
+        :param attempt: the number of retries made so far
+        :type attempt: int
+        :param res: the response, if one was received
+        :type res: arango.response.Response or None
+        :param error: the connection error, if one was raised
+        :type error: Exception or None
+        :returns: the delay before the next attempt or None to stop
+        :rtype: float or None
+        """
+        if error is not None or res.status_code in FAILURE_STATUSES:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        if attempt >= self.max_retries or \
+                not self.can_retry(method, data):
+            return None
+        if error is None and not self.is_transient(res):
+            return None
+        return self.delay(attempt)
+
+    def steps(self, endpoint, method, send, data=None, sleep=time.sleep):
+        """Make the request, retrying it as configured, step by step.
+
+        This is the retry loop shared by the API wrappers, as a step
+        generator (see ``arango.steps``) yielding the calls to ``send``
+        and ``sleep``.
+
+        :param endpoint: the endpoint URL (e.g. 'http://localhost:8529')
+        :type endpoint: str
+        :param method: the HTTP method (e.g. 'get')
+        :type method: str
+        :param send: function sending the request and returning the
+            response (called once per attempt)
+        :type send: callable
+        :param data: the request payload (before encoding)
+        :type data: object
+        :param sleep: function waiting the given number of seconds
+        :type sleep: callable
+        :returns: the step generator
+        :rtype: types.GeneratorType
+        """
+        active = current()
+        breaker = self.breaker(endpoint)
+        attempt = 0
+        while True:
+            breaker.before_call()
+            try:
+                res = yield send, ()
+            except CONNECTION_ERRORS as error:
+                delay = self.next_delay(
+                    breaker, method, data, attempt, error=error
+                )
+                if delay is None:
+                    raise
+            else:
+                delay = self.next_delay(breaker, method, data, attempt, res)
+                if delay is None:
+                    yield None, (res,)
+                    return
+            if active is not None:
+                # Fail now rather than wake up past the deadline
+                delay = active.backoff(delay)
+            yield sleep, (delay,)
+            attempt += 1
+
+    def call(self, endpoint, method, send, data=None):
+        """Make the request, retrying it as configured.
+
+        :param endpoint: the endpoint URL (e.g. 'http://localhost:8529')
+        :type endpoint: str
+        :param method: the HTTP method (e.g. 'get')
+        :type method: str
+        :param send: function sending the request and returning the
+            response (called once per attempt)
+        :type send: callable
+        :param data: the request payload (before encoding)
+        :type data: object
+        :returns: the last response received
+        :rtype: arango.response.Response
+        :raises: CircuitOpenError, DeadlineExceededError
+        """
+        return drive(self.steps(endpoint, method, send, data))
@@ -0,0 +1,49 @@
+"""Step generators sharing request logic between the sync and async APIs.
+
+The decisions taken around a request (which interceptor hooks to call,
+whether to retry and how long to wait) do not depend on how the request
+is sent, so they are written once as generators. A step generator yields
+the calls it needs made as ``(function, args)`` tuples and is sent back
+their results, or has their exceptions thrown in. It finishes by
+yielding ``(None, (result,))``.
+
+``drive`` makes the calls directly; ``arango.aio.api.drive_async`` also
+awaits the results which are awaitable.
+"""
+
+
+def advance(steps, step, stop=None):
+    """Make the calls yielded by the step generator, starting at ``step``.
+
+    :param steps: the step generator
+    :type steps: types.GeneratorType
+    :param step: the step yielded last by the generator
+    :type step: tuple
+    :param stop: the function whose call is left to the caller
+    :type stop: callable or None
+    :returns: the step calling ``stop``, or the final step
+    :rtype: tuple
+    """
+    while True:
+        function, args = step
+        if function is None or function is stop:
+            return step
+        try:
+            result = function(*args)
+        except Exception as error:
+            step = steps.throw(error)
+        else:
+            step = steps.send(result)
+
+
+def drive(steps):
+    """Run the step generator, calling the functions it yields.
+
+    :param steps: the step generator
+    :type steps: types.GeneratorType
+    :returns: the result of the step generator
+    :rtype: object
+    """
+    step = advance(steps, next(steps))
+    steps.close()
+    return step[1][0]
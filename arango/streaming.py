@@ -0,0 +1,263 @@
+"""Incremental parser for cursor response bodies."""
+
+import codecs
+import json
+import re
+
+# Leading whitespace
+WHITESPACE = re.compile(u"[ \t\r\n]*")
+
+# A string
+STRING = re.compile(u'"[^"\\\\]*(?:\\\\.[^"\\\\]*)*"')
+
+# The strings (possibly cut off at the end of the data) and brackets
+# within an object or array
+TOKEN = re.compile(
+    u'"[^"\\\\]*(?:\\\\.[^"\\\\]*)*(?:"|\\\\?\\Z)|[\\[\\]{}]'
+)
+
+
+def _nested(depth):
+    """Return the pattern of the objects and arrays nested up to depth."""
+    content = u'(?:[^"\\[\\]{{}}]|{})*'.format(STRING.pattern)
+    for _ in range(depth - 1):
+        content = u'(?:[^"\\[\\]{{}}]|{0}|\\[{1}\\]|\\{{{1}\\}})*'.format(
+            STRING.pattern, content
+        )
+    return u"\\[{0}\\]|\\{{{0}\\}}".format(content)
+
+
+# A complete object or array nested up to five levels deep, matched in one
+# go (deeper values are scanned token by token)
+NESTED = re.compile(_nested(5))
+
+# A number or a literal (true, false, null)
+SCALAR = re.compile(u"[^ \t\r\n,\\]}]*")
+
+
+class ResultParser(object):
+    """Incremental parser yielding the ``result`` items of a cursor body.
+
+    The body of a cursor response is a JSON object whose ``result`` member
+    is the array of documents in the batch. The chunks of the body are fed
+    to the parser as they arrive. Every item of the ``result`` array is
+    decoded and returned as soon as it is complete, and only the incomplete
+    tail of the body is kept in memory. The other members of the object
+    (``hasMore``, ``id``, ``count``, ``extra`` ...) are collected in
+    ``fields`` which is complete once ``close`` is called.
+
+    By default, the values are decoded with the ``raw_decode`` method of a
+    JSON decoder (C accelerated in the standard library), which also finds
+    where each value ends. If ``loads`` is given (e.g. the ``loads`` method
+    of the codec of the API wrapper), the end of each value is found by
+    scanning its strings and brackets, and the value is decoded by
+    ``loads``. A value which is still incomplete is tried again only once
+    the unparsed data has doubled in size, so documents larger than the
+    chunks are not rescanned over and over.
+
+    :param decoder: the JSON decoder (default: the standard library's)
+    :type decoder: json.JSONDecoder or None
+    :param loads: function decoding one JSON value, used instead of
+        ``decoder``
+    :type loads: callable or None
+    """
+
+    # Parser states
+    OBJECT_START = 0
+    KEY = 1
+    COLON = 2
+    VALUE = 3
+    ITEM = 4
+    AFTER_ITEM = 5
+    AFTER_VALUE = 6
+    DONE = 7
+
+    def __init__(self, decoder=None, loads=None):
+        self.fields = {}
+        self._raw_decode = (decoder or json.JSONDecoder()).raw_decode
+        self._loads = loads
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = u""
+        self._state = self.OBJECT_START
+        self._key = None
+        self._retry = 0
+
+    def _decode(self, pos):
+        """Decode the value at ``pos``.
+
+        Returns the value and its end, or None if more data is needed. A
+        value running up to the end of the data (e.g. a number) may not be
+        complete yet, so it is only decoded once more data follows it.
+        """
+        buf = self._buffer
+        if len(buf) - pos < self._retry:
+            return None
+        if self._loads is not None:
+            end = self._scan(pos)
+            value = None if end >= len(buf) else self._loads(buf[pos:end])
+        elif (buf[pos] not in u'"[{' and
+                SCALAR.match(buf, pos).end() >= len(buf)):
+            # raw_decode would take the start of a split number (e.g.
+            # "-2500." or "12e") for the whole of it
+            value, end = None, len(buf)
+        else:
+            try:
+                value, end = self._raw_decode(buf, pos)
+            except ValueError:
+                value, end = None, len(buf)
+        if end >= len(buf):
+            self._retry = 2 * (len(buf) - pos)
+            return None
+        self._retry = 0
+        return value, end
+
+    def _scan(self, pos):
+        """Return the end of the value at ``pos``.
+
+        Returns the end of the data if the value is incomplete.
+        """
+        buf = self._buffer
+        char = buf[pos]
+        if char == u'"':
+            match = STRING.match(buf, pos)
+            return len(buf) if match is None else match.end()
+        if char not in u"[{":
+            return SCALAR.match(buf, pos).end()
+        match = NESTED.match(buf, pos)
+        if match is not None:
+            return match.end()
+        depth = 0
+        for match in TOKEN.finditer(buf, pos):
+            token = match.group()
+            if token in u"[{":
+                depth += 1
+            elif token in u"]}":
+                depth -= 1
+                if depth == 0:
+                    return match.end()
+        return len(buf)
+
+    def _error(self, pos):
+        raise ValueError(
+            "unexpected data in cursor body: {!r}".format(
+                self._buffer[pos:pos + 20]
+            )
+        )
+
+    def feed(self, chunk, final=False):
+        """Feed the next chunk of the body to the parser.
+
+        :param chunk: the next chunk of the response body
+        :type chunk: bytes
+        :param final: whether or not this is the last chunk of the body
+        :type final: bool
+        :returns: the result items completed by this chunk
+        :rtype: list
+        :raises: ValueError
+        """
+        self._buffer += self._utf8.decode(chunk, final)
+        if final:
+            self._retry = 0
+        buf = self._buffer
+        items = []
+        pos = 0
+        while True:
+            pos = WHITESPACE.match(buf, pos).end()
+            if pos >= len(buf):
+                break
+            state = self._state
+            char = buf[pos]
+            if state == self.ITEM:
+                if char == u"]":
+                    self._state = self.AFTER_VALUE
+                    pos += 1
+                    continue
+                decoded = self._decode(pos)
+                if decoded is None:
+                    break
+                item, pos = decoded
+                items.append(item)
+                self._state = self.AFTER_ITEM
+            elif state == self.AFTER_ITEM:
+                if char == u",":
+                    self._state = self.ITEM
+                elif char == u"]":
+                    self._state = self.AFTER_VALUE
+                else:
+                    self._error(pos)
+                pos += 1
+            elif state == self.OBJECT_START:
+                if char != u"{":
+                    self._error(pos)
+                self._state = self.KEY
+                pos += 1
+            elif state == self.KEY:
+                if char == u"}":
+                    self._state = self.DONE
+                    pos += 1
+                    continue
+                if char != u'"':
+                    self._error(pos)
+                decoded = self._decode(pos)
+                if decoded is None:
+                    break
+                self._key, pos = decoded
+                self._state = self.COLON
+            elif state == self.COLON:
+                if char != u":":
+                    self._error(pos)
+                self._state = self.VALUE
+                pos += 1
+            elif state == self.VALUE:
+                if self._key == "result" and char == u"[":
+                    self._state = self.ITEM
+                    pos += 1
+                    continue
+                decoded = self._decode(pos)
+                if decoded is None:
+                    break
+                self.fields[self._key], pos = decoded
+                self._state = self.AFTER_VALUE
+            elif state == self.AFTER_VALUE:
+                if char == u",":
+                    self._state = self.KEY
+                elif char == u"}":
+                    self._state = self.DONE
+                else:
+                    self._error(pos)
+                pos += 1
+            else:
+                self._error(pos)
+        self._buffer = buf[pos:]
+        return items
+
+    def close(self):
+        """Check that the whole body was parsed.
+
+        The last chunk must have been fed with ``final`` set.
+
+        :returns: the members of the body other than ``result``
+        :rtype: dict
+        :raises: ValueError
+        """
+        if self._state != self.DONE:
+            raise ValueError("incomplete or invalid cursor body")
+        return self.fields
+
+    def parse(self, chunks):
+        """Yield the result items of the body made up of ``chunks``.
+
+        ``fields`` is complete once the generator is exhausted.
+
+        :param chunks: the chunks of the response body
+        :type chunks: collections.Iterable
+        :returns: the result items
+        :rtype: types.GeneratorType
+        :raises: ValueError
+        """
+        for chunk in chunks:
+            for item in self.feed(chunk):
+                yield item
+        for item in self.feed(b"", final=True):
+            yield item
+        self.close()
@@ -0,0 +1,342 @@
+"""Tests for the asynchronous ArangoDB API wrappers."""
+
+import sys
+import unittest
+
+if sys.version_info < (3, 6):
+    raise unittest.SkipTest("the asyncio API requires Python 3.6+")
+
+import asyncio
+
+from arango.aio import AsyncArango
+from arango.aio.api import AsyncAPI
+from arango.aio.cursor import AsyncCursor
+from arango.clients.aio import AsyncioClient
+from arango.interceptors import Interceptor
+from arango.response import Response
+from arango.retry import RetryPolicy
+from arango.exceptions import (
+    CollectionNotFoundError,
+    DocumentRevisionError,
+)
+from arango.tests.utils import get_next_db_name
+from arango import Arango
+
+
+class AsyncArangoTest(unittest.TestCase):
+    """Tests for the asynchronous ArangoDB API wrappers."""
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.arango = AsyncArango()
+        self.wait(self.arango.connect())
+        self.db_name = get_next_db_name(Arango())
+        self.db = self.wait(self.arango.create_database(self.db_name))
+        self.col_name = "test_collection_001"
+        self.col = self.wait(self.db.create_collection(self.col_name))
+
+        # Test database cleanup
+        self.addCleanup(self.loop.close)
+        self.addCleanup(self.wait, self.arango.close())
+        self.addCleanup(self.wait, self.arango.delete_database(
+            name=self.db_name, safe_delete=True
+        ))
+
+    def wait(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def test_collection(self):
+        col = self.wait(self.db.collection(self.col_name))
+        self.assertIs(col, self.col)
+        self.assertRaises(
+            CollectionNotFoundError,
+            self.wait,
+            self.db.collection("missing_collection")
+        )
+
+    def test_document_management(self):
+        self.wait(self.col.create_document({"_key": "doc01", "value": 1}))
+        self.assertTrue(self.wait(self.col.contains("doc01")))
+        self.assertEqual(self.wait(self.col.document("doc01"))["value"], 1)
+
+        rev = self.wait(
+            self.col.update_document("doc01", {"value": 2})
+        )["_rev"]
+        self.assertEqual(self.wait(self.col.document("doc01"))["value"], 2)
+        self.assertRaises(
+            DocumentRevisionError,
+            self.wait,
+            self.col.replace_document("doc01", {"value": 3}, rev="invalid")
+        )
+        self.wait(self.col.replace_document("doc01", {"value": 3}, rev=rev))
+        self.assertEqual(self.wait(self.col.count()), 1)
+
+        self.wait(self.col.delete_document("doc01"))
+        self.assertFalse(self.wait(self.col.contains("doc01")))
+        self.assertIsNone(self.wait(self.col.document("doc01")))
+
+    def test_concurrent_requests(self):
+        self.wait(asyncio.gather(*[
+            self.col.create_document({"_key": "doc{:02d}".format(num)})
+            for num in range(20)
+        ]))
+        self.assertEqual(self.wait(self.col.count()), 20)
+
+    def test_execute_query(self):
+        self.wait(self.col.import_documents([
+            {"_key": "doc01", "value": 1},
+            {"_key": "doc02", "value": 2},
+            {"_key": "doc03", "value": 3},
+        ]))
+        cursor = self.wait(self.db.execute_query(
+            "FOR d IN {} SORT d.value RETURN d".format(self.col_name),
+            batch_size=1,
+        ))
+        self.assertEqual(
+            [doc["_key"] for doc in self.wait(cursor.to_list())],
+            ["doc01", "doc02", "doc03"]
+        )
+
+    def test_cursor_batches(self):
+        self.wait(self.col.import_documents([
+            {"_key": "doc{:02d}".format(num)} for num in range(5)
+        ]))
+        cursor = self.wait(self.db.execute_query(
+            "FOR d IN {} RETURN d._key".format(self.col_name),
+            batch_size=2,
+        ))
+        batches = []
+        batch_iterator = cursor.batches()
+        while True:
+            try:
+                batches.append(self.wait(batch_iterator.__anext__()))
+            except StopAsyncIteration:
+                break
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 1])
+
+
+class AsyncioClientTest(unittest.TestCase):
+    """Tests for the asyncio based HTTP client."""
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+        self.requests = []
+        self.drop_second = False
+        self.server = self.wait(asyncio.start_server(
+            self.answer, "127.0.0.1", 0
+        ))
+        self.addCleanup(self.wait, self.server.wait_closed())
+        self.addCleanup(self.server.close)
+        self.url = "http://127.0.0.1:{}/_api/import".format(
+            self.server.sockets[0].getsockname()[1]
+        )
+
+    def wait(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    async def answer(self, reader, writer):
+        """Record the head and the body chunks of each request.
+
+        With ``drop_second``, the connection is closed after the second
+        request was read, without answering it.
+        """
+        served = 0
+        while True:
+            head = []
+            line = await reader.readline()
+            if not line:
+                break
+            while line not in {b"\r\n", b""}:
+                head.append(line)
+                line = await reader.readline()
+            chunks = []
+            if b"transfer-encoding: chunked\r\n" in [h.lower() for h in head]:
+                while True:
+                    size = int((await reader.readline()).strip(), 16)
+                    chunks.append(await reader.readexactly(size + 2))
+                    if size == 0:
+                        break
+            self.requests.append((head, chunks))
+            served += 1
+            if self.drop_second and served == 2:
+                break
+            writer.write(
+                b"HTTP/1.1 201 Created\r\nContent-Length: 2\r\n\r\n{}"
+            )
+            await writer.drain()
+        writer.close()
+
+    def test_streamed_body(self):
+        produced = []
+
+        def lines():
+            for num in range(3):
+                produced.append(num)
+                yield u"line {}\r\n".format(num)
+
+        client = AsyncioClient({})
+        self.addCleanup(self.wait, client.close())
+        res = self.wait(client.post(self.url, data=lines()))
+        self.assertEqual(res.status_code, 201)
+        self.assertEqual(produced, [0, 1, 2])
+        head, chunks = self.requests[0]
+        self.assertNotIn(b"content-length", b"".join(head).lower())
+        self.assertEqual(chunks, [
+            b"line 0\r\n\r\n", b"line 1\r\n\r\n", b"line 2\r\n\r\n", b"\r\n"
+        ])
+
+
+    def test_dropped_connection(self):
+        self.drop_second = True
+        client = AsyncioClient({})
+        self.addCleanup(self.wait, client.close())
+        self.wait(client.get(self.url))
+        # Reads are sent again on a fresh connection
+        self.assertEqual(self.wait(client.get(self.url)).status_code, 201)
+        self.assertEqual(len(self.requests), 3)
+        # Writes are not, as the server may have processed them
+        self.assertRaises(
+            (ConnectionError, asyncio.IncompleteReadError),
+            self.wait, client.post(self.url, data="{}")
+        )
+        self.assertEqual(len(self.requests), 4)
+
+
+class AsyncInterceptorTest(unittest.TestCase):
+    """Tests for the interceptors of the asynchronous API wrapper."""
+
+    def test_awaitable_hooks(self):
+        log = []
+
+        class Client(object):
+            def get(self, url, **kwargs):
+                log.append("get")
+                return asyncio.sleep(
+                    0, result=Response("get", url, 200, b"{}", {})
+                )
+
+        class Recorder(Interceptor):
+            # Hooks returning awaitables are awaited, others called as is
+            def before(self, request):
+                log.append(("before", request.path))
+                return asyncio.sleep(0)
+
+            def after(self, request, response):
+                log.append(("after", request.status_code))
+
+        api = AsyncAPI(client=Client(), interceptors=[Recorder()])
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        res = loop.run_until_complete(api.get("/_api/version"))
+        self.assertEqual(res.obj, {})
+        self.assertEqual(
+            log, [("before", "/_api/version"), "get", ("after", 200)]
+        )
+
+    def test_retry(self):
+        log = []
+        statuses = [503, 200]
+
+        class Client(object):
+            def get(self, url, **kwargs):
+                log.append("get")
+                return asyncio.sleep(0, result=Response(
+                    "get", url, statuses.pop(0), b"{}", {}
+                ))
+
+        class Recorder(Interceptor):
+            def after(self, request, response):
+                log.append(("after", request.status_code))
+
+        api = AsyncAPI(
+            client=Client(), interceptors=[Recorder()],
+            retry=RetryPolicy(backoff=0.01)
+        )
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        res = loop.run_until_complete(api.get("/_api/version"))
+        self.assertEqual(res.status_code, 200)
+        # The interceptors see the request once, around all the attempts
+        self.assertEqual(log, ["get", "get", ("after", 200)])
+
+
+class AsyncCursorTest(unittest.TestCase):
+    """Tests for prefetching the batches of asynchronous cursors."""
+
+    def setUp(self):
+        self.calls = []
+        self.bodies = [
+            b'{"result": [3, 4], "hasMore": true, "id": "7"}',
+            b'{"result": [5], "hasMore": true, "id": "7"}',
+            b'{"result": [6], "hasMore": false, "id": "7"}',
+        ]
+        self.delete_status = 202
+        calls, bodies = self.calls, self.bodies
+        test = self
+
+        class Client(object):
+            def put(self, url, **kwargs):
+                calls.append("put")
+                return asyncio.sleep(
+                    0.01, result=Response("put", url, 200, bodies.pop(0), {})
+                )
+
+            def delete(self, url, **kwargs):
+                calls.append("delete")
+                return asyncio.sleep(
+                    0, result=Response(
+                        "delete", url, test.delete_status, b"{}", {}
+                    )
+                )
+
+        self.api = AsyncAPI(client=Client(), codec="json")
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.addCleanup(self.loop.close)
+        self.addCleanup(asyncio.set_event_loop, None)
+
+    def wait(self, awaitable):
+        return self.loop.run_until_complete(awaitable)
+
+    def cursor(self, prefetch):
+        first = Response(
+            "post", "/_api/cursor", 201,
+            b'{"result": [1, 2], "hasMore": true, "id": "7", "count": 6}',
+            {}
+        )
+        first.codec = self.api.codec
+        return AsyncCursor(self.api, first, prefetch=prefetch)
+
+    def test_prefetch(self):
+        cursor = self.cursor(prefetch=1)
+        self.assertEqual(cursor.count(), 6)
+        # One batch is held ready while the next one is requested
+        self.wait(asyncio.sleep(0.05))
+        self.assertEqual(self.calls, ["put", "put"])
+        self.assertEqual(self.wait(cursor.to_list()), [1, 2, 3, 4, 5, 6])
+        self.assertEqual(self.calls, ["put"] * 3)
+
+    def test_prefetch_close(self):
+        cursor = self.cursor(prefetch=1)
+        self.wait(cursor.__aenter__())
+        self.wait(cursor.__anext__())
+        self.wait(asyncio.sleep(0.05))
+        self.wait(cursor.__aexit__(None, None, None))
+        self.assertEqual(self.calls, ["put", "put", "delete"])
+
+    def test_close(self):
+        # Any success status deletes the cursor, as in the sync cursor
+        self.delete_status = 200
+        cursor = self.cursor(prefetch=0)
+        self.wait(cursor.close())
+        self.assertEqual(self.calls, ["delete"])
+
+    def test_to_columns(self):
+        columns = self.wait(self.cursor(prefetch=0).to_columns(
+            ["value"], typecodes={"value": "q"}
+        ))
+        self.assertEqual(list(columns["value"]), [1, 2, 3, 4, 5, 6])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+"""Tests for the builder of parameterized AQL queries."""
+
+import unittest
+
+from arango import aql
+from arango.api import API
+from arango.codec import get_codec
+from arango.database import Database
+from arango.exceptions import InvalidArgumentError
+from arango.response import Response
+
+
+class EchoClient(object):
+    """HTTP client returning the bind variables of the queries posted."""
+
+    def __init__(self):
+        self.codec = get_codec("json")
+        self.posted = []
+
+    def post(self, url, data=None, **kwargs):
+        data = self.codec.loads(data)
+        self.posted.append(data)
+        obj = {"result": [data.get("bindVars")], "hasMore": False}
+        return Response("post", url, 201, self.codec.encode(obj), {})
+
+
+class QueryBuilderTest(unittest.TestCase):
+    """Tests for the builder of parameterized AQL queries."""
+
+    def test_build(self):
+        query = (
+            aql.for_("u", "users")
+            .filter("u.age", ">=", 18)
+            .filter("u.active")
+            .sort(("u.name", "desc"), "u._key")
+            .limit(10, offset=20)
+            .return_({"name": aql.Expr("u.name"), "kind": "user"})
+        )
+        self.assertEqual(query.build(), (
+            "FOR u IN @@collection0 FILTER u.age >= @value0 "
+            "FILTER u.active SORT u.name DESC, u._key "
+            "LIMIT @value1, @value2 RETURN {kind: @value3, name: u.name}",
+            {
+                "@collection0": "users",
+                "value0": 18,
+                "value1": 20,
+                "value2": 10,
+                "value3": "user",
+            },
+        ))
+
+    def test_same_structure(self):
+        def adults(collection, age, name):
+            return (
+                aql.for_("u", collection)
+                .filter("u.age", ">=", age)
+                .filter("u.name", "like", name)
+                .return_("u")
+            )
+        query, bind_vars = adults("users", 18, "a%").build()
+        other_query, other_bind_vars = adults("people", 21, "a%").build()
+        self.assertEqual(query, other_query)
+        self.assertNotEqual(bind_vars, other_bind_vars)
+        self.assertIn("u.name LIKE @value1", query)
+
+    def test_composition(self):
+        users = aql.for_("u", "users")
+        adults = users.filter("u.age", ">=", 18)
+        self.assertEqual(
+            users.return_("u").build()[0], "FOR u IN @@collection0 RETURN u"
+        )
+        self.assertEqual(
+            adults.let("n", aql.Expr("LENGTH(u.friends)"))
+            .return_("n", distinct=True).build()[0],
+            "FOR u IN @@collection0 FILTER u.age >= @value0 "
+            "LET n = LENGTH(u.friends) RETURN DISTINCT n"
+        )
+        self.assertEqual(
+            aql.for_("x", aql.Expr("1..3")).return_("x").build(),
+            ("FOR x IN 1..3 RETURN x", {})
+        )
+        self.assertEqual(
+            aql.Query().let("a", [1, 2]).return_("a").build(),
+            ("LET a = @value0 RETURN a", {"value0": [1, 2]})
+        )
+
+    def test_collect(self):
+        self.assertEqual(
+            aql.for_("u", "users")
+            .collect({"city": "u.city", "age": "u.age"}, count_into="n")
+            .return_("[city, age, n]").build()[0],
+            "FOR u IN @@collection0 COLLECT age = u.age, city = u.city "
+            "WITH COUNT INTO n RETURN [city, age, n]"
+        )
+        self.assertEqual(
+            aql.for_("u", "users").collect([("city", "u.city")], into="g")
+            .return_("g").build()[0],
+            "FOR u IN @@collection0 COLLECT city = u.city INTO g RETURN g"
+        )
+        self.assertRaises(
+            InvalidArgumentError, aql.Query().collect, into="a",
+            count_into="b"
+        )
+
+    def test_modifications(self):
+        self.assertEqual(
+            aql.Query().insert({"a": 1}, "users").build(),
+            ("INSERT @value0 INTO @@collection0",
+             {"value0": {"a": 1}, "@collection0": "users"})
+        )
+        self.assertEqual(
+            aql.for_("u", "users").filter("u.age", "<", 18)
+            .update("u", {"minor": True}, "users").build(),
+            ("FOR u IN @@collection0 FILTER u.age < @value0 "
+             "UPDATE u WITH @value1 IN @@collection1",
+             {"@collection0": "users", "value0": 18,
+              "value1": {"minor": True}, "@collection1": "users"})
+        )
+
+    def test_invalid(self):
+        query = aql.for_("u", "users")
+        self.assertRaises(InvalidArgumentError, aql.for_, "u u", "users")
+        self.assertRaises(InvalidArgumentError, query.filter, "u", "=", 1)
+        self.assertRaises(InvalidArgumentError, query.sort)
+        self.assertRaises(InvalidArgumentError, query.sort, ("u", "UP"))
+        self.assertRaises(
+            InvalidArgumentError, query.return_, {"a b": 1}
+        )
+        self.assertRaises(
+            InvalidArgumentError, query.filter("u.a", "==", 1).build,
+            {"value0": 2}
+        )
+
+    def test_bind_parameters(self):
+        query = (
+            "FOR i IN 1..@n /* @a */ FILTER d.@attr == @value "
+            "&& d.s == '@b' && d.t == \"it\\\"s @c\" // @d\n"
+            "FOR e IN @@col RETURN [d.`@e`, @value]"
+        )
+        self.assertEqual(
+            aql.bind_parameters(query), ["n", "attr", "value"]
+        )
+        self.assertEqual(
+            aql.substitute(query, {"n": "p.n", "attr": "p.a", "value": "1"}),
+            "FOR i IN 1..p.n /* @a */ FILTER d[p.a] == 1 "
+            "&& d.s == '@b' && d.t == \"it\\\"s @c\" // @d\n"
+            "FOR e IN @@col RETURN [d.`@e`, 1]"
+        )
+
+    def test_execute_query(self):
+        client = EchoClient()
+        db = Database("_system", API(client=client, codec="json"))
+        query = aql.for_("u", "users").filter("u.name", "==", "@x")
+        query = query.filter("u.age", ">=", aql.Expr("@min")).return_("u")
+        result = list(db.execute_query(query, bind_vars={"min": 18}))
+        bind_vars = {"@collection0": "users", "value0": "@x", "min": 18}
+        self.assertEqual(result, [bind_vars])
+        self.assertEqual(client.posted[0]["query"], query.build()[0])
+        self.assertEqual(
+            client.posted[0]["query"],
+            "FOR u IN @@collection0 FILTER u.name == @value0 "
+            "FILTER u.age >= @min RETURN u"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
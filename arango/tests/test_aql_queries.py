@@ -1,10 +1,13 @@
 """Tests for ArangoDB AQL queries."""
 
 import unittest
+import warnings
 
 from arango import Arango
 from arango.exceptions import (
+    AQLQueryExecuteError,
     AQLQueryValidateError,
+    PlanChangedWarning,
 )
 from arango.tests.utils import (
     get_next_col_name,
@@ -102,6 +105,72 @@ class ArangoDBQueryTest(unittest.TestCase):
             ["doc01"]
         )
 
+    def test_execute_query_incremental(self):
+        collection = self.db.collection(self.col_name)
+        collection.import_documents([
+            {"_key": "doc{:02d}".format(num), "value": num}
+            for num in range(10)
+        ])
+        res = self.db.execute_query(
+            "FOR d IN {} SORT d.value RETURN d.value".format(self.col_name),
+            batch_size=3,
+            incremental=True,
+        )
+        self.assertEqual(list(res), list(range(10)))
+
+    def test_execute_query_cursor(self):
+        collection = self.db.collection(self.col_name)
+        collection.import_documents([
+            {"_key": "doc{:02d}".format(num), "value": num}
+            for num in range(10)
+        ])
+        with self.db.execute_query(
+            "FOR d IN {} SORT d.value LIMIT 4 RETURN d.value".format(
+                self.col_name
+            ),
+            count=True,
+            full_count=True,
+            batch_size=3,
+        ) as cursor:
+            self.assertEqual(cursor.count(), 4)
+            self.assertEqual(cursor.full_count, 10)
+            self.assertIn("scanned_full", cursor.stats)
+            self.assertTrue(cursor.has_more())
+            self.assertEqual(cursor.batch(), [0, 1, 2])
+        self.assertFalse(cursor.has_more())
+
+    def test_prepare(self):
+        collection = self.db.collection(self.col_name)
+        collection.import_documents([{"a": 1}, {"a": 2}])
+        prepared = self.db.prepare(
+            "by_a",
+            "FOR d IN @@col FILTER d.a == @a RETURN d.a",
+            bind_vars={"@col": self.col_name, "a": 1}
+        )
+        self.assertEqual(prepared.bind_var_names, {"@col", "a"})
+        self.assertIsNotNone(prepared.plan)
+        self.assertEqual(list(prepared({"@col": self.col_name}, a=2)), [2])
+        self.assertEqual(self.db.check_plans(), [])
+        collection.create_hash_index(["a"])
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            self.assertEqual(self.db.check_plans(), ["by_a"])
+        self.assertIs(caught[0].category, PlanChangedWarning)
+
+    def test_execute_many(self):
+        collection = self.db.collection(self.col_name)
+        collection.import_documents([{"_key": "doc01", "a": 1}])
+        results = self.db.execute_many(
+            "INSERT {_key: @key, a: @a} INTO @@col RETURN NEW.a",
+            [{"key": "doc02", "a": 2}, {"key": "doc01", "a": 3},
+             {"key": "doc03", "a": 4}],
+            bind_vars={"@col": self.col_name}
+        )
+        self.assertEqual(results[0], [2])
+        self.assertIsInstance(results[1], AQLQueryExecuteError)
+        self.assertEqual(results[2], [4])
+        self.assertEqual(len(collection), 3)
+
 
 if __name__ == "__main__":
     unittest.main()
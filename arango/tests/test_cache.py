@@ -0,0 +1,193 @@
+"""Tests for the client-side cache of AQL query results."""
+
+import time
+import unittest
+
+from arango.api import API
+from arango.cache import QueryCache, is_modifying
+from arango.codec import get_codec
+from arango.database import Database
+from arango.exceptions import InvalidArgumentError
+from arango.profiler import QueryProfiler
+from arango.response import Response
+
+
+class QueryClient(object):
+    """HTTP client answering queries over a collection named 'col'."""
+
+    def __init__(self):
+        self.codec = get_codec("json")
+        self.documents = [{"value": 1}, {"value": 2}]
+        self.revision = "1"
+        self.calls = []
+
+    def _request(self, method, url, data=None, **kwargs):
+        path = url.split("/_db/_system", 1)[1]
+        self.calls.append((method, path))
+        if path == "/_api/query":
+            obj = {"collections": ["col"]}
+        elif path == "/_api/cursor":
+            obj = {
+                "result": list(self.documents),
+                "hasMore": False,
+                "count": len(self.documents),
+                "extra": {"stats": {"scannedFull": 2}},
+            }
+        elif path.endswith("/revision"):
+            obj = {"revision": self.revision}
+        else:
+            obj = {}
+        return Response(method, url, 201, self.codec.encode(obj), {})
+
+    def __getattr__(self, method):
+        return lambda **kwargs: self._request(method, **kwargs)
+
+
+class QueryCacheTest(unittest.TestCase):
+    """Tests for the client-side cache of AQL query results."""
+
+    QUERY = "FOR d IN col FILTER d.value >= @min RETURN d"
+
+    def database(self, profiler=None, **kwargs):
+        self.cache = QueryCache(**kwargs)
+        self.client = QueryClient()
+        api = API(client=self.client, codec="json",
+                  interceptors=[self.cache], profiler=profiler)
+        return Database("_system", api)
+
+    def query(self, db, minimum=0):
+        return list(db.execute_query(
+            self.QUERY, bind_vars={"min": minimum}, count=True, cache=True
+        ))
+
+    def queries(self):
+        return [call for call in self.client.calls
+                if call == ("post", "/_api/cursor")]
+
+    def test_hit(self):
+        db = self.database()
+        self.assertEqual(self.query(db), [{"value": 1}, {"value": 2}])
+        cursor = db.execute_query(
+            self.QUERY, bind_vars={"min": 0}, count=True, cache=True
+        )
+        self.assertEqual(cursor.count(), 2)
+        self.assertEqual(cursor.stats, {"scanned_full": 2})
+        documents = list(cursor)
+        # Every hit decodes documents of its own
+        documents[0]["value"] = 10
+        self.assertEqual(self.query(db), [{"value": 1}, {"value": 2}])
+        self.assertEqual(len(self.queries()), 1)
+        self.assertEqual(self.cache.stats["hits"], 2)
+        # Other bind variables are another entry
+        self.query(db, minimum=2)
+        self.assertEqual(len(self.queries()), 2)
+
+    def test_parsed_once(self):
+        db = self.database(check_revisions=True)
+        self.query(db, minimum=0)
+        self.query(db, minimum=1)
+        self.query(db, minimum=2)
+        self.assertEqual(len(self.queries()), 3)
+        self.assertEqual(
+            self.client.calls.count(("post", "/_api/query")), 1
+        )
+        # Collections bound as parameters are checked as well
+        list(db.execute_query("FOR d IN @@col RETURN d",
+                              bind_vars={"@col": "other"}, cache=True))
+        self.assertIn(("get", "/_api/collection/other/revision"),
+                      self.client.calls)
+
+    def test_options(self):
+        profiler = QueryProfiler(threshold=0.0, explain=False)
+        db = self.database(profiler=profiler)
+        self.query(db)
+        self.query(db)
+        # Only the query run on the server is timed
+        self.assertEqual(profiler.stats["queries"], 1)
+        for options in ({"incremental": True}, {"prefetch": 1},
+                        {"keep_alive": 10}):
+            self.assertRaises(
+                InvalidArgumentError, db.execute_query, self.QUERY,
+                cache=True, **options
+            )
+
+    def test_not_cached(self):
+        db = self.database()
+        list(db.execute_query(self.QUERY, bind_vars={"min": 0}))
+        list(db.execute_query("FOR d IN col REMOVE d IN col", cache=True))
+        list(db.execute_query("FOR d IN col REMOVE d IN col", cache=True))
+        self.assertEqual(len(self.queries()), 3)
+        self.assertEqual(len(self.cache), 0)
+        api = API(client=QueryClient(), codec="json")
+        self.assertRaises(
+            InvalidArgumentError, Database("_system", api).execute_query,
+            self.QUERY, cache=True
+        )
+
+    def test_write_invalidation(self):
+        db = self.database()
+        self.query(db)
+        db.api.get("/_api/document/col/1")
+        db.api.get("/_api/collection/col/revision")
+        db.api.put("/_api/cursor/1")
+        self.query(db)
+        self.assertEqual(len(self.queries()), 1)
+        db.api.post("/_api/document", data={}, params={"collection": "col"})
+        self.query(db)
+        db.api.patch("/_api/document/other/1", data={})
+        self.query(db)
+        db.api.delete("/_api/document/col/1")
+        self.query(db)
+        db.api.post("/_api/transaction", data={})
+        self.query(db)
+        db.api.post("/_api/cursor", data={"query": "REMOVE 'a' IN col"})
+        self.query(db)
+        self.assertEqual(len(self.queries()), 6)
+
+    def test_revisions(self):
+        db = self.database(check_revisions=True)
+        self.query(db)
+        self.query(db)
+        self.assertEqual(len(self.queries()), 1)
+        self.client.revision = "2"
+        self.query(db)
+        self.query(db)
+        self.assertEqual(len(self.queries()), 2)
+
+    def test_ttl(self):
+        db = self.database(ttl=0.05)
+        self.query(db)
+        self.query(db)
+        time.sleep(0.06)
+        self.query(db)
+        self.assertEqual(len(self.queries()), 2)
+
+    def test_limits(self):
+        cache = QueryCache(max_entries=2, max_bytes=10)
+        cache.put("a", 1, 4)
+        cache.put("b", 2, 4)
+        cache.get("a")
+        cache.put("c", 3, 4)
+        # The least recently used entry is dropped first
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"))
+        cache.put("d", 4, 4)
+        self.assertEqual(cache.stats["bytes"], 8)
+        cache.put("e", 5, 11)
+        self.assertIsNone(cache.get("e"))
+
+    def test_stale_put(self):
+        cache = QueryCache()
+        generation = cache.generation
+        cache.invalidate(collection="col")
+        cache.put("a", 1, 1, ["col"], generation=generation)
+        self.assertIsNone(cache.get("a"))
+
+    def test_is_modifying(self):
+        self.assertTrue(is_modifying("FOR d IN c UPDATE d WITH {} IN c"))
+        self.assertTrue(is_modifying("insert {} into c"))
+        self.assertFalse(is_modifying("FOR d IN c RETURN d.update"))
+
+
+if __name__ == "__main__":
+    unittest.main()
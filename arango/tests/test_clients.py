@@ -0,0 +1,213 @@
+"""Tests for the ArangoDB HTTP clients."""
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from arango import Arango
+from arango.api import API, endpoint_url
+from arango.clients import LoadBalancingClient, UnixSocketClient
+from arango.clients.base import BaseClient
+from arango.deadline import deadline
+from arango.response import Response
+
+try:
+    from BaseHTTPServer import BaseHTTPRequestHandler
+    from SocketServer import ThreadingMixIn, UnixStreamServer
+except ImportError:
+    from http.server import BaseHTTPRequestHandler
+    from socketserver import ThreadingMixIn, UnixStreamServer
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    """Answer every request with its method and path."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = '{{"method": "GET", "path": "{}"}}'.format(self.path)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body.encode("utf-8"))
+
+    def log_message(self, *args):
+        pass
+
+
+class ThreadingUnixServer(ThreadingMixIn, UnixStreamServer):
+    daemon_threads = True
+
+
+class RecordingClient(BaseClient):
+    """Client implementing the base client methods, recording timeouts."""
+
+    def __init__(self):
+        self.timeouts = []
+
+    def _respond(self, method, url, timeout):
+        self.timeouts.append(timeout)
+        return Response(method, url, 200, b"{}", {})
+
+    def head(self, url, params=None, headers=None, auth=None,
+             timeout=None):
+        return self._respond("head", url, timeout)
+
+    def get(self, url, params=None, headers=None, auth=None,
+            timeout=None):
+        return self._respond("get", url, timeout)
+
+    def post(self, url, data=None, params=None, headers=None, auth=None,
+             timeout=None):
+        return self._respond("post", url, timeout)
+
+    def put(self, url, data=None, params=None, headers=None, auth=None,
+            timeout=None):
+        return self._respond("put", url, timeout)
+
+    def patch(self, url, data=None, params=None, headers=None, auth=None,
+              timeout=None):
+        return self._respond("patch", url, timeout)
+
+    def delete(self, url, params=None, headers=None, auth=None,
+               timeout=None):
+        return self._respond("delete", url, timeout)
+
+    def options(self, url, data=None, params=None, headers=None,
+                auth=None, timeout=None):
+        return self._respond("options", url, timeout)
+
+
+class BaseClientTest(unittest.TestCase):
+    """Tests for the contract of the base client."""
+
+    def test_timeout(self):
+        client = RecordingClient()
+        api = API(client=client)
+        api.get("/_api/version")
+        api.post("/_api/cursor", {}, timeout=3)
+        with deadline(60):
+            api.delete("/_api/cursor/1")
+        self.assertIsNone(client.timeouts[0])
+        self.assertEqual(client.timeouts[1], 3)
+        self.assertTrue(0 < client.timeouts[2] <= 60)
+
+
+class DefaultClientTest(unittest.TestCase):
+    """Tests for the connection pool of the default HTTP client."""
+
+    def test_pool_prewarm(self):
+        arango = Arango(pool_size=4, prewarm=4)
+        stats = arango.pool_stats
+        self.assertEqual(stats["new_connections"], 4)
+        self.assertEqual(stats["hits"], 1)
+
+    def test_pool_reuse(self):
+        arango = Arango(pool_size=2)
+        for _ in range(5):
+            arango.version
+        stats = arango.pool_stats
+        self.assertEqual(stats["new_connections"], 1)
+        self.assertEqual(stats["hits"], 5)
+        self.assertEqual(stats["waits"], 0)
+
+    def test_pool_idle_timeout(self):
+        arango = Arango(idle_timeout=0)
+        arango.version
+        stats = arango.pool_stats
+        self.assertEqual(stats["evictions"], 1)
+        self.assertEqual(stats["new_connections"], 2)
+
+
+class UnixSocketClientTest(unittest.TestCase):
+    """Tests for the Unix domain socket HTTP client."""
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = os.path.join(directory, "ArangoDB.sock")
+        server = ThreadingUnixServer(self.path, EchoHandler)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+    def test_endpoint_url(self):
+        self.assertEqual(endpoint_url("tcp://127.0.0.1:8529"),
+                         "http://127.0.0.1:8529")
+        self.assertEqual(endpoint_url("ssl://db:8530/"), "https://db:8530")
+        self.assertEqual(endpoint_url("unix:///tmp/arangodb.sock"),
+                         "http+unix://%2Ftmp%2Farangodb.sock")
+
+    def test_requests(self):
+        api = API(endpoint="unix://" + self.path)
+        self.assertIsInstance(api.client, UnixSocketClient)
+        for _ in range(3):
+            res = api.get("/_api/version", params={"details": "true"})
+            self.assertEqual(res.obj, {
+                "method": "GET",
+                "path": "/_db/_system/_api/version?details=true",
+            })
+        stats = api.client.pool_stats
+        self.assertEqual(stats["new_connections"], 1)
+        self.assertEqual(stats["hits"], 2)
+
+
+class LoadBalancingClientTest(unittest.TestCase):
+    """Tests for the load balancing HTTP client."""
+
+    live = "http://localhost:8529"
+    dead = "http://127.0.0.1:1"
+
+    def test_round_robin(self):
+        arango = Arango(endpoints=[self.live, "http://127.0.0.1:8529"])
+        for _ in range(4):
+            arango.version
+        status = arango.client.endpoint_status
+        self.assertTrue(all(endpoint["healthy"] for endpoint in status))
+        self.assertTrue(all(endpoint["outstanding"] == 0
+                            for endpoint in status))
+
+    def test_dead_endpoint_ejected(self):
+        client = LoadBalancingClient({
+            "auth": ("root", ""),
+            "endpoints": [self.dead, self.live],
+            "strategy": "least_outstanding",
+            "max_failures": 1,
+        })
+        arango = Arango(client=client)
+        for _ in range(4):
+            arango.version
+        status = dict((e["url"], e) for e in client.endpoint_status)
+        self.assertFalse(status[self.dead]["healthy"])
+        self.assertEqual(status[self.dead]["failures"], 1)
+        self.assertTrue(status[self.live]["healthy"])
+
+    def test_health_check(self):
+        client = LoadBalancingClient({
+            "auth": ("root", ""),
+            "endpoints": [self.dead, self.live],
+            "max_failures": 2,
+        })
+        client.check_health()
+        status = dict((e["url"], e) for e in client.endpoint_status)
+        self.assertTrue(status[self.dead]["healthy"])
+        client.check_health()
+        status = dict((e["url"], e) for e in client.endpoint_status)
+        self.assertFalse(status[self.dead]["healthy"])
+        self.assertTrue(status[self.live]["healthy"])
+
+    def test_invalid_strategy(self):
+        self.assertRaises(
+            ValueError,
+            LoadBalancingClient,
+            {"endpoints": [self.live], "strategy": "fastest"}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""Tests for the JSON codecs."""
+
+import unittest
+from datetime import date, datetime
+from decimal import Decimal
+
+from arango.codec import (
+    Codec,
+    OrjsonCodec,
+    StandardCodec,
+    UjsonCodec,
+    get_codec,
+    orjson,
+    ujson,
+)
+from arango.exceptions import InvalidArgumentError
+from arango.response import Response
+
+HOOKS = {
+    date: lambda value: value.isoformat(),
+    Decimal: str,
+}
+
+
+class CodecTest(unittest.TestCase):
+    """Tests for the JSON codecs."""
+
+    def codecs(self):
+        codecs = [StandardCodec(HOOKS)]
+        if orjson is not None:
+            codecs.append(OrjsonCodec(HOOKS))
+        if ujson is not None:
+            codecs.append(UjsonCodec(HOOKS))
+        return codecs
+
+    def test_round_trip(self):
+        document = {"_key": "doc01", "values": [1, 2.5, None, True, u"\xe9"]}
+        for codec in self.codecs():
+            self.assertEqual(codec.loads(codec.encode(document)), document)
+            self.assertEqual(codec.loads(codec.dumps(document)), document)
+
+    def test_type_hooks(self):
+        document = {
+            "created": datetime(2015, 6, 1, 12, 30),
+            "price": Decimal("9.99"),
+        }
+        for codec in self.codecs():
+            self.assertEqual(codec.loads(codec.encode(document)), {
+                "created": "2015-06-01T12:30:00",
+                "price": "9.99",
+            })
+
+    def test_missing_hook(self):
+        for codec in self.codecs():
+            self.assertRaises(TypeError, codec.encode, {"value": object()})
+
+    def test_hook_dispatch_cache(self):
+        codec = StandardCodec()
+        codec.register(date, lambda value: "date")
+        self.assertEqual(codec.dumps(datetime(2015, 6, 1)), '"date"')
+        codec.register(datetime, lambda value: "datetime")
+        self.assertEqual(codec.dumps(datetime(2015, 6, 1)), '"datetime"')
+        self.assertEqual(codec.dumps(date(2015, 6, 1)), '"date"')
+
+    def test_get_codec(self):
+        self.assertIsInstance(get_codec(), Codec)
+        self.assertIsInstance(get_codec("json"), StandardCodec)
+        codec = StandardCodec()
+        self.assertIs(get_codec(codec), codec)
+        self.assertRaises(InvalidArgumentError, get_codec, "yaml")
+
+    def test_response_codec(self):
+        res = Response("get", "/", 200, b'{"value": 1}', {})
+        res.codec = StandardCodec()
+        self.assertEqual(res.obj, {"value": 1})
+        res = Response("get", "/", 200, b"not json", {})
+        res.codec = StandardCodec()
+        self.assertIsNone(res.obj)
+
+
+if __name__ == "__main__":
+    unittest.main()
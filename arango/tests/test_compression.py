@@ -0,0 +1,106 @@
+"""Tests for the compression of request and response bodies."""
+
+import gzip
+import io
+import unittest
+import zlib
+
+from arango import Arango
+from arango.compression import Compression, decompress
+from arango.exceptions import InvalidArgumentError
+from arango.response import Response
+from arango.tests.utils import (
+    get_next_col_name,
+    get_next_db_name,
+)
+
+
+class CompressionTest(unittest.TestCase):
+    """Tests for the compression settings and counters."""
+
+    def test_compress_gzip(self):
+        compression = Compression(threshold=10)
+        body = b"0123456789" * 20000
+        self.assertTrue(compression.should_compress(body))
+        compressed = b"".join(compression.compress(body))
+        self.assertEqual(
+            gzip.GzipFile(fileobj=io.BytesIO(compressed)).read(), body
+        )
+        stats = compression.stats
+        self.assertEqual(stats["requests_compressed"], 1)
+        self.assertEqual(stats["request_bytes"], len(body))
+        self.assertEqual(stats["request_bytes_compressed"], len(compressed))
+
+    def test_compress_deflate_iterable(self):
+        compression = Compression(encoding="deflate")
+        pieces = [u"line {}\r\n".format(num) for num in range(1000)]
+        compressed = b"".join(compression.compress(iter(pieces)))
+        self.assertEqual(
+            zlib.decompress(compressed).decode("utf-8"), u"".join(pieces)
+        )
+        self.assertEqual(decompress(compressed, "deflate"),
+                         u"".join(pieces).encode("utf-8"))
+
+    def test_threshold(self):
+        compression = Compression(threshold=100)
+        self.assertFalse(compression.should_compress(None))
+        self.assertFalse(compression.should_compress(b"x" * 99))
+        self.assertTrue(compression.should_compress(u"x" * 100))
+        self.assertTrue(compression.should_compress(iter([b"x"])))
+        self.assertRaises(InvalidArgumentError, Compression, encoding="br")
+
+    def test_stream_disabled(self):
+        for compression in (Compression(threshold=None),
+                            Compression(threshold=float("inf")),
+                            Compression(stream=False)):
+            self.assertFalse(compression.should_compress(iter([b"x"])))
+        self.assertFalse(Compression(threshold=None).should_compress(
+            b"x" * 2000
+        ))
+        self.assertTrue(Compression(stream=False).should_compress(
+            b"x" * 2000
+        ))
+
+    def test_record_response(self):
+        compression = Compression()
+        body = b'{"value": "' + b"x" * 1000 + b'"}'
+        res = Response("get", "/", 200, body, {
+            "Content-Encoding": "gzip", "Content-Length": "40"
+        })
+        compression.record_response(res)
+        compression.record_response(Response("get", "/", 200, body, {}))
+        stats = compression.stats
+        self.assertEqual(stats["responses_compressed"], 1)
+        self.assertEqual(stats["response_bytes"], len(body))
+        self.assertEqual(stats["response_bytes_compressed"], 40)
+
+
+class CompressionServerTest(unittest.TestCase):
+    """Tests for sending compressed requests to the server."""
+
+    def setUp(self):
+        self.compression = Compression(threshold=0)
+        self.arango = Arango(compression=self.compression)
+        self.db_name = get_next_db_name(self.arango)
+        self.db = self.arango.create_database(self.db_name)
+        self.col_name = get_next_col_name(self.db)
+        self.col = self.db.create_collection(self.col_name)
+
+        # Test database cleanup
+        self.addCleanup(self.arango.delete_database,
+                        name=self.db_name, safe_delete=True)
+
+    def test_import_documents(self):
+        self.col.import_documents([
+            {"_key": "doc{:03d}".format(num), "value": num}
+            for num in range(100)
+        ])
+        self.assertEqual(len(self.col), 100)
+        self.assertEqual(self.col.document("doc042")["value"], 42)
+        stats = self.compression.stats
+        self.assertGreater(stats["request_bytes"],
+                           stats["request_bytes_compressed"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,407 @@
+"""Tests for the cursors over query results."""
+
+import gc
+import time
+import unittest
+from array import array
+
+from arango.api import API
+from arango.codec import get_codec
+from arango.cursor import (
+    KEEP_ALIVE_BATCHES,
+    Cursor,
+    KeysetCursor,
+    ParallelScan,
+    _Columns,
+    numpy,
+)
+from arango.exceptions import (
+    AQLQueryExecuteError,
+    CursorDeleteError,
+    CursorGetNextError,
+)
+from arango.response import Response
+
+
+class ScriptedClient(object):
+    """HTTP client answering with the next scripted body (or status)."""
+
+    def __init__(self, *bodies, **kwargs):
+        self.bodies = list(bodies)
+        self.status_code = kwargs.get("status_code", 202)
+        self.delay = kwargs.get("delay", 0)
+        self.calls = []
+        self.data = []
+
+    def _request(self, method, url, data=None, **kwargs):
+        time.sleep(self.delay)
+        self.calls.append((method, url))
+        self.data.append(data)
+        if isinstance(self.bodies[0] if self.bodies else None, int):
+            return Response(method, url, self.bodies.pop(0), b"{}", {})
+        if method == "delete":
+            return Response(method, url, self.status_code, b"{}", {})
+        return Response(method, url, 200, self.bodies.pop(0), {})
+
+    def __getattr__(self, method):
+        return lambda **kwargs: self._request(method, **kwargs)
+
+
+FIRST = (
+    b'{"result": [1, 2], "hasMore": true, "id": "7", "count": 5,'
+    b' "extra": {"stats": {"scannedFull": 20, "fullCount": 12}}}'
+)
+
+
+class CursorTest(unittest.TestCase):
+    """Tests for the cursors over query results."""
+
+    def cursor(self, *bodies, **kwargs):
+        cursor_type = kwargs.pop("cursor_type", "cursor")
+        prefetch = kwargs.pop("prefetch", 0)
+        keep_alive = kwargs.pop("keep_alive", None)
+        api = API(client=ScriptedClient(*bodies, **kwargs), codec="json")
+        first = Response("post", "/_api/cursor", 201, FIRST, {})
+        first.codec = api.codec
+        return Cursor(api, first, cursor_type=cursor_type,
+                      prefetch=prefetch, keep_alive=keep_alive)
+
+    def test_iterate(self):
+        cursor = self.cursor(
+            b'{"result": [3, 4], "hasMore": true, "id": "7"}',
+            b'{"result": [5], "hasMore": false, "id": "7"}',
+        )
+        self.assertEqual(list(cursor), [1, 2, 3, 4, 5])
+        self.assertEqual(cursor.api.client.calls, [
+            ("put", "http://localhost:8529/_db/_system/_api/cursor/7"),
+            ("put", "http://localhost:8529/_db/_system/_api/cursor/7"),
+        ])
+        cursor.close()
+        self.assertEqual(len(cursor.api.client.calls), 2)
+
+    def test_metadata(self):
+        cursor = self.cursor()
+        self.assertEqual(cursor.id, "7")
+        self.assertEqual(cursor.count(), 5)
+        self.assertEqual(cursor.full_count, 12)
+        self.assertEqual(
+            cursor.stats, {"scanned_full": 20, "full_count": 12}
+        )
+        self.assertTrue(cursor.has_more())
+
+    def test_batch(self):
+        cursor = self.cursor(
+            b'{"result": [3, 4], "hasMore": false, "id": "7"}',
+        )
+        self.assertEqual(next(cursor), 1)
+        self.assertEqual(cursor.batch(), [2])
+        self.assertEqual(cursor.batch(), [])
+        self.assertEqual(list(cursor), [3, 4])
+
+    def test_close(self):
+        cursor = self.cursor(cursor_type="export")
+        with cursor:
+            self.assertEqual(next(cursor), 1)
+        self.assertFalse(cursor.has_more())
+        self.assertEqual(list(cursor), [])
+        self.assertEqual(cursor.api.client.calls, [
+            ("delete", "http://localhost:8529/_db/_system/_api/export/7"),
+        ])
+
+    def test_close_error(self):
+        cursor = self.cursor(status_code=500)
+        self.assertRaises(CursorDeleteError, cursor.close)
+
+    def test_garbage_collection(self):
+        cursor = self.cursor()
+        client = cursor.api.client
+        del cursor
+        gc.collect()
+        self.assertEqual(client.calls, [
+            ("delete", "http://localhost:8529/_db/_system/_api/cursor/7"),
+        ])
+
+
+    def test_prefetch(self):
+        cursor = self.cursor(
+            b'{"result": [3, 4], "hasMore": true, "id": "7"}',
+            b'{"result": [5], "hasMore": false, "id": "7"}',
+            delay=0.05, prefetch=2,
+        )
+        # Both batches are fetched while the first one is consumed
+        time.sleep(0.2)
+        self.assertEqual(len(cursor.api.client.calls), 2)
+        self.assertEqual(list(cursor), [1, 2, 3, 4, 5])
+
+    def test_prefetch_overlap(self):
+        bodies = [
+            b'{"result": [0], "hasMore": true, "id": "7"}'
+        ] * 5 + [b'{"result": [0], "hasMore": false, "id": "7"}']
+        cursor = self.cursor(*bodies, delay=0.05, prefetch=1)
+        start = time.time()
+        for _ in cursor:
+            time.sleep(0.05)
+        # Fetching and processing overlap: 6 round trips take ~0.3s and
+        # processing 8 results ~0.4s, where their sum would be ~0.7s
+        self.assertLess(time.time() - start, 0.6)
+
+    def test_prefetch_close(self):
+        cursor = self.cursor(
+            b'{"result": [3, 4], "hasMore": true, "id": "7"}',
+            b'{"result": [5], "hasMore": true, "id": "7"}',
+            b'{"result": [6], "hasMore": true, "id": "7"}',
+            prefetch=1,
+        )
+        self.assertEqual(next(cursor), 1)
+        cursor.close()
+        calls = cursor.api.client.calls
+        self.assertEqual(
+            calls[-1], ("delete", "http://localhost:8529/_db/_system"
+                                  "/_api/cursor/7")
+        )
+        self.assertLess(len(calls), 4)
+        self.assertEqual(list(cursor), [])
+
+    def test_prefetch_error(self):
+        cursor = self.cursor(
+            b'{"result": [3], "hasMore": true, "id": "7"}', 404,
+            prefetch=2,
+        )
+        self.assertEqual(next(cursor), 1)
+        self.assertEqual(next(cursor), 2)
+        self.assertEqual(next(cursor), 3)
+        self.assertRaises(CursorGetNextError, next, cursor)
+        self.assertRaises(StopIteration, next, cursor)
+
+    def test_keep_alive(self):
+        cursor = self.cursor(
+            b'{"result": [3], "hasMore": true, "id": "7"}',
+            b'{"result": [4], "hasMore": true, "id": "7"}',
+            b'{"result": [5], "hasMore": false, "id": "7"}',
+            keep_alive=0.05,
+        )
+        self.assertEqual(next(cursor), 1)
+        # The idle cursor is accessed every 0.05s to renew its TTL
+        time.sleep(0.08)
+        self.assertEqual(len(cursor.api.client.calls), 1)
+        time.sleep(0.05)
+        self.assertEqual(len(cursor.api.client.calls), 2)
+        self.assertEqual(list(cursor), [2, 3, 4, 5])
+
+    def test_keep_alive_bounded(self):
+        bodies = [
+            '{{"result": [{}], "hasMore": true, "id": "7"}}'.format(
+                value
+            ).encode("utf-8") for value in range(3, 10)
+        ] + [b'{"result": [10], "hasMore": false, "id": "7"}']
+        cursor = self.cursor(*bodies, keep_alive=0.01)
+        # The renewals stop once KEEP_ALIVE_BATCHES batches are held
+        time.sleep(0.2)
+        self.assertEqual(
+            len(cursor.api.client.calls), KEEP_ALIVE_BATCHES
+        )
+        self.assertEqual(list(cursor), list(range(1, 11)))
+
+
+class ColumnsTest(unittest.TestCase):
+    """Tests for the batch-wise and columnar consumption of cursors."""
+
+    def cursor(self, first, *bodies):
+        api = API(client=ScriptedClient(*bodies), codec="json")
+        response = Response("post", "/_api/cursor", 201, first, {})
+        response.codec = api.codec
+        return Cursor(api, response)
+
+    def documents(self):
+        return self.cursor(
+            b'{"result": [{"x": 1, "name": "a"}, {"x": 2, "name": "b"}],'
+            b' "hasMore": true, "id": "7", "count": 3}',
+            b'{"result": [{"x": 3}], "hasMore": false, "id": "7"}',
+        )
+
+    def test_batches(self):
+        cursor = self.documents()
+        next(cursor)
+        self.assertEqual(
+            list(cursor.batches()), [[{"x": 2, "name": "b"}], [{"x": 3}]]
+        )
+
+    def test_to_columns(self):
+        columns = self.documents().to_columns(
+            ["x", "name"], typecodes={"x": "d"}
+        )
+        self.assertEqual(columns["x"], array("d", [1, 2, 3]))
+        self.assertEqual(columns["name"], ["a", "b", None])
+
+    def test_to_columns_rows(self):
+        # Arrays are read by position; the count is not known up front
+        cursor = self.cursor(
+            b'{"result": [[1, 2], [3, 4]], "hasMore": true, "id": "7"}',
+            b'{"result": [[5, 6]], "hasMore": false, "id": "7"}',
+        )
+        columns = cursor.to_columns(["a", "b"], typecodes={"a": "q"})
+        self.assertEqual(columns, {"a": array("q", [1, 3, 5]), "b": [2, 4, 6]})
+
+    def test_to_columns_consumed(self):
+        cursor = self.documents()
+        next(cursor)
+        # Allocated for the count, truncated to the remaining results
+        columns = cursor.to_columns(["x"], typecodes={"x": "d"})
+        self.assertEqual(columns["x"], array("d", [2, 3]))
+        self.assertEqual(cursor.to_columns(["x"]), {"x": []})
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_to_numpy(self):
+        columns = self.documents().to_numpy(
+            ["x", "name"], dtypes={"x": "float32"}
+        )
+        self.assertEqual(columns["x"].dtype, numpy.float32)
+        self.assertEqual(columns["x"].tolist(), [1, 2, 3])
+        self.assertEqual(columns["name"].tolist(), ["a", "b", None])
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_to_numpy_widened(self):
+        # The type inferred from the first batch is widened, not truncated
+        first = b'{"result": [1, 2], "hasMore": true, "id": "7", "count": 5}'
+        cursor = self.cursor(
+            first, b'{"result": [1.5, 3, 4], "hasMore": false, "id": "7"}'
+        )
+        column = cursor.to_numpy(["x"])["x"]
+        self.assertEqual(column.dtype, numpy.float64)
+        self.assertEqual(column.tolist(), [1, 2, 1.5, 3, 4])
+        cursor = self.cursor(
+            first,
+            b'{"result": [1.5], "hasMore": true, "id": "7"}',
+            b'{"result": [null, 3], "hasMore": false, "id": "7"}',
+        )
+        column = cursor.to_numpy(["x"])["x"]
+        self.assertEqual(column.dtype, object)
+        self.assertEqual(column.tolist(), [1, 2, 1.5, None, 3])
+        self.assertRaises(TypeError, _Columns, ["x"], 0)
+
+
+class KeysetCursorTest(unittest.TestCase):
+    """Tests for the resumable scans of collections."""
+
+    def setUp(self):
+        self.api = API(client=ScriptedClient(
+            b'{"result": [{"_key": "a"}, {"_key": "b"}], "hasMore": false}',
+            b'{"result": [{"_key": "c"}, {"_key": "d"}], "hasMore": false}',
+            b'{"result": [{"_key": "e"}], "hasMore": false}',
+        ), codec="json")
+
+    def keys(self):
+        return [
+            self.api.codec.loads(data)["bindVars"]["key"]
+            for data in self.api.client.data
+        ]
+
+    def test_scan(self):
+        cursor = KeysetCursor(self.api, "col", batch_size=2)
+        self.assertEqual(
+            [document["_key"] for document in cursor], list("abcde")
+        )
+        self.assertEqual(self.keys(), [None, "b", "d"])
+        self.assertEqual(
+            cursor.checkpoint(), {"collection": "col", "key": "e"}
+        )
+
+    def test_checkpoint(self):
+        cursor = KeysetCursor(self.api, "col", batch_size=2)
+        next(cursor)
+        checkpoint = cursor.checkpoint()
+        self.assertEqual(checkpoint, {"collection": "col", "key": "a"})
+        cursor.close()
+        # A scan resumed from the checkpoint continues after "a"
+        resumed = KeysetCursor(self.api, "col", 2, checkpoint)
+        self.assertEqual(next(resumed), {"_key": "c"})
+        self.assertEqual(self.keys(), [None, "a"])
+        self.assertEqual(resumed.batch(), [{"_key": "d"}])
+        self.assertEqual(resumed.checkpoint()["key"], "d")
+
+
+class CollectionClient(object):
+    """HTTP client answering the keyset queries from a list of keys."""
+
+    def __init__(self, keys, fail_after=None):
+        self.keys = sorted(keys)
+        self.fail_after = fail_after
+        self.queries = []
+        self.codec = get_codec("json")
+
+    def post(self, url, data=None, **kwargs):
+        bind_vars = self.codec.loads(data)["bindVars"]
+        self.queries.append(bind_vars)
+        key = bind_vars["key"] or ""
+        if self.fail_after is not None and key >= self.fail_after:
+            return Response("post", url, 500, b'{"error": true}', {})
+        keys = [
+            k for k in self.keys
+            if k > key and k >= bind_vars.get("start", "") and
+            k < bind_vars.get("end", "~") and
+            ord(k[-1]) % bind_vars.get("partitions", 1) ==
+            bind_vars.get("partition", 0)
+        ][:bind_vars["count"]]
+        body = self.codec.dumps({
+            "result": [{"_key": k} for k in keys], "hasMore": False
+        })
+        return Response("post", url, 201, body, {})
+
+
+class ParallelScanTest(unittest.TestCase):
+    """Tests for the partitioned scans of collections."""
+
+    KEYS = ["k{:02d}".format(num) for num in range(30)]
+
+    def scan(self, client=None, **kwargs):
+        api = API(client=client or CollectionClient(self.KEYS),
+                  codec="json")
+        return ParallelScan(api, "col", batch_size=4, **kwargs)
+
+    def test_hash_partitions(self):
+        scan = self.scan(partitions=3)
+        keys = [document["_key"] for document in scan]
+        self.assertEqual(sorted(keys), self.KEYS)
+        partitions = set(
+            (query["partition"], query["partitions"])
+            for query in scan.cursors[0].api.client.queries
+        )
+        self.assertEqual(partitions, {(0, 3), (1, 3), (2, 3)})
+
+    def test_key_ranges(self):
+        scan = self.scan(boundaries=["k10", "k20"])
+        self.assertEqual(len(scan.cursors), 3)
+        self.assertEqual(
+            [document["_key"] for document in scan.cursors[1]],
+            self.KEYS[10:20]
+        )
+        batches = list(scan.batches())
+        self.assertTrue(all(len(batch) <= 4 for batch in batches))
+        self.assertEqual(
+            sorted(doc["_key"] for batch in batches for doc in batch),
+            self.KEYS[:10] + self.KEYS[20:]
+        )
+
+    def test_checkpoint(self):
+        scan = self.scan(boundaries=["k15"])
+        first = next(iter(scan))["_key"]
+        checkpoint = scan.checkpoint()
+        scan.close()
+        self.assertEqual(checkpoint["boundaries"], ["k15"])
+        self.assertIn(first, checkpoint["keys"])
+        # Only the consumed document is skipped, not the ones fetched
+        resumed = self.scan(checkpoint=checkpoint)
+        keys = [document["_key"] for document in resumed]
+        self.assertEqual(sorted(keys + [first]), self.KEYS)
+
+    def test_error(self):
+        scan = self.scan(
+            client=CollectionClient(self.KEYS, fail_after="k05"),
+            boundaries=["k15"]
+        )
+        with scan:
+            self.assertRaises(AQLQueryExecuteError, list, scan)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+"""Tests for the request timeouts and the deadlines."""
+
+import time
+import unittest
+
+from arango.api import API
+from arango.cursor import arango_cursor
+from arango.database import Database
+from arango.deadline import Deadline, current, deadline
+from arango.exceptions import DeadlineExceededError
+from arango.response import Response
+
+
+class TimedClient(object):
+    """HTTP client recording the timeouts and answering after a delay."""
+
+    def __init__(self, delay=0, body=b"{}"):
+        self.delay = delay
+        self.body = body
+        self.calls = []
+        self.bodies = []
+
+    def _request(self, method, url, data=None, timeout=None, **kwargs):
+        self.calls.append((method, url, timeout))
+        if data is not None and not isinstance(data, bytes):
+            data = b"".join(data)
+        self.bodies.append(data)
+        if isinstance(timeout, tuple):
+            timeout = timeout[1]
+        if timeout is not None and self.delay > timeout:
+            time.sleep(timeout)
+            raise IOError("read timed out")
+        time.sleep(self.delay)
+        return Response(method, url, 200, self.body, {})
+
+    def __getattr__(self, method):
+        return lambda **kwargs: self._request(method, **kwargs)
+
+
+class DeadlineTest(unittest.TestCase):
+    """Tests for propagating deadlines to the requests."""
+
+    def test_timeout(self):
+        api = API(client=TimedClient())
+        api.get("/_api/version")
+        api.get("/_api/version", timeout=(1, 5))
+        self.assertEqual(api.client.calls[0][2], None)
+        self.assertEqual(api.client.calls[1][2], (1, 5))
+
+    def test_capped_timeout(self):
+        api = API(client=TimedClient())
+        with deadline(2):
+            api.get("/_api/version")
+            api.get("/_api/version", timeout=(1, 5))
+        self.assertTrue(1.9 < api.client.calls[0][2] <= 2)
+        connect, read = api.client.calls[1][2]
+        self.assertEqual(connect, 1)
+        self.assertTrue(1.9 < read <= 2)
+        self.assertIsNone(current())
+
+    def test_nested(self):
+        with deadline(1) as outer:
+            # An inner deadline never extends the outer one
+            with deadline(10) as inner:
+                self.assertIs(inner, outer)
+            with deadline(0.5) as inner:
+                self.assertIsNot(inner, outer)
+            self.assertIs(current(), outer)
+
+    def test_exceeded(self):
+        api = API(client=TimedClient(delay=0.2))
+        with deadline(0.05):
+            # The request timed out because of the deadline
+            self.assertRaises(
+                DeadlineExceededError, api.get, "/_api/version"
+            )
+            # Requests are no longer sent once the deadline has passed
+            self.assertRaises(
+                DeadlineExceededError, api.get, "/_api/version"
+            )
+        self.assertEqual(len(api.client.calls), 1)
+        # Timeouts which are not caused by the deadline are left as is
+        self.assertRaises(IOError, api.get, "/_api/version", timeout=0.01)
+
+    def test_streamed_body(self):
+        api = API(client=TimedClient())
+
+        def body():
+            yield b"[1]\n"
+            time.sleep(0.06)
+            yield b"[2]\n"
+
+        with deadline(0.05):
+            self.assertRaises(
+                DeadlineExceededError, api.post, "/_api/import", body()
+            )
+
+    def test_cursor(self):
+        api = API(client=TimedClient(
+            body=b'{"result": [2], "hasMore": false}'
+        ))
+        first = Response("post", "/_api/cursor", 201,
+                         b'{"result": [1], "hasMore": true, "id": "7"}', {})
+        first.codec = api.codec
+        with deadline(0.05):
+            cursor = arango_cursor(api, first)
+        self.assertEqual(next(cursor), 1)
+        # The next batch is requested within the deadline of the cursor
+        time.sleep(0.06)
+        self.assertRaises(DeadlineExceededError, next, cursor)
+        self.assertEqual(api.client.calls, [])
+
+    def test_query_max_runtime(self):
+        api = API(client=TimedClient(
+            body=b'{"result": [], "hasMore": false}'
+        ), codec="json")
+        db = Database("_system", api)
+        with deadline(3):
+            list(db.execute_query("RETURN 1"))
+        list(db.execute_query("RETURN 1", max_runtime=10))
+        list(db.execute_query("RETURN 1"))
+        options = [
+            api.codec.loads(body).get("options")
+            for body in api.client.bodies
+        ]
+        self.assertTrue(2.9 < options[0]["maxRuntime"] <= 3)
+        self.assertEqual(options[1:], [{"maxRuntime": 10}, None])
+
+    def test_remaining(self):
+        active = Deadline(0.05)
+        self.assertFalse(active.expired)
+        self.assertEqual(active.timeout(0.01), 0.01)
+        time.sleep(0.06)
+        self.assertTrue(active.expired)
+        self.assertEqual(active.remaining(), 0)
+        self.assertRaises(DeadlineExceededError, active.check)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -123,6 +123,16 @@ class DocumentManagementTest(unittest.TestCase):
         self.assertEqual(res["errors"], 0)
         self.assertEqual(res["created"], 2)
 
+    def test_import_documents_from_generator(self):
+        documents = (
+            {"_key": "test_doc_{:05d}".format(num), "value": num}
+            for num in range(20000)
+        )
+        res = self.col.import_documents(documents, complete=True)
+        self.assertEqual(res["created"], 20000)
+        self.assertEqual(len(self.col), 20000)
+        self.assertEqual(self.col.document("test_doc_12345")["value"], 12345)
+
     def test_export_documents(self):
         pass
 
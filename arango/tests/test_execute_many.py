@@ -0,0 +1,112 @@
+"""Tests for running an AQL query with many sets of bind variables."""
+
+import unittest
+
+from arango import aql
+from arango.api import API
+from arango.codec import get_codec
+from arango.database import Database
+from arango.exceptions import AQLQueryExecuteError, InvalidArgumentError
+from arango.response import Response
+
+
+class DoublingClient(object):
+    """HTTP client running queries which double the bind variable 'x'.
+
+    Negative values fail the query, like a unique constraint violation.
+    """
+
+    def __init__(self):
+        self.codec = get_codec("json")
+        self.queries = []
+
+    def post(self, url, data=None, **kwargs):
+        data = self.codec.loads(data)
+        self.queries.append(data)
+        bind_vars = data["bindVars"]
+        if "batch" in bind_vars:
+            values = [item["x"] for item in bind_vars["batch"]]
+            result = [[value * 2] for value in values]
+        else:
+            values = [bind_vars["x"]]
+            result = [values[0] * 2]
+        if any(value < 0 for value in values):
+            obj = {"error": True, "errorNum": 1210}
+            return Response("post", url, 409, self.codec.encode(obj), {})
+        obj = {"result": result, "hasMore": False}
+        return Response("post", url, 201, self.codec.encode(obj), {})
+
+
+class ExecuteManyTest(unittest.TestCase):
+    """Tests for running an AQL query with many sets of bind variables."""
+
+    QUERY = "FOR d IN @@col FILTER d.x == @x RETURN @x * 2"
+
+    def setUp(self):
+        self.client = DoublingClient()
+        self.db = Database("_system", API(client=self.client, codec="json"))
+
+    def test_chunks(self):
+        sets = [{"x": x, "@col": "col"} for x in range(5)]
+        results = self.db.execute_many(self.QUERY, sets, chunk_size=2)
+        self.assertEqual(results, [[0], [2], [4], [6], [8]])
+        self.assertEqual(len(self.client.queries), 3)
+        data = self.client.queries[0]
+        self.assertEqual(
+            data["query"],
+            "FOR params IN @batch RETURN (FOR d IN @@col "
+            "FILTER d.x == params.`x` RETURN params.`x` * 2)"
+        )
+        self.assertEqual(
+            data["bindVars"],
+            {"@col": "col", "batch": [{"x": 0}, {"x": 1}]}
+        )
+        self.assertEqual(self.db.execute_many(self.QUERY, []), [])
+        self.assertRaises(
+            InvalidArgumentError, self.db.execute_many, self.QUERY, sets,
+            chunk_size=0
+        )
+
+    def test_errors(self):
+        sets = [{"x": 1}, {"x": -1}, {"x": 3}, {"y": 1}, {"x": 4, "y": 1},
+                {"x": 5, "@col": "other"}]
+        results = self.db.execute_many(
+            self.QUERY, sets, chunk_size=3, bind_vars={"@col": "col"}
+        )
+        self.assertEqual(results[0], [2])
+        self.assertIsInstance(results[1], AQLQueryExecuteError)
+        self.assertEqual(results[2], [6])
+        for result in results[3:]:
+            self.assertIsInstance(result, InvalidArgumentError)
+        # The failed chunk is run again one set at a time
+        self.assertEqual(len(self.client.queries), 4)
+        self.assertEqual(
+            self.client.queries[1],
+            {"query": self.QUERY, "count": False,
+             "bindVars": {"@col": "col", "x": 1}}
+        )
+
+    def test_shared_bind_vars(self):
+        query = (
+            aql.for_("d", "col")
+            .filter("d.x", "==", aql.Expr("@x"))
+            .filter("d.batch", "==", aql.Expr("@params"))
+            .return_("d")
+        )
+        self.db.execute_many(
+            query, [{"x": 1}, {"x": 2}], bind_vars={"params": True}
+        )
+        data, = self.client.queries
+        self.assertEqual(
+            data["query"],
+            "FOR params_ IN @batch RETURN (FOR d IN @@collection0 "
+            "FILTER d.x == params_.`x` FILTER d.batch == @params RETURN d)"
+        )
+        self.assertEqual(data["bindVars"], {
+            "@collection0": "col", "params": True,
+            "batch": [{"x": 1}, {"x": 2}],
+        })
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+"""Tests for sharing the driver across threads and forked processes."""
+
+import os
+import threading
+import time
+import unittest
+
+from arango import forksafe
+from arango.api import API
+from arango.registry import Registry
+from arango.tests.test_pipeline import EchoHandler, ThreadingServer
+
+
+class RegistryTest(unittest.TestCase):
+    """Tests for the thread-safe cache of wrapper objects."""
+
+    def test_get(self):
+        names = ["a", "b"]
+        registry = Registry(lambda: names, lambda name: name.upper())
+        self.assertEqual(registry.get("a"), "A")
+        names.remove("a")
+        # Cached objects are returned without asking the server
+        self.assertEqual(registry.get("a"), "A")
+        self.assertIsNone(registry.get("c"))
+        self.assertNotIn("a", registry)
+        self.assertEqual(sorted(registry), ["b"])
+
+    def test_single_flight(self):
+        loads = []
+
+        def load():
+            loads.append(1)
+            time.sleep(0.05)
+            return ["a"]
+
+        registry = Registry(load, lambda name: object())
+        threads = [
+            threading.Thread(target=registry.refresh) for _ in range(10)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # One listing, plus at most one for the threads which asked while
+        # it was running
+        self.assertTrue(1 <= len(loads) <= 2)
+        self.assertEqual(list(registry), ["a"])
+
+    def test_failed_refresh(self):
+        outcomes = [IOError("refused"), ["a"]]
+
+        def load():
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        registry = Registry(load, lambda name: name)
+        self.assertRaises(IOError, registry.refresh)
+        self.assertEqual(registry.get("a"), "a")
+
+
+@unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+class ForkTest(unittest.TestCase):
+    """Tests for resetting the connections in forked processes."""
+
+    def setUp(self):
+        server = ThreadingServer(("127.0.0.1", 0), EchoHandler)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.api = API(host="127.0.0.1", port=server.server_address[1])
+
+    def test_fork(self):
+        api = self.api
+        api.get("/_api/version")
+        self.assertEqual(api.client.pool_stats["new_connections"], 1)
+        read, write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            # Child: the inherited connection is not reused
+            try:
+                forksafe.check()
+                api.get("/_api/version")
+                stats = api.client.pool_stats
+                ok = stats["new_connections"] == 1 and stats["hits"] == 0
+                os.write(write, b"1" if ok else b"0")
+            finally:
+                os._exit(0)
+        os.close(write)
+        result = os.read(read, 1)
+        os.close(read)
+        os.waitpid(pid, 0)
+        self.assertEqual(result, b"1")
+        # The parent keeps using its own connection
+        api.get("/_api/version")
+        self.assertEqual(api.client.pool_stats["hits"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+"""Tests for the request interceptors."""
+
+import unittest
+
+from arango.api import API
+from arango.interceptors import Interceptor
+from arango.response import Response
+
+
+class EchoClient(object):
+    """HTTP client answering every request with its body and headers."""
+
+    def __init__(self, error=None):
+        self.error = error
+        self.calls = []
+
+    def _request(self, method, url, data=None, params=None, headers=None,
+                 auth=None):
+        self.calls.append((method, url, data, params, headers))
+        if self.error is not None:
+            raise self.error
+        return Response(method, url, 200, b'{"echo": true}', {})
+
+    def __getattr__(self, method):
+        return lambda **kwargs: self._request(method, **kwargs)
+
+
+class Recorder(Interceptor):
+    """Interceptor recording its hook calls in a shared list."""
+
+    def __init__(self, name, log):
+        self.name = name
+        self.log = log
+
+    def before(self, request):
+        self.log.append((self.name, "before", request.method, request.path,
+                         request.body_size))
+        request.headers = dict(request.headers or {}, **{self.name: "1"})
+
+    def after(self, request, response):
+        self.log.append((self.name, "after", request.status_code))
+
+    def failed(self, request, error):
+        self.log.append((self.name, "failed", str(error)))
+
+
+class Cache(Interceptor):
+    """Interceptor answering GET requests from a dictionary."""
+
+    def __init__(self, responses):
+        self.responses = responses
+
+    def before(self, request):
+        if request.method == "get":
+            return self.responses.get(request.path)
+
+    def after(self, request, response):
+        if request.method == "get":
+            self.responses[request.path] = response
+
+
+class InterceptorTest(unittest.TestCase):
+    """Tests for the interceptor chain of the API wrappers."""
+
+    def test_chain(self):
+        log = []
+        api = API(client=EchoClient(), codec="json", interceptors=[
+            Recorder("first", log), Recorder("second", log),
+        ])
+        res = api.post("/_api/document", {"a": 1}, params={"x": 1})
+        self.assertEqual(res.obj, {"echo": True})
+        self.assertEqual(log, [
+            ("first", "before", "post", "/_api/document", 8),
+            ("second", "before", "post", "/_api/document", 8),
+            ("second", "after", 200),
+            ("first", "after", 200),
+        ])
+        method, url, data, params, headers = api.client.calls[0]
+        self.assertEqual(data, b'{"a": 1}')
+        self.assertEqual(params, {"x": 1})
+        self.assertEqual(headers, {"first": "1", "second": "1"})
+
+    def test_short_circuit(self):
+        log = []
+        api = API(client=EchoClient(), interceptors=[
+            Recorder("outer", log), Cache({}), Recorder("inner", log),
+        ])
+        api.get("/_api/version")
+        del log[:]
+        self.assertEqual(api.get("/_api/version").obj, {"echo": True})
+        self.assertEqual(len(api.client.calls), 1)
+        # The hooks after the cache are skipped on a hit
+        self.assertEqual(log, [
+            ("outer", "before", "get", "/_api/version", None),
+            ("outer", "after", 200),
+        ])
+
+    def test_failed(self):
+        log = []
+        api = API(client=EchoClient(IOError("refused")),
+                  interceptors=[Recorder("only", log)])
+        self.assertRaises(IOError, api.get, "/_api/version")
+        self.assertEqual(log[-1], ("only", "failed", "refused"))
+
+
+if __name__ == "__main__":
+    unittest.main()
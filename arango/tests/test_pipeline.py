@@ -0,0 +1,203 @@
+"""Tests for the pipelining client."""
+
+import threading
+import unittest
+
+from arango.api import API
+from arango.deadline import Deadline, activate
+from arango.exceptions import DeadlineExceededError
+from arango.interceptors import Interceptor
+from arango.response import Response
+
+try:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+except ImportError:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    """Answer every request with its method, path and body size.
+
+    Connections are closed by the server after ``max_requests`` responses,
+    or without answering request number ``drop_at``. The methods of the
+    requests received are appended to the ``received`` list if set.
+    """
+
+    protocol_version = "HTTP/1.1"
+    max_requests = None
+    drop_at = None
+    received = None
+
+    def setup(self):
+        BaseHTTPRequestHandler.setup(self)
+        self.served = 0
+
+    def read_body(self):
+        if self.headers.get("Transfer-Encoding") == "chunked":
+            body = b""
+            while True:
+                size = int(self.rfile.readline().strip(), 16)
+                body += self.rfile.read(size + 2)[:size]
+                if size == 0:
+                    return body
+        return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+    def answer(self):
+        size = len(self.read_body())
+        if self.received is not None:
+            self.received.append(self.command)
+        if self.served + 1 == self.drop_at:
+            self.close_connection = True
+            return
+        body = '{{"method": "{}", "path": "{}", "size": {}}}'.format(
+            self.command, self.path, size
+        ).encode("utf-8")
+        self.served += 1
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if self.served == self.max_requests:
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_DELETE = answer
+
+    def log_message(self, *args):
+        pass
+
+
+class ThreadingServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class PipelineTest(unittest.TestCase):
+    """Tests for pipelining requests through the API wrapper."""
+
+    def make_api(self, max_requests=None, drop_at=None, interceptors=None):
+        self.received = []
+        handler = type("Handler", (EchoHandler,), {
+            "max_requests": max_requests,
+            "drop_at": drop_at,
+            "received": self.received,
+        })
+        server = ThreadingServer(("127.0.0.1", 0), handler)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return API(host="127.0.0.1", port=server.server_address[1],
+                   codec="json", interceptors=interceptors)
+
+    def test_pipeline(self):
+        api = self.make_api()
+        with api.pipeline(connections=3, depth=4) as pipe:
+            futures = [
+                pipe.get("/_api/document/col/{}".format(key))
+                for key in range(50)
+            ]
+            futures.append(pipe.post("/_api/document/col", {"a": 1}))
+            self.assertFalse(futures[0].done())
+        self.assertTrue(all(future.done() for future in futures))
+        for key, future in enumerate(futures[:-1]):
+            self.assertEqual(future.result().obj, {
+                "method": "GET",
+                "path": "/_db/_system/_api/document/col/{}".format(key),
+                "size": 0,
+            })
+        self.assertEqual(futures[-1].result().obj["size"], 8)
+        # The sockets are kept for the next pipeline
+        idle = list(api.pipeline_client._idle.values())[0]
+        self.assertEqual(len(idle), 3)
+
+    def test_streamed_body(self):
+        api = self.make_api()
+        with api.pipeline(connections=1) as pipe:
+            first = pipe.get("/a")
+            streamed = pipe.post("/b", iter([b"x" * 10, u"y" * 5]))
+            last = pipe.get("/c")
+        self.assertEqual(streamed.result().obj["size"], 15)
+        self.assertEqual(first.result().obj["path"], "/_db/_system/a")
+        self.assertEqual(last.result().obj["path"], "/_db/_system/c")
+
+    def test_result_flushes(self):
+        api = self.make_api()
+        pipe = api.pipeline()
+        future = pipe.delete("/_api/document/col/a")
+        self.assertEqual(len(pipe), 1)
+        self.assertEqual(future.result().obj["method"], "DELETE")
+        self.assertEqual(len(pipe), 0)
+
+    def test_connection_closed(self):
+        # The requests not answered before the server closed the
+        # connection are sent again on a new one
+        api = self.make_api(max_requests=3)
+        with api.pipeline(connections=1, depth=5) as pipe:
+            futures = [pipe.get("/{}".format(key)) for key in range(12)]
+        self.assertEqual(
+            [future.result().obj["path"] for future in futures],
+            ["/_db/_system/{}".format(key) for key in range(12)]
+        )
+
+    def test_connection_dropped(self):
+        api = self.make_api(drop_at=2)
+        with api.pipeline(connections=1) as pipe:
+            pipe.get("/a")
+        # A write is not sent again, as the server may have processed it
+        with api.pipeline(connections=1) as pipe:
+            future = pipe.post("/b", {"a": 1})
+        self.assertRaises((IOError, EOFError), future.result)
+        self.assertEqual(self.received, ["GET", "POST"])
+        api = self.make_api(drop_at=2)
+        with api.pipeline(connections=1) as pipe:
+            pipe.get("/a")
+        with api.pipeline(connections=1) as pipe:
+            future = pipe.get("/c")
+        self.assertEqual(future.result().obj["path"], "/_db/_system/c")
+        self.assertEqual(self.received, ["GET", "GET", "GET"])
+
+    def test_interceptors(self):
+        log = []
+
+        class Recorder(Interceptor):
+            def before(self, request):
+                log.append(("before", request.method, request.path))
+                if request.path == "/cached":
+                    return Response("get", request.url, 200, b"{}", {})
+
+            def after(self, request, response):
+                log.append(("after", request.path, request.status_code))
+
+        api = self.make_api(interceptors=[Recorder()])
+        with api.pipeline() as pipe:
+            write = pipe.post("/_api/document/col", {"a": 1})
+            cached = pipe.get("/cached")
+            self.assertEqual(log, [
+                ("before", "post", "/_api/document/col"),
+                ("before", "get", "/cached"),
+                ("after", "/cached", 200),
+            ])
+        self.assertEqual(cached.result().obj, {})
+        self.assertEqual(write.result().obj["method"], "POST")
+        self.assertEqual(log[-1], ("after", "/_api/document/col", 200))
+        self.assertEqual(self.received, ["POST"])
+
+    def test_errors(self):
+        api = API(host="127.0.0.1", port=1)
+        with api.pipeline() as pipe:
+            future = pipe.get("/_api/version")
+        self.assertRaises(IOError, future.result)
+        api = self.make_api()
+        active = Deadline(0)
+        with activate(active):
+            pipe = api.pipeline()
+        future = pipe.get("/_api/version")
+        self.assertRaises(DeadlineExceededError, future.result)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+"""Tests for the prepared AQL queries."""
+
+import unittest
+import warnings
+
+from arango.api import API
+from arango.codec import get_codec
+from arango.database import Database
+from arango.exceptions import (
+    AQLQueryValidateError,
+    InvalidArgumentError,
+    PlanChangedWarning,
+    PreparedQueryNotFoundError,
+)
+from arango.response import Response
+
+
+def plan(index):
+    """Return an execution plan using the index (or a full scan)."""
+    if index is None:
+        node = {"type": "EnumerationCollectionNode", "collection": "col"}
+    else:
+        node = {
+            "type": "IndexNode",
+            "collection": "col",
+            "indexes": [{"id": "col/1", "type": index, "fields": ["a"]}],
+        }
+    return {"nodes": [{"type": "SingletonNode"}, node], "estimatedCost": 3}
+
+
+class PlanClient(object):
+    """HTTP client answering AQL requests over a collection named 'col'."""
+
+    def __init__(self):
+        self.codec = get_codec("json")
+        self.index = "hash"
+        self.calls = []
+
+    def _request(self, method, url, data=None, **kwargs):
+        path = url.split("/_db/_system", 1)[1]
+        data = self.codec.loads(data)
+        self.calls.append((path, data))
+        status = 200
+        if path == "/_api/query":
+            if data["query"].startswith("FOR"):
+                obj = {"bindVars": ["a", "@col"], "collections": ["col"]}
+            else:
+                status, obj = 400, {"errorNum": 1501}
+        elif path == "/_api/explain":
+            obj = {"plan": plan(self.index)}
+        else:
+            status = 201
+            obj = {"result": [data["bindVars"]["a"]], "hasMore": False}
+        return Response(method, url, status, self.codec.encode(obj), {})
+
+    def __getattr__(self, method):
+        return lambda **kwargs: self._request(method, **kwargs)
+
+
+class PreparedQueryTest(unittest.TestCase):
+    """Tests for the prepared AQL queries."""
+
+    QUERY = "FOR d IN @@col FILTER d.a == @a RETURN d"
+
+    def setUp(self):
+        self.client = PlanClient()
+        api = API(client=self.client, codec="json")
+        self.db = Database("_system", api)
+
+    def paths(self):
+        return [path for path, _ in self.client.calls]
+
+    def test_prepare(self):
+        prepared = self.db.prepare(
+            "by_a", self.QUERY, bind_vars={"a": 0, "@col": "col"},
+            batch_size=10
+        )
+        self.assertEqual(prepared.bind_var_names, {"a", "@col"})
+        self.assertEqual(prepared.collections, ["col"])
+        self.assertEqual(prepared.plan["nodes"][1]["type"], "index_node")
+        self.assertEqual(self.paths(), ["/_api/query", "/_api/explain"])
+        self.assertEqual(
+            self.client.calls[1][1]["bindVars"], {"a": 0, "@col": "col"}
+        )
+        self.assertIs(self.db.prepared_query("by_a"), prepared)
+        self.assertEqual(self.db.prepared_queries, ["by_a"])
+        self.assertRaises(
+            PreparedQueryNotFoundError, self.db.prepared_query, "other"
+        )
+        self.assertRaises(
+            AQLQueryValidateError, self.db.prepare, "bad", "RETURN ("
+        )
+
+        self.assertEqual(list(prepared({"@col": "col"}, a=1)), [1])
+        self.assertEqual(list(prepared({"@col": "col", "a": 2})), [2])
+        path, data = self.client.calls[-1]
+        self.assertEqual(path, "/_api/cursor")
+        self.assertEqual(data["batchSize"], 10)
+        self.assertEqual(len(self.client.calls), 5)
+        # Mismatching bind variables are refused before anything is sent
+        self.assertRaises(InvalidArgumentError, prepared, a=1)
+        self.assertRaises(
+            InvalidArgumentError, prepared, {"@col": "col"}, a=1, b=2
+        )
+        self.assertEqual(len(self.client.calls), 5)
+
+    def test_explain_on_first_call(self):
+        prepared = self.db.prepare("by_a", self.QUERY)
+        self.assertIsNone(prepared.plan)
+        self.assertEqual(self.db.check_plans(), [])
+        list(prepared({"@col": "col", "a": 1}))
+        self.assertEqual(
+            self.paths(), ["/_api/query", "/_api/explain", "/_api/cursor"]
+        )
+        list(prepared({"@col": "col", "a": 1}))
+        self.assertEqual(self.paths().count("/_api/explain"), 1)
+
+    def test_plan_change(self):
+        changes = []
+        prepared = self.db.prepare(
+            "by_a", self.QUERY, bind_vars={"a": 0, "@col": "col"},
+            on_plan_change=lambda *args: changes.append(args)
+        )
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            self.assertEqual(self.db.check_plans(), [])
+            self.client.index = None
+            self.assertEqual(self.db.check_plans(), ["by_a"])
+        self.assertEqual(self.client.calls[-1][1]["bindVars"]["a"], 0)
+        self.assertEqual(len(caught), 1)
+        self.assertIs(caught[0].category, PlanChangedWarning)
+        self.assertEqual(prepared.plan_changes, 1)
+        (query, old, new), = changes
+        self.assertIs(query, prepared)
+        self.assertEqual(old["nodes"][1]["type"], "index_node")
+        self.assertEqual(
+            new["nodes"][1]["type"], "enumeration_collection_node"
+        )
+        self.client.index = "hash"
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter("always")
+            self.assertTrue(prepared.explain())
+        # The same nodes and indexes make the same plan
+        self.assertFalse(prepared.explain({"a": 5, "@col": "col"}))
+
+    def test_recheck(self):
+        prepared = self.db.prepare(
+            "by_a", self.QUERY, bind_vars={"a": 0, "@col": "col"}, recheck=0
+        )
+        list(prepared({"@col": "col", "a": 1}))
+        self.assertEqual(
+            self.paths(),
+            ["/_api/query", "/_api/explain", "/_api/explain", "/_api/cursor"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
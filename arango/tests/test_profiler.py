@@ -0,0 +1,189 @@
+"""Tests for the profiler of slow AQL queries."""
+
+import gc
+import json
+import time
+import unittest
+
+from arango.api import API
+from arango.codec import get_codec
+from arango.database import Database
+from arango.profiler import QueryProfiler
+from arango.response import Response
+
+PLAN = {
+    "nodes": [
+        {"type": "SingletonNode"},
+        {
+            "type": "IndexNode",
+            "collection": "users",
+            "indexes": [{"type": "hash", "fields": ["name"]}],
+        },
+        {"type": "EnumerateCollectionNode", "collection": "orders"},
+    ]
+}
+
+
+class ProfiledClient(object):
+    """HTTP client answering queries with two batches."""
+
+    def __init__(self):
+        self.codec = get_codec("json")
+        self.explain_status = 200
+        self.calls = []
+
+    def _request(self, method, url, data=None, **kwargs):
+        path = url.split("/_db/_system", 1)[1]
+        data = None if data is None else self.codec.loads(data)
+        self.calls.append((method, path, data))
+        status = 200
+        if path == "/_api/explain":
+            status = self.explain_status
+            obj = {"plan": PLAN} if status == 200 else {"errorNum": 1}
+        elif method == "post":
+            status = 201
+            obj = {
+                "result": [1, 2],
+                "hasMore": True,
+                "id": "1",
+                "extra": {"stats": {
+                    "scannedFull": 100, "scannedIndex": 5,
+                    "executionTime": 0.5,
+                }},
+            }
+        elif method == "put":
+            obj = {"result": [3], "hasMore": False, "id": "1"}
+        else:
+            status, obj = 202, {}
+        return Response(method, url, status, self.codec.encode(obj), {})
+
+    def __getattr__(self, method):
+        return lambda **kwargs: self._request(method, **kwargs)
+
+
+class QueryProfilerTest(unittest.TestCase):
+    """Tests for the profiler of slow AQL queries."""
+
+    QUERY = "FOR u IN users FILTER u.name == @name RETURN u"
+
+    def database(self, profiler):
+        self.client = ProfiledClient()
+        api = API(client=self.client, codec="json", profiler=profiler)
+        return Database("_system", api)
+
+    def run_query(self, db, delay=0.0):
+        cursor = db.execute_query(self.QUERY, bind_vars={"name": "a"})
+        results = []
+        for item in cursor:
+            results.append(item)
+            time.sleep(delay)
+        return results
+
+    def explained(self):
+        return [call for call in self.client.calls
+                if call[1] == "/_api/explain"]
+
+    def test_record(self):
+        profiler = QueryProfiler(threshold=0.05)
+        db = self.database(profiler)
+        self.assertEqual(self.run_query(db), [1, 2, 3])
+        self.assertEqual(len(profiler), 0)
+        self.assertEqual(self.explained(), [])
+        # The time consuming the results is part of the wall time
+        self.assertEqual(self.run_query(db, delay=0.02), [1, 2, 3])
+        self.assertEqual(profiler.stats,
+                         {"queries": 2, "slow": 1, "entries": 1})
+        (_, _, data), = self.explained()
+        self.assertEqual(data["query"], self.QUERY)
+        self.assertEqual(data["bindVars"], {"name": "a"})
+        entry, = profiler.entries
+        self.assertEqual(entry["database"], "_system")
+        self.assertEqual(entry["bind_vars"], {"name": "a"})
+        self.assertGreaterEqual(entry["wall_time"], 0.05)
+        self.assertEqual(entry["execution_time"], 0.5)
+        self.assertEqual(entry["scanned_full"], 100)
+        self.assertEqual(entry["scanned_index"], 5)
+        self.assertEqual(entry["indexes"], [
+            {"collection": "users", "type": "hash", "fields": ["name"]}
+        ])
+        self.assertEqual(entry["full_scans"], ["orders"])
+        self.assertIsNone(entry["error"])
+        self.assertEqual(json.loads(profiler.to_json())[0]["query"],
+                         self.QUERY)
+
+    def test_close(self):
+        profiler = QueryProfiler(threshold=0.0)
+        db = self.database(profiler)
+        cursor = db.execute_query(self.QUERY, bind_vars={"name": "a"})
+        next(cursor)
+        self.assertEqual(len(profiler), 0)
+        cursor.close()
+        cursor.close()
+        self.assertEqual(len(profiler), 1)
+        batches = db.execute_query(self.QUERY, bind_vars={"name": "a"})
+        self.assertEqual(list(batches.batches()), [[1, 2], [3]])
+        self.assertEqual(len(profiler), 2)
+
+    def test_garbage_collected(self):
+        # The finalizer deletes the server cursor but records nothing
+        profiler = QueryProfiler(threshold=0.0)
+        db = self.database(profiler)
+        cursor = db.execute_query(self.QUERY, bind_vars={"name": "a"})
+        next(cursor)
+        next(cursor)
+        del cursor
+        gc.collect()
+        self.assertEqual(self.client.calls[-1][:2],
+                         ("delete", "/_api/cursor/1"))
+        self.assertEqual(self.explained(), [])
+        self.assertEqual(profiler.stats,
+                         {"queries": 0, "slow": 0, "entries": 0})
+
+    def test_explain_error(self):
+        profiler = QueryProfiler(threshold=0.0)
+        db = self.database(profiler)
+        self.client.explain_status = 400
+        self.run_query(db)
+        entry, = profiler.entries
+        self.assertIsNone(entry["plan"])
+        self.assertIn("HTTP Status Code: 400", entry["error"])
+        profiler = QueryProfiler(threshold=0.0, explain=False)
+        db = self.database(profiler)
+        self.run_query(db)
+        self.assertEqual(self.explained(), [])
+        self.assertIsNone(profiler.entries[0]["plan"])
+
+    def test_ring_buffer(self):
+        profiler = QueryProfiler(threshold=0.0, max_entries=2)
+        db = self.database(profiler)
+        for name in "abc":
+            list(db.execute_query(self.QUERY, bind_vars={"name": name}))
+        self.assertEqual(
+            [entry["bind_vars"]["name"] for entry in profiler.entries],
+            ["b", "c"]
+        )
+        self.assertEqual(profiler.stats["slow"], 3)
+        profiler.clear()
+        self.assertEqual(profiler.stats,
+                         {"queries": 0, "slow": 0, "entries": 0})
+
+    def test_summary(self):
+        profiler = QueryProfiler(threshold=0.0)
+        db = self.database(profiler)
+        self.run_query(db)
+        self.run_query(db)
+        list(db.execute_query("FOR o IN orders\n  RETURN o"))
+        summary = profiler.summary()
+        lines = summary.splitlines()
+        self.assertEqual(lines[0], "3 queries timed, 3 slower than 0.0s, "
+                                   "3 recorded")
+        self.assertIn("[_system] FOR o IN orders RETURN o", lines)
+        self.assertIn("[_system] " + self.QUERY, lines)
+        self.assertIn("2 runs", summary)
+        self.assertIn("full collection scans: orders", summary)
+        self.assertIn("indexes used: hash(name)", summary)
+        self.assertEqual(len(profiler.summary(limit=1).splitlines()), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+"""Tests for the retry policy and the circuit breakers."""
+
+import time
+import unittest
+
+from arango.api import API
+from arango.deadline import deadline
+from arango.exceptions import CircuitOpenError, DeadlineExceededError
+from arango.response import Response
+from arango.retry import CircuitBreaker, RetryPolicy
+
+
+class ScriptedClient(object):
+    """HTTP client answering with a list of responses or errors."""
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+
+    def _request(self, method, url, data=None, **kwargs):
+        self.calls.append((method, data))
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        status_code, body = outcome
+        return Response(method, url, status_code, body, {})
+
+    def __getattr__(self, method):
+        return lambda **kwargs: self._request(method, **kwargs)
+
+
+class RetryPolicyTest(unittest.TestCase):
+    """Tests for retrying requests through the API wrapper."""
+
+    def make_api(self, outcomes, **kwargs):
+        kwargs.setdefault("backoff", 0)
+        api = API(
+            client=ScriptedClient(outcomes), retry=RetryPolicy(**kwargs)
+        )
+        return api, api.client
+
+    def test_retry_get(self):
+        api, client = self.make_api([
+            IOError("connection reset"),
+            (503, b""),
+            (500, b'{"error": true, "errorNum": 18}'),
+            (200, b'{"version": "2.6"}'),
+        ])
+        self.assertEqual(api.get("/_api/version").obj, {"version": "2.6"})
+        self.assertEqual(len(client.calls), 4)
+
+    def test_max_retries(self):
+        api, client = self.make_api([(503, b"")] * 3, max_retries=2)
+        self.assertEqual(api.get("/_api/version").status_code, 503)
+        api, client = self.make_api([IOError("refused")] * 3, max_retries=2)
+        self.assertRaises(IOError, api.get, "/_api/version")
+        self.assertEqual(len(client.calls), 3)
+
+    def test_no_retry(self):
+        # Writes are not retried unless enabled
+        api, client = self.make_api([(503, b""), (201, b"{}")])
+        self.assertEqual(api.post("/_api/document", {}).status_code, 503)
+        # Permanent errors are not retried
+        api, client = self.make_api([(404, b'{"errorNum": 1202}')])
+        self.assertEqual(api.get("/_api/document/a/b").status_code, 404)
+
+    def test_retry_writes(self):
+        api, client = self.make_api(
+            [(503, b""), (201, b"{}")], retry_writes=True
+        )
+        self.assertEqual(api.post("/_api/document", {"a": 1}).status_code,
+                         201)
+        # The body is encoded again for every attempt
+        self.assertEqual(client.calls[0][1], client.calls[1][1])
+        # Streamed bodies cannot be sent twice
+        api, client = self.make_api(
+            [(503, b""), (201, b"{}")], retry_writes=True
+        )
+        self.assertEqual(
+            api.post("/_api/import", iter([b"{}"])).status_code, 503
+        )
+
+    def test_deadline(self):
+        # A backoff ending past the deadline fails without sleeping
+        api, client = self.make_api(
+            [(503, b""), (200, b"{}")], backoff=10, max_backoff=10
+        )
+        api.retry.delay = lambda attempt: 5.0
+        start = time.time()
+        with deadline(1):
+            self.assertRaises(DeadlineExceededError, api.get, "/_api/version")
+        self.assertLess(time.time() - start, 0.5)
+        self.assertEqual(len(client.calls), 1)
+
+    def test_backoff(self):
+        policy = RetryPolicy(backoff=0.5, max_backoff=2)
+        for attempt, limit in ((0, 0.5), (1, 1), (2, 2), (10, 2)):
+            for _ in range(20):
+                self.assertTrue(0 <= policy.delay(attempt) <= limit)
+
+    def test_circuit_breaker(self):
+        api, client = self.make_api(
+            [IOError("refused")] * 2 + [(200, b"{}")],
+            max_retries=0, failure_threshold=2, reset_timeout=0.05
+        )
+        self.assertRaises(IOError, api.get, "/_api/version")
+        self.assertRaises(IOError, api.get, "/_api/version")
+        # The circuit is open: the call fails without reaching the client
+        self.assertRaises(CircuitOpenError, api.get, "/_api/version")
+        self.assertEqual(len(client.calls), 2)
+        breaker = api.retry.breaker(api.endpoint)
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        time.sleep(0.06)
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertEqual(api.get("/_api/version").status_code, 200)
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    def test_half_open_trial(self):
+        breaker = CircuitBreaker("http://db:8529", 1, reset_timeout=0.05)
+        breaker.record_failure()
+        self.assertRaises(CircuitOpenError, breaker.before_call)
+        time.sleep(0.06)
+        breaker.before_call()
+        # Only one trial call is let through at a time
+        self.assertRaises(CircuitOpenError, breaker.before_call)
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -74,6 +74,30 @@ class SimpleQueriesTest(unittest.TestCase):
         self.assertIn({"name": "test_doc_02"}, docs)
         self.assertIn({"name": "test_doc_03"}, docs)
 
+    def test_scan(self):
+        self.col.import_documents([
+            {"_key": "doc{:02d}".format(num)} for num in range(5)
+        ])
+        cursor = self.col.scan(batch_size=2)
+        self.assertEqual(
+            [next(cursor)["_key"] for _ in range(3)],
+            ["doc00", "doc01", "doc02"]
+        )
+        resumed = self.col.scan(batch_size=2, checkpoint=cursor.checkpoint())
+        self.assertEqual(
+            [doc["_key"] for doc in resumed], ["doc03", "doc04"]
+        )
+
+    def test_parallel_scan(self):
+        keys = ["doc{:02d}".format(num) for num in range(20)]
+        self.col.import_documents([{"_key": key} for key in keys])
+        with self.col.parallel_scan(
+            batch_size=3, boundaries=["doc05", "doc12"]
+        ) as scan:
+            self.assertEqual(
+                sorted(doc["_key"] for doc in scan), keys
+            )
+
     def test_any(self):
         self.assertEqual(strip_system_keys(self.col.all()), [])
         self.col.import_documents([
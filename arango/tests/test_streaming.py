@@ -0,0 +1,141 @@
+"""Tests for the incremental cursor body parser."""
+
+import json
+import unittest
+
+from arango.api import API
+from arango.codec import Codec
+from arango.cursor import Cursor
+from arango.response import Response
+from arango.streaming import ResultParser
+
+
+class RecordingCodec(Codec):
+    """JSON codec recording the documents it decodes."""
+
+    name = "recording"
+
+    def __init__(self):
+        super(RecordingCodec, self).__init__()
+        self.decoded = []
+
+    def dumps(self, obj):
+        return json.dumps(obj)
+
+    def loads(self, data):
+        self.decoded.append(data)
+        return json.loads(data)
+
+
+class ResultParserTest(unittest.TestCase):
+    """Tests for the incremental cursor body parser."""
+
+    def parse(self, body, size, loads=None):
+        parser = ResultParser(loads=loads)
+        chunks = [body[i:i + size] for i in range(0, len(body), size)]
+        items = list(parser.parse(chunks))
+        return items, parser.fields
+
+    def test_parse(self):
+        result = [
+            {"_key": "a", "text": u"brace } bracket ] \"quote\" \\"},
+            [1, [2, {"x": []}]],
+            -1.5e3,
+            u"caf\xe9 ,",
+            True,
+            None,
+            {},
+        ]
+        fields = {
+            "count": 7, "hasMore": True, "id": "42",
+            "extra": {"stats": {"scannedFull": 7}}, "error": False,
+        }
+        obj = dict(fields, result=result)
+        # Multi-byte characters are split between chunks without escaping
+        for body in (json.dumps(obj).encode("utf-8"),
+                     json.dumps(obj, ensure_ascii=False).encode("utf-8")):
+            for size in (1, 2, 3, 7, len(body)):
+                self.assertEqual(self.parse(body, size), (result, fields))
+                # Items decoded by the codec are found by scanning them
+                self.assertEqual(self.parse(body, size, json.loads),
+                                 (result, fields))
+
+    def test_incremental(self):
+        parser = ResultParser()
+        self.assertEqual(
+            parser.feed(b'{"result": [{"a": 1}, {"b"'), [{"a": 1}]
+        )
+        self.assertEqual(parser.feed(b': 2}, 3'), [{"b": 2}])
+        self.assertEqual(parser.feed(b'], "hasMore": false'), [3])
+        self.assertEqual(parser.feed(b"}", final=True), [])
+        self.assertEqual(parser.close(), {"hasMore": False})
+
+    def test_split_number(self):
+        # Numbers split within their fraction or exponent wait for the rest
+        for loads in (None, json.loads):
+            parser = ResultParser(loads=loads)
+            self.assertEqual(parser.feed(b'{"result": [-2500.'), [])
+            self.assertEqual(parser.feed(b'5, 12e'), [-2500.5])
+            self.assertEqual(parser.feed(b'3, 7'), [12e3])
+            self.assertEqual(parser.feed(b']}', final=True), [7])
+            self.assertEqual(parser.close(), {})
+
+    def test_large_item(self):
+        # The retry of the incomplete item is deferred, but not past the end
+        text = u"x" * 999
+        parser = ResultParser()
+        self.assertEqual(parser.feed(b'{"result": ["' + b"x" * 999), [])
+        self.assertEqual(parser.feed(b'"]}', final=True), [text])
+        self.assertEqual(parser.close(), {})
+
+    def test_whitespace_and_trailing_scalar(self):
+        items, fields = self.parse(
+            b' { "result" : [ 1 , 2 ] , "code" : 201 }', 4
+        )
+        self.assertEqual(items, [1, 2])
+        self.assertEqual(fields, {"code": 201})
+        items, fields = self.parse(b'{"result": []}', 5)
+        self.assertEqual(items, [])
+        self.assertEqual(fields, {})
+
+    def test_loads(self):
+        decoded = []
+
+        def loads(data):
+            decoded.append(data)
+            return json.loads(data)
+
+        parser = ResultParser(loads=loads)
+        self.assertEqual(
+            parser.feed(b'{"result": [{"a": "]\\""}, ["}'), [{"a": "]\""}]
+        )
+        self.assertEqual(parser.feed(b'"], 3], "id": "1"}', final=True),
+                         [["}"], 3])
+        self.assertEqual(parser.close(), {"id": "1"})
+        self.assertIn(u'{"a": "]\\""}', decoded)
+
+    def test_invalid(self):
+        parser = ResultParser()
+        self.assertRaises(ValueError, parser.feed, b'[1, 2]')
+        parser = ResultParser()
+        parser.feed(b'{"result": [1, 2')
+        self.assertRaises(ValueError, parser.close)
+
+
+class IncrementalCursorTest(unittest.TestCase):
+    """Tests for decoding streamed batches with the codec of the API."""
+
+    def test_codec(self):
+        codec = RecordingCodec()
+        api = API(codec=codec)
+        response = Response("post", "/_api/cursor", 201, None, {
+            "Content-Type": "application/json; charset=utf-8"
+        })
+        chunks = iter([b'{"result": [{"a": 1}, ', b'2], "hasMore": false}'])
+        cursor = Cursor(api, response, chunks)
+        self.assertEqual(list(cursor), [{"a": 1}, 2])
+        self.assertIn(u'{"a": 1}', codec.decoded)
+
+
+if __name__ == "__main__":
+    unittest.main()
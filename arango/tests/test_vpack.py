@@ -0,0 +1,121 @@
+"""Tests for the VelocyPack encoder, decoder and codec."""
+
+import unittest
+from binascii import unhexlify
+from datetime import datetime
+
+from arango import Arango, vpack
+from arango.codec import VPackCodec
+from arango.response import Response
+from arango.tests.utils import (
+    get_next_col_name,
+    get_next_db_name,
+)
+
+
+class VPackTest(unittest.TestCase):
+    """Tests for the VelocyPack encoder and decoder."""
+
+    def test_encode(self):
+        self.assertEqual(vpack.dumps([1, 2, 3]), unhexlify("0205313233"))
+        self.assertEqual(vpack.dumps([1, 16]), unhexlify("0608023128100304"))
+        self.assertEqual(vpack.dumps([]), unhexlify("01"))
+        self.assertEqual(vpack.dumps({}), unhexlify("0a"))
+        self.assertEqual(vpack.dumps(None), unhexlify("18"))
+        self.assertEqual(vpack.dumps(-1), unhexlify("3f"))
+        self.assertEqual(vpack.dumps(-7), unhexlify("20f9"))
+        self.assertEqual(vpack.dumps(256), unhexlify("290001"))
+        self.assertEqual(vpack.dumps(u"abc"), unhexlify("43616263"))
+        self.assertEqual(vpack.dumps({"a": 12}), unhexlify("0b08014161280c03"))
+
+    def test_decode(self):
+        self.assertEqual(
+            vpack.loads(unhexlify(
+                "0b13034161280c41621a41634378797a03070a"
+            )),
+            {"a": 12, "b": True, "c": "xyz"}
+        )
+        # Compact array and object
+        self.assertEqual(vpack.loads(unhexlify("130631323303")), [1, 2, 3])
+        self.assertEqual(
+            vpack.loads(unhexlify("140941613141623202")), {"a": 1, "b": 2}
+        )
+        # Array with zero padding after the header
+        self.assertEqual(
+            vpack.loads(unhexlify("0308000000313233")), [1, 2, 3]
+        )
+        self.assertEqual(
+            vpack.loads(unhexlify("1ce803000000000000")),
+            datetime(1970, 1, 1, 0, 0, 1)
+        )
+        self.assertRaises(ValueError, vpack.loads, unhexlify("02"))
+        self.assertRaises(ValueError, vpack.loads, unhexlify("1f"))
+
+    def test_round_trip(self):
+        values = [
+            0, 9, -6, -7, 255, -129, 2 ** 63, 2 ** 64 - 1, -2 ** 63, 1.5,
+            u"x" * 200, u"\xe9t\xe9", True, False, None,
+            [[]] * 300, list(range(70000)),
+            {"z": 1, "a": [1, "aa", None, {}]},
+            dict(("key{}".format(num), num) for num in range(1000)),
+        ]
+        for value in values:
+            self.assertEqual(vpack.loads(vpack.dumps(value)), value)
+
+    def test_unsupported(self):
+        self.assertRaises(TypeError, vpack.dumps, object())
+        self.assertRaises(TypeError, vpack.dumps, {1: "a"})
+        self.assertRaises(ValueError, vpack.dumps, 2 ** 64)
+
+    def test_codec(self):
+        codec = VPackCodec({datetime: lambda value: value.isoformat()})
+        body = codec.encode({"created": datetime(2015, 6, 1)})
+        self.assertEqual(
+            codec.decode(body, "application/x-velocypack"),
+            {"created": "2015-06-01T00:00:00"}
+        )
+        self.assertEqual(codec.decode(b'{"a": 1}', "application/json"),
+                         {"a": 1})
+        res = Response(
+            "get", "/", 200, vpack.dumps({"a": 1}),
+            {"Content-Type": "application/x-velocypack"}
+        )
+        res.codec = codec
+        self.assertEqual(res.obj, {"a": 1})
+
+
+class VPackServerTest(unittest.TestCase):
+    """Tests for talking VelocyPack to the server."""
+
+    def setUp(self):
+        self.arango = Arango(codec="vpack")
+        self.db_name = get_next_db_name(self.arango)
+        self.db = self.arango.create_database(self.db_name)
+        self.col_name = get_next_col_name(self.db)
+        self.col = self.db.create_collection(self.col_name)
+
+        # Test database cleanup
+        self.addCleanup(self.arango.delete_database,
+                        name=self.db_name, safe_delete=True)
+
+    def test_documents(self):
+        self.col.create_document({"_key": "doc01", "value": [1, 2.5]})
+        self.assertEqual(self.col.document("doc01")["value"], [1, 2.5])
+        self.col.update_document("doc01", {"value": u"\xe9"})
+        self.assertEqual(self.col.document("doc01")["value"], u"\xe9")
+
+    def test_import_and_query(self):
+        self.col.import_documents([
+            {"_key": "doc{:02d}".format(num), "value": num}
+            for num in range(10)
+        ])
+        self.assertEqual(len(self.col), 10)
+        values = list(self.db.execute_query(
+            "FOR d IN {} SORT d.value RETURN d.value".format(self.col_name),
+            batch_size=3,
+        ))
+        self.assertEqual(values, list(range(10)))
+
+
+if __name__ == "__main__":
+    unittest.main()
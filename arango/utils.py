@@ -95,7 +95,8 @@ def filter_keys(dictionary, filtered):
     return {k: v for k, v in dictionary.items() if k not in filtered}
 
 
-def stringify_request(method, path, params=None, headers=None, data=None):
+def stringify_request(method, path, params=None, headers=None, data=None,
+                      codec=None):
     """Stringify the HTTP request into a string for batch requests.
 
     :param method: the HTTP method
@@ -108,6 +109,8 @@ def stringify_request(method, path, params=None, headers=None, data=None):
     :type headers: dict or None
     :param data: the request payload
     :type data: dict or None
+    :param codec: the JSON codec for the payload (default: the stdlib)
+    :type codec: arango.codec.Codec or None
     :returns: the stringified request
     :rtype: str
     """
@@ -120,5 +123,37 @@ def stringify_request(method, path, params=None, headers=None, data=None):
                 key=key, value=value
             )
     if data:
-        request_string += "\r\n\r\n{}".format(dumps(data))
+        request_string += "\r\n\r\n{}".format(
+            dumps(data) if codec is None else codec.dumps(data)
+        )
     return request_string
+
+
+def stream_lines(items, encode, chunk_size=65536):
+    """Encode the items one per line and yield the lines in chunks.
+
+    Lines are grouped into chunks of about ``chunk_size`` bytes, so a
+    streamed request body is not sent in tiny pieces while only one chunk
+    is held in memory at a time.
+
+    :param items: the items to encode
+    :type items: collections.Iterable
+    :param encode: function encoding an item into bytes
+    :type encode: callable
+    :param chunk_size: the approximate size of the chunks in bytes
+    :type chunk_size: int
+    :returns: the chunks of CRLF-terminated lines
+    :rtype: types.GeneratorType
+    """
+    lines = []
+    size = 0
+    for item in items:
+        line = encode(item) + b"\r\n"
+        lines.append(line)
+        size += len(line)
+        if size >= chunk_size:
+            yield b"".join(lines)
+            lines = []
+            size = 0
+    if lines:
+        yield b"".join(lines)
@@ -0,0 +1,396 @@
+"""Pure Python VelocyPack encoder and decoder.
+
+VelocyPack is the binary serialization format ArangoDB uses internally. It
+is accepted and returned by the HTTP API with the content type
+``application/x-velocypack``. See the VelocyPack specification at
+https://github.com/arangodb/velocypack/blob/master/VelocyPack.md.
+
+The encoder produces arrays without index tables when all members have the
+same size and arrays and objects with (sorted) index tables otherwise.
+The decoder reads every value type the server sends over HTTP: arrays and
+objects in all their layouts (including the compact ones), null, booleans,
+doubles, UTC dates, integers, strings and binary blobs.
+"""
+
+import struct
+from datetime import datetime, timedelta
+
+from arango.utils import is_string
+
+try:
+    integer_types = (int, long)
+    text_type = unicode
+except NameError:
+    integer_types = (int,)
+    text_type = str
+
+CONTENT_TYPE = "application/x-velocypack"
+
+EPOCH = datetime(1970, 1, 1)
+
+# Pre-built single bytes
+BYTES = [struct.pack("B", value) for value in range(256)]
+
+# Struct objects for the widths with native support
+UINT = {
+    1: struct.Struct("<B"),
+    2: struct.Struct("<H"),
+    4: struct.Struct("<I"),
+    8: struct.Struct("<Q"),
+}
+DOUBLE = struct.Struct("<d")
+INT64 = struct.Struct("<q")
+
+NULL = b"\x18"
+FALSE = b"\x19"
+TRUE = b"\x1a"
+EMPTY_ARRAY = b"\x01"
+EMPTY_OBJECT = b"\x0a"
+
+# Encoded small integers (-6 to 9)
+SMALL_INTS = dict(
+    [(value, BYTES[0x30 + value]) for value in range(10)] +
+    [(value, BYTES[0x40 + value]) for value in range(-6, 0)]
+)
+
+
+def _pack_uint(value, width):
+    """Pack the unsigned integer into ``width`` little endian bytes."""
+    if width in UINT:
+        return UINT[width].pack(value)
+    return b"".join(BYTES[(value >> (8 * i)) & 0xff] for i in range(width))
+
+
+def _unpack_uint(data, pos, width):
+    """Unpack the unsigned integer of ``width`` bytes at ``pos``."""
+    if width in UINT:
+        return UINT[width].unpack_from(data, pos)[0]
+    value = 0
+    for i in range(width):
+        value |= data[pos + i] << (8 * i)
+    return value
+
+
+def _uint_width(value):
+    """Return the number of bytes needed for the unsigned integer."""
+    width = 1
+    while value >> (8 * width):
+        width += 1
+    return width
+
+
+############
+# Encoding #
+############
+
+def _encode_int(value):
+    if -6 <= value <= 9:
+        return SMALL_INTS[value]
+    if value > 0:
+        if value >= 1 << 64:
+            raise ValueError("{} is too large for VelocyPack".format(value))
+        width = _uint_width(value)
+        return BYTES[0x27 + width] + _pack_uint(value, width)
+    if value < -(1 << 63):
+        raise ValueError("{} is too small for VelocyPack".format(value))
+    width = _uint_width(-value - 1 << 1)
+    return BYTES[0x1f + width] + _pack_uint(value + (1 << 8 * width), width)
+
+
+def _encode_string(value):
+    if isinstance(value, text_type):
+        value = value.encode("utf-8")
+    length = len(value)
+    if length <= 126:
+        return BYTES[0x40 + length] + value
+    return b"\xbf" + UINT[8].pack(length) + value
+
+
+def _encode_binary(value):
+    width = _uint_width(len(value))
+    return BYTES[0xbf + width] + _pack_uint(len(value), width) + value
+
+
+def _header_width(size, count, fixed):
+    """Return the width of the length fields for an indexed compound."""
+    for width in (1, 2, 4):
+        if count < 1 << 8 * width and \
+                fixed + 2 * width + count * width + size < 1 << 8 * width:
+            return width
+    return 8
+
+
+def _encode_indexed(head, members, offsets):
+    """Encode an array or object with an index table.
+
+    :param head: the type byte for the 1-byte width (0x06 or 0x0b)
+    :param members: the encoded members (key/value pairs for objects)
+    :param offsets: the member offsets relative to the start of the data
+    """
+    size = sum(len(member) for member in members)
+    count = len(offsets)
+    width = _header_width(size, count, 1)
+    if width < 8:
+        start = 1 + 2 * width
+        length = start + size + count * width
+        header = BYTES[head + {1: 0, 2: 1, 4: 2}[width]] + \
+            _pack_uint(length, width) + _pack_uint(count, width)
+        trailer = b""
+    else:
+        start = 9
+        length = start + size + count * 8 + 8
+        header = BYTES[head + 3] + UINT[8].pack(length)
+        trailer = UINT[8].pack(count)
+    index = b"".join(_pack_uint(start + offset, width) for offset in offsets)
+    return header + b"".join(members) + index + trailer
+
+
+def _encode_array(value, default):
+    if not value:
+        return EMPTY_ARRAY
+    members = [_encode(member, default) for member in value]
+    first = len(members[0])
+    if all(len(member) == first for member in members):
+        size = first * len(members)
+        for width, head in ((1, 0x02), (2, 0x03), (4, 0x04), (8, 0x05)):
+            if 1 + width + size < 1 << 8 * width or width == 8:
+                return BYTES[head] + _pack_uint(1 + width + size, width) + \
+                    b"".join(members)
+    offsets = []
+    offset = 0
+    for member in members:
+        offsets.append(offset)
+        offset += len(member)
+    return _encode_indexed(0x06, members, offsets)
+
+
+def _encode_object(value, default):
+    if not value:
+        return EMPTY_OBJECT
+    members = []
+    keyed_offsets = []
+    offset = 0
+    for key, member in value.items():
+        if isinstance(key, text_type):
+            key = key.encode("utf-8")
+        elif not is_string(key):
+            raise TypeError(
+                "object keys must be strings, not {!r}".format(key)
+            )
+        if len(key) <= 126:
+            encoded = BYTES[0x40 + len(key)] + key
+        else:
+            encoded = b"\xbf" + UINT[8].pack(len(key)) + key
+        encoded += _encode(member, default)
+        keyed_offsets.append((key, offset))
+        members.append(encoded)
+        offset += len(encoded)
+    keyed_offsets.sort()
+    return _encode_indexed(
+        0x0b, members, [offset for _, offset in keyed_offsets]
+    )
+
+
+def _encode(value, default):
+    """Encode the value into VelocyPack bytes."""
+    encoder = ENCODERS.get(type(value))
+    if encoder is not None:
+        return encoder(value, default)
+    if isinstance(value, integer_types):
+        return _encode_int(value)
+    if isinstance(value, float):
+        return b"\x1b" + DOUBLE.pack(value)
+    if is_string(value):
+        return _encode_string(value)
+    if isinstance(value, dict):
+        return _encode_object(value, default)
+    if isinstance(value, (list, tuple)):
+        return _encode_array(value, default)
+    if isinstance(value, (bytes, bytearray)):
+        return _encode_binary(bytes(value))
+    if default is None:
+        raise TypeError(
+            "{!r} is not VelocyPack serializable".format(value)
+        )
+    return _encode(default(value), default)
+
+
+# Encoders for the exact built-in types (subclasses take the slow path)
+ENCODERS = {
+    type(None): lambda value, default: NULL,
+    bool: lambda value, default: TRUE if value else FALSE,
+    float: lambda value, default: b"\x1b" + DOUBLE.pack(value),
+    dict: _encode_object,
+    list: _encode_array,
+    tuple: _encode_array,
+}
+for _type in integer_types:
+    ENCODERS[_type] = lambda value, default: _encode_int(value)
+for _type in set([str, text_type]):
+    ENCODERS[_type] = lambda value, default: _encode_string(value)
+
+
+def dumps(value, default=None):
+    """Serialize ``value`` to VelocyPack.
+
+    :param value: the object to serialize
+    :type value: object
+    :param default: function returning a serializable replacement for
+        objects which cannot be serialized otherwise
+    :type default: callable or None
+    :returns: the VelocyPack encoded value
+    :rtype: bytes
+    :raises: TypeError, ValueError
+    """
+    return _encode(value, default)
+
+
+############
+# Decoding #
+############
+
+def _decode_compound(data, pos, head):
+    """Decode an array or object, returning the value and its end."""
+    if head <= 0x09:
+        is_object = False
+        if head <= 0x05:
+            width = 1 << (head - 0x02)
+            indexed = False
+        else:
+            width = 1 << (head - 0x06)
+            indexed = True
+    else:
+        is_object = True
+        indexed = True
+        width = 1 << ((head - 0x0b) % 4)
+    length = _unpack_uint(data, pos + 1, width)
+    end = pos + length
+    if not indexed:
+        count = None
+        start = pos + 1 + width
+        stop = end
+    elif width < 8:
+        count = _unpack_uint(data, pos + 1 + width, width)
+        start = pos + 1 + 2 * width
+        stop = end - count * width
+    else:
+        count = _unpack_uint(data, end - 8, 8)
+        start = pos + 9
+        stop = end - 8 - count * 8
+    # Skip the optional zero padding between the header and the data
+    while start < stop and data[start] == 0:
+        start += 1
+    if is_object:
+        result = {}
+        for _ in range(count):
+            key, start = _decode(data, start)
+            result[key], start = _decode(data, start)
+        return result, end
+    result = []
+    while start < stop:
+        member, start = _decode(data, start)
+        result.append(member)
+    return result, end
+
+
+def _read_varint(data, pos, step):
+    """Read a variable length unsigned integer (step -1 reads backwards)."""
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        value |= (byte & 0x7f) << shift
+        shift += 7
+        pos += step
+        if not byte & 0x80:
+            return value, pos
+
+
+def _decode_compact(data, pos, is_object):
+    """Decode a compact array or object, returning the value and its end."""
+    length, start = _read_varint(data, pos + 1, 1)
+    end = pos + length
+    count, _ = _read_varint(data, end - 1, -1)
+    if is_object:
+        result = {}
+        for _ in range(count):
+            key, start = _decode(data, start)
+            result[key], start = _decode(data, start)
+        return result, end
+    result = []
+    for _ in range(count):
+        member, start = _decode(data, start)
+        result.append(member)
+    return result, end
+
+
+def _decode(data, pos):
+    """Decode the value at ``pos``, returning the value and its end."""
+    head = data[pos]
+    if 0x40 <= head <= 0xbe:
+        end = pos + 1 + head - 0x40
+        return data[pos + 1:end].decode("utf-8"), end
+    if 0x30 <= head <= 0x39:
+        return head - 0x30, pos + 1
+    if 0x3a <= head <= 0x3f:
+        return head - 0x40, pos + 1
+    if 0x28 <= head <= 0x2f:
+        width = head - 0x27
+        return _unpack_uint(data, pos + 1, width), pos + 1 + width
+    if 0x20 <= head <= 0x27:
+        width = head - 0x1f
+        value = _unpack_uint(data, pos + 1, width)
+        if value >= 1 << (8 * width - 1):
+            value -= 1 << 8 * width
+        return value, pos + 1 + width
+    if head == 0x18:
+        return None, pos + 1
+    if head == 0x19:
+        return False, pos + 1
+    if head == 0x1a:
+        return True, pos + 1
+    if head == 0x1b:
+        return DOUBLE.unpack_from(data, pos + 1)[0], pos + 9
+    if 0x02 <= head <= 0x12 and head != 0x0a:
+        return _decode_compound(data, pos, head)
+    if head == 0x01:
+        return [], pos + 1
+    if head == 0x0a:
+        return {}, pos + 1
+    if head == 0x13 or head == 0x14:
+        return _decode_compact(data, pos, head == 0x14)
+    if head == 0xbf:
+        length = UINT[8].unpack_from(data, pos + 1)[0]
+        end = pos + 9 + length
+        return data[pos + 9:end].decode("utf-8"), end
+    if 0xc0 <= head <= 0xc7:
+        width = head - 0xbf
+        length = _unpack_uint(data, pos + 1, width)
+        start = pos + 1 + width
+        return bytes(data[start:start + length]), start + length
+    if head == 0x1c:
+        milliseconds = INT64.unpack_from(data, pos + 1)[0]
+        return EPOCH + timedelta(milliseconds=milliseconds), pos + 9
+    raise ValueError(
+        "unsupported VelocyPack type 0x{:02x} at position {}".format(
+            head, pos
+        )
+    )
+
+
+def loads(data):
+    """Deserialize the VelocyPack value in ``data``.
+
+    :param data: the VelocyPack encoded value
+    :type data: bytes or bytearray
+    :returns: the deserialized value
+    :rtype: object
+    :raises: ValueError
+    """
+    if not isinstance(data, bytearray) and bytes is str:
+        data = bytearray(data)
+    try:
+        value, _ = _decode(data, 0)
+    except (IndexError, struct.error) as error:
+        raise ValueError("truncated VelocyPack value: {}".format(error))
+    return value
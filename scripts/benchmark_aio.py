@@ -0,0 +1,69 @@
+"""Compare the throughput of the synchronous and the asyncio clients.
+
+Both clients fetch the same document repeatedly from a local stand-in
+server which delays every response by ``--latency`` seconds. The sync
+client issues the requests one after the other, while the asyncio client
+keeps up to ``--concurrency`` requests in flight on a single thread.
+
+Usage: PYTHONPATH=. python scripts/benchmark_aio.py [--requests N]
+           [--latency SECONDS] [--concurrency N]
+"""
+
+import argparse
+import asyncio
+import time
+
+from standin import StandInServer
+
+from arango.api import API
+from arango.aio.api import AsyncAPI
+from arango.clients.aio import AsyncioClient
+
+
+def bench_sync(server, requests):
+    api = API(host=server.host, port=server.port)
+    start = time.time()
+    for _ in range(requests):
+        api.get("/_api/document/col/doc").obj
+    return time.time() - start
+
+
+def bench_async(server, requests, concurrency):
+    client = AsyncioClient({"auth": ("root", ""), "pool_size": concurrency})
+    api = AsyncAPI(host=server.host, port=server.port, client=client)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch():
+        async with semaphore:
+            (await api.get("/_api/document/col/doc")).obj
+
+    async def run():
+        start = time.time()
+        await asyncio.gather(*[fetch() for _ in range(requests)])
+        elapsed = time.time() - start
+        await client.close()
+        return elapsed
+
+    return asyncio.run(run())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=0.002)
+    parser.add_argument("--concurrency", type=int, default=200)
+    args = parser.parse_args()
+
+    with StandInServer(latency=args.latency) as server:
+        sync_time = bench_sync(server, args.requests)
+        async_time = bench_async(server, args.requests, args.concurrency)
+
+    print("requests: {}, latency: {}s".format(args.requests, args.latency))
+    print("sync client:    {:8.0f} req/s".format(args.requests / sync_time))
+    print("asyncio client: {:8.0f} req/s (concurrency {})".format(
+        args.requests / async_time, args.concurrency
+    ))
+
+
+if __name__ == "__main__":
+    main()
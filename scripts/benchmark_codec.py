@@ -0,0 +1,69 @@
+"""Compare the JSON codecs on a bulk import payload.
+
+Every installed codec encodes the same list of documents the way
+``Collection.import_documents`` does (one JSON document per line) and
+decodes a cursor-like response body.
+
+Usage: PYTHONPATH=. python scripts/benchmark_codec.py [--documents N]
+"""
+
+import argparse
+import timeit
+from datetime import datetime
+from decimal import Decimal
+
+from arango.codec import CODECS, get_codec
+
+HOOKS = {
+    datetime: lambda value: value.isoformat(),
+    Decimal: str,
+}
+
+
+def make_documents(count):
+    return [
+        {
+            "_key": "doc{}".format(num),
+            "name": "document number {}".format(num),
+            "value": num,
+            "ratio": num / 7.0,
+            "tags": ["a", "b", "c"],
+            "nested": {"flag": num % 2 == 0, "items": list(range(10))},
+            "created": datetime(2015, 6, 1, 12, num % 60),
+            "price": Decimal("9.99"),
+        }
+        for num in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--documents", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    documents = make_documents(args.documents)
+    print("{} documents, best of {} (ms)".format(
+        args.documents, args.repeat
+    ))
+    print("{:<8} {:>10} {:>10}".format("codec", "encode", "decode"))
+    for name, _, module in CODECS:
+        if module is None:
+            print("{:<8} {:>10}".format(name, "n/a"))
+            continue
+        codec = get_codec(name, HOOKS)
+        body = codec.encode({"result": documents, "hasMore": False})
+        encode = min(timeit.repeat(
+            lambda: b"\r\n".join([codec.encode(doc) for doc in documents]),
+            number=1, repeat=args.repeat
+        ))
+        decode = min(timeit.repeat(
+            lambda: codec.loads(body), number=1, repeat=args.repeat
+        ))
+        print("{:<8} {:>10.1f} {:>10.1f}".format(
+            name, encode * 1000, decode * 1000
+        ))
+
+
+if __name__ == "__main__":
+    main()
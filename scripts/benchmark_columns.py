@@ -0,0 +1,126 @@
+"""Compare the memory of row-wise and columnar cursor consumption.
+
+A local stand-in server answers an AQL query with ``--documents``
+documents of three numeric attributes, in batches of ``--batch-size``.
+The results are collected three ways: as the usual list of documents
+copied into lists afterwards, with ``to_columns`` into ``array.array``
+columns, and with ``to_numpy`` (if NumPy is installed). The script
+reports the time and the peak memory allocated by Python (tracemalloc)
+while the results are consumed. The server runs in a separate process so
+that only the client's memory is measured.
+
+Usage: PYTHONPATH=. python scripts/benchmark_columns.py [--documents N]
+           [--batch-size N]
+"""
+
+import argparse
+import json
+import multiprocessing
+import time
+import tracemalloc
+
+from standin import StandInServer
+
+from arango.api import API
+from arango.cursor import numpy
+from arango.database import Database
+
+FIELDS = ["x", "y", "value"]
+
+
+def make_handler(count, batch_size):
+    batches = []
+    for start in range(0, count, batch_size):
+        stop = min(start + batch_size, count)
+        batches.append(json.dumps({
+            "result": [
+                {"x": num * 0.5, "y": num * 0.25, "value": num}
+                for num in range(start, stop)
+            ],
+            "hasMore": stop < count,
+            "id": "1",
+            "count": count,
+            "error": False,
+            "code": 200,
+        }).encode("utf-8"))
+    state = {"next": 0}
+
+    def handler(method, path, headers, body=None):
+        if method == "POST":
+            state["next"] = 0
+        number = state["next"]
+        state["next"] += 1
+        return 200, {"Content-Type": "application/json"}, batches[number]
+    return handler
+
+
+def serve(count, batch_size, ports, stop):
+    handler = make_handler(count, batch_size)
+    with StandInServer(handler=handler) as server:
+        ports.put(server.port)
+        stop.wait()
+
+
+def rows(cursor):
+    documents = list(cursor)
+    return dict(
+        (field, [document[field] for document in documents])
+        for field in FIELDS
+    )
+
+
+def arrays(cursor):
+    return cursor.to_columns(FIELDS, {"x": "d", "y": "d", "value": "q"})
+
+
+def numpy_arrays(cursor):
+    return cursor.to_numpy(FIELDS)
+
+
+def measure(db, consume):
+    tracemalloc.start()
+    start = time.time()
+    columns = consume(db.execute_query("FOR d IN col RETURN d", count=True))
+    elapsed = time.time() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del columns
+    return elapsed, current, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--documents", type=int, default=500000)
+    parser.add_argument("--batch-size", type=int, default=10000)
+    args = parser.parse_args()
+
+    modes = [("rows", rows), ("to_columns", arrays)]
+    if numpy is not None:
+        modes.append(("to_numpy", numpy_arrays))
+
+    ports = multiprocessing.Queue()
+    stop = multiprocessing.Event()
+    process = multiprocessing.Process(
+        target=serve, args=(args.documents, args.batch_size, ports, stop)
+    )
+    process.start()
+    try:
+        db = Database("_system", API(host="127.0.0.1", port=ports.get()))
+        print("documents: {}, batch size: {}".format(
+            args.documents, args.batch_size
+        ))
+        print("{:>12} {:>10} {:>12} {:>10}".format(
+            "mode", "time (s)", "result (MB)", "peak (MB)"
+        ))
+        for name, consume in modes:
+            elapsed, current, peak = measure(db, consume)
+            print("{:>12} {:>10.2f} {:>12.1f} {:>10.1f}".format(
+                name, elapsed, current / 1e6, peak / 1e6
+            ))
+    finally:
+        stop.set()
+        process.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Measure the effect of compression on bulk imports and cursor reads.
+
+A local stand-in server accepts document imports (gzip or deflate encoded
+request bodies, sent with chunked transfer encoding) and answers cursor
+requests with a large batch of documents, gzipping responses when the
+client accepts it. The script reports the bytes on the wire and the time
+taken with and without compression, plus the driver's counters.
+
+Usage: PYTHONPATH=. python scripts/benchmark_compression.py [--documents N]
+"""
+
+import argparse
+import json
+import time
+
+from standin import StandInServer
+
+from arango.api import API
+from arango.collection import Collection
+from arango.compression import Compression
+
+PROPERTIES = json.dumps({
+    "id": "1", "name": "col", "type": 2, "status": 3, "waitForSync": False,
+    "keyOptions": {}, "isVolatile": False, "doCompact": True,
+    "journalSize": 0, "isSystem": False,
+}).encode("utf-8")
+
+
+def make_documents(count):
+    return [
+        {
+            "_key": "doc{}".format(num),
+            "name": "document number {}".format(num),
+            "value": num,
+            "tags": ["red", "green", "blue"],
+            "active": num % 2 == 0,
+        }
+        for num in range(count)
+    ]
+
+
+def make_handler(documents):
+    cursor = json.dumps({
+        "result": documents, "hasMore": False, "error": False, "code": 201,
+    }).encode("utf-8")
+
+    def handler(method, path, headers, body):
+        res_headers = {"Content-Type": "application/json; charset=utf-8"}
+        if "/_api/collection/" in path:
+            return 200, res_headers, PROPERTIES
+        if "/_api/cursor" in path:
+            return 201, res_headers, cursor
+        created = len(body.splitlines())
+        return 201, res_headers, json.dumps({
+            "error": False, "created": created, "errors": 0
+        }).encode("utf-8")
+
+    return handler
+
+
+def run(server, documents, requests, compression):
+    api = API(host=server.host, port=server.port, compression=compression)
+    if compression is None:
+        # The HTTP client accepts gzip by default, so opt out explicitly
+        api.client.session.headers["Accept-Encoding"] = "identity"
+    col = Collection("col", api)
+    server.bytes_received = server.bytes_sent = 0
+    start = time.time()
+    for _ in range(requests):
+        assert col.import_documents(documents)["created"] == len(documents)
+        assert len(api.post("/_api/cursor", {}).obj["result"]) == \
+            len(documents)
+    return time.time() - start, server.bytes_received, server.bytes_sent
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--documents", type=int, default=20000)
+    parser.add_argument("--requests", type=int, default=5)
+    args = parser.parse_args()
+
+    documents = make_documents(args.documents)
+    with StandInServer(handler=make_handler(documents),
+                       compress_threshold=1024) as server:
+        print("{:<12} {:>10} {:>14} {:>14}".format(
+            "mode", "time (s)", "sent (bytes)", "received (bytes)"
+        ))
+        compression = Compression(threshold=1024)
+        for name, setting in (("plain", None), ("compressed", compression)):
+            elapsed, received, sent = run(
+                server, documents, args.requests, setting
+            )
+            print("{:<12} {:>10.2f} {:>14} {:>14}".format(
+                name, elapsed, received, sent
+            ))
+        print("counters: {}".format(compression.stats))
+
+
+if __name__ == "__main__":
+    main()
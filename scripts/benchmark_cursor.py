@@ -0,0 +1,107 @@
+"""Compare buffered and incremental reading of large cursor batches.
+
+A local stand-in server answers an AQL query with a single batch of the
+given number of documents. The batch is read once the usual way (the whole
+body is received and decoded before the first document is yielded) and
+once incrementally (``execute_query(..., incremental=True)``). The script
+reports the time until the first document is yielded, the total time and
+the peak memory allocated by Python (tracemalloc, in a separate run) while
+the documents are consumed one by one. The server runs in a separate
+process so that only the client's memory is measured.
+
+Usage: PYTHONPATH=. python scripts/benchmark_cursor.py [--documents N ...]
+"""
+
+import argparse
+import json
+import multiprocessing
+import time
+import tracemalloc
+
+from standin import StandInServer
+
+from arango.api import API
+from arango.database import Database
+
+
+def make_handler(count):
+    body = json.dumps({
+        "result": [
+            {
+                "_key": "doc{}".format(num),
+                "name": "document number {}".format(num),
+                "value": num,
+                "tags": ["red", "green", "blue"],
+            }
+            for num in range(count)
+        ],
+        "hasMore": False,
+        "error": False,
+        "code": 201,
+    }).encode("utf-8")
+
+    def handler(method, path, headers, body_=None):
+        return 201, {"Content-Type": "application/json; charset=utf-8"}, body
+    return handler
+
+
+def serve(count, ports, stop):
+    with StandInServer(handler=make_handler(count)) as server:
+        ports.put(server.port)
+        stop.wait()
+
+
+def consume(db, count, incremental):
+    start = time.time()
+    first = None
+    consumed = 0
+    for _ in db.execute_query("FOR d IN col RETURN d",
+                              incremental=incremental):
+        if first is None:
+            first = time.time() - start
+        consumed += 1
+    assert consumed == count, consumed
+    return first, time.time() - start
+
+
+def measure(db, count, incremental):
+    """Time a run, then measure the memory in a second (slower) run."""
+    first, elapsed = consume(db, count, incremental)
+    tracemalloc.start()
+    consume(db, count, incremental)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return first, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--documents", type=int, nargs="+",
+                        default=[10000, 50000, 200000])
+    args = parser.parse_args()
+
+    print("{:>10} {:>12} {:>10} {:>10} {:>10}".format(
+        "documents", "mode", "first (s)", "total (s)", "peak (MB)"
+    ))
+    for count in args.documents:
+        ports = multiprocessing.Queue()
+        stop = multiprocessing.Event()
+        process = multiprocessing.Process(
+            target=serve, args=(count, ports, stop)
+        )
+        process.start()
+        try:
+            db = Database("_system", API(host="127.0.0.1", port=ports.get()))
+            for incremental in (False, True):
+                first, elapsed, peak = measure(db, count, incremental)
+                print("{:>10} {:>12} {:>10.3f} {:>10.2f} {:>10.1f}".format(
+                    count, "incremental" if incremental else "buffered",
+                    first, elapsed, peak / 1e6
+                ))
+        finally:
+            stop.set()
+            process.join()
+
+
+if __name__ == "__main__":
+    main()
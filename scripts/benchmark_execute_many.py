@@ -0,0 +1,75 @@
+"""Compare running a query per set of bind variables with execute_many.
+
+A local stand-in server answers every AQL query after ``--latency``
+seconds, standing in for the network round trip and the query setup on
+the server. The same query is run for ``--sets`` sets of bind variables,
+once with an ``execute_query`` call per set and once with
+``execute_many``, which sends the sets in chunks of ``--chunk-size``.
+
+Usage: PYTHONPATH=. python scripts/benchmark_execute_many.py [--sets N]
+           [--chunk-size N] [--latency SECONDS]
+"""
+
+import argparse
+import json
+import time
+
+from standin import StandInServer
+
+from arango.api import API
+from arango.database import Database
+
+QUERY = "FOR d IN col FILTER d.value == @value RETURN d"
+
+
+def handler(method, path, headers, body=None):
+    if method == "HEAD":
+        return 200, {"Content-Type": "application/json"}, b""
+    bind_vars = json.loads(body.decode("utf-8"))["bindVars"]
+    if "batch" in bind_vars:
+        result = [[{"value": item["value"]}] for item in bind_vars["batch"]]
+    else:
+        result = [{"value": bind_vars["value"]}]
+    return 201, {"Content-Type": "application/json"}, json.dumps({
+        "result": result, "hasMore": False, "error": False, "code": 201,
+    }).encode("utf-8")
+
+
+def one_by_one(db, sets):
+    start = time.time()
+    results = [list(db.execute_query(QUERY, bind_vars=bind_vars))
+               for bind_vars in sets]
+    return time.time() - start, results
+
+
+def many(db, sets, chunk_size):
+    start = time.time()
+    results = db.execute_many(QUERY, sets, chunk_size=chunk_size)
+    return time.time() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sets", type=int, default=2000)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.002)
+    args = parser.parse_args()
+
+    sets = [{"value": value} for value in range(args.sets)]
+    with StandInServer(handler=handler, latency=args.latency) as server:
+        db = Database("_system", API(host=server.host, port=server.port))
+        single, expected = one_by_one(db, sets)
+        chunked, results = many(db, sets, args.chunk_size)
+    assert results == expected
+
+    print("sets: {}, latency: {}s".format(args.sets, args.latency))
+    print("execute_query per set: {:8.3f}s ({} requests)".format(
+        single, args.sets
+    ))
+    print("execute_many:          {:8.3f}s ({} requests)".format(
+        chunked, -(-args.sets // args.chunk_size)
+    ))
+
+
+if __name__ == "__main__":
+    main()
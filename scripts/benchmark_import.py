@@ -0,0 +1,112 @@
+"""Measure the client memory use of streamed document imports.
+
+Documents are produced by a generator and imported into a local stand-in
+server, once with the old approach (joining every encoded document into a
+single body) and once with the streamed body of ``import_documents``. The
+script reports the peak memory allocated by Python (tracemalloc) and the
+time taken for increasing numbers of documents. The server runs in a
+separate process so that only the client's memory is measured.
+
+Usage: PYTHONPATH=. python scripts/benchmark_import.py [--documents N ...]
+"""
+
+import argparse
+import json
+import multiprocessing
+import time
+import tracemalloc
+
+from standin import StandInServer
+
+from arango.api import API
+from arango.collection import Collection
+
+PROPERTIES = json.dumps({
+    "id": "1", "name": "col", "type": 2, "status": 3, "waitForSync": False,
+    "keyOptions": {}, "isVolatile": False, "doCompact": True,
+    "journalSize": 0, "isSystem": False,
+}).encode("utf-8")
+
+
+def handler(method, path, headers, body):
+    res_headers = {"Content-Type": "application/json; charset=utf-8"}
+    if "/_api/collection/" in path:
+        return 200, res_headers, PROPERTIES
+    created = body.count(b"\n") + (not body.endswith(b"\n"))
+    return 201, res_headers, json.dumps({
+        "error": False, "created": created, "errors": 0
+    }).encode("utf-8")
+
+
+def serve(ports, stop):
+    with StandInServer(handler=handler) as server:
+        ports.put(server.port)
+        stop.wait()
+
+
+def generate(count):
+    for num in range(count):
+        yield {
+            "_key": "doc{}".format(num),
+            "name": "document number {}".format(num),
+            "value": num,
+            "tags": ["red", "green", "blue"],
+        }
+
+
+def joined_import(col, count):
+    """The previous implementation: build the whole body up front."""
+    documents = list(generate(count))
+    data = "\r\n".join([json.dumps(doc) for doc in documents])
+    return col.api.post(
+        "/_api/import",
+        data=data,
+        params={"type": "documents", "collection": col.name},
+    ).obj
+
+
+def streamed_import(col, count):
+    return col.import_documents(generate(count))
+
+
+def measure(func, col, count):
+    tracemalloc.start()
+    start = time.time()
+    result = func(col, count)
+    elapsed = time.time() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert result["created"] == count, result
+    return peak, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--documents", type=int, nargs="+",
+                        default=[10000, 100000, 500000])
+    args = parser.parse_args()
+
+    ports = multiprocessing.Queue()
+    stop = multiprocessing.Event()
+    process = multiprocessing.Process(target=serve, args=(ports, stop))
+    process.start()
+    try:
+        col = Collection("col", API(host="127.0.0.1", port=ports.get()))
+        print("{:>10} {:>16} {:>16} {:>10} {:>10}".format(
+            "documents", "joined peak (MB)", "stream peak (MB)",
+            "joined (s)", "stream (s)"
+        ))
+        for count in args.documents:
+            joined_peak, joined_time = measure(joined_import, col, count)
+            stream_peak, stream_time = measure(streamed_import, col, count)
+            print("{:>10} {:>16.1f} {:>16.1f} {:>10.2f} {:>10.2f}".format(
+                count, joined_peak / 1e6, stream_peak / 1e6,
+                joined_time, stream_time
+            ))
+    finally:
+        stop.set()
+        process.join()
+
+
+if __name__ == "__main__":
+    main()
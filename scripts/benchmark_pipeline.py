@@ -0,0 +1,64 @@
+"""Compare sequential and pipelined document reads.
+
+A burst of ``--requests`` document reads is sent to a local stand-in
+server which delays every response by ``--latency`` seconds, first one
+request after the other through the API wrapper, then pipelined over
+``--connections`` sockets with ``api.pipeline()``.
+
+Usage: PYTHONPATH=. python scripts/benchmark_pipeline.py [--requests N]
+           [--latency SECONDS] [--connections N] [--depth N]
+"""
+
+import argparse
+import time
+
+from standin import StandInServer
+
+from arango.api import API
+
+
+def bench_sequential(api, requests):
+    start = time.time()
+    for key in range(requests):
+        api.get("/_api/document/col/{}".format(key)).obj
+    return time.time() - start
+
+
+def bench_pipeline(api, requests, connections, depth):
+    start = time.time()
+    with api.pipeline(connections=connections, depth=depth) as pipe:
+        futures = [
+            pipe.get("/_api/document/col/{}".format(key))
+            for key in range(requests)
+        ]
+    for future in futures:
+        future.result().obj
+    return time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=0.0005)
+    parser.add_argument("--connections", type=int, default=4)
+    parser.add_argument("--depth", type=int, default=32)
+    args = parser.parse_args()
+
+    with StandInServer(latency=args.latency) as server:
+        api = API(host=server.host, port=server.port)
+        sequential_time = bench_sequential(api, args.requests)
+        pipeline_time = bench_pipeline(
+            api, args.requests, args.connections, args.depth
+        )
+
+    print("requests: {}, latency: {}s".format(args.requests, args.latency))
+    print("sequential: {:8.3f}s {:8.0f} req/s".format(
+        sequential_time, args.requests / sequential_time
+    ))
+    print("pipelined:  {:8.3f}s {:8.0f} req/s ({} connections, "
+          "depth {})".format(pipeline_time, args.requests / pipeline_time,
+                             args.connections, args.depth))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Compare on-demand and prefetched fetching of cursor batches.
+
+A local stand-in server answers an AQL query with ``--batches`` batches
+of ``--batch-size`` documents each, delaying every response by
+``--latency`` seconds. The consumer spends ``--work`` seconds on every
+batch. The query is consumed once with every batch requested only when
+the previous one is used up, and once with ``prefetch`` batches fetched
+on a background thread, where the total time should approach the larger
+of the network and the processing time instead of their sum.
+
+Usage: PYTHONPATH=. python scripts/benchmark_prefetch.py [--batches N]
+           [--batch-size N] [--latency SECONDS] [--work SECONDS]
+           [--prefetch N]
+"""
+
+import argparse
+import json
+import time
+
+from standin import StandInServer
+
+from arango.api import API
+from arango.database import Database
+
+
+def make_handler(batches, batch_size):
+    def body(number):
+        return json.dumps({
+            "result": [
+                {"_key": "doc{}".format(num), "value": num}
+                for num in range(batch_size)
+            ],
+            "hasMore": number < batches - 1,
+            "id": "1",
+            "error": False,
+            "code": 200,
+        }).encode("utf-8")
+
+    state = {"next": 0}
+
+    def handler(method, path, headers, body_=None):
+        if method == "POST":
+            state["next"] = 0
+        elif method == "DELETE":
+            return 202, {"Content-Type": "application/json"}, b"{}"
+        number = state["next"]
+        state["next"] += 1
+        return 200, {"Content-Type": "application/json"}, body(number)
+    return handler
+
+
+def consume(db, work, prefetch):
+    start = time.time()
+    cursor = db.execute_query("FOR d IN col RETURN d", prefetch=prefetch)
+    while True:
+        batch = cursor.batch()
+        if not batch:
+            if not cursor.has_more():
+                break
+            batch = [next(cursor)] + cursor.batch()
+        # Stands in for processing the batch (e.g. writing it elsewhere)
+        time.sleep(work)
+    return time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--batches", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.01)
+    parser.add_argument("--work", type=float, default=0.01)
+    parser.add_argument("--prefetch", type=int, default=2)
+    args = parser.parse_args()
+
+    handler = make_handler(args.batches, args.batch_size)
+    with StandInServer(handler=handler, latency=args.latency) as server:
+        db = Database("_system", API(host=server.host, port=server.port))
+        on_demand = consume(db, args.work, 0)
+        prefetched = consume(db, args.work, args.prefetch)
+
+    print("batches: {} x {} documents, latency: {}s, work: {}s".format(
+        args.batches, args.batch_size, args.latency, args.work
+    ))
+    print("on demand:  {:8.3f}s".format(on_demand))
+    print("prefetched: {:8.3f}s (prefetch {})".format(
+        prefetched, args.prefetch
+    ))
+
+
+if __name__ == "__main__":
+    main()
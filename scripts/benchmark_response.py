@@ -0,0 +1,126 @@
+"""Measure the cost of building responses on the create_document and
+contains paths.
+
+The first part times the construction of the response objects alone:
+the old eager decoding (bytes to text, then ``json.loads``) against the
+lazy ``arango.response.Response`` with and without reading ``obj``. The
+second part times ``Collection.create_document`` and
+``Collection.contains`` end to end against a local stand-in server.
+
+Usage: PYTHONPATH=. python scripts/benchmark_response.py [--requests N]
+"""
+
+import argparse
+import json
+import timeit
+
+from standin import StandInServer
+
+from arango.api import API
+from arango.collection import Collection
+from arango.response import Response
+
+CREATED = json.dumps({
+    "error": False,
+    "_id": "col/12345",
+    "_key": "12345",
+    "_rev": "12345",
+}).encode("utf-8")
+
+DOCUMENT = json.dumps({
+    "_id": "col/12345",
+    "_key": "12345",
+    "_rev": "12345",
+    "values": list(range(200)),
+    "tags": ["tag{}".format(num) for num in range(50)],
+}).encode("utf-8")
+
+PROPERTIES = json.dumps({
+    "id": "1", "name": "col", "type": 2, "status": 3, "waitForSync": False,
+    "keyOptions": {}, "isVolatile": False, "doCompact": True,
+    "journalSize": 0, "isSystem": False,
+}).encode("utf-8")
+
+
+class EagerResponse(object):
+    """The previous response class, decoding and parsing up front."""
+
+    def __init__(self, method, url, status_code, content, headers,
+                 status_text=None):
+        self.method = method
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.status_text = status_text
+        content = content.decode("utf-8")
+        try:
+            self.obj = json.loads(content) if content else None
+        except ValueError:
+            self.obj = None
+
+
+def handler(method, path, headers, body):
+    json_headers = {"Content-Type": "application/json; charset=utf-8"}
+    if method == "HEAD":
+        return 200, json_headers, b""
+    if "/_api/collection/" in path:
+        return 200, json_headers, PROPERTIES
+    return 202, json_headers, CREATED
+
+
+def bench_construction(number):
+    cases = [
+        ("head (empty)", b""),
+        ("create_document", CREATED),
+        ("document (large)", DOCUMENT),
+    ]
+    print("response construction ({} iterations, usec per response)"
+          .format(number))
+    print("{:<18} {:>8} {:>8} {:>10}".format(
+        "content", "eager", "lazy", "lazy+obj"
+    ))
+    for name, content in cases:
+        eager = timeit.timeit(
+            lambda: EagerResponse("get", "/", 200, content, {}),
+            number=number
+        )
+        lazy = timeit.timeit(
+            lambda: Response("get", "/", 200, content, {}),
+            number=number
+        )
+        lazy_obj = timeit.timeit(
+            lambda: Response("get", "/", 200, content, {}).obj,
+            number=number
+        )
+        print("{:<18} {:>8.2f} {:>8.2f} {:>10.2f}".format(
+            name, *[t / number * 1e6 for t in (eager, lazy, lazy_obj)]
+        ))
+
+
+def bench_collection(requests):
+    with StandInServer(handler=handler) as server:
+        api = API(host=server.host, port=server.port)
+        col = Collection("col", api)
+        create = timeit.timeit(
+            lambda: col.create_document({"value": 1}), number=requests
+        )
+        contains = timeit.timeit(
+            lambda: col.contains("12345"), number=requests
+        )
+    print("collection methods ({} requests, usec per call)".format(requests))
+    print("create_document: {:8.1f}".format(create / requests * 1e6))
+    print("contains:        {:8.1f}".format(contains / requests * 1e6))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--iterations", type=int, default=100000)
+    args = parser.parse_args()
+    bench_construction(args.iterations)
+    print("")
+    bench_collection(args.requests)
+
+
+if __name__ == "__main__":
+    main()
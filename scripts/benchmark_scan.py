@@ -0,0 +1,84 @@
+"""Compare single-stream and parallel partitioned collection scans.
+
+A local stand-in server answers the keyset queries of ``Collection.scan``
+and ``Collection.parallel_scan`` for a collection of ``--documents``
+documents, delaying every response by ``--latency`` seconds (the server
+side time to read a batch). The collection is read once through a single
+stream and once in ``--partitions`` key ranges at the same time.
+
+Usage: PYTHONPATH=. python scripts/benchmark_scan.py [--documents N]
+           [--batch-size N] [--latency SECONDS] [--partitions N]
+"""
+
+import argparse
+import json
+import time
+
+from standin import StandInServer
+
+from arango.api import API
+from arango.cursor import KeysetCursor, ParallelScan
+
+
+def make_handler(keys):
+    def handler(method, path, headers, body=None):
+        bind_vars = json.loads(body.decode("utf-8"))["bindVars"]
+        after = bind_vars["key"] or ""
+        start = bind_vars.get("start") or ""
+        end = bind_vars.get("end")
+        result = []
+        for key in keys:
+            if end is not None and key >= end:
+                break
+            if key > after and key >= start:
+                result.append({"_key": key, "value": len(result)})
+                if len(result) == bind_vars["count"]:
+                    break
+        return 201, {"Content-Type": "application/json"}, json.dumps({
+            "result": result, "hasMore": False, "error": False, "code": 201
+        }).encode("utf-8")
+    return handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--documents", type=int, default=100000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--partitions", type=int, default=4)
+    args = parser.parse_args()
+
+    keys = ["{:08d}".format(num) for num in range(args.documents)]
+    step = args.documents // args.partitions
+    boundaries = keys[step::step][:args.partitions - 1]
+
+    handler = make_handler(keys)
+    with StandInServer(handler=handler, latency=args.latency) as server:
+        # What Collection.scan and Collection.parallel_scan return
+        api = API(host=server.host, port=server.port)
+
+        start = time.time()
+        count = sum(1 for _ in KeysetCursor(api, "col", args.batch_size))
+        single_time = time.time() - start
+        assert count == args.documents, count
+
+        start = time.time()
+        count = sum(1 for _ in ParallelScan(
+            api, "col", batch_size=args.batch_size, boundaries=boundaries
+        ))
+        parallel_time = time.time() - start
+        assert count == args.documents, count
+
+    print("documents: {}, batch size: {}, latency: {}s".format(
+        args.documents, args.batch_size, args.latency
+    ))
+    print("single stream: {:8.3f}s {:8.0f} docs/s".format(
+        single_time, args.documents / single_time
+    ))
+    print("{} partitions:  {:8.3f}s {:8.0f} docs/s".format(
+        args.partitions, parallel_time, args.documents / parallel_time
+    ))
+
+
+if __name__ == "__main__":
+    main()
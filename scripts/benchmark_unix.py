@@ -0,0 +1,81 @@
+"""Compare the request latency over TCP and over a Unix domain socket.
+
+The same stand-in server answers document reads on the loopback interface
+and on a Unix socket. Each client reads the document ``--requests`` times,
+one request after the other over a pooled connection. The clients take
+turns for ``--rounds`` rounds to even out the noise of the machine, and the
+latency percentiles of the fastest round of each are printed.
+
+Usage: PYTHONPATH=. python scripts/benchmark_unix.py [--requests N]
+           [--rounds N]
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from standin import StandInServer
+
+from arango.api import API
+
+
+def bench(api, requests):
+    # Open the pooled connection first
+    api.get("/_api/document/col/doc")
+    latencies = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        api.get("/_api/document/col/doc").obj
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return latencies
+
+
+def percentile(latencies, fraction):
+    return latencies[min(int(len(latencies) * fraction), len(latencies) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "arangodb.sock")
+    try:
+        with StandInServer() as tcp_server, \
+                StandInServer(unix_socket=path):
+            apis = [
+                ("tcp", API(host=tcp_server.host, port=tcp_server.port)),
+                ("unix", API(endpoint="unix://" + path)),
+            ]
+            rounds = dict((name, []) for name, _ in apis)
+            for _ in range(args.rounds):
+                for name, api in apis:
+                    rounds[name].append(bench(api, args.requests))
+            results = [
+                (name, min(rounds[name], key=sum)) for name, _ in apis
+            ]
+    finally:
+        shutil.rmtree(directory)
+
+    print("requests: {}, rounds: {}".format(args.requests, args.rounds))
+    print("{:6} {:>10} {:>10} {:>10} {:>10}".format(
+        "", "mean (us)", "p50 (us)", "p99 (us)", "req/s"
+    ))
+    for name, latencies in results:
+        total = sum(latencies)
+        print("{:6} {:10.1f} {:10.1f} {:10.1f} {:10.0f}".format(
+            name,
+            total / len(latencies) * 1e6,
+            percentile(latencies, 0.5) * 1e6,
+            percentile(latencies, 0.99) * 1e6,
+            len(latencies) / total,
+        ))
+
+
+if __name__ == "__main__":
+    main()
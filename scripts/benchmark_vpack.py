@@ -0,0 +1,147 @@
+"""Compare JSON and VelocyPack on the wire and on the client CPU.
+
+A local stand-in server answers cursor requests with a batch of documents
+and accepts document imports, speaking JSON or VelocyPack depending on the
+Content-Type and Accept headers of the request. For both formats the
+script reports the payload sizes, the time spent encoding and decoding on
+the client, and the end-to-end time of the requests.
+
+Usage: PYTHONPATH=. python scripts/benchmark_vpack.py [--documents N]
+"""
+
+import argparse
+import json
+import time
+import timeit
+
+from standin import StandInServer
+
+from arango import vpack
+from arango.api import API
+from arango.codec import get_codec
+from arango.collection import Collection
+
+PROPERTIES = {
+    "id": "1", "name": "col", "type": 2, "status": 3, "waitForSync": False,
+    "keyOptions": {}, "isVolatile": False, "doCompact": True,
+    "journalSize": 0, "isSystem": False,
+}
+
+
+def make_documents(count):
+    return [
+        {
+            "_key": "doc{}".format(num),
+            "_id": "col/doc{}".format(num),
+            "_rev": str(1000000 + num),
+            "name": "document number {}".format(num),
+            "value": num,
+            "ratio": num / 7.0,
+            "active": num % 2 == 0,
+            "tags": ["red", "green", "blue"],
+            "scores": list(range(10)),
+        }
+        for num in range(count)
+    ]
+
+
+def make_handler(documents):
+    cursor = {
+        "result": documents, "hasMore": False, "count": len(documents),
+        "cached": False, "error": False, "code": 201,
+    }
+    bodies = {
+        "json": {
+            "cursor": json.dumps(cursor).encode("utf-8"),
+            "properties": json.dumps(PROPERTIES).encode("utf-8"),
+        },
+        "vpack": {
+            "cursor": vpack.dumps(cursor),
+            "properties": vpack.dumps(PROPERTIES),
+        },
+    }
+    imported = {"error": False, "created": len(documents), "errors": 0}
+
+    def handler(method, path, headers, body):
+        if headers.get("accept", "").startswith(vpack.CONTENT_TYPE):
+            fmt = "vpack"
+            content_type = vpack.CONTENT_TYPE
+        else:
+            fmt = "json"
+            content_type = "application/json; charset=utf-8"
+        res_headers = {"Content-Type": content_type}
+        if "/_api/collection/" in path:
+            return 200, res_headers, bodies[fmt]["properties"]
+        if "/_api/cursor" in path:
+            return 201, res_headers, bodies[fmt]["cursor"]
+        # Decode the import payload like the server would
+        if headers.get("content-type", "").startswith(vpack.CONTENT_TYPE):
+            count = len(vpack.loads(body))
+        else:
+            count = len(body.splitlines())
+        imported["created"] = count
+        if fmt == "vpack":
+            return 201, res_headers, vpack.dumps(imported)
+        return 201, res_headers, json.dumps(imported).encode("utf-8")
+
+    return handler, bodies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--documents", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=20)
+    args = parser.parse_args()
+
+    documents = make_documents(args.documents)
+    handler, bodies = make_handler(documents)
+    json_codec = get_codec("json")
+    vpack_codec = get_codec("vpack")
+
+    print("{} documents per batch".format(args.documents))
+    print("{:<6} {:>12} {:>12} {:>10} {:>10} {:>10} {:>10}".format(
+        "format", "cursor (B)", "import (B)", "dec (ms)", "enc (ms)",
+        "query (ms)", "import (ms)"
+    ))
+    with StandInServer(handler=handler) as server:
+        for name, codec in (("json", json_codec), ("vpack", vpack_codec)):
+            body = bodies[name]["cursor"]
+            content_type = codec.content_type
+            decode = min(timeit.repeat(
+                lambda: codec.decode(body, content_type),
+                number=1, repeat=5
+            ))
+            if codec.binary:
+                import_body = codec.encode(documents)
+                encode = min(timeit.repeat(
+                    lambda: codec.encode(documents), number=1, repeat=5
+                ))
+            else:
+                import_body = b"\r\n".join(
+                    [codec.encode(doc) for doc in documents]
+                )
+                encode = min(timeit.repeat(
+                    lambda: [codec.encode(doc) for doc in documents],
+                    number=1, repeat=5
+                ))
+
+            api = API(host=server.host, port=server.port, codec=codec)
+            col = Collection("col", api)
+            start = time.time()
+            for _ in range(args.requests):
+                api.post("/_api/cursor", data={"query": "..."}).obj
+            query = (time.time() - start) / args.requests
+            start = time.time()
+            for _ in range(args.requests):
+                col.import_documents(documents)
+            imports = (time.time() - start) / args.requests
+
+            print("{:<6} {:>12} {:>12} {:>10.1f} {:>10.1f} {:>10.1f} "
+                  "{:>10.1f}".format(
+                      name, len(body), len(import_body), decode * 1000,
+                      encode * 1000, query * 1000, imports * 1000
+                  ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""Local stand-in for an ArangoDB server, used by the benchmark scripts.
+
+The server speaks just enough HTTP/1.1 (keep-alive, Content-Length and
+chunked request bodies, gzip and deflate content encoding) to answer the
+requests made by the driver. Every request is answered by a handler
+function after an optional artificial delay which stands in for the
+network round trip and the server side processing time.
+"""
+
+import asyncio
+import gzip
+import json
+import threading
+import zlib
+
+
+def default_handler(method, path, headers, body):
+    """Answer every request with a small JSON document."""
+    if method == "HEAD":
+        return 200, {"Content-Type": "application/json"}, b""
+    document = {"_id": "col/doc", "_key": "doc", "_rev": "1", "value": 1}
+    return 200, {"Content-Type": "application/json"}, \
+        json.dumps(document).encode("utf-8")
+
+
+class StandInServer(object):
+    """Stand-in ArangoDB server running on a background event loop.
+
+    :param handler: function (method, path, headers, body) returning a
+        tuple of (status_code, headers, body)
+    :type handler: callable
+    :param latency: artificial delay added to every response (in seconds)
+    :type latency: float
+    :param unix_socket: listen on this unix socket path instead of TCP
+    :type unix_socket: str or None
+    :param compress_threshold: gzip response bodies of at least this size
+        if the client accepts it (None disables response compression)
+    :type compress_threshold: int or None
+    """
+
+    def __init__(self, handler=default_handler, latency=0.0,
+                 unix_socket=None, compress_threshold=None):
+        self.handler = handler
+        self.latency = latency
+        self.unix_socket = unix_socket
+        self.compress_threshold = compress_threshold
+        self.bytes_received = 0
+        self.bytes_sent = 0
+        self.host = "127.0.0.1"
+        self.port = None
+        self._server = None
+        self._loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(self):
+        self._thread.start()
+        self._ready.wait()
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(
+            self._shutdown(), self._loop
+        ).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    async def _shutdown(self):
+        self._server.close()
+        current = asyncio.current_task()
+        tasks = [t for t in asyncio.all_tasks() if t is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        if self.unix_socket is not None:
+            self._server = self._loop.run_until_complete(
+                asyncio.start_unix_server(self._serve, path=self.unix_socket)
+            )
+        else:
+            self._server = self._loop.run_until_complete(
+                asyncio.start_server(self._serve, self.host, 0, backlog=1024)
+            )
+            self.port = self._server.sockets[0].getsockname()[1]
+        self._ready.set()
+        self._loop.run_forever()
+        self._loop.close()
+
+    async def _read_body(self, reader, headers):
+        if "chunked" in headers.get("transfer-encoding", ""):
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+                self.bytes_received += size
+            return b"".join(chunks)
+        length = int(headers.get("content-length", 0))
+        self.bytes_received += length
+        return await reader.readexactly(length) if length else b""
+
+    async def _serve(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    key, _, value = line.decode("latin-1").partition(":")
+                    headers[key.strip().lower()] = value.strip()
+                body = await self._read_body(reader, headers)
+                encoding = headers.get("content-encoding")
+                if encoding == "gzip":
+                    body = gzip.decompress(body)
+                elif encoding == "deflate":
+                    body = zlib.decompress(body)
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                status, res_headers, res_body = self.handler(
+                    method, path, headers, body
+                )
+                head = ["HTTP/1.1 {} OK".format(status)]
+                res_headers = dict(res_headers)
+                if (self.compress_threshold is not None and
+                        len(res_body) >= self.compress_threshold and
+                        "gzip" in headers.get("accept-encoding", "")):
+                    res_body = gzip.compress(res_body)
+                    res_headers["Content-Encoding"] = "gzip"
+                res_headers["Content-Length"] = str(len(res_body))
+                self.bytes_sent += len(res_body)
+                for key, value in res_headers.items():
+                    head.append("{}: {}".format(key, value))
+                writer.write(
+                    ("\r\n".join(head) + "\r\n\r\n").encode("latin-1")
+                )
+                if method != "HEAD":
+                    writer.write(res_body)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError,
+                asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()